@@ -1,61 +1,96 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
-from ._version_helper import (
-    get_version_information, GitInformation, PackageInformation, GitDummy
-)
 from pathlib import Path
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
-version, last_stable_release, git_hash, git_author = [""] * 4
-git_status, git_builder, git_build_date = [""] * 3
-
-try:
-    path = Path(__file__).parent
-    with open(path / ".version", "r") as f:
-        data = f.read()
-    exec(data)
-    __version__ = version
-    __last_release__ = last_stable_release
-    __short_version__ = __last_release__
-    __git_hash__ = git_hash
-    __git_author__ = git_author
-    __git_status__ = git_status
-    __git_builder__ = git_builder
-    __git_build_date__ = git_build_date
-except Exception:
+_VERSION_ATTRIBUTES = [
+    "__version__", "__last_release__", "__short_version__", "__git_hash__",
+    "__git_author__", "__git_status__", "__git_builder__",
+    "__git_build_date__", "__version_string__"
+]
+
+
+def _version_information():
+    """Return a dictionary containing the version information for this
+    installation of pesummary. The information is read from the `.version`
+    file if it exists, otherwise it is generated from the git repository.
+    This is only called when the version information is first requested to
+    avoid launching subprocesses at import time
+    """
     try:
-        git_info = GitInformation()
-    except TypeError:
+        version, last_stable_release, git_hash, git_author = [""] * 4
+        git_status, git_builder, git_build_date = [""] * 3
+        path = Path(__file__).parent
+        with open(path / ".version", "r") as f:
+            data = f.read()
+        _locals = {}
+        exec(data, {}, _locals)
+        info = {
+            "__version__": _locals.get("version", version),
+            "__last_release__": _locals.get(
+                "last_stable_release", last_stable_release
+            ),
+            "__git_hash__": _locals.get("git_hash", git_hash),
+            "__git_author__": _locals.get("git_author", git_author),
+            "__git_status__": _locals.get("git_status", git_status),
+            "__git_builder__": _locals.get("git_builder", git_builder),
+            "__git_build_date__": _locals.get(
+                "git_build_date", git_build_date
+            )
+        }
+        info["__short_version__"] = info["__last_release__"]
+    except Exception:
+        from ._version_helper import (
+            get_version_information, GitInformation, GitDummy
+        )
         try:
-            from pesummary import _version
-            import os
-            cfg = _version.get_config()
-            ff = _version.__file__
-            root = os.path.realpath(ff)
-            for i in cfg.versionfile_source.split('/'):
-                root = os.path.dirname(root)
-            git_info = GitInformation(directory=root)
-        except Exception:
-            git_info = GitDummy()
-
-    __version__ = get_version_information()
-    __short_version__ = get_version_information(short=True)
-    __last_release__ = git_info.last_version
-    __git_hash__ = git_info.hash
-    __git_author__ = git_info.author
-    __git_status__ = git_info.status
-    __git_builder__ = git_info.builder
-    __git_build_date__ = git_info.build_date
-
-__version_string__ = (
-    "# pesummary version information\n\n"
-    "version = '%s'\nlast_stable_release = '%s'\n\ngit_hash = '%s'\n"
-    "git_author = '%s'\ngit_status = '%s'\ngit_builder = '%s'\n"
-    "git_build_date = '%s'\n\n" % (
-        __version__, __last_release__, __git_hash__, __git_author__,
-        __git_status__, __git_builder__, __git_build_date__
+            git_info = GitInformation()
+        except TypeError:
+            try:
+                from pesummary import _version
+                import os
+                cfg = _version.get_config()
+                ff = _version.__file__
+                root = os.path.realpath(ff)
+                for i in cfg.versionfile_source.split('/'):
+                    root = os.path.dirname(root)
+                git_info = GitInformation(directory=root)
+            except Exception:
+                git_info = GitDummy()
+
+        info = {
+            "__version__": get_version_information(),
+            "__short_version__": get_version_information(short=True),
+            "__last_release__": git_info.last_version,
+            "__git_hash__": git_info.hash,
+            "__git_author__": git_info.author,
+            "__git_status__": git_info.status,
+            "__git_builder__": git_info.builder,
+            "__git_build_date__": git_info.build_date
+        }
+
+    info["__version_string__"] = (
+        "# pesummary version information\n\n"
+        "version = '%s'\nlast_stable_release = '%s'\n\ngit_hash = '%s'\n"
+        "git_author = '%s'\ngit_status = '%s'\ngit_builder = '%s'\n"
+        "git_build_date = '%s'\n\n" % (
+            info["__version__"], info["__last_release__"],
+            info["__git_hash__"], info["__git_author__"],
+            info["__git_status__"], info["__git_builder__"],
+            info["__git_build_date__"]
+        )
     )
-)
+    return info
+
+
+def __getattr__(name):
+    if name in _VERSION_ATTRIBUTES:
+        globals().update(_version_information())
+        return globals()[name]
+    raise AttributeError(
+        "module '{}' has no attribute '{}'".format(__name__, name)
+    )
+
 
 __bilby_compatibility__ = "0.3.6"
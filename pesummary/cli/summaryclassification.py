@@ -7,6 +7,9 @@ import pesummary
 from pesummary.gw.file.read import read as GWRead
 from pesummary.gw.pepredicates import PEPredicates
 from pesummary.gw.p_astro import PAstro
+from pesummary.gw.classification import (
+    ClassificationSamples, population_reweight
+)
 from pesummary.utils.utils import make_dir, logger
 from pesummary.utils.exceptions import InputError
 import argparse
@@ -57,14 +60,14 @@ def generate_probabilities(result_files, prior="both"):
         f = GWRead(i)
         if not isinstance(f, pesummary.gw.file.formats.pesummary.PESummary):
             f.generate_all_posterior_samples()
-            mydict["default"], mydict["population"] = \
-                PEPredicates.classifications(f.samples, f.parameters)
-            em_bright = PAstro.classifications(f.samples_dict)
+            samples = ClassificationSamples.from_samples(f.samples_dict)
         else:
             label = f.labels[0]
-            mydict["default"], mydict["population"] = \
-                PEPredicates.classifications(f.samples[0], f.parameters[0])
-            em_bright = PAstro.classifications(f.samples_dict[label])
+            samples = ClassificationSamples.from_samples(f.samples_dict[label])
+        population = population_reweight(samples)
+        mydict["default"], mydict["population"] = \
+            PEPredicates.classifications(samples, population=population)
+        em_bright = PAstro.classifications(samples, population=population)
         mydict["default"].update(em_bright[0])
         mydict["population"].update(em_bright[1])
         classifications.append(mydict)
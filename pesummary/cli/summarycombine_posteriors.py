@@ -76,6 +76,22 @@ def command_line():
         "--seed", dest="seed", default=123456789, type=int,
         help="Random seed to used through the analysis. Default 123456789"
     )
+    parser.add_argument(
+        "--stream", action="store_true", default=False, help=(
+            "Combine the posterior samples without loading each file into "
+            "memory. Each file is read in chunks and only the drawn samples "
+            "are kept. No parameter conversion is performed and only the "
+            "parameters common to all files are included. Only available "
+            "for dat, txt, csv, npy and hdf5 files"
+        )
+    )
+    parser.add_argument(
+        "--chunk_size", dest="chunk_size", default=100000, type=int,
+        help=(
+            "Number of rows to read at once when the `--stream` option is "
+            "provided. Default 100000"
+        )
+    )
     parser.add_argument(
         "--add_to_existing", action="store_true", default=False, help=(
             "Add the combined samples to an existing metafile. Only used when "
@@ -126,12 +142,125 @@ class Input(_Input):
             self.labels = self.opts.labels
 
 
+def stream_combine(
+    labels, result_files, use_all=False, weights=None, shuffle=False,
+    file_format="dat", filename=None, outdir="./", chunk_size=100000
+):
+    """Combine the posterior samples stored in multiple files without
+    loading each file into memory. The number of samples drawn from each file
+    follows `pesummary.utils.samples_dict.MultiAnalysisSamplesDict.combine`.
+    The draws for each file are chosen before the file is read and the file
+    is then streamed in chunks, keeping only the drawn rows. Peak memory is
+    therefore bounded by the size of the combined posterior rather than the
+    sum of the inputs
+
+    Parameters
+    ----------
+    labels: list
+        list of labels to distinguish each file
+    result_files: list
+        list of paths to the files you wish to combine. Alternatively a list
+        of `pesummary.core.file.stream.StreamingPosterior` objects
+    use_all: Bool, optional
+        if True, use all of the samples (do not weight). Default False
+    weights: list, optional
+        weights to assign to each file
+    shuffle: Bool, optional
+        shuffle the combined samples
+    file_format: str, optional
+        format of the output file. Default 'dat'
+    filename: str, optional
+        name of the output file
+    outdir: str, optional
+        directory to save the output file
+    chunk_size: int, optional
+        maximum number of rows to read from a file at once
+    """
+    from pesummary.core.file.stream import StreamingPosterior
+    from pesummary.utils.samples_dict import SamplesDict
+    from pesummary.utils.utils import check_filename
+    from pesummary import conf
+
+    files = [
+        _file if isinstance(_file, StreamingPosterior) else
+        StreamingPosterior(_file) for _file in result_files
+    ]
+    intersection = set.intersection(*[set(_file.parameters) for _file in files])
+    parameters = [
+        param for param in files[0].parameters if param in intersection
+    ]
+    lengths = np.array([_file.nsamples for _file in files])
+    draw = MultiAnalysisSamplesDict._number_of_draws(
+        labels, lengths, use_all=use_all, weights=weights,
+        _logger=logger.info
+    )
+    indices = [
+        None if draw[num] == lengths[num] else np.sort(
+            np.random.choice(lengths[num], draw[num], replace=False)
+        ) for num in range(len(files))
+    ]
+    _extension = {"hdf5": "h5", "numpy": "npy"}.get(file_format, file_format)
+    _filename = check_filename(
+        default_filename="pesummary_{}.%s" % (_extension), outdir=outdir,
+        filename=filename
+    )
+    if file_format == "dat" and not shuffle:
+        logger.info("Streaming samples to file '{}'".format(_filename))
+        with open(_filename, "w") as f:
+            f.write(conf.delimiter.join(parameters) + "\n")
+            for num, _file in enumerate(files):
+                if draw[num] == 0:
+                    continue
+                np.savetxt(
+                    f, _file.take(
+                        indices[num], parameters=parameters,
+                        chunk_size=chunk_size
+                    ), delimiter=conf.delimiter
+                )
+        return
+    combined = np.empty((int(np.sum(draw)), len(parameters)), dtype=float)
+    offset = 0
+    for num, _file in enumerate(files):
+        if draw[num] == 0:
+            continue
+        _file.take(
+            indices[num], parameters=parameters, chunk_size=chunk_size,
+            out=combined[offset:offset + draw[num]]
+        )
+        offset += draw[num]
+    if shuffle:
+        np.random.shuffle(combined)
+    logger.info("Saving samples to file '{}'".format(_filename))
+    SamplesDict(parameters, combined.T, logger_warn="debug").write(
+        file_format=file_format, filename=os.path.basename(_filename),
+        outdir=outdir
+    )
+
+
 def main(args=None):
     """Top level interface for `summarycombine_posteriors`
     """
     _parser = parser(existing_parser=command_line())
     opts, unknown = _parser.parse_known_args(args=args)
     args = Input(opts)
+    if opts.stream and args.pesummary:
+        logger.warning(
+            "Unable to stream samples from a PESummary metafile. Loading the "
+            "file into memory"
+        )
+    elif opts.stream:
+        from pesummary.core.file.stream import StreamingPosterior
+        try:
+            files = [StreamingPosterior(path) for path in args.result_files]
+        except ValueError as e:
+            logger.warning("{}. Loading the files into memory".format(e))
+        else:
+            return stream_combine(
+                args.labels, files, use_all=opts.use_all,
+                weights=opts.weights, shuffle=opts.shuffle,
+                file_format=opts.file_format, filename=opts.filename,
+                outdir=opts.outdir, chunk_size=opts.chunk_size
+            )
     if not args.pesummary:
         samples = {
             label: samples for label, samples in
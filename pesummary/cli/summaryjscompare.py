@@ -19,13 +19,13 @@ import matplotlib.pyplot as plt
 
 from pesummary.io import read
 from pesummary.core.parser import parser as pesummary_parser
-from pesummary.core.plots.bounded_1d_kde import ReflectionBoundedKDE
 from pesummary.core.plots.figure import figure
 from pesummary.gw.plots.bounds import default_bounds
 from pesummary.gw.plots.latex_labels import GWlatex_labels
 from pesummary.core.plots.latex_labels import latex_labels
-from pesummary.utils.tqdm import tqdm
-from pesummary.utils.utils import jensen_shannon_divergence
+from pesummary.utils.bootstrap import (
+    bootstrap_jensen_shannon_divergence, bootstrap_jensen_shannon_divergences
+)
 from pesummary.utils.utils import _check_latex_install, get_matplotlib_style_file, logger
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
@@ -40,23 +40,14 @@ def load_data(data_file):
     return f.samples_dict
 
 
-def js_bootstrap(key, resultA, resultB, nsamples, ntests):
-    """
-    Evaluates mean JS divergence with bootstrapping
+def _bounds(key, samplesA, samplesB):
+    """Return the lower and upper bound for a given parameter
+
     key: string posterior parameter
-    result_A: first full posterior samples set
-    result_B: second full posterior samples set
-    nsamples: number for downsampling full sample set
-    ntests: number of iterations over different nsamples realisations
-    returns: 1 dim array (of lenght ntests)
+    samplesA: first set of samples for key
+    samplesB: second set of samples for key
+    returns: tuple (xlow, xhigh)
     """
-
-    samplesA = resultA[key]
-    samplesB = resultB[key]
-
-    # Get minimum number of samples to use
-    nsamples = min([nsamples, len(samplesA), len(samplesB)])
-
     xlow, xhigh = None, None
     if key in default_bounds.keys():
         bounds = default_bounds[key]
@@ -67,16 +58,29 @@ def js_bootstrap(key, resultA, resultB, nsamples, ntests):
                 xhigh = np.min([np.max(samplesA), np.max(samplesB)])
             else:
                 xhigh = bounds["high"]
+    return xlow, xhigh
 
-    js_array = np.zeros(ntests)
 
-    for j in tqdm(range(ntests)):
-        bootA = np.random.choice(samplesA, size=nsamples, replace=False)
-        bootB = np.random.choice(samplesB, size=nsamples, replace=False)
-        js_array[j] = np.nan_to_num(
-            jensen_shannon_divergence([bootA, bootB], kde=ReflectionBoundedKDE, xlow=xlow, xhigh=xhigh)
+def js_bootstrap(key, resultA, resultB, nsamples, ntests):
+    """
+    Evaluates mean JS divergence with bootstrapping
+    key: string posterior parameter
+    result_A: first full posterior samples set
+    result_B: second full posterior samples set
+    nsamples: number for downsampling full sample set
+    ntests: number of iterations over different nsamples realisations
+    returns: 1 dim array (of lenght ntests)
+    """
+    samplesA = resultA[key]
+    samplesB = resultB[key]
+    xlow, xhigh = _bounds(key, samplesA, samplesB)
+    js_array = bootstrap_jensen_shannon_divergence(
+        samplesA, samplesB, nsamples=nsamples, ntests=ntests, xlow=xlow,
+        xhigh=xhigh, random_state=np.random.default_rng(
+            np.random.randint(2**32 - 1)
         )
-    return js_array
+    )
+    return np.nan_to_num(js_array)
 
 
 def calc_median_error(jsvalues, quantiles=(0.16, 0.84)):
@@ -222,6 +226,10 @@ def parse_cmd_line(args=None):
         "--nsamples", type=int, default=10000, required=False, help="Number of samples to use",
     )
     parser.add_argument("--random-seed", type=int, default=150914)
+    parser.add_argument(
+        "--multi_process", type=int, default=1, required=False,
+        help="Number of cpus to use when bootstrapping the parameters",
+    )
     parser.add_argument(
         "--webdir", type=str, default=".", required=False, help="Path to webdirectory where plots will be saved"
     )
@@ -248,10 +256,14 @@ def main(args=None):
 
     logger.debug("Evaluating JS divergence..")
     js_data = dict()
-    js = np.zeros((args.ntests, len(main_keys)))
-    for i, key in enumerate(main_keys):
-        js[:, i] = js_bootstrap(key, resultA, resultB, args.nsamples, ntests=args.ntests,)
-        js_data[key] = calc_median_error(js[:, i])
+    keys = [key for key in main_keys if key in resultA and key in resultB]
+    bounds = {key: _bounds(key, resultA[key], resultB[key]) for key in keys}
+    js = bootstrap_jensen_shannon_divergences(
+        resultA, resultB, keys, bounds=bounds, multi_process=args.multi_process,
+        seed=args.random_seed, nsamples=args.nsamples, ntests=args.ntests,
+    )
+    for key in keys:
+        js_data[key] = calc_median_error(np.nan_to_num(js[key]))
     logger.debug("Making pp-plot..")
     pp_plot(args.event, resultA, resultB, labelA, labelB, main_keys, args.nsamples, js_data=js_data, webdir=args.webdir)
 
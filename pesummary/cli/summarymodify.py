@@ -551,17 +551,22 @@ def _store_skymap(data, kwargs=None, replace=False):
     data: dict
         dictionary containing the data
     kwargs: dict
-        dictionary of kwargs showing the label as key and posterior as the item
+        dictionary of kwargs showing the label as key and either the path to
+        a fits file or a pesummary.gw.file.skymap.SkyMap object as the item
     replace: dict
         replace a skymap already stored in the result file
     """
     from pesummary.io import read
+    from pesummary.gw.file.skymap import SkyMap
 
     message = "Unable to find label '{}' in the metafile. Unable to store skymap"
     for label, path in kwargs.items():
         check = _check_label(data, label, message.format(label))
         if check:
-            skymap = read(path, skymap=True)
+            if isinstance(path, SkyMap):
+                skymap = path
+            else:
+                skymap = read(path, skymap=True)
             if "skymap" not in data[label].keys():
                 data[label]["skymap"] = {}
             if "meta_data" not in data[label]["skymap"].keys():
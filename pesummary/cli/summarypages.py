@@ -75,7 +75,9 @@ class _CoreWebpageGeneration(PostProcessing):
             mcmc_samples=self.mcmc_samples,
             external_hdf5_links=self.external_hdf5_links, key_data=key_data,
             existing_plot=self.existing_plot, disable_expert=self.disable_expert,
-            analytic_priors=self.analytic_prior_dict
+            analytic_priors=self.analytic_prior_dict,
+            multi_process=self.multi_process, thumbnails=self.thumbnails,
+            incremental=self.incremental
         )
 
     def generate_webpages(self):
@@ -128,7 +130,9 @@ class _GWWebpageGeneration(GWPostProcessing):
             external_hdf5_links=self.external_hdf5_links,
             preliminary_pages=self.preliminary_pages,
             disable_expert=self.disable_expert,
-            analytic_priors=self.analytic_prior_dict
+            analytic_priors=self.analytic_prior_dict,
+            multi_process=self.multi_process, thumbnails=self.thumbnails,
+            incremental=self.incremental
         )
 
     def generate_webpages(self):
@@ -181,7 +185,9 @@ class _PublicGWWebpageGeneration(GWPostProcessing):
             external_hdf5_links=self.external_hdf5_links,
             preliminary_pages=self.preliminary_pages,
             disable_expert=self.disable_expert,
-            analytic_priors=self.analytic_prior_dict
+            analytic_priors=self.analytic_prior_dict,
+            multi_process=self.multi_process, thumbnails=self.thumbnails,
+            incremental=self.incremental
         )
 
     def generate_webpages(self):
@@ -239,7 +245,9 @@ def main(args=None, _parser=None, _core_input_cls=None, _gw_input_cls=None):
     )
     func["MetaFile"](args, history=_history)
     if gw_results_file(opts):
-        kwargs = dict(ligo_skymap_PID=plotting_object.ligo_skymap_PID)
+        kwargs = dict(
+            ligo_skymap_scheduler=plotting_object.ligo_skymap_scheduler
+        )
     else:
         kwargs = {}
     func["FinishingTouches"](args, **kwargs)
@@ -36,14 +36,13 @@ class PlotGeneration(object):
         logger.info("Starting to generate plots")
         if self.gw and self.inputs.public:
             object = _PublicGWPlotGeneration(self.inputs, colors=self.colors)
-            self.ligo_skymap_PID = object.ligo_skymap_PID
         elif self.gw:
             object = _GWPlotGeneration(self.inputs, colors=self.colors)
         else:
             object = _CorePlotGeneration(self.inputs, colors=self.colors)
         object.generate_plots()
         if self.gw:
-            self.ligo_skymap_PID = object.ligo_skymap_PID
+            self.ligo_skymap_scheduler = object.ligo_skymap_scheduler
         logger.info("Finished generating plots")
 
 
@@ -79,7 +78,10 @@ class _CorePlotGeneration(PostProcessing):
             disable_corner=self.disable_corner,
             multi_process=self.multi_process, mcmc_samples=self.mcmc_samples,
             corner_params=self.corner_params, expert_plots=expert_plots,
-            checkpoint=self.restart_from_checkpoint
+            checkpoint=self.restart_from_checkpoint,
+            thumbnails=self.thumbnails, webp_thumbnails=self.webp_thumbnails,
+            incremental=self.incremental,
+            interactive_point_budget=self.interactive_point_budget
         )
 
     def generate_plots(self):
@@ -137,9 +139,14 @@ class _GWPlotGeneration(GWPostProcessing):
             skymap=self.skymap, existing_skymap=self.existing_skymap,
             corner_params=self.corner_params,
             preliminary_pages=self.preliminary_pages, expert_plots=expert_plots,
-            checkpoint=self.restart_from_checkpoint
+            checkpoint=self.restart_from_checkpoint,
+            thumbnails=self.thumbnails, webp_thumbnails=self.webp_thumbnails,
+            incremental=self.incremental, seed=self.seed,
+            interactive_point_budget=self.interactive_point_budget
+        )
+        self.ligo_skymap_scheduler = (
+            self.plotting_object.ligo_skymap_scheduler
         )
-        self.ligo_skymap_PID = self.plotting_object.ligo_skymap_PID
 
     def generate_plots(self):
         """Generate all plots within the GW module
@@ -196,9 +203,14 @@ class _PublicGWPlotGeneration(GWPostProcessing):
             skymap=self.skymap, existing_skymap=self.existing_skymap,
             corner_params=self.corner_params,
             preliminary_pages=self.preliminary_pages, expert_plots=expert_plots,
-            checkpoint=self.restart_from_checkpoint
+            checkpoint=self.restart_from_checkpoint,
+            thumbnails=self.thumbnails, webp_thumbnails=self.webp_thumbnails,
+            incremental=self.incremental, seed=self.seed,
+            interactive_point_budget=self.interactive_point_budget
+        )
+        self.ligo_skymap_scheduler = (
+            self.plotting_object.ligo_skymap_scheduler
         )
-        self.ligo_skymap_PID = self.plotting_object.ligo_skymap_PID
 
     def generate_plots(self):
         """Generate all plots within the GW module
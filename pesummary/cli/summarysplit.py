@@ -49,20 +49,49 @@ def command_line():
         "--multi_process", dest="multi_process", type=int, default=1,
         help="The number of cores to use when writing split posterior samples"
     )
+    parser.add_argument(
+        "--indexed", action="store_true", default=False, help=(
+            "Rather than writing N separate files, write the posterior "
+            "samples once to a single hdf5 file alongside the start and stop "
+            "index of each split, and a json manifest listing the splits. "
+            "Each split can then be loaded with "
+            "`pesummary.cli.summarysplit.load_split`. The `--file_format` "
+            "option is ignored"
+        )
+    )
     return parser
 
 
-def _write_posterior_samples(
-    posterior_samples, split_idxs, file_format, outdir, filename
-):
-    """Split a set of posterior samples and write them to file
+# posterior samples shared with each worker when the pool is initialised.
+# This ensures that the samples are only sent to each worker once rather than
+# once per split
+_SHARED_POSTERIOR = {}
+
+
+def _share_posterior_samples(parameters, samples):
+    """Store the posterior samples in the global namespace of the current
+    process. This is used as the initializer for a pool of workers
 
     Parameters
     ----------
-    posterior_samples: pesummary.utils.samples_dict.SamplesDict
-        set of posterior samples you wish to split and write to file
-    split_idxs: np.ndarray
-        2D array giving indices for each split, e.g. [[1,2,3], [4,5,6], [7,8]]
+    parameters: list
+        list of parameters
+    samples: np.ndarray
+        2D array of samples with shape (n_samples, n_parameters)
+    """
+    _SHARED_POSTERIOR["parameters"] = parameters
+    _SHARED_POSTERIOR["samples"] = samples
+
+
+def _write_posterior_samples(start, stop, file_format, outdir, filename):
+    """Write a slice of the shared posterior samples to file
+
+    Parameters
+    ----------
+    start: int
+        index of the first sample to write
+    stop: int
+        index after the last sample to write
     file_format: str
         format to write the posterior samples
     outdir: str
@@ -70,11 +99,10 @@ def _write_posterior_samples(
     filename: str
         filename to use for each file
     """
-    _parameters = posterior_samples.parameters
-    _samples = posterior_samples.samples.T[split_idxs[0]:split_idxs[-1] + 1]
     write(
-        _parameters, _samples, file_format=file_format, outdir=outdir,
-        filename=filename
+        _SHARED_POSTERIOR["parameters"],
+        _SHARED_POSTERIOR["samples"][start:stop], file_format=file_format,
+        outdir=outdir, filename=filename
     )
     return
 
@@ -90,9 +118,79 @@ def _wrapper_for_write_posterior_samples(args):
     return _write_posterior_samples(*args)
 
 
+def _write_indexed_posterior_samples(
+    posterior_samples, bounds, outdir="./", filename=None
+):
+    """Write the posterior samples once to a single hdf5 file alongside the
+    start and stop index of each split. A json manifest listing each split is
+    also written
+
+    Parameters
+    ----------
+    posterior_samples: pesummary.utils.samples_dict.SamplesDict
+        set of posterior samples you wish to split and write to file
+    bounds: np.ndarray
+        2D array giving the start and stop index of each split
+    outdir: str, optional
+        directory to write the file. Default './'
+    filename: str, optional
+        name of the file. Default 'split_posterior_samples.h5'
+    """
+    import h5py
+    import json
+
+    if filename is None:
+        filename = "split_posterior_samples.h5"
+    _filename = os.path.join(outdir, filename)
+    logger.info(
+        "Writing posterior samples and {} splits to '{}'".format(
+            len(bounds), _filename
+        )
+    )
+    with h5py.File(_filename, "w") as f:
+        f.create_dataset(
+            "posterior_samples", data=posterior_samples.to_structured_array()
+        )
+        f.create_dataset("split_index", data=bounds)
+    manifest = {
+        "file": filename, "parameters": list(posterior_samples.parameters),
+        "splits": {
+            str(num): [int(start), int(stop)] for num, (start, stop) in
+            enumerate(bounds)
+        }
+    }
+    with open(os.path.splitext(_filename)[0] + "_manifest.json", "w") as f:
+        json.dump(manifest, f, indent=4)
+    return _filename
+
+
+def load_split(path, num):
+    """Load a single split from a file written with the `--indexed` option.
+    Only the samples for the requested split are read from disk
+
+    Parameters
+    ----------
+    path: str
+        path to the file written with the `--indexed` option
+    num: int
+        the split you wish to load
+    """
+    import h5py
+    from pesummary.core.file.formats.numpy import (
+        _parameters_and_samples_from_structured_array
+    )
+    from pesummary.utils.samples_dict import SamplesDict
+
+    with h5py.File(path, "r") as f:
+        start, stop = f["split_index"][num]
+        data = f["posterior_samples"][start:stop]
+    parameters, samples = _parameters_and_samples_from_structured_array(data)
+    return SamplesDict(parameters, np.asarray(samples).T)
+
+
 def _split_posterior_samples(
     posterior_samples, N_files, file_format="dat", outdir="./",
-    filename=None, multi_process=1
+    filename=None, multi_process=1, indexed=False
 ):
     """Split a set of posterior samples and write each split to file
 
@@ -114,6 +212,9 @@ def _split_posterior_samples(
     multi_process: int, optional
         number of cpus to use when writing the split posterior samples.
         Default 1
+    indexed: Bool, optional
+        if True, write the posterior samples once to a single hdf5 file
+        alongside the start and stop index of each split. Default False
     """
     n_samples = posterior_samples.number_of_samples
     if N_files > n_samples:
@@ -126,33 +227,51 @@ def _split_posterior_samples(
         N_files = n_samples
     elif not N_files:
         N_files = n_samples
-    if filename is None:
-        filename = "split_posterior_samples_{}.%s" % (file_format)
     make_dir(outdir)
 
     logger.info(
         "Splitting posterior samples into {} files".format(N_files)
     )
-    idxs = np.arange(n_samples)
-    split_idxs = np.array_split(idxs, N_files)
-    filenames = [
-        filename.format(num) for num in np.arange(len(split_idxs))
+    # np.array_split gives the first n_samples % N_files splits one extra
+    # sample. Only the start and stop index of each split is stored
+    sizes = np.full(N_files, n_samples // N_files, dtype=int)
+    sizes[:n_samples % N_files] += 1
+    stops = np.cumsum(sizes)
+    bounds = np.array([stops - sizes, stops]).T
+    if indexed:
+        return _write_indexed_posterior_samples(
+            posterior_samples, bounds, outdir=outdir
+        )
+    if filename is None:
+        filename = "split_posterior_samples_{}.%s" % (file_format)
+    args = [
+        (start, stop, file_format, outdir, filename.format(num)) for
+        num, (start, stop) in enumerate(bounds)
     ]
-    args = np.array(
-        [
-            [posterior_samples] * len(split_idxs), split_idxs,
-            [file_format] * len(split_idxs), [outdir] * len(split_idxs),
-            filenames
-        ], dtype=object
-    ).T
-    with multiprocessing.Pool(multi_process) as pool:
-        _ = np.array(
-            list(
-                iterator(
-                    pool.imap(_wrapper_for_write_posterior_samples, args),
-                    tqdm=True, desc="Saving posterior samples to file",
-                    logger=logger, total=len(split_idxs)
-                )
+    initargs = (
+        posterior_samples.parameters, np.asarray(posterior_samples.samples).T
+    )
+    if multi_process == 1:
+        _share_posterior_samples(*initargs)
+        results = map(_wrapper_for_write_posterior_samples, args)
+        _ = list(
+            iterator(
+                results, tqdm=True, desc="Saving posterior samples to file",
+                logger=logger, total=len(args)
+            )
+        )
+        _SHARED_POSTERIOR.clear()
+        return
+    with multiprocessing.Pool(
+        multi_process, initializer=_share_posterior_samples, initargs=initargs
+    ) as pool:
+        _ = list(
+            iterator(
+                pool.imap(
+                    _wrapper_for_write_posterior_samples, args,
+                    chunksize=max(1, len(args) // (4 * multi_process))
+                ), tqdm=True, desc="Saving posterior samples to file",
+                logger=logger, total=len(args)
             )
         )
 
@@ -172,12 +291,14 @@ def main(args=None):
             _split_posterior_samples(
                 posterior_samples[label], opts.N_files,
                 outdir=os.path.join(opts.outdir, label),
-                file_format=opts.file_format, multi_process=opts.multi_process
+                file_format=opts.file_format, multi_process=opts.multi_process,
+                indexed=opts.indexed
             )
     else:
         _split_posterior_samples(
             posterior_samples, opts.N_files, outdir=opts.outdir,
-            file_format=opts.file_format, multi_process=opts.multi_process
+            file_format=opts.file_format, multi_process=opts.multi_process,
+            indexed=opts.indexed
         )
 
 
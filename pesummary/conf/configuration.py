@@ -1,9 +1,8 @@
 import numpy as np
-import pkg_resources
 import os
 
 # matplotlib style file
-_path = pkg_resources.resource_filename("pesummary", "conf")
+_path = os.path.dirname(os.path.abspath(__file__))
 style_file = os.path.join(_path, "matplotlib_rcparams.sty")
 
 # checkpoint file
@@ -68,6 +67,15 @@ default_f_final = 1024.0
 # Default delta_f to use for GW specific conversions
 default_delta_f = 1. / 256
 
+# Default number of equation of state families to cache when calculating
+# tidal deformabilities
+default_eos_cache_size = 128
+
+# Default relative quantisation tolerance for equation of state parameters
+# when caching neutron star families. None means that only identical
+# parameters share a family, i.e. the tidal deformabilities are exact
+default_eos_tolerance = None
+
 # Standard meta_data names
 log_evidence = "ln_evidence"
 evidence = "evidence"
@@ -334,6 +334,16 @@ def _core_command_line_arguments(parser):
         "-e", "--existing_webdir", dest="existing", default=None,
         help="web directory of existing output"
     )
+    core_group.add_argument(
+        "--incremental", action="store_true", default=False,
+        help=(
+            "When adding to an existing web directory, only generate plots, "
+            "statistics and webpages for the new results and append the new "
+            "results to the existing hdf5 metafile in place. Everything "
+            "stored in the existing web directory is trusted and not "
+            "regenerated"
+        )
+    )
     core_group.add_argument(
         "--seed", dest="seed", default=123456789, type=int,
         help="Random seed to used through the analysis. Default 123456789"
@@ -428,6 +438,16 @@ def _samples_command_line_arguments(parser):
             "Default do not reweight samples."
         )
     )
+    sample_group.add_argument(
+        "--reweight_mode", default="rejection",
+        choices=["rejection", "weights"], help=(
+            "How to reweight the posterior and/or prior samples. 'rejection' "
+            "resamples the posterior with rejection sampling. 'weights' keeps "
+            "all samples and stores importance weights which are used when "
+            "calculating summary statistics and generating plots. Default "
+            "'rejection'"
+        )
+    )
     sample_group.add_argument(
         "--descriptions", default={}, action=DictionaryAction, nargs="+",
         help=(
@@ -584,6 +604,17 @@ def _performance_command_line_options(parser):
         "--disable_interactive", action="store_true", default=False,
         help="Whether to make interactive plots or not"
     )
+    performance_group.add_argument(
+        "--interactive_point_budget", dest="interactive_point_budget",
+        type=int, default=None,
+        help=(
+            "Maximum number of samples per analysis to show in the "
+            "interactive plots. The samples are downsampled, keeping the "
+            "tails, and stored once per analysis in a payload shared by all "
+            "interactive plots. Default all samples are embedded in each "
+            "interactive plot"
+        )
+    )
     performance_group.add_argument(
         "--disable_corner", action="store_true", default=False,
         help="Whether to make a corner plot or not"
@@ -592,6 +623,18 @@ def _performance_command_line_options(parser):
         "--disable_expert", action="store_true", default=False,
         help="Whether to generate extra diagnostic plots or not"
     )
+    performance_group.add_argument(
+        "--thumbnails", action="store_true", default=False,
+        help=(
+            "Whether to generate reduced size thumbnails of all plots. If "
+            "provided, the thumbnails are lazily loaded on the webpages and "
+            "the full resolution plot is shown in the modal carousel"
+        )
+    )
+    performance_group.add_argument(
+        "--webp_thumbnails", action="store_true", default=False,
+        help="Whether to also generate WebP variants of the thumbnails"
+    )
     performance_group.add_argument(
         "--multi_process", dest="multi_process", default=1,
         help="The number of cores to use when generating plots"
@@ -2,11 +2,16 @@
 
 import os
 import sys
+import json
+import hashlib
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from astropy.utils.console import ProgressBarOrSpinner
 from astropy.utils.data import download_file, conf, _tempfilestodel
 from pesummary.io import read
+from pesummary.utils.utils import logger, make_dir, FETCH_CACHE
 from tempfile import NamedTemporaryFile
 import tarfile
 
@@ -20,32 +25,424 @@ except ImportError:
     CIECPLIB = False
 
 
-def _unpack_and_extract(path_to_file, filename, path=None):
+def _stream_member(path_to_file, path, outfile, block_size=2**20):
+    """Stream a single file out of a tarball without unpacking, or listing,
+    the rest of the archive. The tarball is read sequentially and reading
+    stops as soon as the requested file has been written
+
+    Parameters
+    ----------
+    path_to_file: str
+        path to the tarball
+    path: str
+        name, or part of the name, of the file you wish to extract
+    outfile: file
+        open file object to write the extracted file to
+    block_size: int, optional
+        number of bytes to copy at a time. Default 1MB
     """
+    _files = []
+    with tarfile.open(path_to_file, "r|*") as tar:
+        for member in tar:
+            _files.append(member.name)
+            if path in member.name and member.isfile():
+                shutil.copyfileobj(
+                    tar.extractfile(member), outfile, length=block_size
+                )
+                return member.name
+    raise ValueError(
+        "Unable to find a file called '{}' in tarball. The list of "
+        "available files are: {}".format(path, ", ".join(_files))
+    )
+
+
+def _unpack_and_extract(path_to_file, filename, path=None):
+    """Unpack a tarball. If `path` is provided, only the first file whose name
+    contains `path` is extracted
+
+    Parameters
+    ----------
+    path_to_file: str
+        path to the tarball
+    filename: str
+        name of the downloaded tarball
+    path: str, optional
+        name, or part of the name, of the file you wish to extract. Default
+        extract all files
     """
     path_to_file = Path(path_to_file)
     if not tarfile.is_tarfile(path_to_file):
         raise ValueError("unable to unpack file")
     outdir = path_to_file.parent
-    tar = tarfile.open(path_to_file, 'r')
-    _files = tar.getnames()
     if path is None:
         print("Extracting all files from {}".format(path_to_file))
-        tar.extractall(path=outdir)
+        with tarfile.open(path_to_file, 'r') as tar:
+            tar.extractall(path=outdir)
         return outdir / Path(filename).stem
-    if not any(path in _file for _file in _files):
-        raise ValueError(
-            "Unable to find a file called '{}' in tarball. The list of "
-            "available files are: {}".format(path, ", ".join(_files))
-        )
-    _path = [_file for _file in _files if path in _file][0]
-    tar.extract(_path, path=outdir)
-    unpacked_file = path_to_file.parent / _path
+    with NamedTemporaryFile(dir=outdir, delete=False) as f:
+        try:
+            _path = _stream_member(path_to_file, path, f)
+        except ValueError:
+            os.remove(f.name)
+            raise
+    unpacked_file = outdir / Path(_path).name
+    shutil.move(f.name, unpacked_file)
     if conf.delete_temporary_downloads_at_exit:
         _tempfilestodel.append(unpacked_file)
     return unpacked_file
 
 
+def _sha256(path, block_size=2**20):
+    """Return the sha256 checksum of a file
+
+    Parameters
+    ----------
+    path: str
+        path to the file
+    block_size: int, optional
+        number of bytes to read at a time. Default 1MB
+    """
+    _hash = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            _hash.update(block)
+    return _hash.hexdigest()
+
+
+def _url_name(url):
+    """Return the name of the file stored at a url
+    """
+    from urllib.parse import urlparse
+
+    return Path(urlparse(url).path).name or "download"
+
+
+class DownloadCache(object):
+    """Content-addressed cache of downloaded files. Each file is stored once,
+    under its sha256 checksum, and an index maps every url to the checksum of
+    its contents. The size and modification time of a cached file are checked
+    before it is returned and the file is re-hashed if either has changed, or
+    every time if `verify=True`. The least recently used files are evicted
+    once the cache exceeds `max_size`. All files are written to a temporary file and moved
+    into place so concurrent downloads, from threads or separate processes,
+    never see a partially written file
+
+    Parameters
+    ----------
+    cache_dir: str, optional
+        directory to store the cache. Default ~/.cache/pesummary/fetch
+    max_size: int, optional
+        maximum size of the cache in bytes. Default 20GB
+    verify: Bool, optional
+        if True, verify the checksum of a cached file each time it is used.
+        Default False
+
+    Attributes
+    ----------
+    hits: int
+        number of urls found in the cache
+    misses: int
+        number of urls which had to be downloaded
+    """
+    def __init__(self, cache_dir=FETCH_CACHE, max_size=20 * 1024**3, verify=False):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.verify = verify
+        self.hits, self.misses = 0, 0
+
+    def __len__(self):
+        return len(self._objects())
+
+    def _index_path(self, url):
+        return os.path.join(
+            self.cache_dir, "index",
+            "{}.json".format(hashlib.sha256(url.encode("utf-8")).hexdigest())
+        )
+
+    def _object_dir(self, checksum):
+        return os.path.join(self.cache_dir, "objects", checksum)
+
+    def _objects(self):
+        """Return the directory of each object stored in the cache
+        """
+        directory = os.path.join(self.cache_dir, "objects")
+        if not os.path.isdir(directory):
+            return []
+        return [os.path.join(directory, _dir) for _dir in os.listdir(directory)]
+
+    def _tempfile(self):
+        """Return an open temporary file in the cache directory
+        """
+        make_dir(os.path.join(self.cache_dir, "tmp"))
+        fd, tmp = tempfile.mkstemp(dir=os.path.join(self.cache_dir, "tmp"))
+        return os.fdopen(fd, "wb"), tmp
+
+    @staticmethod
+    def _size(path):
+        """Return the total size of a file or directory in bytes
+        """
+        if os.path.isfile(path):
+            return os.path.getsize(path)
+        return sum(
+            os.path.getsize(os.path.join(root, _file)) for root, _, files in
+            os.walk(path) for _file in files
+        )
+
+    @property
+    def size(self):
+        """Total size of the files stored in the cache in bytes
+        """
+        return sum(self._size(_dir) for _dir in self._objects())
+
+    def lookup(self, url):
+        """Return the path to the cached copy of a url. None is returned if
+        the url is not cached or if the cached copy fails verification
+
+        Parameters
+        ----------
+        url: str
+            url you wish to look up
+        """
+        index = self._index_path(url)
+        try:
+            with open(index, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        path = os.path.join(self._object_dir(entry["sha256"]), entry["name"])
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        verify = self.verify or (
+            stat.st_size != entry.get("size")
+            or stat.st_mtime_ns != entry.get("mtime")
+        )
+        if verify and _sha256(path) != entry["sha256"]:
+            logger.warning(
+                "Cached copy of {} failed checksum verification. Removing "
+                "from cache".format(url)
+            )
+            shutil.rmtree(self._object_dir(entry["sha256"]), ignore_errors=True)
+            return None
+        os.utime(self._object_dir(entry["sha256"]))
+        return path
+
+    def add(self, url, path, sha256=None, name=None):
+        """Move a local file into the cache and return its new path
+
+        Parameters
+        ----------
+        url: str
+            url, or other unique identifier, of the file
+        path: str
+            path to the local file. The file is moved into the cache
+        sha256: str, optional
+            expected sha256 checksum of the file. A ValueError is raised if
+            the file does not match
+        name: str, optional
+            name of the cached file. Default the name of the file at `url`
+        """
+        checksum = _sha256(path)
+        if sha256 is not None and checksum != sha256.lower():
+            os.remove(path)
+            raise ValueError(
+                "Checksum of the file downloaded from {} ({}) does not match "
+                "the expected checksum ({})".format(url, checksum, sha256)
+            )
+        if name is None:
+            name = _url_name(url)
+        make_dir(self._object_dir(checksum))
+        cached = os.path.join(self._object_dir(checksum), name)
+        if os.path.isfile(cached):
+            os.remove(path)
+        else:
+            f, tmp = self._tempfile()
+            f.close()
+            shutil.move(path, tmp)
+            os.replace(tmp, cached)
+        stat = os.stat(cached)
+        f, tmp = self._tempfile()
+        with f:
+            f.write(
+                json.dumps(
+                    {
+                        "url": url, "sha256": checksum, "name": name,
+                        "size": stat.st_size, "mtime": stat.st_mtime_ns
+                    }
+                ).encode("utf-8")
+            )
+        make_dir(os.path.dirname(self._index_path(url)))
+        os.replace(tmp, self._index_path(url))
+        self.evict(keep=[self._object_dir(checksum)])
+        return cached
+
+    def _stream(
+        self, url, block_size=2**16, timeout=60, show_progress=True,
+        http_headers=None, cache=None
+    ):
+        """Download a url into a temporary file in the cache directory. The
+        `timeout`, `show_progress` and `http_headers` kwargs match those of
+        astropy.utils.data.download_file. The astropy `cache` kwarg is
+        ignored since the file is always stored in the download cache
+        """
+        from io import StringIO
+        from urllib.request import urlopen, Request
+
+        f, tmp = self._tempfile()
+        request = Request(url, headers=http_headers or {})
+        with f, urlopen(request, timeout=timeout) as response:
+            size = int(response.headers.get("content-length", 0))
+            bytes_read = 0
+            dlmsg = "Downloading {}".format(url)
+            _file = sys.stdout if show_progress else StringIO()
+            with ProgressBarOrSpinner(size, dlmsg, file=_file) as p:
+                for block in iter(lambda: response.read(block_size), b""):
+                    f.write(block)
+                    bytes_read += len(block)
+                    p.update(bytes_read)
+        return tmp
+
+    def fetch(self, url, sha256=None, function=None, **kwargs):
+        """Return the path to a cached copy of a url, downloading it if
+        required
+
+        Parameters
+        ----------
+        url: str
+            url you wish to download
+        sha256: str, optional
+            expected sha256 checksum of the file
+        function: func, optional
+            function used to download the url. Must return the path to the
+            downloaded file. Default stream the url with urllib
+        **kwargs: dict, optional
+            all kwargs passed to function
+        """
+        path = self.lookup(url)
+        if path is not None and (
+                sha256 is None or sha256.lower() == Path(path).parent.name
+        ):
+            self.hits += 1
+            return path
+        self.misses += 1
+        if function is None:
+            local = self._stream(url, **kwargs)
+        else:
+            local = function(url, **kwargs)
+        return self.add(url, local, sha256=sha256)
+
+    def fetch_many(self, urls, multi_process=4, **kwargs):
+        """Return the paths to cached copies of a list of urls. Urls which
+        are not cached are downloaded in parallel
+
+        Parameters
+        ----------
+        urls: list
+            list of urls you wish to download
+        multi_process: int, optional
+            maximum number of simultaneous downloads. Default 4
+        **kwargs: dict, optional
+            all kwargs passed to the fetch method
+        """
+        with ThreadPoolExecutor(max_workers=max(multi_process, 1)) as executor:
+            return list(executor.map(lambda url: self.fetch(url, **kwargs), urls))
+
+    def extract(self, path_to_file, path):
+        """Return the path to a cached copy of a single file stored in a
+        tarball. The file is streamed out of the tarball without unpacking
+        the rest of the archive
+
+        Parameters
+        ----------
+        path_to_file: str
+            path to a tarball stored in the cache
+        path: str
+            name, or part of the name, of the file you wish to extract
+        """
+        key = "tar://{}/{}".format(Path(path_to_file).parent.name, path)
+        cached = self.lookup(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+        f, tmp = self._tempfile()
+        try:
+            with f:
+                member = _stream_member(path_to_file, path, f)
+        except ValueError:
+            os.remove(tmp)
+            raise
+        return self.add(key, tmp, name=Path(member).name)
+
+    def extract_all(self, path_to_file):
+        """Unpack a tarball stored in the cache and return the path to the
+        unpacked directory
+
+        Parameters
+        ----------
+        path_to_file: str
+            path to a tarball stored in the cache
+        """
+        path_to_file = Path(path_to_file)
+        unpacked = path_to_file.parent / path_to_file.stem
+        if os.path.isdir(unpacked):
+            return unpacked
+        print("Extracting all files from {}".format(path_to_file))
+        make_dir(os.path.join(self.cache_dir, "tmp"))
+        tmp = tempfile.mkdtemp(dir=os.path.join(self.cache_dir, "tmp"))
+        with tarfile.open(path_to_file, "r") as tar:
+            tar.extractall(path=tmp)
+        try:
+            os.replace(os.path.join(tmp, path_to_file.stem), unpacked)
+        except OSError:
+            if not os.path.isdir(unpacked):
+                raise
+        shutil.rmtree(tmp, ignore_errors=True)
+        return unpacked
+
+    def evict(self, max_size=None, keep=None):
+        """Remove the least recently used files until the size of the cache
+        is below max_size
+
+        Parameters
+        ----------
+        max_size: int, optional
+            maximum size of the cache in bytes. Default self.max_size
+        keep: list, optional
+            list of object directories which should not be removed
+        """
+        if max_size is None:
+            max_size = self.max_size
+        if keep is None:
+            keep = []
+        objects = []
+        for _dir in self._objects():
+            try:
+                objects.append((os.path.getmtime(_dir), self._size(_dir), _dir))
+            except OSError:
+                continue
+        total = sum(_object[1] for _object in objects)
+        for mtime, size, _dir in sorted(objects):
+            if total <= max_size:
+                break
+            if _dir in keep:
+                continue
+            logger.debug("Removing {} from the download cache".format(_dir))
+            shutil.rmtree(_dir, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Remove all files from the cache
+        """
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self.hits, self.misses = 0, 0
+
+
+DOWNLOAD_CACHE = DownloadCache()
+_STREAM_KWARGS = ["timeout", "show_progress", "http_headers", "cache"]
+
+
 def _scp_file(path):
     """Secure copy a file from a server
 
@@ -115,10 +512,60 @@ def _download_file(url, unpack=False, path=None, **kwargs):
     return download_file(url, **kwargs)
 
 
+def _copy_to_outdir(local, outdir, delete_on_exit=True):
+    """Copy a cached file, or directory, to outdir
+    """
+    filename = Path(local).name
+    new_name = Path(outdir) / filename
+    if os.path.exists(new_name):
+        new_name = Path(outdir) / (
+            Path(NamedTemporaryFile().name).name + "_" + filename
+        )
+    if os.path.isdir(local):
+        shutil.copytree(local, new_name)
+    else:
+        shutil.copy(local, new_name)
+    if delete_on_exit:
+        _tempfilestodel.append(new_name)
+    return new_name
+
+
+def _download_and_read_cached_file(
+    url, download_kwargs={}, read_file=True, delete_on_exit=True, outdir=None,
+    unpack=False, path=None, _function=_download_file, sha256=None,
+    cache=DOWNLOAD_CACHE, **kwargs
+):
+    """Download a url into the download cache and read the cached file with
+    the pesummary.io.read function. See `download_and_read_file`
+    """
+    function = _function
+    if _function is _download_file:
+        download_kwargs = download_kwargs.copy()
+        if set(download_kwargs.keys()).issubset(_STREAM_KWARGS):
+            function = None
+        else:
+            # the file is moved into the download cache so astropy must not
+            # keep its own copy
+            download_kwargs["cache"] = False
+    local = cache.fetch(url, sha256=sha256, function=function, **download_kwargs)
+    if unpack:
+        if not tarfile.is_tarfile(local):
+            raise ValueError("unable to unpack file")
+        if path is None:
+            local = cache.extract_all(local)
+        else:
+            local = cache.extract(local, path)
+    if outdir is not None:
+        local = _copy_to_outdir(local, outdir, delete_on_exit=delete_on_exit)
+    if not read_file:
+        return Path(local)
+    return read(local, **kwargs)
+
+
 def download_and_read_file(
     url, download_kwargs={}, read_file=True, delete_on_exit=True, outdir=None,
-    unpack=False, path=None, _function=_download_file,
-    **kwargs
+    unpack=False, path=None, _function=_download_file, cache=True,
+    sha256=None, **kwargs
 ):
     """Downloads a URL and reads the file with pesummary.io.read function
 
@@ -132,13 +579,34 @@ def download_and_read_file(
         if True, read the downloaded file and return the opened object.
         if False, return the path to the downloaded file. Default True
     delete_on_exit: Bool, optional
-        if True, delete the file on exit. Default True
+        if True, delete the file on exit. Default True. Files stored in the
+        download cache are never deleted on exit; only copies saved to
+        outdir are
     outdir: str, optional
         save the file to outdir. Default the default directory from
-        tmpfile.NamedTemporaryFile
+        tmpfile.NamedTemporaryFile, or the download cache if cache=True
+    unpack: Bool, optional
+        if True, unpack the downloaded tarball. Default False
+    path: str, optional
+        name, or part of the name, of a single file to extract from the
+        tarball. Only used if unpack=True. Default extract all files
+    cache: Bool/DownloadCache, optional
+        if True, store the downloaded file in the download cache and reuse it
+        in future. A DownloadCache object may also be provided. Default True
+    sha256: str, optional
+        expected sha256 checksum of the downloaded file. Only used if
+        cache=True
     **kwargs: dict, optional
         additional kwargs passed to pesummary.io.read function
     """
+    if isinstance(cache, DownloadCache) or cache:
+        return _download_and_read_cached_file(
+            url, download_kwargs=download_kwargs, read_file=read_file,
+            delete_on_exit=delete_on_exit, outdir=outdir, unpack=unpack,
+            path=path, _function=_function, sha256=sha256,
+            cache=cache if isinstance(cache, DownloadCache) else DOWNLOAD_CACHE,
+            **kwargs
+        )
     conf.delete_temporary_downloads_at_exit = delete_on_exit
     local = _function(url, **download_kwargs)
     filename = Path(url).name
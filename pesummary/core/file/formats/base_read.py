@@ -12,13 +12,61 @@ from pesummary.utils.utils import logger
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
 
+def _columnar_samples(parameters, samples):
+    """Return the parameters and a 2d array of posterior samples. This is the
+    ingestion contract for all readers: posterior samples should be passed as
+    either a dictionary of arrays keyed by parameter or a 2d float array with
+    shape (nsamples, nparameters). Samples passed as a dictionary are stacked
+    so that each column is contiguous in memory
+
+    Parameters
+    ----------
+    parameters: list
+        list of parameters. If `samples` is a dictionary, `parameters` gives
+        the order of the columns. If None, the keys of `samples` are used
+    samples: dict/np.ndarray
+        either a dictionary of samples keyed by parameter or a 2d array of
+        samples where the columns correspond to a given parameter
+    """
+    if isinstance(samples, dict):
+        if parameters is None:
+            parameters = list(samples.keys())
+        if not len(parameters):
+            return parameters, np.zeros((0, 0))
+        return parameters, np.array(
+            [np.asarray(samples[param], dtype=float) for param in parameters]
+        ).T
+    samples = np.asarray(samples, dtype=float)
+    if samples.ndim == 1:
+        samples = samples.reshape(-1, len(parameters))
+    return parameters, samples
+
+
+def _append_columns(samples, columns):
+    """Return a 2d array of posterior samples with additional columns
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        2d array of samples where the columns correspond to a given parameter
+    columns: list
+        list of columns to append. A float is broadcast to every sample
+    """
+    samples = np.asarray(samples, dtype=float)
+    columns = [
+        np.broadcast_to(np.asarray(column, dtype=float), (len(samples),)) for
+        column in columns
+    ]
+    return np.array(list(samples.T) + columns).T
+
+
 def _downsample(samples, number, extra_kwargs=None):
     """Downsample a posterior table
 
     Parameters
     ----------
-    samples: 2d list
-        list of posterior samples where the columns correspond to a given
+    samples: np.ndarray
+        2d array of posterior samples where the columns correspond to a given
         parameter
     number: int
         number of posterior samples you wish to downsample to
@@ -38,10 +86,10 @@ def _downsample(samples, number, extra_kwargs=None):
         )
     _samples = np.array(resample_posterior_distribution(_samples, number))
     if extra_kwargs is None:
-        return _samples.T.tolist()
+        return _samples.T
     _extra_kwargs = copy.deepcopy(extra_kwargs)
     _extra_kwargs["sampler"]["nsamples"] = number
-    return _samples.T.tolist(), _extra_kwargs
+    return _samples.T, _extra_kwargs
 
 
 class Read(object):
@@ -58,8 +106,8 @@ class Read(object):
     ----------
     parameters: list
         list of parameters stored in the result file
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file keyed by parameters
     input_version: str
@@ -133,14 +181,10 @@ class Read(object):
         remove: Bool, optional
             if True, remove samples with log_likelihood='nan' from samples
         """
-        import math
         if "log_likelihood" not in parameters:
             return parameters, samples
         ind = parameters.index("log_likelihood")
-        likelihoods = np.array(samples).T[ind]
-        inds = np.array(
-            [math.isnan(_) for _ in likelihoods], dtype=bool
-        )
+        inds = np.isnan(np.asarray(samples, dtype=float)[:, ind])
         if not sum(inds):
             return parameters, samples
         msg = (
@@ -148,7 +192,7 @@ class Read(object):
         )
         if remove:
             msg += "Removing samples from posterior table."
-            samples = np.array(samples)[~inds].tolist()
+            samples = np.asarray(samples)[~inds]
         else:
             msg += "This may cause problems when analysing posterior samples."
         logger.warning(msg.format(sum(inds)))
@@ -171,7 +215,7 @@ class Read(object):
                 parameters.index("weights") if "weights" in parameters else
                 parameters.index("weight")
             )
-            return Array(np.array(samples).T[ind])
+            return Array(np.asarray(samples)[:, ind])
         return None
 
     @property
@@ -261,6 +305,7 @@ class Read(object):
         self.data = _data
         if _data is None:
             self.data = self._load(function, **kwargs)
+        self._columnar_data(self.data)
         if isinstance(self.data["parameters"][0], list):
             _cls = MultiAnalysisParameters
         else:
@@ -303,6 +348,45 @@ class Read(object):
         if self.weights is None:
             self.weights = self.check_for_weights(self.parameters, self.samples)
 
+    @staticmethod
+    def _columnar_data(data):
+        """Convert the posterior samples returned by a reader to 2d arrays
+        in place. See `pesummary.core.file.formats.base_read._columnar_samples`
+        for the accepted formats
+
+        Parameters
+        ----------
+        data: dict
+            dictionary containing the 'parameters' and 'samples' returned by
+            a reader
+        """
+        parameters, samples = data["parameters"], data["samples"]
+        if isinstance(samples, dict) and parameters is None:
+            parameters = list(samples.keys())
+        mcmc = data.get("mcmc_samples", False)
+        if len(parameters) and isinstance(parameters[0], list):
+            _samples = []
+            for _parameters, _analysis in zip(parameters, samples):
+                if mcmc:
+                    _samples.append([
+                        _columnar_samples(_parameters, chain)[1] for chain in
+                        _analysis
+                    ])
+                else:
+                    _samples.append(
+                        _columnar_samples(_parameters, _analysis)[1]
+                    )
+            data["parameters"], data["samples"] = parameters, _samples
+        elif mcmc:
+            data["samples"] = [
+                _columnar_samples(parameters, chain)[1] for chain in samples
+            ]
+        else:
+            data["parameters"], data["samples"] = _columnar_samples(
+                parameters, samples
+            )
+        return data
+
     @staticmethod
     def extension_from_path(path):
         """Return the extension of the file from the file path
@@ -591,8 +675,8 @@ class SingleAnalysisRead(Read):
     ----------
     parameters: list
         list of parameters stored in the file
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file
     input_version: str
@@ -650,7 +734,9 @@ class SingleAnalysisRead(Read):
             function you wish to use to extract the information from the
             configuration file
         """
-        self.data[0], self.data[1] = function(self.parameters, self.samples, config_file)
+        self.parameters, self.samples = function(
+            self.parameters, self.samples, config_file
+        )
 
     def _add_marginalized_parameters_from_config_file(self, config_file, function):
         """Search the configuration file and add marginalized parameters to the
@@ -664,7 +750,9 @@ class SingleAnalysisRead(Read):
             function you wish to use to extract the information from the
             configuration file
         """
-        self.data[0], self.data[1] = function(self.parameters, self.samples, config_file)
+        self.parameters, self.samples = function(
+            self.parameters, self.samples, config_file
+        )
 
     def to_latex_table(self, parameter_dict=None, save_to_file=None):
         """Make a latex table displaying the data in the result file.
@@ -745,19 +833,30 @@ class SingleAnalysisRead(Read):
         """
         return self.write(file_format="dat", **kwargs)
 
-    def reweight_samples(self, function, **kwargs):
+    def reweight_samples(self, function, mode="rejection", **kwargs):
         """Reweight the posterior and/or prior samples according to a new prior
+
+        Parameters
+        ----------
+        function: func/str
+            function to use when reweighting
+        mode: str, optional
+            either 'rejection' to resample the posterior with rejection
+            sampling or 'weights' to keep all samples and store importance
+            weights. Default 'rejection'
         """
         if self.mcmc_samples:
             return ValueError("Cannot currently reweight MCMC chains")
         _samples = self.samples_dict
-        new_samples = _samples.reweight(function, **kwargs)
+        new_samples = _samples.reweight(function, mode=mode, **kwargs)
         self.parameters = Parameters(new_samples.parameters)
         self.samples = np.array(new_samples.samples).T
+        self.weights = self.check_for_weights(self.parameters, self.samples)
         self.extra_kwargs["sampler"].update(
             {
                 "nsamples": new_samples.number_of_samples,
-                "nsamples_before_reweighting": _samples.number_of_samples
+                "nsamples_before_reweighting": _samples.number_of_samples,
+                "effective_sample_size": new_samples.effective_sample_size
             }
         )
         self.extra_kwargs["meta_data"]["reweighting"] = function
@@ -768,7 +867,9 @@ class SingleAnalysisRead(Read):
         prior_samples = self.priors["samples"]
         if not len(prior_samples):
             return
-        new_prior_samples = prior_samples.reweight(function, **kwargs)
+        new_prior_samples = prior_samples.reweight(
+            function, mode=mode, **kwargs
+        )
         self.priors["samples"] = new_prior_samples
 
 
@@ -786,8 +887,9 @@ class MultiAnalysisRead(Read):
     ----------
     parameters: 2d list
         list of parameters for each analysis
-    samples: 3d list
-        list of samples stored in the result file for each analysis
+    samples: list
+        list of 2d arrays of samples stored in the result file for each
+        analysis
     samples_dict: dict
         dictionary of samples stored in the result file keyed by analysis label
     input_version: str
@@ -1052,28 +1154,43 @@ class MultiAnalysisRead(Read):
             with open(save_to_file, "w") as f:
                 f.writelines([macros])
 
-    def reweight_samples(self, function, labels=None, **kwargs):
+    def reweight_samples(
+        self, function, labels=None, mode="rejection", **kwargs
+    ):
         """Reweight the posterior and/or prior samples according to a new prior
 
         Parameters
         ----------
+        function: func/str
+            function to use when reweighting
         labels: list, optional
             list of analyses you wish to reweight. Default reweight all
             analyses
+        mode: str, optional
+            either 'rejection' to resample the posterior with rejection
+            sampling or 'weights' to keep all samples and store importance
+            weights. Default 'rejection'
         """
         _samples_dict = self.samples_dict
         for idx, label in enumerate(self.labels):
             if labels is not None and label not in labels:
                 continue
-            new_samples = _samples_dict[label].reweight(function, **kwargs)
+            new_samples = _samples_dict[label].reweight(
+                function, mode=mode, **kwargs
+            )
             self.parameters[idx] = Parameters(new_samples.parameters)
             self.samples[idx] = np.array(new_samples.samples).T
+            if isinstance(getattr(self, "weights", None), dict):
+                self.weights[label] = self.check_for_weights(
+                    self.parameters[idx], self.samples[idx]
+                )
             self.extra_kwargs[idx]["sampler"].update(
                 {
                     "nsamples": new_samples.number_of_samples,
                     "nsamples_before_reweighting": (
                         _samples_dict[label].number_of_samples
-                    )
+                    ),
+                    "effective_sample_size": new_samples.effective_sample_size
                 }
             )
             self.extra_kwargs[idx]["meta_data"]["reweighting"] = function
@@ -1084,5 +1201,7 @@ class MultiAnalysisRead(Read):
             prior_samples = self.priors["samples"][label]
             if not len(prior_samples):
                 continue
-            new_prior_samples = prior_samples.reweight(function, **kwargs)
+            new_prior_samples = prior_samples.reweight(
+                function, mode=mode, **kwargs
+            )
             self.priors["samples"][label] = new_prior_samples
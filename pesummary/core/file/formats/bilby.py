@@ -1,11 +1,12 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
 import os
+from collections import OrderedDict
 import numpy as np
 from pesummary.core.file.formats.base_read import SingleAnalysisRead
-from pesummary.core.plots.latex_labels import latex_labels
+from pesummary.core.latex_labels import latex_labels
 from pesummary import conf
-from pesummary.utils.utils import logger
+from pesummary.utils.utils import logger, make_dir, PRIOR_CACHE
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
@@ -60,7 +61,7 @@ def read_bilby(
     # Drop all non numeric bilby data outputs
     posterior = posterior.select_dtypes(include=[float, int])
     parameters = list(posterior.keys())
-    samples = posterior.to_numpy().real
+    samples = {param: np.real(posterior[param].to_numpy()) for param in parameters}
     injection = bilby_object.injection_parameters
     if injection is None:
         injection = {i: j for i, j in zip(
@@ -86,7 +87,7 @@ def read_bilby(
         extra_kwargs = _bilby_class.grab_extra_kwargs(bilby_object)
     except Exception:
         extra_kwargs = {"sampler": {}, "meta_data": {}}
-    extra_kwargs["sampler"]["nsamples"] = len(samples)
+    extra_kwargs["sampler"]["nsamples"] = len(posterior)
     extra_kwargs["sampler"]["pe_algorithm"] = "bilby"
     try:
         version = bilby_object.version
@@ -97,7 +98,7 @@ def read_bilby(
 
     data = {
         "parameters": parameters,
-        "samples": samples.tolist(),
+        "samples": samples,
         "injection": injection,
         "version": version,
         "kwargs": extra_kwargs
@@ -110,9 +111,10 @@ def read_bilby(
     if not disable_prior:
         logger.debug("Drawing prior samples from bilby result file")
         if nsamples_for_prior is None:
-            nsamples_for_prior = len(samples)
+            nsamples_for_prior = len(posterior)
         prior_samples = Bilby.grab_priors(
-            bilby_object, nsamples=nsamples_for_prior
+            bilby_object, nsamples=nsamples_for_prior,
+            parameters=list(posterior.keys())
         )
         data["prior"] = {"samples": prior_samples}
         if len(prior_samples):
@@ -275,7 +277,375 @@ def config_from_object(bilby_object):
     return config
 
 
-def prior_samples_from_file(path, cls="PriorDict", nsamples=5000, **kwargs):
+class PriorSampleCache(object):
+    """Least recently used cache of samples drawn from a `bilby` prior
+    dictionary. Draws are keyed by a canonical hash of the prior dictionary,
+    the number of draws and the random seed, and are stored both in memory
+    and on disk so that repeated invocations and multiple analyses which share
+    a prior skip the draw. A fixed number of samples, `ndraws`, is drawn and
+    sliced to the requested length, so runs with posteriors of different
+    lengths share a draw. If every prior in the dictionary is independent,
+    only the requested parameters are drawn and each parameter is cached
+    separately. Otherwise (constraints, conditional or joint priors) the full
+    dictionary is drawn at once. The least recently used draws are removed
+    from disk once the cache exceeds `max_size`
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        maximum number of prior dictionaries to store in memory. Default 16
+    cache_dir: str, optional
+        directory to store the cached draws. If None, draws are only cached in
+        memory. Default ~/.cache/pesummary/prior
+    ndraws: int, optional
+        number of samples drawn for each prior dictionary. Requests for more
+        samples draw the smallest power of two multiple of `ndraws` which is
+        large enough. Default 5000
+    max_size: int, optional
+        maximum size of the draws stored on disk in bytes. Default 1GB
+
+    Attributes
+    ----------
+    hits: int
+        number of parameters found in the cache
+    misses: int
+        number of parameters which had to be drawn
+    """
+    def __init__(
+        self, maxsize=16, cache_dir=PRIOR_CACHE, ndraws=5000,
+        max_size=1024**3
+    ):
+        self.maxsize = maxsize
+        self.cache_dir = cache_dir
+        self.ndraws = ndraws
+        self.max_size = max_size
+        self.clear()
+
+    def clear(self):
+        """Remove all draws from the in-memory cache. Draws stored on disk are
+        not removed
+        """
+        self._cache = OrderedDict()
+        self.hits, self.misses = 0, 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def _ndraws(self, nsamples):
+        """Return the number of samples to draw for a given request
+        """
+        ndraws = self.ndraws
+        while ndraws < nsamples:
+            ndraws *= 2
+        return ndraws
+
+    @classmethod
+    def _canonical(cls, value):
+        """Return a json serializable representation of a prior, or one of
+        its arguments. Arrays are hashed in full and functions are
+        represented by their qualified name
+        """
+        import hashlib
+        import re
+
+        if isinstance(value, np.ndarray):
+            return {
+                "dtype": str(value.dtype), "shape": list(value.shape),
+                "sha256": hashlib.sha256(
+                    np.ascontiguousarray(value).tobytes()
+                ).hexdigest()
+            }
+        if isinstance(value, dict):
+            return {
+                str(key): cls._canonical(item) for key, item in value.items()
+            }
+        if isinstance(value, (list, tuple)):
+            return [cls._canonical(item) for item in value]
+        if value is None or isinstance(value, (str, bool)):
+            return value
+        if isinstance(value, (int, float, np.integer, np.floating)):
+            return float(value)
+        if hasattr(value, "get_instantiation_dict"):
+            canonical = {
+                "class": "{}.{}".format(
+                    type(value).__module__, type(value).__qualname__
+                ),
+                "kwargs": cls._canonical(value.get_instantiation_dict())
+            }
+            # priors read from file, e.g. bilby.core.prior.FromFile, only
+            # store the file name in their instantiation dict
+            for attr in ["xx", "yy"]:
+                if hasattr(value, attr):
+                    canonical[attr] = cls._canonical(
+                        np.asarray(getattr(value, attr))
+                    )
+            return canonical
+        if callable(value) and hasattr(value, "__qualname__"):
+            return "{}.{}".format(
+                getattr(value, "__module__", None), value.__qualname__
+            )
+        # reprs may contain memory addresses which change between invocations
+        return re.sub(r" at 0x[0-9a-fA-F]+", "", repr(value))
+
+    @classmethod
+    def key(cls, prior, nsamples, seed=None):
+        """Return a canonical hash of a prior dictionary, the number of
+        samples and the random seed
+
+        Parameters
+        ----------
+        prior: bilby.core.prior.PriorDict
+            prior dictionary you wish to draw samples from
+        nsamples: int
+            number of samples to draw
+        seed: int, optional
+            random seed used for the draw. Default None
+        """
+        import hashlib
+        import json
+
+        return hashlib.sha256(
+            json.dumps(
+                {
+                    "class": type(prior).__name__,
+                    "priors": {
+                        key: cls._canonical(item) for key, item in
+                        prior.items()
+                    },
+                    "conversion_function": cls._canonical(
+                        getattr(prior, "conversion_function", None)
+                    ),
+                    "nsamples": int(nsamples),
+                    "seed": seed if seed is None else int(seed)
+                }, sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()
+
+    @staticmethod
+    def _independent(prior):
+        """Return True if every prior in a prior dictionary can be drawn
+        independently of the others
+        """
+        from bilby.core.prior import Constraint, JointPrior
+
+        return not any(
+            isinstance(item, (Constraint, JointPrior)) or
+            hasattr(item, "condition_func") for item in prior.values()
+        )
+
+    def _path(self, key, param):
+        return os.path.join(self.cache_dir, key, "{}.npy".format(param))
+
+    def _read(self, key, param):
+        """Return the samples for a parameter stored on disk. None is returned
+        if the samples are not stored or can not be read
+        """
+        if self.cache_dir is None:
+            return None
+        path = self._path(key, param)
+        if not os.path.isfile(path):
+            return None
+        try:
+            samples = np.load(path)
+            # mark the draw as recently used
+            os.utime(os.path.join(self.cache_dir, key))
+            return samples
+        except Exception as e:
+            logger.debug(
+                "Unable to read cached prior samples '{}' because {}".format(
+                    path, e
+                )
+            )
+            return None
+
+    def _write(self, key, samples):
+        """Store samples on disk. Each parameter is written to a temporary file
+        and moved into place so that concurrent jobs never read a partially
+        written file
+        """
+        import tempfile
+
+        if self.cache_dir is None:
+            return
+        try:
+            make_dir(os.path.join(self.cache_dir, key))
+            for param, value in samples.items():
+                fd, tmp = tempfile.mkstemp(
+                    dir=os.path.join(self.cache_dir, key), suffix=".tmp"
+                )
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, np.asarray(value))
+                os.replace(tmp, self._path(key, param))
+        except OSError as e:
+            logger.debug("Unable to cache prior samples because {}".format(e))
+        self.evict(keep=[os.path.join(self.cache_dir, key)])
+
+    def evict(self, max_size=None, keep=None):
+        """Remove the least recently used draws from disk until the size of
+        the cache is below max_size
+
+        Parameters
+        ----------
+        max_size: int, optional
+            maximum size of the cache in bytes. Default self.max_size
+        keep: list, optional
+            list of draw directories which should not be removed
+        """
+        import shutil
+
+        if self.cache_dir is None or not os.path.isdir(self.cache_dir):
+            return
+        if max_size is None:
+            max_size = self.max_size
+        if keep is None:
+            keep = []
+        draws = []
+        for _dir in os.listdir(self.cache_dir):
+            _dir = os.path.join(self.cache_dir, _dir)
+            try:
+                size = sum(
+                    os.path.getsize(os.path.join(_dir, _file)) for _file in
+                    os.listdir(_dir)
+                )
+                draws.append((os.path.getmtime(_dir), size, _dir))
+            except OSError:
+                continue
+        total = sum(_draw[1] for _draw in draws)
+        for mtime, size, _dir in sorted(draws):
+            if total <= max_size:
+                break
+            if _dir in keep:
+                continue
+            logger.debug("Removing {} from the prior cache".format(_dir))
+            shutil.rmtree(_dir, ignore_errors=True)
+            total -= size
+
+    @staticmethod
+    def _draw(prior, nsamples, parameters=None, seed=None):
+        """Draw samples from a prior dictionary without changing the global
+        random state
+        """
+        if seed is not None:
+            state = np.random.get_state()
+            np.random.seed(seed)
+        try:
+            if parameters is None:
+                return prior.sample(size=nsamples)
+            return prior.sample_subset(keys=parameters, size=nsamples)
+        finally:
+            if seed is not None:
+                np.random.set_state(state)
+
+    @staticmethod
+    def _parameter_seed(seed, param):
+        """Return a seed for a single parameter which does not depend on the
+        other parameters being drawn
+        """
+        import hashlib
+
+        if seed is None:
+            return None
+        return int(
+            hashlib.sha256("{}:{}".format(seed, param).encode("utf-8")).hexdigest(),
+            16
+        ) % 2**32
+
+    def sample(self, prior, nsamples, parameters=None, seed=None):
+        """Return a dictionary of samples drawn from a prior dictionary,
+        drawing only what is not already cached
+
+        Parameters
+        ----------
+        prior: bilby.core.prior.PriorDict
+            prior dictionary you wish to draw samples from
+        nsamples: int
+            number of samples to draw
+        parameters: list, optional
+            parameters you wish to draw samples for. Default all parameters
+            in the prior dictionary
+        seed: int, optional
+            random seed used for the draw. Default None
+        """
+        from bilby.core.prior import Constraint
+
+        prior.convert_floats_to_delta_functions()
+        ndraws = self._ndraws(nsamples)
+        key = self.key(prior, ndraws, seed=seed)
+        keys = [
+            param for param, item in prior.items() if not
+            isinstance(item, Constraint)
+        ]
+        if parameters is not None:
+            keys = [param for param in keys if param in parameters]
+        if key in self._cache.keys():
+            self._cache.move_to_end(key)
+        else:
+            self._cache[key] = {}
+            if len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        cached = self._cache[key]
+        for param in keys:
+            if param not in cached.keys():
+                _samples = self._read(key, param)
+                if _samples is not None:
+                    cached[param] = _samples
+        missing = [param for param in keys if param not in cached.keys()]
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if len(missing) and self._independent(prior):
+            drawn = {
+                param: self._draw(
+                    prior, ndraws, parameters=[param],
+                    seed=self._parameter_seed(seed, param)
+                )[param] for param in missing
+            }
+        elif len(missing):
+            drawn = self._draw(prior, ndraws, seed=seed)
+        else:
+            drawn = {}
+        if len(drawn):
+            drawn = {param: np.asarray(value) for param, value in drawn.items()}
+            cached.update(drawn)
+            self._write(key, drawn)
+        return {
+            param: np.array(cached[param][:int(nsamples)]) for param in keys
+        }
+
+
+PRIOR_SAMPLE_CACHE = PriorSampleCache()
+
+
+def _draw_prior_samples(prior, nsamples, parameters=None, seed=None, cache=True):
+    """Draw samples from a bilby prior dictionary, using the prior sample
+    cache if requested
+
+    Parameters
+    ----------
+    prior: bilby.core.prior.PriorDict
+        prior dictionary you wish to draw samples from
+    nsamples: int
+        number of samples to draw
+    parameters: list, optional
+        parameters you wish to draw samples for. Default all parameters
+    seed: int, optional
+        random seed used for the draw. Default None
+    cache: Bool, optional
+        if True, use the prior sample cache. Default True
+    """
+    if cache:
+        return PRIOR_SAMPLE_CACHE.sample(
+            prior, nsamples, parameters=parameters, seed=seed
+        )
+    samples = PriorSampleCache._draw(prior, nsamples, seed=seed)
+    if parameters is None:
+        return samples
+    return {key: item for key, item in samples.items() if key in parameters}
+
+
+def prior_samples_from_file(
+    path, cls="PriorDict", nsamples=5000, parameters=None, seed=None,
+    cache=True, **kwargs
+):
     """Return a dict of prior samples from a `bilby` prior file
 
     Parameters
@@ -286,17 +656,28 @@ def prior_samples_from_file(path, cls="PriorDict", nsamples=5000, **kwargs):
         class you wish to read in the prior file
     nsamples: int, optional
         number of samples to draw from a prior file. Default 5000
+    parameters: list, optional
+        parameters you wish to draw samples for. Default all parameters
+    seed: int, optional
+        random seed used for the draw. Default None
+    cache: Bool, optional
+        if True, reuse previous draws from the same prior. Default True
     """
     from bilby.core import prior
 
     if isinstance(cls, str):
         cls = getattr(prior, cls)
     _prior = cls(filename=path)
-    samples = _prior.sample(size=nsamples)
+    samples = _draw_prior_samples(
+        _prior, nsamples, parameters=parameters, seed=seed, cache=cache
+    )
     return _bilby_prior_dict_to_pesummary_samples_dict(samples, prior=_prior)
 
 
-def prior_samples_from_bilby_object(bilby_object, nsamples=5000, **kwargs):
+def prior_samples_from_bilby_object(
+    bilby_object, nsamples=5000, parameters=None, seed=None, cache=True,
+    **kwargs
+):
     """Return a dict of prior samples from a `bilby.core.result.Result`
     object
 
@@ -306,8 +687,17 @@ def prior_samples_from_bilby_object(bilby_object, nsamples=5000, **kwargs):
         a bilby.core.result.Result object you wish to draw prior samples from
     nsamples: int, optional
         number of samples to draw from a prior file. Default 5000
+    parameters: list, optional
+        parameters you wish to draw samples for. Default all parameters
+    seed: int, optional
+        random seed used for the draw. Default None
+    cache: Bool, optional
+        if True, reuse previous draws from the same prior. Default True
     """
-    samples = bilby_object.priors.sample(size=nsamples)
+    samples = _draw_prior_samples(
+        bilby_object.priors, nsamples, parameters=parameters, seed=seed,
+        cache=cache
+    )
     return _bilby_prior_dict_to_pesummary_samples_dict(
         samples, prior=bilby_object.priors
     )
@@ -376,12 +766,12 @@ class Bilby(SingleAnalysisRead):
         self.load(self._grab_data_from_bilby_file, **kwargs)
 
     @staticmethod
-    def grab_priors(bilby_object, nsamples=5000):
+    def grab_priors(bilby_object, nsamples=5000, parameters=None):
         """Draw samples from the prior functions stored in the bilby file
         """
         try:
             return prior_samples_from_bilby_object(
-                bilby_object, nsamples=nsamples
+                bilby_object, nsamples=nsamples, parameters=parameters
             )
         except Exception as e:
             logger.info("Failed to draw prior samples because {}".format(e))
@@ -0,0 +1,171 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import os
+import pickle
+import struct
+import hashlib
+from pesummary.utils.utils import logger
+from pesummary.core.file.formats.pickle import read_pickle
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+__doc__ = """Append-only checkpoint files. A checkpoint file starts with a
+header followed by a base snapshot of the object being checkpointed. Small
+records are then appended to the end of the file as the object is updated.
+Each record is stored as its length, its sha256 checksum and the pickled
+record. Records are written with an fsync so that a checkpoint file is never
+left in an inconsistent state; if the final record is incomplete or its
+checksum does not match, it is ignored when the file is read"""
+
+MAGIC = b"PESUMMARY-CHECKPOINT-1\n"
+_RECORD_HEADER = struct.Struct("<Q32s")
+
+
+def _encode_record(obj):
+    """Return a record ready to be written to a checkpoint file
+
+    Parameters
+    ----------
+    obj: object
+        object you wish to store in the record
+    """
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    return _RECORD_HEADER.pack(
+        len(payload), hashlib.sha256(payload).digest()
+    ) + payload
+
+
+def _fsync_directory(path):
+    """Flush the directory entry for a file to disk
+
+    Parameters
+    ----------
+    path: str
+        path to a file in the directory you wish to flush
+    """
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def is_checkpoint_log(path):
+    """Return True if a file is an append-only checkpoint file
+
+    Parameters
+    ----------
+    path: str
+        path to the file you wish to check
+    """
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def write_checkpoint(obj, path):
+    """Write a base snapshot of an object to a new checkpoint file. The
+    snapshot is written to a temporary file and moved into place so an
+    existing checkpoint file is only replaced once the snapshot is on disk
+
+    Parameters
+    ----------
+    obj: object
+        object you wish to checkpoint
+    path: str
+        path to the checkpoint file
+    """
+    tmp = "{}.tmp".format(path)
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(_encode_record(obj))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_directory(path)
+
+
+def append_to_checkpoint(path, method, *args):
+    """Append a record to an existing checkpoint file. When the checkpoint
+    file is read, `method` is called on the snapshot with `args`
+
+    Parameters
+    ----------
+    path: str
+        path to the checkpoint file
+    method: str
+        name of the method to call on the snapshot when replaying the record
+    *args: tuple
+        arguments to pass to `method` when replaying the record
+    """
+    with open(path, "ab") as f:
+        f.write(_encode_record((method, args)))
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def iterate_checkpoint(path):
+    """Iterate over the records stored in a checkpoint file. The first record
+    is the base snapshot. Iteration stops at the first incomplete or corrupted
+    record
+
+    Parameters
+    ----------
+    path: str
+        path to the checkpoint file
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(
+                "{} is not a pesummary checkpoint file".format(path)
+            )
+        while True:
+            header = f.read(_RECORD_HEADER.size)
+            if not len(header):
+                return
+            if len(header) < _RECORD_HEADER.size:
+                logger.warning(
+                    "Ignoring incomplete record at the end of the checkpoint "
+                    "file {}".format(path)
+                )
+                return
+            length, checksum = _RECORD_HEADER.unpack(header)
+            payload = f.read(length)
+            if len(payload) < length or (
+                    hashlib.sha256(payload).digest() != checksum
+            ):
+                logger.warning(
+                    "Ignoring corrupted record at the end of the checkpoint "
+                    "file {}".format(path)
+                )
+                return
+            yield pickle.loads(payload)
+
+
+def read_checkpoint(path):
+    """Read a checkpoint file and return the checkpointed object after
+    replaying all appended records. Pickle files written by older versions
+    of pesummary are also supported
+
+    Parameters
+    ----------
+    path: str
+        path to the checkpoint file
+    """
+    if not is_checkpoint_log(path):
+        return read_pickle(path)
+    records = iterate_checkpoint(path)
+    state = next(records, None)
+    if state is None:
+        raise ValueError("No snapshot found in checkpoint file {}".format(path))
+    nrecords = 0
+    for method, args in records:
+        getattr(state, method)(*args)
+        nrecords += 1
+    logger.debug(
+        "Replayed {} records from checkpoint file {}".format(nrecords, path)
+    )
+    return state
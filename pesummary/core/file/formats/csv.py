@@ -5,15 +5,18 @@ from pesummary.core.file.formats.dat import read_dat, _write_dat
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
 
-def read_csv(path):
+def read_csv(path, nthreads=None):
     """Grab the parameters and samples in a .csv file
 
     Parameters
     ----------
     path: str
         path to the result file you wish to read in
+    nthreads: int, optional
+        number of threads to use when parsing the file. Default the number of
+        available CPUs
     """
-    return read_dat(path, delimiter=",")
+    return read_dat(path, delimiter=",", nthreads=nthreads)
 
 
 def _write_csv(
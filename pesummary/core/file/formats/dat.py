@@ -1,20 +1,221 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
+import io
+import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from pesummary import conf
 from pesummary.utils.utils import logger, check_filename
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
+DEFAULT_CHUNK_BYTES = 64 * 1024 ** 2
 
-def read_dat(path, delimiter=None):
-    """Grab the parameters and samples in a .dat file
+
+def _text_header(path, delimiter=None):
+    """Return the parameters stored in the header of a text file and the byte
+    offset of the first row of samples. The header is parsed with
+    `np.genfromtxt` so that the parameter names match those returned by
+    `genfromtxt(..., names=True)`
+
+    Parameters
+    ----------
+    path: str
+        path to the text file
+    delimiter: str, optional
+        delimiter used in the text file. Default any whitespace
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        offset = f.tell()
+        first = f.readline()
+    if not len(header.strip()) or not len(first.strip()):
+        raise ValueError("Unable to find a header followed by samples")
+    names = np.genfromtxt(
+        io.StringIO((header + first).decode("utf-8")), names=True,
+        delimiter=delimiter
+    ).dtype.names
+    return list(names), offset
+
+
+def _text_chunks(path, offset, nchunks):
+    """Split the samples stored in a text file into byte ranges which start
+    and end on a line boundary
+
+    Parameters
+    ----------
+    path: str
+        path to the text file
+    offset: int
+        byte offset of the first row of samples
+    nchunks: int
+        number of byte ranges to split the samples into
+    """
+    size = os.path.getsize(path)
+    step = max(-(-(size - offset) // nchunks), 1)
+    bounds = [offset]
+    with open(path, "rb") as f:
+        while bounds[-1] + step < size:
+            f.seek(bounds[-1] + step)
+            f.readline()
+            if f.tell() >= size:
+                break
+            bounds.append(f.tell())
+    return list(zip(bounds, bounds[1:] + [size]))
+
+
+def _read_bytes(path, start, stop):
+    """Return the bytes stored in a file between two offsets
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(stop - start)
+
+
+def _count_rows(path, start, stop):
+    """Return the number of rows stored in a byte range of a text file
+    """
+    data = _read_bytes(path, start, stop).rstrip()
+    return data.count(b"\n") + 1 if len(data) else 0
+
+
+def _fields_per_line(data):
+    """Return the number of whitespace separated fields on each line of a
+    byte string
+
+    Parameters
+    ----------
+    data: bytes
+        byte string you wish to count the fields of
+    """
+    if not len(data):
+        return np.array([], dtype=int)
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    newline = buffer == ord("\n")
+    space = newline | np.isin(buffer, list(b" \t\r\v\f"))
+    start = ~space
+    start[1:] &= space[:-1]
+    line = np.cumsum(newline)
+    return np.bincount(line[start], minlength=line[-1] + 1)
+
+
+def _parse_rows(path, start, stop, samples, row, nrows, delimiter=None):
+    """Parse a byte range of a text file into a slice of a preallocated array.
+    `np.fromstring` releases the GIL while parsing so byte ranges can be
+    parsed concurrently in separate threads
+
+    Parameters
+    ----------
+    path: str
+        path to the text file
+    start: int
+        byte offset of the first row in the range
+    stop: int
+        byte offset of the end of the range
+    samples: np.ndarray
+        preallocated 2d array to store the parsed samples
+    row: int
+        index of the first row in `samples` to fill
+    nrows: int
+        number of rows stored in the byte range
+    delimiter: str, optional
+        delimiter used in the text file. Default any whitespace
+    """
+    data = _read_bytes(path, start, stop).rstrip()
+    if delimiter is not None:
+        data = data.replace(delimiter.encode("utf-8"), b" ")
+    fields = _fields_per_line(data)
+    if len(fields) != nrows or np.any(fields != samples.shape[1]):
+        invalid = np.argwhere(fields != samples.shape[1])
+        raise ValueError(
+            "Expected {} rows of {} values between bytes {} and {} but "
+            "found {} rows{}".format(
+                nrows, samples.shape[1], start, stop, len(fields),
+                " and {} values in row {}".format(
+                    fields[invalid[0][0]], invalid[0][0] + 1
+                ) if len(invalid) else ""
+            )
+        )
+    values = np.fromstring(data, sep=" ")
+    if values.size != nrows * samples.shape[1]:
+        raise ValueError(
+            "Expected {} values between bytes {} and {} but found {}".format(
+                nrows * samples.shape[1], start, stop, values.size
+            )
+        )
+    samples[row:row + nrows] = values.reshape(nrows, samples.shape[1])
+
+
+def read_text_columns(
+    path, delimiter=None, nthreads=None, chunk_bytes=DEFAULT_CHUNK_BYTES
+):
+    """Read the parameters and samples stored in a text file with a single
+    header line. The header and delimiter are resolved once, the samples are
+    split into byte ranges and each range is parsed in a separate thread
+    directly into a preallocated float64 array with contiguous columns. A
+    ValueError is raised if the file cannot be parsed this way, for example
+    because it contains missing values, comments or blank lines
+
+    Parameters
+    ----------
+    path: str
+        path to the text file
+    delimiter: str, optional
+        delimiter used in the text file. Default any whitespace
+    nthreads: int, optional
+        number of threads to use. Default the number of available CPUs
+    chunk_bytes: int, optional
+        maximum size of each byte range. Default 64MB
+    """
+    parameters, offset = _text_header(path, delimiter=delimiter)
+    size = os.path.getsize(path) - offset
+    if nthreads is None:
+        nthreads = os.cpu_count() or 1
+    nchunks = max(-(-size // chunk_bytes), nthreads, 1)
+    chunks = _text_chunks(path, offset, nchunks)
+    nthreads = max(min(nthreads, len(chunks)), 1)
+    with ThreadPoolExecutor(max_workers=nthreads) as executor:
+        nrows = list(
+            executor.map(lambda chunk: _count_rows(path, *chunk), chunks)
+        )
+        samples = np.empty((sum(nrows), len(parameters)), order="F")
+        rows = np.cumsum([0] + nrows[:-1])
+        with warnings.catch_warnings():
+            # np.fromstring warns rather than raises when it stops early. The
+            # number of values parsed is checked in `_parse_rows` instead
+            warnings.simplefilter("ignore", DeprecationWarning)
+            list(executor.map(
+                lambda args: _parse_rows(
+                    path, *args[0], samples, args[1], args[2],
+                    delimiter=delimiter
+                ), zip(chunks, rows, nrows)
+            ))
+    return parameters, samples
+
+
+def read_dat(path, delimiter=None, nthreads=None):
+    """Grab the parameters and samples in a .dat file. The file is parsed
+    with `read_text_columns` and `np.genfromtxt` is used as a fallback if the
+    file is malformed
 
     Parameters
     ----------
     path: str
         path to the result file you wish to read in
+    delimiter: str, optional
+        delimiter used in the result file. Default any whitespace
+    nthreads: int, optional
+        number of threads to use when parsing the file. Default the number of
+        available CPUs
     """
+    try:
+        return read_text_columns(path, delimiter=delimiter, nthreads=nthreads)
+    except (ValueError, UnicodeDecodeError) as e:
+        logger.debug(
+            "Unable to parse {} in chunks because: {}. Falling back to "
+            "np.genfromtxt".format(path, e)
+        )
     from .numpy import genfromtxt
     return genfromtxt(path, delimiter=delimiter, names=True)
 
@@ -23,8 +23,8 @@ class SingleAnalysisDefault(SingleAnalysisRead):
     ----------
     parameters: list
         list of parameters stored in the result file
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file keyed by parameters
     input_version: str
@@ -65,8 +65,9 @@ class MultiAnalysisDefault(MultiAnalysisRead):
     ----------
     parameters: 2d list
         list of parameters stored in the result file for each analyses
-    samples: 2d list
-        list of samples stored in the result file for each analyses
+    samples: list
+        list of 2d arrays of samples stored in the result file for each
+        analyses
     samples_dict: dict
         dictionary of samples stored in the result file keyed by analysis label
     input_version: str
@@ -109,8 +110,8 @@ class Default(object):
     ----------
     parameters: list
         list of parameters stored in the result file
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file keyed by parameters
     input_version: str
@@ -186,12 +187,12 @@ class Default(object):
         return {i: float("nan") for i in parameters}
 
     @staticmethod
-    def _grab_data_from_dat_file(path, **kwargs):
+    def _grab_data_from_dat_file(path, nthreads=None, **kwargs):
         """Grab the data stored in a .dat file
         """
         from pesummary.core.file.formats.dat import read_dat
 
-        parameters, samples = read_dat(path)
+        parameters, samples = read_dat(path, nthreads=nthreads)
         return {
             "parameters": parameters, "samples": samples,
             "injection": Default._default_injection(parameters)
@@ -210,12 +211,12 @@ class Default(object):
         }
 
     @staticmethod
-    def _grab_data_from_csv_file(path, **kwargs):
+    def _grab_data_from_csv_file(path, nthreads=None, **kwargs):
         """Grab the data stored in a .csv file
         """
         from pesummary.core.file.formats.csv import read_csv
 
-        parameters, samples = read_csv(path)
+        parameters, samples = read_csv(path, nthreads=nthreads)
         return {
             "parameters": parameters, "samples": samples,
             "injection": Default._default_injection(parameters)
@@ -236,7 +237,7 @@ class Default(object):
         parameters = samples.parameters
         analytic = samples.analytic
         return {
-            "parameters": parameters, "samples": samples.samples.T.tolist(),
+            "parameters": parameters, "samples": samples.samples.T,
             "injection": Default._default_injection(parameters),
             "analytic": analytic
         }
@@ -2,7 +2,7 @@
 
 import h5py
 import numpy as np
-from pesummary.core.file.formats.base_read import Read
+from pesummary.core.file.formats.base_read import Read, _columnar_samples
 from pesummary.utils.dict import load_recursively, paths_to_key
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
@@ -56,14 +56,15 @@ def _read_hdf5_with_deepdish(path, remove_params=None, path_to_samples=None):
         for param in remove_params:
             if param in parameters:
                 parameters.remove(param)
-    data = np.zeros([len(reduced_f[parameters[0]]), len(parameters)])
-    for num, par in enumerate(parameters):
-        for key, i in enumerate(reduced_f[par]):
-            data[key][num] = float(np.real(i))
-    data = data.tolist()
-    for num, par in enumerate(parameters):
-        if par == "logL":
-            parameters[num] = "log_likelihood"
+    data = {
+        par: np.real(np.asarray(reduced_f[par])).astype(float) for par in
+        parameters
+    }
+    if "logL" in data.keys():
+        data["log_likelihood"] = data.pop("logL")
+    parameters = [
+        "log_likelihood" if par == "logL" else par for par in parameters
+    ]
     return parameters, data
 
 
@@ -96,22 +97,21 @@ def _read_hdf5_with_h5py(
             ]
         else:
             parameters = copy.deepcopy(original_parameters)
-        n_samples = len(f[path_to_samples][parameters[0]])
         try:
-            samples = np.array([
-                f[path_to_samples][original_parameters.index(i)] for i in
+            samples = {
+                i: f[path_to_samples][original_parameters.index(i)] for i in
                 parameters
-            ]).T
+            }
         except (AttributeError, KeyError, TypeError):
-            samples = np.array([f[path_to_samples][i] for i in parameters]).T
+            samples = {i: np.array(f[path_to_samples][i]) for i in parameters}
         cond1 = "loglr" not in parameters or "log_likelihood" not in \
             parameters
         cond2 = "likelihood_stats" in f.keys() and "loglr" in \
             f["likelihood_stats"]
         if cond1 and cond2:
             parameters.append("log_likelihood")
-            for num, i in enumerate(samples):
-                samples[num].append(float(f["likelihood_stats/loglr"][num]))
+            samples["log_likelihood"] = np.array(f["likelihood_stats/loglr"])
+        parameters, samples = _columnar_samples(parameters, samples)
     elif c1:
         original_parameters = [
             i.decode("utf-8") if isinstance(i, bytes) else i for i in
@@ -124,9 +124,13 @@ def _read_hdf5_with_h5py(
         else:
             parameters = copy.deepcopy(original_parameters)
         samples = np.array(f[path_to_samples]["samples"])
+        if remove_params is not None:
+            samples = samples[
+                :, [original_parameters.index(i) for i in parameters]
+            ]
     elif isinstance(f[path_to_samples], h5py._hl.dataset.Dataset):
         parameters = list(f[path_to_samples].dtype.names)
-        samples = np.array(f[path_to_samples]).view((float, len(parameters))).tolist()
+        samples = np.array(f[path_to_samples]).view((float, len(parameters)))
     if return_posterior_dataset:
         return parameters, samples, f[path_to_samples]
     f.close()
@@ -103,10 +103,7 @@ def read_json(path, path_to_samples=None, decoder=PESummaryJsonDecoder):
         )
     for key in _non_numeric:
         parameters.remove(key)
-    samples = [
-        [reduced_data[j][i] for j in parameters] for i in
-        range(len(reduced_data[parameters[0]]))
-    ]
+    samples = {j: np.asarray(reduced_data[j], dtype=float) for j in parameters}
     return parameters, samples
 
 
@@ -11,7 +11,9 @@ import numpy as np
 import configparser
 import warnings
 
-from pesummary.core.file.formats.base_read import MultiAnalysisRead
+from pesummary.core.file.formats.base_read import (
+    MultiAnalysisRead, _columnar_samples
+)
 from pesummary.utils.samples_dict import (
     MCMCSamplesDict, MultiAnalysisSamplesDict, SamplesDict, Array
 )
@@ -321,15 +323,19 @@ class PESummary(MultiAnalysisRead):
                 chains = list(dataset.keys())
                 parameters = [j for j in dataset[chains[0]].dtype.names]
                 samples = [
-                    [np.array(j.tolist()) for j in dataset[chain]] for chain
-                    in chains
+                    _columnar_samples(
+                        parameters, {j: dataset[chain][j] for j in parameters}
+                    )[1] for chain in chains
                 ]
             else:
                 posterior_samples = data["posterior_samples"]
                 new_format = (h5py._hl.dataset.Dataset, np.ndarray)
                 if isinstance(posterior_samples, new_format):
                     parameters = [j for j in posterior_samples.dtype.names]
-                    samples = [np.array(j.tolist()) for j in posterior_samples]
+                    samples = _columnar_samples(
+                        parameters,
+                        {j: posterior_samples[j] for j in parameters}
+                    )[1]
                 else:
                     parameters = \
                         posterior_samples["parameter_names"].copy()
@@ -388,7 +394,7 @@ class PESummary(MultiAnalysisRead):
                     parameters.index("weights") if "weights" in parameters
                     else parameters.index(b"weights")
                 )
-                weights_list.append(Array([sample[ind] for sample in samples]))
+                weights_list.append(Array(np.asarray(samples)[..., ind]))
             else:
                 weights_list.append(None)
             if "version" in data.keys():
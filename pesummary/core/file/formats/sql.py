@@ -62,8 +62,8 @@ def read_sql(path, path_to_samples=None, remove_row_column="ROW", **kwargs):
             mask[ind] = False
             samples[num] = _samples[:, mask]
     if len(tables) == 1:
-        return parameters[0], np.array(samples[0]).tolist(), tables
-    return parameters, np.array(samples).tolist(), tables
+        return parameters[0], samples[0], tables
+    return parameters, samples, tables
 
 
 def write_sql(
@@ -6,7 +6,9 @@ import copy
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 STEP_NUMBER_PARAMS = ["cycle"]
-algorithms = ["burnin_by_step_number", "burnin_by_first_n"]
+algorithms = [
+    "burnin_by_step_number", "burnin_by_first_n", "burnin_by_autocorrelation"
+]
 
 
 def _number_of_negative_steps(samples, logger_level="debug"):
@@ -106,3 +108,85 @@ def burnin_by_first_n(samples, N, step_number=False, logger_level="debug"):
         )
     )
     return _samples.discard_samples(n_samples)
+
+
+def burnin_by_autocorrelation(
+    samples, burnin_factor=2., thin_factor=0.5, thin=True, c=5,
+    rhat_threshold=1.01, parameters=None, logger_level="debug"
+):
+    """Discard samples as burnin and thin the remaining samples based on the
+    integrated autocorrelation time of each parameter. The autocorrelation
+    time is estimated from the second half of each chain, which is assumed to
+    be stationary. The first burnin_factor times the longest autocorrelation
+    time are then discarded and the chains are thinned by thin_factor times
+    the shortest autocorrelation time. See pesummary.utils.diagnostics
+
+    Parameters
+    ----------
+    samples: pesummary.utils.samples_dict.MCMCSamplesDict
+        MCMCSamplesDict object containing the samples for multiple mcmc chains
+    burnin_factor: float, optional
+        number of autocorrelation times to discard as burnin. Default 2
+    thin_factor: float, optional
+        fraction of the autocorrelation time to thin the chains by. Default
+        0.5
+    thin: Bool, optional
+        if False, do not thin the chains. Default True
+    c: float, optional
+        window constant used when calculating the autocorrelation time.
+        Default 5
+    rhat_threshold: float, optional
+        a warning is printed if the split R-hat of any parameter after
+        removing the burnin exceeds this value. Default 1.01
+    parameters: list, optional
+        parameters to use when calculating the autocorrelation time. Default
+        all parameters common to all chains
+    logger_level: str, optional
+        logger level to use when printing information to stdout. Default debug
+    """
+    from pesummary.utils.diagnostics import (
+        integrated_autocorrelation_time, split_rhat
+    )
+
+    _samples = copy.deepcopy(samples)
+    parameters, data = _samples._chain_array(parameters)
+    nsteps = data.shape[-1]
+    tau = integrated_autocorrelation_time(data[..., nsteps // 2:], c=c)
+    tau = tau[np.isfinite(tau)]
+    if not len(tau):
+        logger.warning(
+            "Unable to estimate the autocorrelation time. Aborting discard"
+        )
+        return _samples
+    nburnin = min(int(np.ceil(burnin_factor * np.max(tau))), nsteps - 1)
+    nthin = max(1, int(thin_factor * np.min(tau))) if thin else 1
+    getattr(logger, logger_level)(
+        "Estimated autocorrelation times between {:.1f} and {:.1f} steps. "
+        "Removing the first {} samples from each chain as burnin and thinning "
+        "by {}".format(np.min(tau), np.max(tau), nburnin, nthin)
+    )
+    _samples = _samples.discard_samples(nburnin)
+    if nthin > 1:
+        from pesummary.utils.samples_dict import SamplesDict
+
+        for chain in _samples.keys():
+            _samples[chain] = SamplesDict(
+                {
+                    param: value[::nthin] for param, value in
+                    _samples[chain].items()
+                }, logger_warn="debug"
+            )
+    rhat = split_rhat(data[..., nburnin::nthin])
+    if np.any(rhat > rhat_threshold):
+        logger.warning(
+            "The split R-hat for {} is greater than {} after removing the "
+            "burnin. The chains may not have converged".format(
+                ", ".join(
+                    [
+                        param for param, value in zip(parameters, rhat) if
+                        value > rhat_threshold
+                    ]
+                ), rhat_threshold
+            )
+        )
+    return _samples
@@ -209,7 +209,7 @@ class _MetaFile(object):
         existing_priors={}, existing_metafile=None, outdir=None, existing=None,
         package_information={}, mcmc_samples=False, filename=None,
         external_hdf5_links=False, hdf5_compression=None, history=None,
-        descriptions=None
+        descriptions=None, incremental=False
     ):
         self.data = {}
         self.webdir = webdir
@@ -258,11 +258,17 @@ class _MetaFile(object):
             from pesummary.core.inputs import _Input
             self.package_information = _Input.get_package_information()
         self.mcmc_samples = mcmc_samples
+        self.incremental = incremental
 
         if self.existing_labels is None:
             self.existing_labels = [None]
         if self.existing is not None:
             self.add_existing_data()
+        if self.incremental and not self.append_to_existing:
+            logger.warning(
+                "Unable to append the new analyses to the existing metafile "
+                "in place. Rewriting the full metafile"
+            )
 
     @property
     def outdir(self):
@@ -296,6 +302,35 @@ class _MetaFile(object):
     def meta_file(self):
         return os.path.join(os.path.abspath(self.outdir), self.file_name)
 
+    @property
+    def new_labels(self):
+        """Return the labels which are not stored in the existing metafile
+        """
+        return [
+            label for label in self.labels if label not in self.existing_labels
+        ]
+
+    @property
+    def append_to_existing(self):
+        """Return True if the new labels can be appended to the existing
+        metafile in place rather than rewriting the full metafile
+        """
+        if not self.incremental or self.existing_metafile is None:
+            return False
+        if not self.hdf5 or self.external_hdf5_links:
+            return False
+        _hdf5 = os.path.splitext(self.existing_metafile)[1] in [".h5", ".hdf5"]
+        _same = os.path.abspath(self.existing_metafile) == self.meta_file
+        return _hdf5 and _same
+
+    @property
+    def labels_to_write(self):
+        """Return the labels which need to be written to the metafile
+        """
+        if self.append_to_existing:
+            return self.new_labels
+        return self.labels
+
     def make_dictionary(self):
         """Wrapper function for _make_dictionary
         """
@@ -311,8 +346,10 @@ class _MetaFile(object):
             label: {
                 posterior: {}, "injection_data": {}, "version": {},
                 "meta_data": {}, "priors": {}, "config_file": {}
-            } for label in self.labels
+            } for label in self.labels_to_write
         }
+        if self.append_to_existing:
+            return dictionary
         dictionary["version"] = self.package_information
         dictionary["version"]["pesummary"] = [__version__]
         dictionary["history"] = self.history
@@ -326,12 +363,15 @@ class _MetaFile(object):
         else:
             posterior = "posterior_samples"
         dictionary = self._dictionary_structure
-        if self.file_kwargs is not None and isinstance(self.file_kwargs, dict):
+        _store_history = "history" in dictionary.keys()
+        if _store_history and isinstance(self.file_kwargs, dict):
             if "webpage_url" in self.file_kwargs.keys():
                 dictionary["history"]["webpage_url"] = self.file_kwargs["webpage_url"]
             else:
                 dictionary["history"]["webpage_url"] = "None"
         for num, label in enumerate(self.labels):
+            if label not in self.labels_to_write:
+                continue
             parameters = self.samples[label].keys()
             samples = np.array([self.samples[label][i] for i in parameters]).T
             dictionary[label][posterior] = {
@@ -488,7 +528,8 @@ class _MetaFile(object):
         """
         if self.mcmc_samples:
             return
-        for label in self.labels:
+        labels = self.new_labels if self.incremental else self.labels
+        for label in labels:
             if not os.path.isdir(os.path.join(self.outdir, label)):
                 make_dir(os.path.join(self.outdir, label))
             for param, samples in self.samples[label].items():
@@ -568,9 +609,10 @@ class _MetaFile(object):
     def save_to_hdf5(
         data, labels, samples, meta_file, no_convert=False,
         extra_keys=DEFAULT_HDF5_KEYS, mcmc_samples=False,
-        external_hdf5_links=False, compression=None, _class=None
+        external_hdf5_links=False, compression=None, _class=None, mode="w"
     ):
-        """Save the metafile as a hdf5 file
+        """Save the metafile as a hdf5 file. If mode='a', the data is appended
+        to an existing hdf5 file
         """
         import h5py
 
@@ -619,7 +661,7 @@ class _MetaFile(object):
                     compression=compression
                 )
         else:
-            with h5py.File(meta_file, "w") as f:
+            with h5py.File(meta_file, mode) as f:
                 recursively_save_dictionary_to_hdf5_file(
                     f, data, extra_keys=extra_keys + labels,
                     compression=compression
@@ -636,8 +678,9 @@ class _MetaFile(object):
                 samples.T, header=parameters
             )
 
+        labels = self.new_labels if self.incremental else self.labels
         if self.mcmc_samples:
-            for label in self.labels:
+            for label in labels:
                 parameters = list(self.samples[label].keys())
                 for chain in self.samples[label][parameters[0]].keys():
                     samples = np.array(
@@ -645,7 +688,7 @@ class _MetaFile(object):
                     )
                     _save(parameters, samples, chain)
                     return
-        for label in self.labels:
+        for label in labels:
             parameters = self.samples[label].keys()
             samples = np.array([self.samples[label][i] for i in parameters])
             _save(parameters, samples, label)
@@ -682,17 +725,18 @@ class MetaFile(PostProcessing):
             mcmc_samples=self.mcmc_samples, filename=self.filename,
             external_hdf5_links=self.external_hdf5_links,
             hdf5_compression=self.hdf5_compression, history=history,
-            descriptions=self.descriptions
+            descriptions=self.descriptions, incremental=self.incremental
         )
         meta_file.make_dictionary()
         if not self.hdf5:
             meta_file.save_to_json(meta_file.data, meta_file.meta_file)
         else:
             meta_file.save_to_hdf5(
-                meta_file.data, meta_file.labels, meta_file.samples,
+                meta_file.data, meta_file.labels_to_write, meta_file.samples,
                 meta_file.meta_file, mcmc_samples=meta_file.mcmc_samples,
                 external_hdf5_links=meta_file.external_hdf5_links,
-                compression=meta_file.hdf5_compression
+                compression=meta_file.hdf5_compression,
+                mode="a" if meta_file.append_to_existing else "w"
             )
         meta_file.save_to_dat()
         meta_file.write_marginalized_posterior_to_dat()
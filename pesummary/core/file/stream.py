@@ -0,0 +1,197 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import io
+from itertools import islice
+from pathlib import Path
+import numpy as np
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+TEXT_EXTENSIONS = {"dat": None, "txt": None, "csv": ","}
+HDF5_EXTENSIONS = ["hdf5", "h5", "hdf"]
+NUMPY_EXTENSIONS = ["npy"]
+
+
+class StreamingPosterior(object):
+    """Class to read the posterior samples stored in a result file in chunks
+    of rows without loading the full table into memory. Only the parameters
+    stored in the file are returned; no parameter conversion is performed
+
+    Parameters
+    ----------
+    path: str
+        path to the result file you wish to read
+    path_to_samples: str, optional
+        path to the posterior table in a hdf5 file. Default guess the path
+    delimiter: str, optional
+        delimiter used in a text file. Default guess from the file extension
+
+    Attributes
+    ----------
+    parameters: list
+        list of parameters stored in the file
+    nsamples: int
+        number of samples stored in the file
+
+    Methods
+    -------
+    chunks:
+        Iterate over the posterior table in chunks of rows
+    take:
+        Return the rows of the posterior table for a given set of indices
+    """
+    def __init__(self, path, path_to_samples=None, delimiter=None):
+        self.path = path
+        self.extension = Path(path).suffix[1:]
+        if self.extension in TEXT_EXTENSIONS.keys():
+            self.delimiter = (
+                delimiter if delimiter is not None else
+                TEXT_EXTENSIONS[self.extension]
+            )
+            self.parameters, self.nsamples = self._text_header()
+        elif self.extension in HDF5_EXTENSIONS:
+            from pesummary.core.file.formats.base_read import Read
+            if path_to_samples is None:
+                path_to_samples = Read.guess_path_to_samples(path)
+            self.path_to_samples = path_to_samples
+            self.parameters, self.nsamples = self._hdf5_header()
+        elif self.extension in NUMPY_EXTENSIONS:
+            _table = np.load(path, mmap_mode="r")
+            self.parameters = list(_table.dtype.names)
+            self.nsamples = len(_table)
+        else:
+            raise ValueError(
+                "Unable to stream samples from a '{}' file. Streaming is only "
+                "available for the following formats: {}".format(
+                    self.extension, ", ".join(
+                        list(TEXT_EXTENSIONS.keys()) + HDF5_EXTENSIONS +
+                        NUMPY_EXTENSIONS
+                    )
+                )
+            )
+
+    @staticmethod
+    def _is_data(line):
+        """Return True if a line in a text file contains samples
+        """
+        line = line.strip()
+        return len(line) and not line.startswith("#")
+
+    def _text_header(self):
+        """Return the parameters and number of samples stored in a text file.
+        The header is parsed with `np.genfromtxt` to match
+        `pesummary.core.file.formats.dat.read_dat`
+        """
+        with open(self.path, "r") as f:
+            header = f.readline()
+            first = next((line for line in f if self._is_data(line)), "")
+            nsamples = int(bool(first)) + sum(
+                1 for line in f if self._is_data(line)
+            )
+        names = np.genfromtxt(
+            io.StringIO(header + first), names=True, delimiter=self.delimiter
+        ).dtype.names
+        return list(names), nsamples
+
+    def _hdf5_header(self):
+        """Return the parameters and number of samples stored in a hdf5 file
+        """
+        import h5py
+
+        with h5py.File(self.path, "r") as f:
+            table = f[self.path_to_samples]
+            if isinstance(table, h5py.Dataset):
+                return list(table.dtype.names), len(table)
+            if "parameter_names" in table.keys():
+                parameters = [
+                    p.decode("utf-8") if isinstance(p, bytes) else p for p in
+                    table["parameter_names"]
+                ]
+                return parameters, len(table["samples"])
+            parameters = list(table.keys())
+            return parameters, len(table[parameters[0]])
+
+    def chunks(self, chunk_size=100000):
+        """Iterate over the posterior table in chunks of rows. Each chunk is
+        a 2d array with shape (rows, parameters)
+
+        Parameters
+        ----------
+        chunk_size: int, optional
+            maximum number of rows to read at once. Default 100000
+        """
+        if self.extension in TEXT_EXTENSIONS.keys():
+            with open(self.path, "r") as f:
+                f.readline()
+                lines = (line for line in f if self._is_data(line))
+                while True:
+                    block = list(islice(lines, chunk_size))
+                    if not len(block):
+                        break
+                    yield np.loadtxt(
+                        block, delimiter=self.delimiter, ndmin=2
+                    )
+        elif self.extension in NUMPY_EXTENSIONS:
+            table = np.load(self.path, mmap_mode="r")
+            for start in range(0, self.nsamples, chunk_size):
+                yield self._structured_to_2d(table[start:start + chunk_size])
+        else:
+            import h5py
+
+            with h5py.File(self.path, "r") as f:
+                table = f[self.path_to_samples]
+                for start in range(0, self.nsamples, chunk_size):
+                    _slice = slice(start, start + chunk_size)
+                    if isinstance(table, h5py.Dataset):
+                        yield self._structured_to_2d(table[_slice])
+                    elif "parameter_names" in table.keys():
+                        yield np.asarray(table["samples"][_slice], dtype=float)
+                    else:
+                        yield np.array(
+                            [table[param][_slice] for param in self.parameters],
+                            dtype=float
+                        ).T
+
+    def _structured_to_2d(self, array):
+        """Convert a structured array into a 2d float array
+        """
+        out = np.empty((len(array), len(self.parameters)), dtype=float)
+        for num, param in enumerate(self.parameters):
+            out[:, num] = array[param]
+        return out
+
+    def take(self, indices=None, parameters=None, chunk_size=100000, out=None):
+        """Return the rows of the posterior table for a given set of indices.
+        Only a single chunk of the table is held in memory at any one time
+
+        Parameters
+        ----------
+        indices: np.ndarray, optional
+            sorted indices of the rows you wish to return. Default all rows
+        parameters: list, optional
+            parameters you wish to return. Default all parameters
+        chunk_size: int, optional
+            maximum number of rows to read at once. Default 100000
+        out: np.ndarray, optional
+            preallocated array of shape (len(indices), len(parameters)) to
+            store the rows in
+        """
+        if parameters is None:
+            parameters = self.parameters
+        columns = [self.parameters.index(param) for param in parameters]
+        nrows = self.nsamples if indices is None else len(indices)
+        if out is None:
+            out = np.empty((nrows, len(columns)), dtype=float)
+        start, filled = 0, 0
+        for chunk in self.chunks(chunk_size=chunk_size):
+            stop = start + len(chunk)
+            if indices is None:
+                rows = slice(None)
+            else:
+                lo, hi = np.searchsorted(indices, [start, stop])
+                rows = indices[lo:hi] - start
+            block = chunk[rows][:, columns]
+            out[filled:filled + len(block)] = block
+            filled += len(block)
+            start = stop
+        return out
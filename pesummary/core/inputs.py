@@ -67,7 +67,7 @@ class _Input(object):
         existing_file, webdir, compare=None, read_function=Read,
         _replace_with_pesummary_kwargs={}, nsamples=None,
         disable_injection=False, keep_nan_likelihood_samples=False,
-        reweight_samples=False, **kwargs
+        reweight_samples=False, reweight_mode="rejection", **kwargs
     ):
         """Grab data from an existing PESummary metafile
 
@@ -133,7 +133,9 @@ class _Input(object):
         if not f.mcmc_samples:
             f.generate_all_posterior_samples(labels=labels, **kwargs)
         if reweight_samples:
-            f.reweight_samples(reweight_samples, labels=labels, **kwargs)
+            f.reweight_samples(
+                reweight_samples, labels=labels, mode=reweight_mode, **kwargs
+            )
 
         parameters = f.parameters
         if not f.mcmc_samples:
@@ -230,7 +232,7 @@ class _Input(object):
         file_format=None, nsamples=None, disable_prior_sampling=False,
         nsamples_for_prior=None, path_to_samples=None,
         keep_nan_likelihood_samples=False, reweight_samples=False,
-        **kwargs
+        reweight_mode="rejection", nthreads=None, **kwargs
     ):
         """Grab data from a result file containing posterior samples
 
@@ -249,6 +251,9 @@ class _Input(object):
         file_format, str, optional
             the file format you wish to use when loading. Default None.
             If None, the read function loops through all possible options
+        nthreads: int, optional
+            number of threads to use when reading the result file. Only used
+            for text files. Default the number of available CPUs
         kwargs: dict
             Dictionary of keyword arguments fed to the
             `generate_all_posterior_samples` method
@@ -256,7 +261,8 @@ class _Input(object):
         f = read_function(
             file, file_format=file_format, disable_prior=disable_prior_sampling,
             nsamples_for_prior=nsamples_for_prior, path_to_samples=path_to_samples,
-            remove_nan_likelihood_samples=not keep_nan_likelihood_samples
+            remove_nan_likelihood_samples=not keep_nan_likelihood_samples,
+            nthreads=nthreads
         )
         if config is not None:
             f.add_fixed_parameters_from_config_file(config)
@@ -269,7 +275,7 @@ class _Input(object):
                 injection, conversion_kwargs=kwargs
             )
         if reweight_samples:
-            f.reweight_samples(reweight_samples)
+            f.reweight_samples(reweight_samples, mode=reweight_mode)
         parameters = f.parameters
         samples = np.array(f.samples).T
         DataFrame = {label: SamplesDict(parameters, samples)}
@@ -419,6 +425,21 @@ class _Input(object):
             self.existing, "samples", files[0]
         )
 
+    @property
+    def incremental(self):
+        return self._incremental
+
+    @incremental.setter
+    def incremental(self, incremental):
+        self._incremental = incremental
+        if incremental and not self.add_to_existing:
+            logger.warning(
+                "Unable to incrementally add to an existing web directory "
+                "because no existing web directory has been provided. "
+                "Ignoring the 'incremental' option"
+            )
+            self._incremental = False
+
     @property
     def style_file(self):
         return self._style_file
@@ -1325,6 +1346,7 @@ class _Input(object):
             data = self.grab_data_from_metafile(
                 file, self.webdir, compare=self.compare_results,
                 nsamples=self.nsamples, reweight_samples=self.reweight_samples,
+                reweight_mode=self.reweight_mode,
                 disable_injection=self.disable_injection,
                 keep_nan_likelihood_samples=self.keep_nan_likelihood_samples,
                 **grab_data_kwargs
@@ -1337,8 +1359,9 @@ class _Input(object):
                 nsamples_for_prior=self.nsamples_for_prior,
                 path_to_samples=self.path_to_samples[label],
                 reweight_samples=self.reweight_samples,
+                reweight_mode=self.reweight_mode,
                 keep_nan_likelihood_samples=self.keep_nan_likelihood_samples,
-                **grab_data_kwargs
+                nthreads=int(self.opts.multi_process), **grab_data_kwargs
             )
         self._open_result_files.update({file: data["open_file"]})
         return data
@@ -1926,6 +1949,9 @@ class Input(_Input):
     existing_labels: list
         list of labels stored in an existing metafile. None if
         `self.add_to_existing` is False
+    incremental: Bool
+        if True, only the new result files are processed when adding to an
+        existing web directory
     user: str
         the user who submitted the job
     webdir: str
@@ -1961,8 +1987,14 @@ class Input(_Input):
         if True, comparison plots and pages are not produced
     disable_interactive: Bool
         if True, interactive plots are not produced
+    interactive_point_budget: int
+        maximum number of samples per analysis to show in interactive plots
     disable_expert: Bool
         if True, expert diagnostic plots are not produced
+    thumbnails: Bool
+        if True, reduced size thumbnails of all plots are produced
+    webp_thumbnails: Bool
+        if True, WebP variants of the thumbnails are also produced
     """
     def __init__(
         self, opts, ignore_copy=False, extra_options=None, checkpoint=None,
@@ -2016,6 +2048,7 @@ class Input(_Input):
             self.existing_priors = None
             self.existing_config = None
             self.existing_injection_data = None
+        self.incremental = self.opts.incremental
         self.user = self.opts.user
         self.webdir = self.opts.webdir
         self._restarted_from_checkpoint = False
@@ -2050,6 +2083,7 @@ class Input(_Input):
         self.file_format = self.opts.file_format
         self.nsamples = self.opts.nsamples
         self.keep_nan_likelihood_samples = self.opts.keep_nan_likelihood_samples
+        self.reweight_mode = self.opts.reweight_mode
         self.reweight_samples = self.opts.reweight_samples
         self.samples = self.opts.samples
         self.ignore_parameters = self.opts.ignore_parameters
@@ -2073,7 +2107,10 @@ class Input(_Input):
         self.pe_algorithm = self.opts.pe_algorithm
         self.disable_comparison = self.opts.disable_comparison
         self.disable_interactive = self.opts.disable_interactive
+        self.interactive_point_budget = self.opts.interactive_point_budget
         self.disable_expert = self.opts.disable_expert
+        self.thumbnails = self.opts.thumbnails
+        self.webp_thumbnails = self.opts.webp_thumbnails
         self.multi_process = self.opts.multi_process
         self.multi_threading_for_plots = self.multi_process
         self.existing_plot = self.opts.existing_plot
@@ -2085,11 +2122,8 @@ class Input(_Input):
     def write_current_state(self):
         """Write the current state of the input class to file
         """
-        from pesummary.io import write
-        write(
-            self, outdir=self.resume_file_dir, file_format="pickle",
-            filename=self.resume_file, overwrite=True
-        )
+        from pesummary.core.file.formats.checkpoint import write_checkpoint
+        write_checkpoint(self, self._resume_file_path)
         logger.debug(
             "Written checkpoint file: {}".format(self._resume_file_path)
         )
@@ -2128,6 +2162,9 @@ class PostProcessing(object):
     existing_labels: list
         list of labels stored in an existing metafile. None if
         `self.add_to_existing` is False
+    incremental: Bool
+        if True, only the new result files are processed when adding to an
+        existing web directory
     user: str
         the user who submitted the job
     webdir: str
@@ -2191,12 +2228,14 @@ class PostProcessing(object):
             self.existing_priors = None
             self.existing_config = None
             self.existing_injection_data = None
+        self.incremental = self.inputs.incremental
         self.user = self.inputs.user
         self.host = self.inputs.host
         self.webdir = self.inputs.webdir
         self.baseurl = self.inputs.baseurl
         self.mcmc_samples = self.inputs.mcmc_samples
         self.labels = self.inputs.labels
+        self.seed = self.inputs.seed
         self.weights = self.inputs.weights
         self.config = self.inputs.config
         self.injection_file = self.inputs.injection_file
@@ -2223,8 +2262,11 @@ class PostProcessing(object):
         self.descriptions = self.inputs.descriptions
         self.disable_comparison = self.inputs.disable_comparison
         self.disable_interactive = self.inputs.disable_interactive
+        self.interactive_point_budget = self.inputs.interactive_point_budget
         self.disable_expert = self.inputs.disable_expert
         self.disable_corner = self.inputs.disable_corner
+        self.thumbnails = self.inputs.thumbnails
+        self.webp_thumbnails = self.inputs.webp_thumbnails
         self.multi_process = self.inputs.multi_threading_for_plots
         self.package_information = self.inputs.package_information
         self.existing_plot = self.inputs.existing_plot
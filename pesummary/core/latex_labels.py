@@ -0,0 +1,9 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+
+latex_labels = {
+    "log_likelihood": r"$\log{\mathcal{L}}$",
+    "log_prior": r"$\log{P}$"
+}
@@ -1,17 +1,149 @@
+from collections import OrderedDict
+import hashlib
 import numpy as np
 from scipy.stats import gaussian_kde as kde
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
 
+class KDEGridCache(object):
+    """Least recently used cache of gridded 2d probability densities. A
+    density is stored against a digest of the samples, their weights, the
+    bounds and the kernel covariance. The samples identify the parameter pair
+    and the analysis label, so the same density is reused by the triangle,
+    reverse triangle and comparison plots for a given pair of parameters
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        maximum number of densities to store. Default 32
+
+    Attributes
+    ----------
+    hits: int
+        number of times a density was found in the cache
+    misses: int
+        number of times a density had to be calculated
+    """
+    def __init__(self, maxsize=32):
+        self.maxsize = maxsize
+        self.clear()
+
+    def clear(self):
+        """Remove all densities from the cache
+        """
+        self._cache = OrderedDict()
+        self.hits, self.misses = 0, 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get(self, key, function):
+        """Return the cached density for a given key, calling `function` to
+        calculate it if it is not in the cache
+
+        Parameters
+        ----------
+        key: str
+            key to use for the cache
+        function: func
+            function which takes no arguments and returns the density
+        """
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        self.misses += 1
+        value = function()
+        self._cache[key] = value
+        if self.maxsize is not None and len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return value
+
+
+KDE_GRID_CACHE = KDEGridCache()
+
+
+def _linear_binning(x, y, weights, xgrid, ygrid):
+    """Distribute weighted samples onto the nodes of a regular grid by
+    bilinear interpolation
+
+    Parameters
+    ----------
+    x: np.ndarray
+        x coordinates of the samples
+    y: np.ndarray
+        y coordinates of the samples
+    weights: np.ndarray
+        weight of each sample
+    xgrid: np.ndarray
+        regularly spaced nodes along the x axis
+    ygrid: np.ndarray
+        regularly spaced nodes along the y axis
+    """
+    nx, ny = len(xgrid), len(ygrid)
+    fx = (x - xgrid[0]) / (xgrid[1] - xgrid[0])
+    fy = (y - ygrid[0]) / (ygrid[1] - ygrid[0])
+    keep = (fx >= 0) & (fx <= nx - 1) & (fy >= 0) & (fy <= ny - 1)
+    fx, fy, weights = fx[keep], fy[keep], weights[keep]
+    ix = np.minimum(np.floor(fx).astype(int), nx - 2)
+    iy = np.minimum(np.floor(fy).astype(int), ny - 2)
+    dx, dy = fx - ix, fy - iy
+    counts = np.zeros(nx * ny)
+    for (_ix, _iy, _weight) in [
+            [ix, iy, (1 - dx) * (1 - dy)], [ix + 1, iy, dx * (1 - dy)],
+            [ix, iy + 1, (1 - dx) * dy], [ix + 1, iy + 1, dx * dy]
+    ]:
+        counts += np.bincount(
+            _ix * ny + _iy, weights=weights * _weight, minlength=nx * ny
+        )
+    return counts.reshape(nx, ny)
+
+
 class Bounded_2d_kde(kde):
     """Class to generate a two-dimensional KDE for a probability distribution
     functon that exists on a bounded domain
+
+    Parameters
+    ----------
+    pts: np.ndarray
+        2d array of samples
+    xlow: float, optional
+        lower bound of the x domain
+    xhigh: float, optional
+        upper bound of the x domain
+    ylow: float, optional
+        lower bound of the y domain
+    yhigh: float, optional
+        upper bound of the y domain
+    transform: func, optional
+        function to transform the samples before the KDE is constructed
+    method: str, optional
+        method to use when evaluating the KDE on a regular grid with
+        `grid_evaluate`. Either 'direct', which evaluates the KDE at every
+        grid point, or 'fft', which bins the samples onto a fine grid and
+        convolves with the kernel. Default 'direct'
+    grid_size: int, optional
+        number of grid points along each axis to use for the 'fft' method.
+        Default 512
+    cache: Bool, optional
+        if True, store the gridded density from the 'fft' method in
+        `KDE_GRID_CACHE`. Default True
+    *args: tuple
+        all args passed to scipy.stats.gaussian_kde
+    **kwargs: dict
+        all kwargs passed to scipy.stats.gaussian_kde
     """
     def __init__(self, pts, xlow=None, xhigh=None, ylow=None, yhigh=None,
-                 transform=None, *args, **kwargs):
+                 transform=None, *args, method="direct", grid_size=512,
+                 cache=True, **kwargs):
         pts = np.atleast_2d(pts)
         assert pts.ndim == 2, 'Bounded_kde can only be two-dimensional'
+        if method not in ["direct", "fft"]:
+            raise ValueError(
+                "Unknown method '{}'. Please choose either 'direct' or "
+                "'fft'".format(method)
+            )
         self._transform = transform
         if transform is not None:
             pts = transform(pts)
@@ -20,6 +152,9 @@ class Bounded_2d_kde(kde):
         self._xhigh = xhigh
         self._ylow = ylow
         self._yhigh = yhigh
+        self.method = method
+        self.grid_size = grid_size
+        self.cache = cache
 
     @property
     def xlow(self):
@@ -104,3 +239,140 @@ class Bounded_2d_kde(kde):
         results = self.evaluate(_pts)
         results[out_of_bounds] = 0.
         return results
+
+    def _out_of_bounds(self, X, Y):
+        """Return a boolean mask of the grid points outside of the domain
+        """
+        out_of_bounds = np.zeros(X.shape, dtype=bool)
+        for bound, values, compare in zip(
+                [self.xlow, self.xhigh, self.ylow, self.yhigh], [X, X, Y, Y],
+                [np.less, np.greater, np.less, np.greater]
+        ):
+            if bound is not None:
+                out_of_bounds |= compare(values, bound)
+        return out_of_bounds
+
+    def _cache_key(self):
+        """Return a digest of the samples, weights, bounds and kernel
+        """
+        digest = hashlib.sha256()
+        for array in [self.dataset, self.weights, self.covariance]:
+            digest.update(np.ascontiguousarray(array, dtype=float).tobytes())
+        digest.update(repr(
+            (self.xlow, self.xhigh, self.ylow, self.yhigh, self.grid_size)
+        ).encode())
+        return digest.hexdigest()
+
+    def _fft_grid(self):
+        """Return the density on a regular grid spanning the samples. Copies
+        of the samples are mirrored about each bound which lies within the
+        support of the kernel, binned onto the grid together with the original
+        samples and convolved with the kernel by FFT. This gives the same
+        reflected estimate as `evaluate` without evaluating the kernel for
+        every sample at every grid point
+        """
+        from scipy.signal import fftconvolve
+
+        sigma = np.sqrt(np.diag(self.covariance))
+        nodes, mirrors = [], []
+        for idx, (low, high) in enumerate(
+                [[self.xlow, self.xhigh], [self.ylow, self.yhigh]]
+        ):
+            _low = np.min(self.dataset[idx]) - 5 * sigma[idx]
+            _high = np.max(self.dataset[idx]) + 5 * sigma[idx]
+            _mirrors = [None]
+            if low is not None and low > _low:
+                _low = low
+                _mirrors.append(low)
+            if high is not None and high < _high:
+                _high = high
+                _mirrors.append(high)
+            spacing = (_high - _low) / (self.grid_size - 1)
+            # pad the grid so that samples within the support of the kernel
+            # (and their mirrored copies) contribute to the density
+            npad = int(np.ceil(5 * sigma[idx] / spacing))
+            nodes.append(
+                _low + spacing * np.arange(-npad, self.grid_size + npad)
+            )
+            mirrors.append(_mirrors)
+        x, y = self.dataset
+        # reflecting the samples in one axis reflects the kernel too, which
+        # flips the sign of the correlation. Copies reflected in one axis are
+        # therefore binned separately from those reflected in neither or both
+        counts = np.zeros((2, len(nodes[0]), len(nodes[1])))
+        for xmirror in mirrors[0]:
+            _x = x if xmirror is None else 2 * xmirror - x
+            for ymirror in mirrors[1]:
+                _y = y if ymirror is None else 2 * ymirror - y
+                flipped = (xmirror is None) != (ymirror is None)
+                counts[int(flipped)] += _linear_binning(
+                    _x, _y, self.weights, *nodes
+                )
+        npad = [(len(_nodes) - self.grid_size) // 2 for _nodes in nodes]
+        offsets = [
+            (_nodes[1] - _nodes[0]) * np.arange(-_npad, _npad + 1) for
+            _nodes, _npad in zip(nodes, npad)
+        ]
+        dX, dY = np.meshgrid(*offsets, indexing="ij")
+        norm = np.sqrt(np.linalg.det(2 * np.pi * self.covariance))
+        density = np.zeros_like(counts[0])
+        for flipped, _counts in enumerate(counts):
+            if not np.any(_counts):
+                continue
+            inv_cov = self.inv_cov * np.array([[1, -1], [-1, 1]]) ** flipped
+            kernel = np.exp(
+                -0.5 * (
+                    inv_cov[0, 0] * dX ** 2 + 2 * inv_cov[0, 1] * dX * dY
+                    + inv_cov[1, 1] * dY ** 2
+                )
+            ) / norm
+            density += fftconvolve(_counts, kernel, mode="same")
+        density = density[
+            npad[0]:npad[0] + self.grid_size, npad[1]:npad[1] + self.grid_size
+        ]
+        # remove the small negative values introduced by the FFT
+        return (
+            nodes[0][npad[0]:npad[0] + self.grid_size],
+            nodes[1][npad[1]:npad[1] + self.grid_size],
+            np.clip(density, 0., None)
+        )
+
+    def grid_evaluate(self, x, y):
+        """Return an estimate of the density evaluated on a regular grid. The
+        density is set to zero outside of the domain
+
+        Parameters
+        ----------
+        x: np.ndarray
+            grid points along the x axis
+        y: np.ndarray
+            grid points along the y axis
+
+        Returns
+        -------
+        density: np.ndarray
+            2d array of shape (len(y), len(x)) matching np.meshgrid(x, y)
+        """
+        X, Y = np.meshgrid(x, y)
+        if self.method == "direct" or self._transform is not None:
+            # a transform maps the regular grid onto an irregular one, so
+            # the KDE must be evaluated directly
+            return self(np.vstack([X.ravel(), Y.ravel()])).reshape(X.shape)
+        from scipy.ndimage import map_coordinates
+
+        if self.cache:
+            xnodes, ynodes, density = KDE_GRID_CACHE.get(
+                self._cache_key(), self._fft_grid
+            )
+        else:
+            xnodes, ynodes, density = self._fft_grid()
+        coords = [
+            (X - xnodes[0]) / (xnodes[1] - xnodes[0]),
+            (Y - ynodes[0]) / (ynodes[1] - ynodes[0])
+        ]
+        results = map_coordinates(density, coords, order=1, mode="nearest")
+        outside = self._out_of_bounds(X, Y)
+        for _coords, _nodes in zip(coords, [xnodes, ynodes]):
+            outside |= (_coords < -0.5) | (_coords > len(_nodes) - 0.5)
+        results[outside] = 0.
+        return results
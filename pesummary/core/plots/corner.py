@@ -134,10 +134,14 @@ def hist2d(
     kernel = kde(values, **kde_kwargs)
     xmin, xmax = np.min(x.flatten()), np.max(x.flatten())
     ymin, ymax = np.min(y.flatten()), np.max(y.flatten())
-    X, Y = np.meshgrid(X, Y)
-    pts = np.vstack([X.ravel(), Y.ravel()])
-    z = kernel(pts)
-    H = z.reshape(X.shape)
+    if hasattr(kernel, "grid_evaluate"):
+        H = kernel.grid_evaluate(X, Y)
+        X, Y = np.meshgrid(X, Y)
+    else:
+        X, Y = np.meshgrid(X, Y)
+        pts = np.vstack([X.ravel(), Y.ravel()])
+        z = kernel(pts)
+        H = z.reshape(X.shape)
     if smooth is not None:
         if kde_kwargs.get("transform", None) is not None:
             from pesummary.utils.utils import logger
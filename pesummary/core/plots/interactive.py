@@ -1,13 +1,155 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
+import json
+import numpy as np
 import plotly.graph_objects as go
 from plotly.colors import DEFAULT_PLOTLY_COLORS
 import plotly
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
+_PAYLOAD_LOADER = """window.PESUMMARY_SAMPLES = window.PESUMMARY_SAMPLES || {};
+window.pesummary_samples = window.pesummary_samples || function(label, parameter) {
+    var payload = window.PESUMMARY_SAMPLES[label];
+    payload.decoded = payload.decoded || {};
+    if (!(parameter in payload.decoded)) {
+        var string = atob(payload.data[parameter]);
+        var bytes = new Uint8Array(string.length);
+        for (var i = 0; i < string.length; i++) {
+            bytes[i] = string.charCodeAt(i);
+        }
+        var values = new Float32Array(bytes.buffer);
+        var offset = payload.offset[parameter];
+        var decoded = new Array(values.length);
+        for (var j = 0; j < values.length; j++) {
+            decoded[j] = offset + values[j];
+        }
+        payload.decoded[parameter] = decoded;
+    }
+    return payload.decoded[parameter];
+};
+"""
 
-def write_to_html(fig, filename):
+_PAYLOAD_BINDING = """<script>
+(function() {{
+    var figure = {figure};
+    var bindings = {bindings};
+    bindings.forEach(function(binding) {{
+        var keys = binding[1].split(".");
+        var obj = figure.data[binding[0]];
+        for (var i = 0; i < keys.length - 1; i++) {{
+            obj = obj[keys[i]];
+        }}
+        obj[keys[keys.length - 1]] = window.pesummary_samples(
+            binding[2], binding[3]
+        );
+    }});
+    Plotly.newPlot("{div_id}", figure.data, figure.layout, {{"responsive": true}});
+}})();
+</script>
+"""
+
+
+def downsample(samples, npoints=10000, tail_fraction=0.1, seed=123456789):
+    """Return the indices of a subset of samples which contains at most
+    npoints samples. The samples which lie furthest into the tails of any
+    dimension are always kept and the remainder of the subset is drawn
+    uniformly from the bulk
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        2d array of samples with shape (dimensions, number of samples)
+    npoints: int, optional
+        maximum number of samples to keep. Default 10000
+    tail_fraction: float, optional
+        fraction of npoints to reserve for samples in the tails. Default 0.1
+    seed: int, optional
+        random seed to use when drawing samples from the bulk. Default
+        123456789
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pesummary.core.plots.interactive import downsample
+    >>> samples = np.random.normal(size=(2, 100000))
+    >>> indices = downsample(samples, npoints=1000)
+    >>> len(indices)
+    1000
+    >>> np.argmax(samples[0]) in indices
+    True
+    """
+    samples = np.atleast_2d(samples)
+    nsamples = samples.shape[1]
+    if nsamples <= npoints:
+        return np.arange(nsamples)
+    ranks = np.argsort(np.argsort(samples, axis=1), axis=1)
+    distance_from_tail = np.min(
+        np.minimum(ranks, nsamples - 1 - ranks), axis=0
+    )
+    ntail = int(np.clip(tail_fraction, 0., 1.) * npoints)
+    tail = np.argsort(distance_from_tail, kind="stable")[:ntail]
+    bulk = np.setdiff1d(np.arange(nsamples), tail, assume_unique=True)
+    bulk = np.random.default_rng(seed).choice(
+        bulk, npoints - ntail, replace=False
+    )
+    return np.sort(np.concatenate([tail, bulk]))
+
+
+def write_payload(
+    samples, label, filename, npoints=10000, tail_fraction=0.1,
+    seed=123456789
+):
+    """Write a set of samples to a javascript payload which can be shared
+    between all interactive plots. The samples are downsampled to at most
+    npoints (see `downsample`) and each dimension is stored as base64 encoded
+    float32 offsets from its median
+
+    Parameters
+    ----------
+    samples: dict
+        dictionary of samples for each parameter
+    label: str
+        label used to identify the samples in the payload
+    filename: str
+        name of the file you wish to write the payload to
+    npoints: int, optional
+        maximum number of samples to store. Default 10000
+    tail_fraction: float, optional
+        fraction of npoints to reserve for samples in the tails. Default 0.1
+    seed: int, optional
+        random seed to use when downsampling. Default 123456789
+    """
+    import base64
+
+    parameters = list(samples.keys())
+    data = np.array([np.asarray(samples[param]) for param in parameters])
+    data = data[:, downsample(data, npoints, tail_fraction, seed)]
+    offset = np.nan_to_num(np.nanmedian(data, axis=1))
+    encoded = {
+        param: base64.b64encode(
+            (value - _offset).astype("<f4").tobytes()
+        ).decode("ascii") for param, value, _offset in zip(
+            parameters, data, offset
+        )
+    }
+    payload = {
+        "nsamples": int(data.shape[1]),
+        "offset": {param: float(_offset) for param, _offset in zip(
+            parameters, offset
+        )},
+        "data": encoded
+    }
+    with open(filename, "w") as f:
+        f.write(_PAYLOAD_LOADER)
+        f.write(
+            "window.PESUMMARY_SAMPLES[{}] = {};\n".format(
+                json.dumps(label), json.dumps(payload)
+            )
+        )
+
+
+def write_to_html(fig, filename, bindings=None, payloads=None):
     """Write a plotly.graph.objects.go.Figure to a html file
 
     Parameters
@@ -16,13 +158,40 @@ def write_to_html(fig, filename):
         figure containing the plot that you wish to save to html
     filename: str
         name of the file that you wish to write the figure to
+    bindings: list, optional
+        list of (trace index, attribute, label, parameter) tuples. If
+        provided, the attribute of each trace is populated in the browser
+        with the samples for parameter stored in the payload for label.
+        Default None
+    payloads: list, optional
+        list of payload files to load before the figure is drawn. Only used
+        if bindings is provided. Default None
     """
-    div = plotly.offline.plot(fig, include_plotlyjs=False, output_type='div')
     data = "<script src='https://cdn.plot.ly/plotly-latest.min.js'></script>\n"
     data += (
         "<script src='https://cdnjs.cloudflare.com/ajax/libs/mathjax/2.7.1/"
         "MathJax.js?config=TeX-MML-AM_SVG'></script>"
     )
+    if bindings is None:
+        div = plotly.offline.plot(
+            fig, include_plotlyjs=False, output_type='div'
+        )
+    else:
+        import uuid
+
+        div_id = "pesummary-{}".format(uuid.uuid4())
+        layout = fig.layout
+        div = "\n" + "".join(
+            "<script src='{}'></script>\n".format(src) for src in
+            dict.fromkeys(payloads or [])
+        )
+        div += "<div id='{}' style='width:{}px;height:{}px;'></div>\n".format(
+            div_id, layout.width, layout.height
+        )
+        div += _PAYLOAD_BINDING.format(
+            figure=plotly.io.to_json(fig), bindings=json.dumps(bindings),
+            div_id=div_id
+        )
     with open(filename, "w") as f:
         data += div
         f.write(data)
@@ -122,7 +291,7 @@ def histogram2d(
 def ridgeline(
     data, labels, xlabel='x', palette='colorblind', colors=None, width=3,
     write_to_html_file="interactive_ridgeline.html", showlegend=False,
-    dimensions={'width': 1100, 'height': 700}
+    dimensions={'width': 1100, 'height': 700}, payload=None
 ):
     """Build an interactive ridgeline plot
 
@@ -149,15 +318,22 @@ def ridgeline(
         Whether or not to add a legend to the plot
     dimensions: dict
         A dictionary giving the width and height of the figure
+    payload: dict, optional
+        dictionary containing the 'src' of the payload for each label (see
+        `write_payload`) and the 'parameter' to plot. If provided, the samples
+        are loaded from the shared payloads in the browser rather than being
+        embedded in the html file, and data is ignored. Default None
     """
     fig = go.Figure()
     if colors is None:
         import seaborn
 
         colors = seaborn.color_palette(
-            palette=palette, n_colors=len(data)
+            palette=palette, n_colors=len(labels)
         ).as_hex()
 
+    if payload is not None:
+        data = [None] * len(labels)
     for dd, label, color in zip(data, labels, colors):
         fig.add_trace(go.Violin(x=dd, line_color=color, name=label))
 
@@ -170,7 +346,15 @@ def ridgeline(
         font=dict(size=18), showlegend=showlegend
     )
     if write_to_html_file is not None:
-        write_to_html(fig, write_to_html_file)
+        if payload is not None:
+            write_to_html(
+                fig, write_to_html_file, bindings=[
+                    [num, "x", label, payload["parameter"]] for num, label
+                    in enumerate(labels)
+                ], payloads=payload["src"]
+            )
+        else:
+            write_to_html(fig, write_to_html_file)
         return
     return fig
 
@@ -178,7 +362,8 @@ def ridgeline(
 def corner(
     data, labels, dimensions={'width': 900, 'height': 900}, show_diagonal=False,
     colors={'selected': 'rgba(248,148,6,1)', 'not_selected': 'rgba(0,0,0,1)'},
-    show_upper_half=False, write_to_html_file="interactive_corner.html"
+    show_upper_half=False, write_to_html_file="interactive_corner.html",
+    payload=None
 ):
     """Build an interactive corner plot
 
@@ -202,7 +387,15 @@ def corner(
         Whether or not to show the upper half of scatter plots
     write_to_html_file: str
         Name of the html file you wish to write the figure to
+    payload: dict, optional
+        dictionary containing the 'src' and 'label' of a payload written with
+        `write_payload` and the names of the 'parameters' to plot. If
+        provided, the samples are loaded from the shared payload in the
+        browser rather than being embedded in the html file, and data is
+        ignored. Default None
     """
+    if payload is not None:
+        data = [None] * len(labels)
     data_structure = [
         dict(label=label, values=value) for label, value in zip(
             labels, data
@@ -231,6 +424,16 @@ def corner(
         )
     )
     if write_to_html_file is not None:
-        write_to_html(fig, write_to_html_file)
+        if payload is not None:
+            write_to_html(
+                fig, write_to_html_file, bindings=[
+                    [0, "dimensions.{}.values".format(num), payload["label"],
+                     parameter] for num, parameter in enumerate(
+                        payload["parameters"]
+                    )
+                ], payloads=[payload["src"]]
+            )
+        else:
+            write_to_html(fig, write_to_html_file)
         return
     return fig
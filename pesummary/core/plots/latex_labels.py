@@ -1,9 +1,7 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
-__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
-
+# The latex labels are stored outside of pesummary.core.plots so that they can
+# be imported without configuring matplotlib
+from pesummary.core.latex_labels import latex_labels
 
-latex_labels = {
-    "log_likelihood": r"$\log{\mathcal{L}}$",
-    "log_prior": r"$\log{P}$"
-}
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
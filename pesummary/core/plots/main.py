@@ -59,6 +59,21 @@ class _PlotGeneration(object):
         whether to make interactive plots, default is False
     disable_corner: bool, optional
         whether to make the corner plot, default is False
+    thumbnails: bool, optional
+        whether to generate reduced size thumbnails of all plots, default is
+        False
+    webp_thumbnails: bool, optional
+        whether to also generate WebP variants of the thumbnails, default is
+        False
+    incremental: bool, optional
+        whether only the plots which have changed since the existing webpage
+        was generated need new thumbnails, default is False
+    interactive_point_budget: int, optional
+        maximum number of samples per analysis to show in the interactive
+        plots. If provided, the samples are downsampled (keeping the tails)
+        and stored once per analysis in a payload which is shared by all
+        interactive plots. Default None, i.e. all samples are embedded in each
+        interactive plot
     """
     def __init__(
         self, savedir=None, webdir=None, labels=None, samples=None,
@@ -68,7 +83,9 @@ class _PlotGeneration(object):
         add_to_existing=False, priors={}, include_prior=False, weights=None,
         disable_comparison=False, linestyles=None, disable_interactive=False,
         multi_process=1, mcmc_samples=False, disable_corner=False,
-        corner_params=None, expert_plots=True, checkpoint=False
+        corner_params=None, expert_plots=True, checkpoint=False,
+        thumbnails=False, webp_thumbnails=False, incremental=False,
+        interactive_point_budget=None
     ):
         self.package = "core"
         self.webdir = webdir
@@ -92,6 +109,8 @@ class _PlotGeneration(object):
         self.include_prior = include_prior
         self.linestyles = linestyles
         self.make_interactive = not disable_interactive
+        self.interactive_point_budget = interactive_point_budget
+        self._interactive_payloads = {}
         self.make_corner = not disable_corner
         self.corner_params = corner_params
         self.expert_plots = expert_plots
@@ -99,6 +118,9 @@ class _PlotGeneration(object):
             logger.warning("Unable to generate expert plots for mcmc samples")
             self.expert_plots = False
         self.checkpoint = checkpoint
+        self.thumbnails = thumbnails
+        self.webp_thumbnails = webp_thumbnails
+        self.incremental = incremental
         self.multi_process = multi_process
         self.pool = self.setup_pool()
         self.preliminary_pages = {label: False for label in self.labels}
@@ -242,6 +264,20 @@ class _PlotGeneration(object):
         if self.make_comparison:
             logger.debug("Starting to generate comparison plots")
             self._generate_comparison_plots()
+        if self.thumbnails:
+            logger.debug("Starting to generate thumbnails")
+            self.make_thumbnails()
+
+    def make_thumbnails(self):
+        """Generate reduced size thumbnails for all plots and record the
+        dimensions of each plot
+        """
+        from pesummary.core.plots.thumbnails import make_thumbnails
+
+        return make_thumbnails(
+            self.savedir, webp=self.webp_thumbnails, pool=self.pool,
+            skip_existing=self.incremental
+        )
 
     def check_prior_samples_in_dict(self, label, param):
         """Check to see if there are prior samples for a given param
@@ -1197,6 +1233,42 @@ class _PlotGeneration(object):
             fig, filename, preliminary=preliminary
         )
 
+    def interactive_payload(self, label):
+        """Write the samples for a given analysis to a payload which is
+        shared by all interactive plots and return its location relative to
+        the html pages. None is returned if the interactive plots embed all
+        samples
+
+        Parameters
+        ----------
+        label: str
+            the label for the results file that you wish to write a payload
+            for
+        """
+        if self.interactive_point_budget is None:
+            return None
+        if label not in self._interactive_payloads.keys():
+            if label in self.samples.keys():
+                samples = self.samples[label]
+                if self.mcmc_samples:
+                    samples = samples.combine
+            else:
+                samples = {
+                    param: self.same_samples[param][label] for param in
+                    self.same_parameters
+                }
+            make_dir(os.path.join(self.savedir, "interactive"))
+            filename = os.path.join(
+                self.savedir, "interactive", "{}_samples.js".format(label)
+            )
+            interactive.write_payload(
+                samples, label, filename, npoints=self.interactive_point_budget
+            )
+            self._interactive_payloads[label] = os.path.relpath(
+                filename, os.path.join(self.webdir, "html")
+            )
+        return self._interactive_payloads[label]
+
     def interactive_ridgeline_plot(self, label):
         """Generate an interactive ridgeline plot for all paramaters that are
         common to all result files
@@ -1204,10 +1276,16 @@ class _PlotGeneration(object):
         error_message = (
             "Failed to generate an interactive ridgeline plot for %s because {}"
         )
+        payload = None
+        if self.interactive_point_budget is not None:
+            payload = [
+                self.interactive_payload(_label) for _label in
+                self.same_samples[self.same_parameters[0]].keys()
+            ]
         for param in self.same_parameters:
             arguments = [
                 self.savedir, param, self.same_samples[param],
-                latex_labels[param], self.colors, self.checkpoint
+                latex_labels[param], self.colors, self.checkpoint, payload
             ]
             self._try_to_make_a_plot(
                 arguments, self._interactive_ridgeline_plot,
@@ -1217,9 +1295,29 @@ class _PlotGeneration(object):
 
     @staticmethod
     def _interactive_ridgeline_plot(
-        savedir, parameter, samples, latex_label, colors, checkpoint=False
+        savedir, parameter, samples, latex_label, colors, checkpoint=False,
+        payload=None
     ):
-        """Generate an interactive ridgeline plot for
+        """Generate an interactive ridgeline plot for a given parameter
+
+        Parameters
+        ----------
+        savedir: str
+            the directory you wish to save the plot in
+        parameter: str
+            name of the parameter that you wish to plot
+        samples: dict
+            dictionary of samples for each analysis
+        latex_label: str
+            latex label for parameter
+        colors: list
+            list of colors to use for each analysis
+        checkpoint: Bool, optional
+            if True, do not regenerate a plot which already exists
+        payload: list, optional
+            location of the shared payload for each analysis. If provided,
+            the samples are loaded from the payloads rather than being
+            embedded in the html file
         """
         filename = os.path.join(
             savedir, "interactive_ridgeline_{}.html".format(parameter)
@@ -1227,9 +1325,11 @@ class _PlotGeneration(object):
         if os.path.isfile(filename) and checkpoint:
             return
         same_samples = [val for key, val in samples.items()]
+        if payload is not None:
+            payload = dict(src=payload, parameter=parameter)
         _ = interactive.ridgeline(
             same_samples, list(samples.keys()), xlabel=latex_label,
-            colors=colors, write_to_html_file=filename
+            colors=colors, write_to_html_file=filename, payload=payload
         )
 
     def interactive_corner_plot(self, label):
@@ -1242,12 +1342,12 @@ class _PlotGeneration(object):
         """
         self._interactive_corner_plot(
             self.savedir, label, self.samples[label], latex_labels,
-            self.checkpoint
+            self.checkpoint, payload=self.interactive_payload(label)
         )
 
     @staticmethod
     def _interactive_corner_plot(
-        savedir, label, samples, latex_labels, checkpoint=False
+        savedir, label, samples, latex_labels, checkpoint=False, payload=None
     ):
         """Generate an interactive corner plot for a given set of samples
 
@@ -1262,17 +1362,25 @@ class _PlotGeneration(object):
             contain samples for each parameter
         latex_labels: str
             latex labels for each parameter in samples
+        checkpoint: Bool, optional
+            if True, do not regenerate a plot which already exists
+        payload: str, optional
+            location of the shared payload for label. If provided, the
+            samples are loaded from the payload rather than being embedded in
+            the html file
         """
         filename = os.path.join(
             savedir, "corner", "{}_interactive.html".format(label)
         )
         if os.path.isfile(filename) and checkpoint:
             return
-        parameters = samples.keys()
+        parameters = list(samples.keys())
         data = [samples[parameter] for parameter in parameters]
         latex_labels = [latex_labels[parameter] for parameter in parameters]
+        if payload is not None:
+            payload = dict(src=payload, label=label, parameters=parameters)
         _ = interactive.corner(
-            data, latex_labels, write_to_html_file=filename
+            data, latex_labels, write_to_html_file=filename, payload=payload
         )
 
     def oned_cdf_comparison_plot(self, label):
@@ -6,6 +6,7 @@ from pesummary.utils.utils import (
 )
 from pesummary.core.plots.seaborn.kde import kdeplot
 from pesummary.core.plots.figure import figure, subplots, ExistingFigure
+from pesummary.utils.diagnostics import autocorrelation
 from pesummary import conf
 
 import matplotlib.style
@@ -15,7 +16,6 @@ import copy
 from itertools import cycle
 
 import numpy as np
-from scipy import signal
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 _check_latex_install()
@@ -52,18 +52,12 @@ def _autocorrelation_plot(
         fig, ax = figure(gca=True)
     else:
         ax = fig.gca()
-    samples = samples[int(len(samples) / 2):]
-    x = samples - np.mean(samples)
-    y = np.conj(x[::-1])
-    acf = np.fft.ifftshift(signal.fftconvolve(y, x, mode="full"))
-    N = np.array(samples).shape[0]
-    acf = acf[0:N]
+    acf = autocorrelation(np.asarray(samples)[int(len(samples) / 2):])
     # Hack to make test pass with python3.8
     if color == "$":
         color = conf.color
     ax.plot(
-        acf / acf[0], linestyle=" ", marker="o", markersize=markersize,
-        color=color
+        acf, linestyle=" ", marker="o", markersize=markersize, color=color
     )
     ax.ticklabel_format(axis="x", style="plain")
     ax.set_xlabel("lag")
@@ -92,10 +86,29 @@ def _autocorrelation_plot_mcmc(
     """
     cycol = cycle(colorcycle)
     fig, ax = figure(gca=True)
-    for ss in samples:
-        fig = _autocorrelation_plot(
-            param, ss, fig=fig, markersize=1.25, color=next(cycol), grid=grid
+    lengths = [len(ss) for ss in samples]
+    if len(set(lengths)) > 1:
+        for ss in samples:
+            fig = _autocorrelation_plot(
+                param, ss, fig=fig, markersize=1.25, color=next(cycol),
+                grid=grid
+            )
+        return fig
+    logger.debug("Generating the autocorrelation function for %s" % (param))
+    acf = autocorrelation(np.asarray(samples)[:, int(lengths[0] / 2):])
+    for _acf in acf:
+        color = next(cycol)
+        # Hack to make test pass with python3.8
+        if color == "$":
+            color = conf.color
+        ax.plot(
+            _acf, linestyle=" ", marker="o", markersize=1.25, color=color
         )
+    ax.ticklabel_format(axis="x", style="plain")
+    ax.set_xlabel("lag")
+    ax.set_ylabel("ACF")
+    ax.grid(b=grid)
+    fig.tight_layout()
     return fig
 
 
@@ -619,14 +632,60 @@ def _1d_histogram_plot_bootstrap(
         number of tests to perform. Default 100
     **kwargs: dict, optional
         all additional kwargs passed to _1d_histogram_plot
+
+    Notes
+    -----
+    When only a Gaussian or reflection bounded KDE is requested, the
+    densities of all tests are evaluated in a single batch with
+    `pesummary.utils.bootstrap.bootstrap_kde`
     """
     if nsamples > len(samples):
         nsamples = int(len(samples) / 2)
+    cycol = cycle(colorcycle)
+    kde_kwargs = kwargs.get("kde_kwargs", {})
+    _kernel = kde_kwargs.get("kde_kernel", None)
+    _batched = (
+        kde and not hist and not plot_percentile and (
+            _kernel is None or (
+                getattr(_kernel, "__name__", None) == "bounded_1d_kde" and
+                kde_kwargs.get("method", "Reflection") == "Reflection"
+            )
+        ) and all(
+            key in ["kde_kernel", "xlow", "xhigh"] for key in kde_kwargs.keys()
+        )
+    )
+    if _batched:
+        from pesummary.utils.bootstrap import bootstrap_kde
+
+        logger.debug(
+            "Evaluating {} bootstrapped KDEs for {} in a single batch".format(
+                ntests, param
+            )
+        )
+        x, densities, _ = bootstrap_kde(
+            samples, nsamples=nsamples, ntests=ntests,
+            xlow=kde_kwargs.get("xlow", None),
+            xhigh=kde_kwargs.get("xhigh", None),
+            random_state=np.random.default_rng(np.random.randint(2**32 - 1))
+        )
+        fig, ax = figure(gca=True)
+        for density in densities:
+            color = next(cycol)
+            ax.plot(x, density, color=color)
+            if shade:
+                ax.fill_between(x, 0, density, color=color, alpha=0.1)
+        ax.set_xlabel(latex_label)
+        ax.set_ylabel("Probability Density")
+        ax.grid(b=kwargs.get("grid", True))
+        ax.set_title(
+            "Ntests: {}, Nsamples per test: {}".format(ntests, nsamples)
+        )
+        fig.tight_layout()
+        return fig
     _samples = [
         np.random.choice(samples, size=nsamples, replace=False) for _ in
         range(ntests)
     ]
-    cycol = cycle(colorcycle)
     fig, ax = figure(gca=True)
     for ss in _samples:
         fig = _1d_histogram_plot(
@@ -0,0 +1,193 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import os
+import json
+from glob import glob
+from multiprocessing import Pool
+
+from pesummary.utils.utils import logger, make_dir
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+THUMBNAIL_DIRECTORY = "thumbnails"
+IMAGE_DIMENSIONS_FILE = "image_dimensions.json"
+
+
+def thumbnail_path(path, format=None):
+    """Return the path to the thumbnail of a given image
+
+    Parameters
+    ----------
+    path: str
+        path to the full resolution image
+    format: str, optional
+        format of the thumbnail. Default is to use the same format as the
+        full resolution image
+    """
+    dirname, basename = os.path.split(path)
+    if format is not None:
+        basename = "{}.{}".format(os.path.splitext(basename)[0], format)
+    return os.path.join(dirname, THUMBNAIL_DIRECTORY, basename)
+
+
+def make_thumbnail(path, width=450, webp=False):
+    """Generate a reduced size thumbnail of an image. The thumbnail is stored
+    in a `thumbnails` directory alongside the full resolution image
+
+    Parameters
+    ----------
+    path: str
+        path to the full resolution image
+    width: int, optional
+        maximum width of the thumbnail in pixels. Default 450
+    webp: Bool, optional
+        if True, a WebP variant of the thumbnail is also generated. Default
+        False
+
+    Returns
+    -------
+    dimensions: dict
+        dictionary containing the width and height of the full resolution
+        image and the thumbnail
+    """
+    from PIL import Image
+
+    make_dir(os.path.join(os.path.dirname(path), THUMBNAIL_DIRECTORY))
+    with Image.open(path) as image:
+        dimensions = {"width": image.size[0], "height": image.size[1]}
+        thumbnail = image.copy()
+    thumbnail.thumbnail(
+        (width, int(width * dimensions["height"] / dimensions["width"]) or 1)
+    )
+    thumbnail.save(thumbnail_path(path))
+    dimensions.update(
+        {"thumbnail_width": thumbnail.size[0],
+         "thumbnail_height": thumbnail.size[1]}
+    )
+    if webp:
+        try:
+            thumbnail.save(thumbnail_path(path, format="webp"), format="webp")
+            dimensions["webp"] = True
+        except (KeyError, OSError) as e:
+            logger.debug(
+                "Unable to generate a WebP thumbnail for {} because {}".format(
+                    path, e
+                )
+            )
+            dimensions["webp"] = False
+    return dimensions
+
+
+def _wrapper_for_make_thumbnail(args):
+    """Wrapper function for make_thumbnail for a pool of workers
+
+    Parameters
+    ----------
+    args: tuple
+        all args passed to make_thumbnail
+    """
+    try:
+        return make_thumbnail(*args)
+    except Exception as e:
+        logger.warning(
+            "Failed to generate a thumbnail for {} because {}".format(args[0], e)
+        )
+        return None
+
+
+def make_thumbnails(
+    savedir, images=None, width=450, webp=False, multi_process=1, pool=None,
+    skip_existing=False
+):
+    """Generate thumbnails for a set of images and record the dimensions of
+    each image in a json file stored in the thumbnails directory
+
+    Parameters
+    ----------
+    savedir: str
+        directory containing the full resolution images
+    images: list, optional
+        list of images to generate thumbnails for. Default all png images in
+        savedir
+    width: int, optional
+        maximum width of the thumbnails in pixels. Default 450
+    webp: Bool, optional
+        if True, WebP variants of the thumbnails are also generated. Default
+        False
+    multi_process: int, optional
+        number of cores to use when generating thumbnails. Default 1
+    pool: multiprocessing.Pool, optional
+        existing pool of workers to use. Default None
+    skip_existing: Bool, optional
+        if True, thumbnails are only generated for images which do not
+        already have an up to date thumbnail. Default False
+
+    Returns
+    -------
+    dimensions: dict
+        dictionary containing the dimensions of each image, keyed by the
+        basename of the image
+    """
+    if images is None:
+        images = sorted(glob(os.path.join(savedir, "*.png")))
+    if skip_existing:
+        _existing = read_image_dimensions(savedir)
+        images = [
+            path for path in images if not _thumbnail_up_to_date(
+                path, _existing
+            )
+        ]
+    args = [(path, width, webp) for path in images]
+    if pool is not None:
+        dimensions = pool.map(_wrapper_for_make_thumbnail, args)
+    elif multi_process > 1:
+        with Pool(processes=multi_process) as _pool:
+            dimensions = _pool.map(_wrapper_for_make_thumbnail, args)
+    else:
+        dimensions = [_wrapper_for_make_thumbnail(arg) for arg in args]
+    dimensions = {
+        os.path.basename(path): _dimensions for path, _dimensions in
+        zip(images, dimensions) if _dimensions is not None
+    }
+    make_dir(os.path.join(savedir, THUMBNAIL_DIRECTORY))
+    filename = os.path.join(savedir, THUMBNAIL_DIRECTORY, IMAGE_DIMENSIONS_FILE)
+    existing = read_image_dimensions(savedir)
+    existing.update(dimensions)
+    with open(filename, "w") as f:
+        json.dump(existing, f, indent=4, sort_keys=True)
+    return existing
+
+
+def _thumbnail_up_to_date(path, dimensions):
+    """Return True if the thumbnail of an image exists, has been recorded and
+    is newer than the image
+
+    Parameters
+    ----------
+    path: str
+        path to the full resolution image
+    dimensions: dict
+        dictionary containing the dimensions of each image, keyed by the
+        basename of the image
+    """
+    thumbnail = thumbnail_path(path)
+    if os.path.basename(path) not in dimensions.keys():
+        return False
+    if not os.path.isfile(thumbnail):
+        return False
+    return os.path.getmtime(thumbnail) >= os.path.getmtime(path)
+
+
+def read_image_dimensions(savedir):
+    """Read the dimensions of all images which have a thumbnail
+
+    Parameters
+    ----------
+    savedir: str
+        directory containing the full resolution images
+    """
+    filename = os.path.join(savedir, THUMBNAIL_DIRECTORY, IMAGE_DIMENSIONS_FILE)
+    if not os.path.isfile(filename):
+        return {}
+    with open(filename, "r") as f:
+        return json.load(f)
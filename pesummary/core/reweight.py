@@ -5,6 +5,7 @@ from pesummary.utils.utils import logger
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 options = {}
+modes = ["rejection", "weights"]
 
 
 def rejection_sampling(data, weights):
@@ -25,3 +26,75 @@ def rejection_sampling(data, weights):
         )
     )
     return data[idx]
+
+
+def effective_sample_size(weights):
+    """Return Kish's effective sample size for a set of importance weights
+
+    Parameters
+    ----------
+    weights: np.ndarray
+        a set of weights for each sample
+    """
+    weights = np.asarray(weights, dtype=float)
+    return np.sum(weights)**2 / np.sum(weights**2)
+
+
+def importance_sampling(data, weights):
+    """Reweight an input by attaching a set of importance weights to each
+    sample. No samples are discarded. If the input is already weighted, the
+    new weights are multiplied by the existing weights
+
+    Parameters
+    ----------
+    data: pesummary.utils.samples_dict.SamplesDict
+        posterior table you wish to reweight
+    weights: np.ndarray
+        a set of weights for each sample
+    """
+    from pesummary.utils.samples_dict import SamplesDict
+
+    weights = np.asarray(weights, dtype=float)
+    parameters = list(data.keys())
+    samples = np.array([data[param] for param in parameters])
+    existing = [param for param in ["weights", "weight"] if param in parameters]
+    if len(existing):
+        ind = parameters.index(existing[0])
+        weights = weights * samples[ind]
+        samples = np.delete(samples, ind, axis=0)
+        parameters.pop(ind)
+    weights = weights / np.max(weights)
+    logger.info(
+        "Importance sampling resulted in an effective sample size of {:.1f} "
+        "({} input)".format(effective_sample_size(weights), len(weights))
+    )
+    return SamplesDict(
+        parameters + ["weights"], np.vstack([samples, weights]),
+        logger_warn="debug"
+    )
+
+
+def apply_weights(data, weights, mode="rejection"):
+    """Reweight an input with a set of weights, either by rejection sampling
+    or by attaching importance weights to each sample
+
+    Parameters
+    ----------
+    data: np.ndarray/pesummary.utils.samples_dict.SamplesDict
+        posterior table you wish to reweight
+    weights: np.ndarray
+        a set of weights for each sample
+    mode: str, optional
+        either 'rejection' to discard samples with rejection sampling or
+        'weights' to attach importance weights to each sample. Default
+        'rejection'
+    """
+    if mode == "rejection":
+        return rejection_sampling(data, weights)
+    elif mode == "weights":
+        return importance_sampling(data, weights)
+    raise ValueError(
+        "Unknown reweighting mode '{}'. Please choose one of {}".format(
+            mode, ", ".join(modes)
+        )
+    )
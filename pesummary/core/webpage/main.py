@@ -100,6 +100,15 @@ class _WebpageGeneration(object):
         dictionary of package information
     mcmc_samples: Bool
         Whether or not mcmc samples have been passed
+    multi_process: int, optional
+        number of processes to use when generating independent groups of
+        webpages. Default 1
+    thumbnails: Bool, optional
+        if True, images are lazily loaded and thumbnails are used in place of
+        the full resolution images where possible. Default False
+    incremental: Bool, optional
+        if True and adding to an existing webpage, result pages are only
+        generated for the new labels. Default False
     """
     def __init__(
         self, webdir=None, samples=None, labels=None, publication=None,
@@ -113,6 +122,7 @@ class _WebpageGeneration(object):
         package_information={"packages": [], "manager": "pypi"},
         mcmc_samples=False, external_hdf5_links=False, key_data=None,
         existing_plot=None, disable_expert=False, analytic_priors=None,
+        multi_process=1, thumbnails=False, incremental=False
     ):
         self.webdir = webdir
         make_dir(self.webdir)
@@ -142,6 +152,7 @@ class _WebpageGeneration(object):
         self.existing_metafile = existing_metafile
         self.existing_file_kwargs = existing_file_kwargs
         self.add_to_existing = add_to_existing
+        self.incremental = incremental
         self.analytic_priors = analytic_priors
         if self.analytic_priors is None:
             self.analytic_priors = {label: None for label in self.samples.keys()}
@@ -171,6 +182,13 @@ class _WebpageGeneration(object):
         self.external_hdf5_links = external_hdf5_links
         self.existing_plot = existing_plot
         self.expert_plots = not disable_expert
+        self.multi_process = multi_process
+        self.image_dimensions = None
+        if thumbnails:
+            from pesummary.core.plots.thumbnails import read_image_dimensions
+            self.image_dimensions = read_image_dimensions(
+                os.path.join(self.webdir, "plots")
+            )
         self.make_comparison = (
             not disable_comparison and self._total_number_of_labels > 1
         )
@@ -219,6 +237,19 @@ class _WebpageGeneration(object):
             "posterior_samples.h5"
         )
 
+    @property
+    def result_page_labels(self):
+        """Return the labels which require result pages. If incrementally
+        adding to an existing webpage, the result pages for the existing labels
+        are not regenerated
+        """
+        if self.incremental and self.existing_labels is not None:
+            return [
+                label for label in self.labels if label not in
+                self.existing_labels
+            ]
+        return self.labels
+
     @property
     def _total_number_of_labels(self):
         _number_of_labels = 0
@@ -519,14 +550,15 @@ class _WebpageGeneration(object):
     def generate_webpages(self):
         """Generate all webpages for all result files passed
         """
+        webpage.clear_html_caches()
         if self.add_to_existing:
             self.add_existing_data()
         self.make_home_pages()
-        self.make_1d_histogram_pages()
-        self.make_corner_pages()
-        self.make_config_pages()
+        page_groups = ["make_1d_histogram_pages", "make_config_pages"]
         if self.make_comparison:
-            self.make_comparison_pages()
+            page_groups.append("make_comparison_pages")
+        processes = self.launch_page_groups(page_groups)
+        self.make_corner_pages()
         if self.make_interactive:
             self.make_interactive_pages()
         if self.existing_plot is not None:
@@ -538,11 +570,96 @@ class _WebpageGeneration(object):
             self.make_notes_page()
         self.make_downloads_page()
         self.make_about_page()
+        self.wait_for_page_groups(processes)
+        if self.incremental and self.existing_labels is not None:
+            self.update_existing_navbars()
         try:
             self.generate_specific_javascript()
         except Exception:
             pass
 
+    def launch_page_groups(self, page_groups):
+        """Generate groups of independent webpages. If multi_process > 1, up
+        to multi_process - 1 groups are generated in separate processes while
+        the remaining groups are generated in the current process. Each
+        process runs a method of this class, and therefore needs a copy of
+        its state, so processes are always started with the 'fork' start
+        method. If 'fork' is not available on this platform, all groups are
+        generated in the current process
+
+        Parameters
+        ----------
+        page_groups: list
+            list of method names which each generate a group of webpages
+
+        Returns
+        -------
+        processes: dict
+            dictionary of processes which are generating webpages keyed by
+            the method name
+        """
+        import multiprocessing as mp
+
+        processes = {}
+        nprocesses = min(int(self.multi_process) - 1, len(page_groups))
+        if nprocesses > 0 and "fork" not in mp.get_all_start_methods():
+            logger.debug(
+                "Unable to fork processes on this platform. Generating all "
+                "webpages in series"
+            )
+            nprocesses = 0
+        elif nprocesses > 0:
+            ctx = mp.get_context("fork")
+        for group in page_groups[:max(nprocesses, 0)]:
+            logger.debug("Launching subprocess to run {}".format(group))
+            processes[group] = ctx.Process(target=getattr(self, group))
+            processes[group].start()
+        for group in page_groups[len(processes):]:
+            getattr(self, group)()
+        return processes
+
+    def update_existing_navbars(self):
+        """Update the navbar on the result pages of the existing labels. When
+        incrementally adding to an existing webpage, these pages are not
+        regenerated and would otherwise not link to the new labels
+        """
+        for label in self.existing_labels:
+            if label not in self.navbar["result_page"].keys():
+                continue
+            prefix = "{}_{}".format(label, label)
+            pages = glob(os.path.join(self.webdir, "html", prefix + "*.html"))
+            for filename in pages:
+                if os.path.basename(filename)[len(prefix)] not in [".", "_"]:
+                    continue
+                with open(filename, "r") as f:
+                    html = f.read()
+                _html = webpage.replace_navbar_links(
+                    html, self.navbar["result_page"][label], label=label
+                )
+                if _html != html:
+                    with open(filename, "w") as f:
+                        f.write(_html)
+
+    def wait_for_page_groups(self, processes):
+        """Wait for all groups of webpages generated in separate processes to
+        finish. If a process failed, the group is generated again in the
+        current process
+
+        Parameters
+        ----------
+        processes: dict
+            dictionary of processes keyed by the method name that they are
+            running
+        """
+        for group, process in processes.items():
+            process.join()
+            if process.exitcode != 0:
+                logger.warning(
+                    "Failed to run {} in a subprocess. Running again in "
+                    "series".format(group)
+                )
+                getattr(self, group)()
+
     def create_blank_html_pages(self, pages, stylesheets=[]):
         """Create blank html pages
 
@@ -581,7 +698,7 @@ class _WebpageGeneration(object):
         """
         html_file = webpage.open_html(
             web_dir=self.webdir, base_url=self.base_url, html_page=html_page,
-            label=label
+            label=label, image_dimensions=self.image_dimensions
         )
         _preliminary_keys = self.preliminary_pages.keys()
         if self.all_pages_preliminary:
@@ -617,7 +734,7 @@ class _WebpageGeneration(object):
     def make_home_pages(self):
         """Wrapper function for _make_home_pages()
         """
-        pages = ["{}_{}".format(i, i) for i in self.labels]
+        pages = ["{}_{}".format(i, i) for i in self.result_page_labels]
         pages.append("home")
         self.create_blank_html_pages(pages)
         self._make_home_pages(pages)
@@ -642,6 +759,8 @@ class _WebpageGeneration(object):
             return
 
         for num, i in enumerate(self.labels):
+            if i not in self.result_page_labels:
+                continue
             html_file = self.setup_page(
                 i, self.navbar["result_page"][i], i, approximant=i,
                 title="{} Summary page".format(i),
@@ -715,20 +834,21 @@ class _WebpageGeneration(object):
     def make_1d_histogram_pages(self):
         """Wrapper function for _make_1d_histogram pages
         """
+        labels = self.result_page_labels
         pages = [
-            "{}_{}_{}".format(i, i, j) for i in self.labels for j in
+            "{}_{}_{}".format(i, i, j) for i in labels for j in
             self.samples[i].keys()
         ]
-        pages += ["{}_{}_Custom".format(i, i) for i in self.labels]
-        pages += ["{}_{}_All".format(i, i) for i in self.labels]
-        for i in self.labels:
+        pages += ["{}_{}_Custom".format(i, i) for i in labels]
+        pages += ["{}_{}_All".format(i, i) for i in labels]
+        for i in labels:
             if len(self._additional_1d_pages[i]):
                 pages += [
                     "{}_{}_{}".format(i, i, j) for j in
                     self._additional_1d_pages[i]
                 ]
         pages += [
-            "{}_{}_{}_all".format(i, i, j[0]) for i in self.labels for j in
+            "{}_{}_{}_all".format(i, i, j[0]) for i in labels for j in
             self.categorize_parameters(self.samples[i].keys()) if len(j[1])
         ]
         self.create_blank_html_pages(pages)
@@ -743,6 +863,8 @@ class _WebpageGeneration(object):
             list of pages that you wish to create
         """
         for num, i in enumerate(self.labels):
+            if i not in self.result_page_labels:
+                continue
             if len(self._additional_1d_pages[i]):
                 for j in self._additional_1d_pages[i]:
                     _parameters = self.additional_1d_pages[j]
@@ -978,8 +1100,8 @@ class _WebpageGeneration(object):
         """Wrapper function for _make_additional_plots_pages
         """
         pages = [
-            "{}_{}_Additional".format(i, i) for i in self.labels if i in
-            self.existing_plot.keys()
+            "{}_{}_Additional".format(i, i) for i in self.result_page_labels
+            if i in self.existing_plot.keys()
         ]
         self.create_blank_html_pages(pages)
         self._make_additional_plots_pages(pages)
@@ -994,6 +1116,8 @@ class _WebpageGeneration(object):
         """
         from PIL import Image
         for num, i in enumerate(self.labels):
+            if i not in self.result_page_labels:
+                continue
             if i not in self.existing_plot.keys():
                 continue
             html_file = self.setup_page(
@@ -1053,7 +1177,7 @@ class _WebpageGeneration(object):
     def make_corner_pages(self):
         """Wrapper function for _make_corner_pages
         """
-        pages = ["{}_{}_Corner".format(i, i) for i in self.labels]
+        pages = ["{}_{}_Corner".format(i, i) for i in self.result_page_labels]
         self.create_blank_html_pages(pages)
         self._make_corner_pages(pages)
 
@@ -1066,6 +1190,8 @@ class _WebpageGeneration(object):
             list of pages that you wish to create
         """
         for num, i in enumerate(self.labels):
+            if i not in self.result_page_labels:
+                continue
             html_file = self.setup_page(
                 "{}_Corner".format(i), self.navbar["result_page"][i], i,
                 title="{} Corner Plots".format(i), approximant=i,
@@ -1093,7 +1219,7 @@ class _WebpageGeneration(object):
     def make_config_pages(self):
         """Wrapper function for _make_config_pages
         """
-        pages = ["{}_{}_Config".format(i, i) for i in self.labels]
+        pages = ["{}_{}_Config".format(i, i) for i in self.result_page_labels]
         self.create_blank_html_pages(pages, stylesheets=pages)
         self._make_config_pages(pages)
 
@@ -1106,6 +1232,8 @@ class _WebpageGeneration(object):
             list of pages that you wish to create
         """
         for num, i in enumerate(self.labels):
+            if i not in self.result_page_labels:
+                continue
             html_file = self.setup_page(
                 "{}_Config".format(i), self.navbar["result_page"][i], i,
                 title="{} Configuration".format(i), approximant=i,
@@ -1371,7 +1499,10 @@ class _WebpageGeneration(object):
     def make_interactive_pages(self):
         """Wrapper function for _make_interactive_pages
         """
-        pages = ["{}_{}_Interactive_Corner".format(i, i) for i in self.labels]
+        pages = [
+            "{}_{}_Interactive_Corner".format(i, i) for i in
+            self.result_page_labels
+        ]
         if self.make_comparison:
             pages += ["Comparison_Interactive_Ridgeline"]
         self.create_blank_html_pages(pages)
@@ -1389,6 +1520,8 @@ class _WebpageGeneration(object):
             list of pages that you wish to create
         """
         for num, i in enumerate(self.labels):
+            if i not in self.result_page_labels:
+                continue
             html_file = self.setup_page(
                 "{}_Interactive_Corner".format(i),
                 self.navbar["result_page"][i], i,
@@ -11,7 +11,7 @@ class table_of_images(Base):
                  autoscale=False, unique_id=None, captions=None, extra_div=False,
                  mcmc_samples=False, margin_left=None, display=None,
                  container_id=None, close_container=True,
-                 add_to_open_container=False):
+                 add_to_open_container=False, image_dimensions=None):
         """
 
         Parameters
@@ -19,6 +19,11 @@ class table_of_images(Base):
         content: nd list
             nd list containing the image paths that you want to include in your
             table. Sorted by columns [[column1], [column2]]
+        image_dimensions: dict, optional
+            dictionary containing the dimensions of each image which has a
+            thumbnail, keyed by the basename of the image. If provided, images
+            are lazily loaded and thumbnails are used in place of the full
+            resolution images where possible
         """
         self.content = content
         self.rows = rows
@@ -36,6 +41,7 @@ class table_of_images(Base):
         self.container_id = container_id
         self.close_container = close_container
         self.add_to_open_container = add_to_open_container
+        self.image_dimensions = image_dimensions
         if self.unique_id is not None:
             self.modal_id = "Modal_{}".format(self.unique_id)
             self.demo_id = "demo_{}".format(self.unique_id)
@@ -47,8 +53,54 @@ class table_of_images(Base):
     def _add_scripts(self):
         self.add_content("<link rel='stylesheet' href='../css/image_styles.css'>\n")
 
+    def _lazy_image(self, path, width):
+        """Return the source and additional attributes for a lazily loaded
+        image. A thumbnail is used in place of the full resolution image if
+        the image is displayed at a width no larger than the thumbnail
+
+        Parameters
+        ----------
+        path: str
+            path to the full resolution image
+        width: str/float
+            width that the image is displayed at in pixels
+        """
+        from pesummary.core.plots.thumbnails import thumbnail_path
+
+        dimensions = self.image_dimensions.get(path.split("/")[-1], None)
+        attributes = "loading='lazy' "
+        if dimensions is None:
+            return path, attributes, None
+        height = int(
+            float(width) * dimensions["height"] / dimensions["width"]
+        )
+        attributes += "width='{}' height='{}' ".format(int(float(width)), height)
+        if float(width) > dimensions["thumbnail_width"]:
+            return path, attributes, None
+        attributes += "data-src='{}' ".format(path)
+        webp = None
+        if dimensions.get("webp", False):
+            webp = thumbnail_path(path, format="webp")
+        return thumbnail_path(path), attributes, webp
+
     def _insert_image(self, path, width, indent, _id, justify="center"):
+        webp = None
+        if self.image_dimensions is not None:
+            path, attributes, webp = self._lazy_image(path, width)
+        else:
+            attributes = ""
+        if self.code == "changeimage":
+            # changeimage only updates the src of the img tag so a webp
+            # source would continue to be displayed after the toggle
+            webp = None
+        if webp is not None:
+            self.add_content("<picture>", indent=indent)
+            self.add_content(
+                "<source srcset='{}' type='image/webp'>".format(webp),
+                indent=indent
+            )
         string = "<img src='{}' alt='No image available' ".format(path) + \
+                 attributes + \
                  "style='align-items:center; width:{}px;'".format(width)
         string += "id={} onclick='{}(\"{}\"".format(_id, self.code, _id)
         if self.code != "changeimage":
@@ -57,6 +109,8 @@ class table_of_images(Base):
             string += ", mcmc_samples=\"{}\"".format(self.mcmc_samples)
         string += ")'>\n"
         self.add_content(string, indent=indent)
+        if webp is not None:
+            self.add_content("</picture>", indent=indent)
 
     def make(self):
         if not self.add_to_open_container:
@@ -4,6 +4,7 @@ import pesummary
 from pesummary.core.webpage import tables
 from pesummary.core.webpage.base import Base
 
+import io
 import sys
 from pygments import highlight
 from pygments.lexers import get_lexer_by_name
@@ -90,6 +91,89 @@ OTHER_SCRIPTS = """    <script src='https://ajax.googleapis.com/ajax/libs/jquery
     <link rel="stylesheet" href="../css/toggle.css">
 """
 
+_HEADER_CACHE = {}
+_FRAGMENT_CACHE = {}
+
+
+def clear_html_caches():
+    """Remove all precompiled headers and fragments. Fragments may contain
+    run specific information, for example paths in the web directory, so
+    this should be called before a new set of webpages is generated
+    """
+    _HEADER_CACHE.clear()
+    _FRAGMENT_CACHE.clear()
+
+
+def replace_navbar_links(html, links, label=None):
+    """Replace the links in the navigation bar of an existing html page
+
+    Parameters
+    ----------
+    html: str
+        contents of the existing html page
+    links: list
+        list giving the links that you want the navbar to include. See
+        `page.make_navbar` for details
+    label: str, optional
+        the label that prepends the html page
+
+    Returns
+    -------
+    html: str
+        contents of the html page with the updated navbar links. If the page
+        does not contain a navbar, the contents are returned unchanged
+    """
+    def _links_block(contents):
+        start = contents.find(
+            "<div class='collapse navbar-collapse' id='collapsibleNavbar'>"
+        )
+        if start == -1:
+            return None
+        end = contents.find("</div>", start)
+        if end == -1:
+            return None
+        return start, end + len("</div>")
+
+    _existing = _links_block(html)
+    if _existing is None:
+        return html
+    _page = page(io.StringIO(), None, None, label)
+    _page._navbar(links)
+    _navbar = _page.html_file.getvalue()
+    _start, _end = _links_block(_navbar)
+    return html[:_existing[0]] + _navbar[_start:_end] + html[_existing[1]:]
+
+
+def _html_header(title, stylesheets, home):
+    """Return the header which is written at the top of each html page. The
+    header is precompiled once per combination of arguments and reused for
+    all subsequent pages
+
+    Parameters
+    ----------
+    title: str
+        header title of html page
+    stylesheets: tuple
+        tuple of stylesheets to include in the html page
+    home: Bool
+        if True, return the header for the home page
+    """
+    key = (title, stylesheets, home)
+    if key in _HEADER_CACHE:
+        return _HEADER_CACHE[key]
+    stylesheet_elements = ''.join([
+        "  <link rel='stylesheet' href='../css/{0:s}.css'>\n".format(s)
+        for s in stylesheets])
+    bootstrap = BOOTSTRAP.split("\n")
+    bootstrap[1] = "  <title>{}</title>".format(title)
+    bootstrap[-4] = stylesheet_elements
+    if not home:
+        scripts = OTHER_SCRIPTS.split("\n")
+    else:
+        scripts = HOME_SCRIPTS.split("\n")
+    _HEADER_CACHE[key] = "".join([j + "\n" for j in bootstrap + scripts])
+    return _HEADER_CACHE[key]
+
 
 def make_html(web_dir, title="Summary Pages", pages=None, stylesheets=[],
               label=None):
@@ -111,26 +195,14 @@ def make_html(web_dir, title="Summary Pages", pages=None, stylesheets=[],
     """
     for i in pages:
         if i != "home":
-            f = open("{}/html/{}.html".format(web_dir, i), "w")
-        else:
-            f = open("{}/{}.html".format(web_dir, i), "w")
-        stylesheet_elements = ''.join([
-            "  <link rel='stylesheet' href='../css/{0:s}.css'>\n".format(s)
-            for s in stylesheets])
-        bootstrap = BOOTSTRAP.split("\n")
-        bootstrap[1] = "  <title>{}</title>".format(title)
-        bootstrap[-4] = stylesheet_elements
-        bootstrap = [j + "\n" for j in bootstrap]
-        f.writelines(bootstrap)
-        if i != "home":
-            scripts = OTHER_SCRIPTS.split("\n")
+            filename = "{}/html/{}.html".format(web_dir, i)
         else:
-            scripts = HOME_SCRIPTS.split("\n")
-        scripts = [j + "\n" for j in scripts]
-        f.writelines(scripts)
+            filename = "{}/{}.html".format(web_dir, i)
+        with open(filename, "w") as f:
+            f.write(_html_header(title, tuple(stylesheets), i == "home"))
 
 
-def open_html(web_dir, base_url, html_page, label=None):
+def open_html(web_dir, base_url, html_page, label=None, image_dimensions=None):
     """Open html page ready so you can manipulate the contents
 
     Parameters
@@ -143,6 +215,9 @@ def open_html(web_dir, base_url, html_page, label=None):
         name of the html page that you would like to edit
     label: str
         the label that prepends your page name
+    image_dimensions: dict, optional
+        dictionary containing the dimensions of each image which has a
+        thumbnail. If provided, images are lazily loaded on the page
     """
     try:
         if html_page[-5:] == ".html":
@@ -150,35 +225,91 @@ def open_html(web_dir, base_url, html_page, label=None):
     except Exception:
         pass
     if html_page == "home.html" or html_page == "home":
-        f = open(web_dir + "/home.html", "a")
+        f = HTMLBuffer(web_dir + "/home.html")
     else:
         if label is not None:
-            f = open(web_dir + "/html/{}_".format(label) + html_page
-                     + ".html", "a")
+            f = HTMLBuffer(
+                web_dir + "/html/{}_".format(label) + html_page + ".html"
+            )
         else:
-            f = open(web_dir + "/html/" + html_page + ".html", "a")
-    return page(f, web_dir, base_url, label)
+            f = HTMLBuffer(web_dir + "/html/" + html_page + ".html")
+    return page(f, web_dir, base_url, label, image_dimensions=image_dimensions)
+
+
+class HTMLBuffer(io.StringIO):
+    """Class to assemble the contents of a html page in memory. The contents
+    are appended to the file with a single write when the buffer is closed.
+    As with a file object, the buffer is closed (and therefore written)
+    when it is garbage collected
+
+    Parameters
+    ----------
+    filename: str
+        path to the html page that you wish to append to
+    mode: str, optional
+        mode to use when opening the file. Default 'a'
+    """
+    def __init__(self, filename, mode="a"):
+        super(HTMLBuffer, self).__init__()
+        self.filename = filename
+        self.mode = mode
+
+    def close(self):
+        """Write the contents of the buffer to file and close the buffer
+        """
+        if not self.closed:
+            with open(self.filename, self.mode) as f:
+                f.write(self.getvalue())
+        super(HTMLBuffer, self).close()
 
 
 class page(Base):
     """Class to generate and manipulate an html page.
     """
-    def __init__(self, html_file, web_dir, base_url, label):
+    def __init__(self, html_file, web_dir, base_url, label, image_dimensions=None):
         self.html_file = html_file
         self.web_dir = web_dir
         self.base_url = base_url
         self.label = label
+        self.image_dimensions = image_dimensions
         self.content = []
 
+    def _add_cached_fragment(self, key, function, *args, **kwargs):
+        """Add a fragment of html to the page. The fragment is rendered once
+        and stored in memory so that identical fragments on other pages are
+        not regenerated
+
+        Parameters
+        ----------
+        key: tuple
+            unique key describing the fragment
+        function: func
+            function which writes the fragment to the page
+        *args: tuple
+            all args passed to function
+        **kwargs: dict
+            all kwargs passed to function
+        """
+        if key not in _FRAGMENT_CACHE:
+            html_file, self.html_file = self.html_file, io.StringIO()
+            try:
+                function(*args, **kwargs)
+                _FRAGMENT_CACHE[key] = self.html_file.getvalue()
+            finally:
+                self.html_file = html_file
+        self.html_file.write(_FRAGMENT_CACHE[key])
+
     def _header(self, approximant):
         """
         """
         self.add_content("<h7 hidden>{}</h7>".format(self.label))
         self.add_content("<h7 hidden>{}</h7>".format(approximant))
 
-    def _footer(self, user, rundir, fix_bottom=False):
+    def _footer(self, user, rundir, fix_bottom=False, timestamp=None):
         """
         """
+        if timestamp is None:
+            timestamp = (time.strftime("%H:%M"), time.strftime("%B %d %Y"))
         self.add_content("<script>")
         self.add_content("$(document).ready(function(){", indent=2)
         self.add_content("$('[data-toggle=\"tooltip\"]').tooltip();", indent=4)
@@ -239,9 +370,7 @@ class page(Base):
         self.add_content(
             "<p style='color: #E8E8E8; font-weight: bold; "
             "font-family: arial-body; margin-top:14px'>This page was produced "
-            "by {} at {} on {}</p>".format(
-                user, time.strftime("%H:%M"), time.strftime("%B %d %Y")
-            )
+            "by {} at {} on {}</p>".format(user, *timestamp)
         )
         self.add_content("</div>", indent=4)
         self.add_content("</div>", indent=2)
@@ -280,7 +409,11 @@ class page(Base):
     def make_footer(self, user=None, rundir=None, fix_bottom=False):
         """Make footer for document in bootstrap format.
         """
-        self._footer(user, rundir, fix_bottom=fix_bottom)
+        timestamp = (time.strftime("%H:%M"), time.strftime("%B %d %Y"))
+        self._add_cached_fragment(
+            ("footer", user, rundir, fix_bottom, timestamp), self._footer,
+            user, rundir, fix_bottom=fix_bottom, timestamp=timestamp
+        )
 
     def make_banner(
         self, approximant=None, key="Summary", _style=None, link=None,
@@ -424,9 +557,26 @@ class page(Base):
         hdf5: Bool, optional
             true if a hdf5 file format is chosen for the meta file
         """
-        self._setup_navbar(background_color)
         if links is None:
             raise Exception("Please specify links for use with navbar\n")
+        self._add_cached_fragment(
+            (
+                "navbar", repr(links), samples_path, search, histogram_download,
+                background_color, hdf5, about, toggle
+            ), self._navbar, links, samples_path=samples_path, search=search,
+            histogram_download=histogram_download,
+            background_color=background_color, about=about, toggle=toggle
+        )
+
+    def _navbar(
+        self, links, samples_path="./samples", search=True,
+        histogram_download=None, background_color="navbar-dark", about=True,
+        toggle=False
+    ):
+        """Write a navigation bar in bootstrap format to the page. See
+        `make_navbar` for details
+        """
+        self._setup_navbar(background_color)
         self.add_content("<div class='collapse navbar-collapse' id='collapsibleNavbar'>\n", indent=4)
         self.add_content("<ul class='navbar-nav'>\n", indent=6)
         for i in links:
@@ -833,7 +983,9 @@ class page(Base):
                                        extra_div=extra_div, display=display,
                                        mcmc_samples=mcmc_samples,
                                        margin_left=margin_left,
-                                       container_id=container_id, **kwargs)
+                                       container_id=container_id,
+                                       image_dimensions=self.image_dimensions,
+                                       **kwargs)
         table.make()
 
     def insert_image(self, path, justify="center", code=None):
@@ -1009,8 +1161,13 @@ class page(Base):
                 self.add_content("<div class='carousel-item active'>\n", indent=10)
             else:
                 self.add_content("<div class='carousel-item'>\n", indent=10)
-            self.add_content("<img src={} style='align-items:center;' "
-                             "class='mx-auto d-block'>\n".format(i), indent=12)
+            if self.image_dimensions is not None:
+                self.add_content("<img src={} loading='lazy' style='align-items:"
+                                 "center;' class='mx-auto d-block'>\n".format(i),
+                                 indent=12)
+            else:
+                self.add_content("<img src={} style='align-items:center;' "
+                                 "class='mx-auto d-block'>\n".format(i), indent=12)
             self.add_content("</div>\n", indent=10)
 
         self.add_content("</div>\n", indent=8)
@@ -0,0 +1,258 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import multiprocessing
+import numpy as np
+from pesummary.utils.utils import logger
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+PARAMETER_MAPPING = {
+    "mass_1_source": "m1_source",
+    "mass_2_source": "m2_source",
+    "luminosity_distance": "dist",
+    "redshift": "redshift",
+    "a_1": "a1",
+    "a_2": "a2"
+}
+
+
+class ClassificationSamples(object):
+    """Light-weight, pandas-free table of the columns needed for source
+    classification. Columns are stored under their PEPredicates names but can
+    also be accessed with their pesummary names. Indexing with a str returns a
+    column and indexing with an array of indices or a boolean mask returns a
+    new ClassificationSamples object containing only those rows. This is the
+    interface required by the PEPredicates package
+
+    Parameters
+    ----------
+    columns: dict
+        dictionary of 1d arrays keyed by their PEPredicates name
+    """
+    def __init__(self, columns):
+        self._columns = columns
+
+    @classmethod
+    def from_samples(cls, samples, parameters=None):
+        """Project the columns needed for source classification from a set of
+        samples. Columns are returned as views where possible
+
+        Parameters
+        ----------
+        samples: dict/np.ndarray
+            dictionary of samples keyed by parameter or a 2d array of samples
+            with shape (nsamples, nparameters)
+        parameters: list, optional
+            list of parameters corresponding to the columns of `samples`. Only
+            used if `samples` is a 2d array
+        """
+        if isinstance(samples, cls):
+            return samples
+        if not hasattr(samples, "keys"):
+            _samples = np.asarray(samples)
+            samples = {
+                param: _samples[..., num] for num, param in
+                enumerate(parameters)
+            }
+        return cls({
+            value: np.asarray(samples[key]) for key, value in
+            PARAMETER_MAPPING.items() if key in samples.keys()
+        })
+
+    def _key(self, key):
+        """Return the PEPredicates name for a given parameter
+        """
+        return PARAMETER_MAPPING.get(key, key)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._columns[self._key(key)]
+        return ClassificationSamples(
+            {param: value[key] for param, value in self._columns.items()}
+        )
+
+    def __contains__(self, key):
+        return self._key(key) in self._columns.keys()
+
+    def __len__(self):
+        if not len(self._columns):
+            return 0
+        return len(next(iter(self._columns.values())))
+
+    def keys(self):
+        return self._columns.keys()
+
+    def items(self):
+        return self._columns.items()
+
+
+def population_reweight(samples):
+    """Return a single draw of samples which have been resampled to a
+    population prior using the PEPredicates package. The same draw should be
+    shared between all classifications which require a population prior
+
+    Parameters
+    ----------
+    samples: ClassificationSamples
+        samples you wish to resample
+    """
+    from pesummary.gw.pepredicates import PEPredicates
+
+    samples = ClassificationSamples.from_samples(samples)
+    PEPredicates._check_parameters(samples)
+    return PEPredicates.resample_to_population(samples)
+
+
+def bootstrap_uncertainty(probabilities, nsamples, nbootstrap=1000):
+    """Return the bootstrap uncertainty on a set of classification
+    probabilities. Each probability is the fraction of samples which satisfy a
+    predicate, so the number of samples satisfying the predicate in a bootstrap
+    resample is binomially distributed. Bootstrap draws are therefore taken
+    directly from this distribution rather than by resampling the posterior
+
+    Parameters
+    ----------
+    probabilities: dict
+        dictionary of probabilities estimated from `nsamples` samples
+    nsamples: int
+        number of samples used to estimate the probabilities
+    nbootstrap: int, optional
+        number of bootstrap draws. Default 1000
+    """
+    uncertainty = {}
+    for key, value in probabilities.items():
+        if isinstance(value, str) or not nsamples:
+            uncertainty[key] = "-"
+            continue
+        draws = np.random.binomial(
+            nsamples, np.clip(value, 0., 1.), size=nbootstrap
+        ) / nsamples
+        uncertainty[key] = np.round(np.std(draws), 5)
+    return uncertainty
+
+
+def _add_uncertainty(classifications, samples, population, nbootstrap):
+    """Add the bootstrap uncertainty on the default and population
+    probabilities to a dictionary of classifications
+    """
+    for prior, _samples in zip(["default", "population"], [samples, population]):
+        classifications["{}_uncertainty".format(prior)] = bootstrap_uncertainty(
+            classifications[prior], len(_samples), nbootstrap=nbootstrap
+        )
+    return classifications
+
+
+def classify(samples, pepredicates=True, em_bright=True, nbootstrap=0):
+    """Return the PEPredicates source classification and em-bright
+    probabilities for a set of samples. The samples are reweighted to a
+    population prior once and the draw is shared between PEPredicates and
+    em-bright. A failure in one classification is logged and does not prevent
+    the other from being calculated
+
+    Parameters
+    ----------
+    samples: dict
+        dictionary of samples
+    pepredicates: Bool, optional
+        if True, calculate the PEPredicates classification probabilities.
+        Default True
+    em_bright: Bool, optional
+        if True, calculate the `HasNS` and `HasRemnant` probabilities. Default
+        True
+    nbootstrap: int, optional
+        number of bootstrap draws used to estimate the uncertainty on each
+        probability. Default 0, no uncertainties are returned
+    """
+    from pesummary.gw.pepredicates import PEPredicates
+    from pesummary.gw.p_astro import PAstro
+    from pesummary.utils.utils import RedirectLogger
+
+    samples = ClassificationSamples.from_samples(samples)
+    data = {"pepredicates": None, "em_bright": None}
+    population, population_error = None, None
+    try:
+        with RedirectLogger("PEPredicates", level="DEBUG") as redirector:
+            population = population_reweight(samples)
+    except Exception as e:
+        population_error = e
+    if pepredicates:
+        default_error = (
+            "Failed to generate source classification probabilities because {}"
+        )
+        try:
+            PEPredicates.check_for_install()
+            if population_error is not None:
+                raise population_error
+            with RedirectLogger("PEPredicates", level="DEBUG") as redirector:
+                default, pop = PEPredicates.classifications(
+                    samples, population=population
+                )
+            data["pepredicates"] = {"default": default, "population": pop}
+            if nbootstrap:
+                _add_uncertainty(
+                    data["pepredicates"], samples, population, nbootstrap
+                )
+        except ImportError:
+            logger.warning(
+                default_error.format("'PEPredicates' is not installed")
+            )
+        except Exception as e:
+            logger.warning(default_error.format("%s" % (e)))
+    if em_bright:
+        default_error = (
+            "Failed to generate `HasNS` and `HasRemnant` probabilities because {}"
+        )
+        try:
+            PAstro.check_for_install()
+            if population_error is not None:
+                raise population_error
+            with RedirectLogger("p_astro", level="DEBUG") as redirector:
+                default, pop = PAstro.classifications(
+                    samples, population=population
+                )
+            data["em_bright"] = {"default": default, "population": pop}
+            if nbootstrap:
+                _add_uncertainty(
+                    data["em_bright"], samples, population, nbootstrap
+                )
+        except ImportError:
+            logger.warning(default_error.format("'p_astro' is not installed"))
+        except Exception as e:
+            logger.warning(default_error.format("%s" % (e)))
+    return data
+
+
+def _wrapper_for_classify(args):
+    """Wrapper function for the classify function to be used with the
+    multiprocessing module
+    """
+    return classify(*args[:1], **args[1])
+
+
+def classify_analyses(samples, multi_process=1, **kwargs):
+    """Return the source classification and em-bright probabilities for
+    multiple analyses or mcmc chains. Only the columns needed for
+    classification are passed to each process
+
+    Parameters
+    ----------
+    samples: dict
+        dictionary of samples for each analysis
+    multi_process: int, optional
+        number of cores to use when classifying the analyses in parallel.
+        Default 1
+    **kwargs: dict, optional
+        all kwargs passed to the classify function
+    """
+    labels = list(samples.keys())
+    args = [
+        [ClassificationSamples.from_samples(samples[label]), kwargs] for label
+        in labels
+    ]
+    multi_process = min(multi_process, len(labels))
+    if multi_process > 1:
+        with multiprocessing.Pool(multi_process) as pool:
+            data = pool.map(_wrapper_for_classify, args)
+    else:
+        data = [_wrapper_for_classify(arg) for arg in args]
+    return {label: _data for label, _data in zip(labels, data)}
@@ -6,21 +6,18 @@ error_msg = (
 )
 import copy
 import numpy as np
-from pathlib import Path
 
 from pesummary import conf
 from pesummary.utils.decorators import set_docstring
 from pesummary.utils.exceptions import EvolveSpinError
 from pesummary.utils.utils import logger
+from pesummary.utils.lazy import attach, module_available
 
-try:
-    import lalsimulation
-except ImportError:
-    logger.warning(error_msg.format("lalsimulation"))
-try:
-    import astropy
-except ImportError:
-    logger.warning(error_msg.format("astropy"))
+# only check that the optional dependencies are installed. They are imported
+# when they are first needed
+for _module in ["lalsimulation", "astropy"]:
+    if not module_available(_module):
+        logger.warning(error_msg.format(_module))
 
 from .angles import *
 from .cosmology import *
@@ -36,6 +33,21 @@ from .tidal import _check_NSBH_approximant
 from .time import *
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+# submodules which are rarely used and depend on heavy optional dependencies
+# are only imported when they are first accessed
+__getattr__, __dir__, _ = attach(
+    __name__, submodules=["evolve", "nrutils", "tgr"], submod_attrs={
+        "evolve": [
+            "evolve_spins", "evolve_angles_forwards", "evolve_angles_backwards"
+        ],
+        "nrutils": ["NRSur_fit"],
+        "tgr": [
+            "imrct_deviation_parameters_integrand",
+            "imrct_deviation_parameters_from_final_mass_final_spin",
+            "generate_imrct_deviation_parameters"
+        ]
+    }
+)
 _conversion_doc = """
     Class to calculate all possible derived quantities
 
@@ -112,6 +124,16 @@ _conversion_doc = """
     resume_file: str, optional
         path to file to use for checkpointing. If not provided, checkpointing
         is not used. Default None
+    eos_cache_size: int, optional
+        maximum number of equation of state families to cache when calculating
+        the tidal deformability from equation of state parameters. Default
+        conf.default_eos_cache_size
+    eos_tolerance: float/list, optional
+        relative quantisation tolerance for the equation of state parameters,
+        either a single tolerance or one for each parameter. Draws within
+        `eos_tolerance` share a neutron star family and the derived tidal
+        deformabilities are only approximate. Default
+        conf.default_eos_tolerance, i.e. None and exact
 
     Examples
     --------
@@ -148,7 +170,26 @@ def convert(*args, restart_from_checkpoint=False, resume_file=None, **kwargs):
 
 
 class _PickledConversion(object):
-    pass
+    """Snapshot of the _Conversion class stored in a checkpoint file. The
+    samples are stored as a list of columns, one for each parameter. The
+    methods below are used to replay the records appended to the checkpoint
+    file after the snapshot was written
+    """
+    def _append_column(self, parameter, samples):
+        self.parameters.append(parameter)
+        self.samples.append(np.array(samples, dtype=float))
+
+    def _replace_column(self, parameter, samples):
+        ind = self.parameters.index(parameter)
+        self.samples[ind] = np.array(samples, dtype=float)
+
+    def _remove_column(self, parameter):
+        ind = self.parameters.index(parameter)
+        self.parameters.remove(parameter)
+        del self.samples[ind]
+
+    def _remove_samples(self, indices):
+        self.samples = [np.delete(column, indices) for column in self.samples]
 
 
 @set_docstring(_conversion_doc % {"function": "_Conversion"})
@@ -167,8 +208,11 @@ class _Conversion(object):
             "Reading checkpoint file: {}".format(resume_file)
         )
         state = read(resume_file, checkpoint=True)
+        samples = state.samples
+        if getattr(state, "columnar", False):
+            samples = np.array(samples).T
         return cls(
-            state.parameters, state.samples, extra_kwargs=state.extra_kwargs,
+            state.parameters, samples, extra_kwargs=state.extra_kwargs,
             evolve_spins_forwards=state.evolve_spins_forwards,
             evolve_spins_backwards=state.evolve_spins_backwards,
             NRSur_fits=state.NRSurrogate,
@@ -179,26 +223,56 @@ class _Conversion(object):
             disable_remnant=state.disable_remnant,
             add_zero_spin=state.add_zero_spin, regenerate=state.regenerate,
             return_kwargs=state.return_kwargs, return_dict=state.return_dict,
-            resume_file=state.resume_file
+            resume_file=state.resume_file,
+            eos_cache_size=getattr(
+                state, "eos_cache_size", conf.default_eos_cache_size
+            ),
+            eos_tolerance=getattr(
+                state, "eos_tolerance", conf.default_eos_tolerance
+            )
         )
 
     def write_current_state(self):
-        """Write the current state of the conversion class to file
+        """Write the current state of the conversion class to file. This
+        writes a new base snapshot which subsequent changes are appended to
         """
-        from pesummary.io import write
+        from pesummary.core.file.formats.checkpoint import write_checkpoint
         state = _PickledConversion()
         for key, value in vars(self).items():
-            setattr(state, key, value)
+            if not key.startswith("_checkpoint"):
+                setattr(state, key, value)
+        state.columnar = True
 
-        _path = Path(self.resume_file)
-        write(
-            state, outdir=_path.parent, file_format="pickle",
-            filename=_path.name, overwrite=True
-        )
+        write_checkpoint(state, self.resume_file)
+        self._checkpoint_snapshot = True
         logger.debug(
             "Written checkpoint file: {}".format(self.resume_file)
         )
 
+    def _update_current_state(self, method, *args):
+        """Append a record to the checkpoint file describing a change to the
+        posterior table. A base snapshot is written if one does not exist
+
+        Parameters
+        ----------
+        method: str
+            name of the `_PickledConversion` method to call when replaying
+            the record
+        *args: tuple
+            arguments to pass to `method` when replaying the record
+        """
+        from pesummary.core.file.formats.checkpoint import append_to_checkpoint
+        if self.resume_file is None:
+            return
+        if not getattr(self, "_checkpoint_snapshot", False):
+            return self.write_current_state()
+        append_to_checkpoint(self.resume_file, method, *args)
+        logger.debug(
+            "Appended '{}' record to checkpoint file: {}".format(
+                method, self.resume_file
+            )
+        )
+
     def __new__(cls, *args, **kwargs):
         from pesummary.utils.samples_dict import SamplesDict
         from pesummary.utils.parameters import Parameters
@@ -215,16 +289,19 @@ class _Conversion(object):
             )
         elif isinstance(args[0], dict):
             parameters = Parameters(args[0].keys())
-            samples = np.atleast_2d(
-                np.array([args[0][i] for i in parameters]).T
-            ).tolist()
+            samples = [
+                np.array(np.atleast_1d(args[0][i]), dtype=float) for i in
+                parameters
+            ]
         else:
             if not isinstance(args[0], Parameters):
                 parameters = Parameters(args[0])
             else:
                 parameters = args[0]
-            samples = args[1]
-            samples = np.atleast_2d(samples).tolist()
+            samples = [
+                np.array(column, dtype=float) for column in
+                np.atleast_2d(args[1]).T
+            ]
         extra_kwargs = kwargs.get("extra_kwargs", {"sampler": {}, "meta_data": {}})
         f_low = kwargs.get("f_low", None)
         f_ref = kwargs.get("f_ref", None)
@@ -410,27 +487,30 @@ class _Conversion(object):
             kwargs.get("add_zero_spin", False), disable_remnant,
             kwargs.get("return_kwargs", False), kwargs.get("return_dict", True),
             kwargs.get("resume_file", None), multipole_snr, precessing_snr,
-            pycbc_psd, psd_default, evolve_spins_backwards, force_evolve
+            pycbc_psd, psd_default, evolve_spins_backwards, force_evolve,
+            kwargs.get("eos_cache_size", conf.default_eos_cache_size),
+            kwargs.get("eos_tolerance", conf.default_eos_tolerance)
         )
         return_kwargs = kwargs.get("return_kwargs", False)
         if kwargs.get("return_dict", True) and return_kwargs:
             return [
-                SamplesDict(obj.parameters, np.array(obj.samples).T),
+                SamplesDict(obj.parameters, np.array(obj.samples)),
                 obj.extra_kwargs
             ]
         elif kwargs.get("return_dict", True):
-            return SamplesDict(obj.parameters, np.array(obj.samples).T)
+            return SamplesDict(obj.parameters, np.array(obj.samples))
         elif return_kwargs:
-            return obj.parameters, obj.samples, obj.extra_kwargs
+            return obj.parameters, np.array(obj.samples).T, obj.extra_kwargs
         else:
-            return obj.parameters, obj.samples
+            return obj.parameters, np.array(obj.samples).T
 
     def __init__(
         self, parameters, samples, extra_kwargs, evolve_spins_forwards, NRSurrogate,
         waveform_fits, multi_process, regenerate, redshift_method,
         cosmology, force_non_evolved, force_remnant, add_zero_spin,
         disable_remnant, return_kwargs, return_dict, resume_file, multipole_snr,
-        precessing_snr, psd, psd_default, evolve_spins_backwards, force_evolve
+        precessing_snr, psd, psd_default, evolve_spins_backwards, force_evolve,
+        eos_cache_size, eos_tolerance
     ):
         self.parameters = parameters
         self.samples = samples
@@ -446,6 +526,8 @@ class _Conversion(object):
         self.force_non_evolved = force_non_evolved
         self.force_remnant = force_remnant
         self.force_evolve = force_evolve
+        self.eos_cache_size = eos_cache_size
+        self.eos_tolerance = eos_tolerance
         self.disable_remnant = disable_remnant
         self.return_kwargs = return_kwargs
         self.return_dict = return_dict
@@ -607,14 +689,22 @@ class _Conversion(object):
             )
             ind = self.parameters.index(parameter)
             self.parameters.remove(self.parameters[ind])
-            for i in self.samples:
-                del i[ind]
+            del self.samples[ind]
+            self._update_current_state("_remove_column", parameter)
         else:
             logger.info(
                 "'{}' is not in the table of posterior samples. Unable to "
                 "remove".format(parameter)
             )
 
+    @property
+    def nsamples(self):
+        """Return the number of samples in the posterior table
+        """
+        if not len(self.samples):
+            return 0
+        return len(self.samples[0])
+
     def _specific_parameter_samples(self, param):
         """Return the samples for a specific parameter
 
@@ -624,10 +714,9 @@ class _Conversion(object):
             the parameter that you would like to return the samples for
         """
         if param == "empty":
-            return np.array(np.zeros(len(self.samples)))
+            return np.array(np.zeros(self.nsamples))
         ind = self.parameters.index(param)
-        samples = np.array([i[ind] for i in self.samples])
-        return samples
+        return np.array(self.samples[ind])
 
     def specific_parameter_samples(self, param):
         """Return the samples for either a list or a single parameter
@@ -656,10 +745,10 @@ class _Conversion(object):
         """
         if parameter not in self.parameters:
             self.parameters.append(parameter)
-            for num, i in enumerate(self.samples):
-                self.samples[num].append(samples[num])
-        if self.resume_file is not None:
-            self.write_current_state()
+            self.samples.append(np.array(samples, dtype=float))
+            self._update_current_state(
+                "_append_column", parameter, self.samples[-1]
+            )
 
     def _mchirp_from_mchirp_source_z(self):
         samples = self.specific_parameter_samples(["chirp_mass_source", "redshift"])
@@ -678,8 +767,10 @@ class _Conversion(object):
 
     def _invert_q(self):
         ind = self.parameters.index("mass_ratio")
-        for num, i in enumerate(self.samples):
-            self.samples[num][ind] = 1. / self.samples[num][ind]
+        self.samples[ind] = 1. / self.samples[ind]
+        self._update_current_state(
+            "_replace_column", "mass_ratio", self.samples[ind]
+        )
 
     def _invq_from_q(self):
         samples = self.specific_parameter_samples("mass_ratio")
@@ -712,7 +803,7 @@ class _Conversion(object):
         self.append_data("mass_2", mass_2)
 
     def _reference_frequency(self):
-        nsamples = len(self.samples)
+        nsamples = self.nsamples
         extra_kwargs = self.extra_kwargs["meta_data"]
         if extra_kwargs != {} and "f_ref" in list(extra_kwargs.keys()):
             self.append_data(
@@ -1070,7 +1161,8 @@ class _Conversion(object):
         ])
         lambda_1, lambda_2 = \
             lambda1_lambda2_from_4_parameter_piecewise_polytrope_equation_of_state(
-                *samples, multi_process=self.multi_process
+                *samples, multi_process=self.multi_process,
+                cache_size=self.eos_cache_size, tolerance=self.eos_tolerance
             )
         if "lambda_1" not in self.parameters:
             self.append_data("lambda_1", lambda_1)
@@ -1084,7 +1176,8 @@ class _Conversion(object):
             "mass_1", "mass_2"
         ])
         lambda_1, lambda_2 = lambda1_lambda2_from_spectral_decomposition(
-            *samples, multi_process=self.multi_process
+            *samples, multi_process=self.multi_process,
+            cache_size=self.eos_cache_size, tolerance=self.eos_tolerance
         )
         if "lambda_1" not in self.parameters:
             self.append_data("lambda_1", lambda_1)
@@ -1394,7 +1487,7 @@ class _Conversion(object):
         data, fits = final_remnant_properties_from_NRSurrogate(
             *samples, f_low=f_low, f_ref=frequency_samples[0],
             properties=parameters, return_fits_used=True,
-            approximant=approximant
+            approximant=approximant, multi_process=self.multi_process
         )
         for param in parameters:
             self.append_data(param, data[param])
@@ -1596,8 +1689,11 @@ class _Conversion(object):
                         "Removing %s samples because they have unphysical "
                         "values (%s < 0)" % (len(ind), i)
                     )
-                    for i in np.arange(len(ind) - 1, -1, -1):
-                        self.samples.remove(list(np.array(self.samples)[ind[i][0]]))
+                    ind = ind.flatten()
+                    self.samples = [
+                        np.delete(column, ind) for column in self.samples
+                    ]
+                    self._update_current_state("_remove_samples", ind)
 
     def generate_all_posterior_samples(self):
         logger.debug("Starting to generate all derived posteriors")
@@ -1631,13 +1727,15 @@ class _Conversion(object):
                 _tilt = np.arccos(np.sign(_spin))
                 self.append_data("tilt_{}".format(_index), _tilt)
                 _spin_ind = self.parameters.index(_param)
-                for num, i in enumerate(self.samples):
-                    self.samples[num][_spin_ind] = abs(self.samples[num][_spin_ind])
+                self.samples[_spin_ind] = np.abs(self.samples[_spin_ind])
+                self._update_current_state(
+                    "_replace_column", _param, self.samples[_spin_ind]
+                )
 
         if not cond2 and not cond3 and self.add_zero_spin:
             for _param in spin_magnitudes:
                 if _param not in self.parameters:
-                    _spin = np.zeros(len(self.samples))
+                    _spin = np.zeros(self.nsamples)
                     self.append_data(_param, _spin)
                     _index = _param.split("a_")[1]
                     self.append_data("spin_{}z".format(_index), _spin)
@@ -1668,7 +1766,7 @@ class _Conversion(object):
             self._q_from_m1_m2()
         if "mass_ratio" in self.parameters:
             ind = self.parameters.index("mass_ratio")
-            median = np.median([i[ind] for i in self.samples])
+            median = np.median(self.samples[ind])
             if median > 1.:
                 self._invert_q()
         if "inverted_mass_ratio" not in self.parameters and "mass_ratio" in \
@@ -2054,5 +2152,5 @@ class _Conversion(object):
             if param in self.parameters:
                 ind = self.parameters.index(param)
                 self.parameters.remove(self.parameters[ind])
-                for i in self.samples:
-                    del i[ind]
+                del self.samples[ind]
+                self._update_current_state("_remove_column", param)
@@ -7,12 +7,6 @@ from pesummary.utils.decorators import array_input
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
-try:
-    from astropy.cosmology import z_at_value
-    import astropy.units as u
-except ImportError:
-    pass
-
 
 def _wrapper_for_z_from_dL_exact(args):
     """Wrapper function for _z_from_dL_exact for a pool of workers
@@ -36,6 +30,9 @@ def _z_from_dL_exact(luminosity_distance, cosmology):
     cosmology: astropy.cosmology.LambdaCDM
         the cosmology to use for conversions
     """
+    from astropy.cosmology import z_at_value
+    import astropy.units as u
+
     _z = z_at_value(
         cosmology.luminosity_distance, luminosity_distance * u.Mpc
     )
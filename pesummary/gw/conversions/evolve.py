@@ -50,17 +50,20 @@ def evolve_spins(*args, evolve_limit="ISCO", **kwargs):
 @array_input(
     ignore_kwargs=[
         "final_velocity", "tolerance", "dt", "multi_process",
-        "evolution_approximant"
+        "evolution_approximant", "backend", "step_size", "batch_size"
     ], force_return_array=True
 )
 def evolve_angles_forwards(
     mass_1, mass_2, a_1, a_2, tilt_1, tilt_2, phi_12, f_low, f_ref,
     approximant, final_velocity="ISCO", tolerance=1e-3,
-    dt=0.1, multi_process=1, evolution_approximant="SpinTaylorT5"
+    dt=0.1, multi_process=1, evolution_approximant="SpinTaylorT5",
+    backend="lalsimulation", step_size=0.2, batch_size=1000
 ):
     """Evolve the BBH spin angles forwards to a specified value using
     lalsimulation.SimInspiralSpinTaylorPNEvolveOrbit. By default this is
-    the Schwarzchild ISCO velocity.
+    the Schwarzchild ISCO velocity. Alternatively, the orbit-averaged
+    precession equations can be integrated for a batch of samples at once
+    with numpy by passing backend='numpy'
 
     Parameters
     ----------
@@ -99,7 +102,28 @@ def evolve_angles_forwards(
     evolution_approximant: str
         name of the approximant you wish to use to evolve the spins. Default
         is SpinTaylorT5. Other choices are SpinTaylorT1 or SpinTaylorT4
+    backend: str, optional
+        backend to use when evolving the spins. Either 'lalsimulation', where
+        each sample is evolved separately with
+        lalsimulation.SimInspiralSpinTaylorPNEvolveOrbit, or 'numpy', where
+        the SpinTaylorT5 precession equations are integrated for a batch of
+        samples at once. Default 'lalsimulation'
+    step_size: float, optional
+        maximum change in the precession phase, in radians, per integration
+        step when backend='numpy'. Default 0.2
+    batch_size: int, optional
+        number of samples to evolve at once when backend='numpy'. Default
+        1000
     """
+    if backend not in ["lalsimulation", "numpy"]:
+        raise ValueError(
+            "Unknown backend '{}'. Please choose either 'lalsimulation' or "
+            "'numpy'".format(backend)
+        )
+    if backend == "numpy" and evolution_approximant != "SpinTaylorT5":
+        raise ValueError(
+            "The numpy backend only supports the SpinTaylorT5 approximant"
+        )
     if isinstance(final_velocity, str) and final_velocity.lower() == "isco":
         final_velocity = 6. ** -0.5
     else:
@@ -118,6 +142,12 @@ def evolve_angles_forwards(
     f_start = float(np.where(
         np.array(spinfreq_enum == SIM_INSPIRAL_SPINS_FLOW), f_low, f_ref
     ))
+    if backend == "numpy":
+        return _evolve_angles_forwards_batched(
+            mass_1, mass_2, a_1, a_2, tilt_1, tilt_2, phi_12, f_start,
+            final_velocity, tolerance, step_size=step_size,
+            batch_size=batch_size, multi_process=multi_process
+        )
     with multiprocessing.Pool(multi_process) as pool:
         args = np.array([
             mass_1, mass_2, a_1, a_2, tilt_1, tilt_2, phi_12,
@@ -238,6 +268,342 @@ def _evolve_angles_forwards(
     return tilt_1_evol, tilt_2_evol, phi_12_evol
 
 
+def _spin_taylor_t5_derivatives(v, L, S1, S2, X1, X2):
+    """Return the derivatives of the direction of the orbital angular
+    momentum and the spin vectors with respect to the orbital velocity for a
+    batch of samples. The spins precess according to the orbit-averaged
+    SpinTaylor equations with next-to-leading order spin-orbit and spin-spin
+    couplings and the orbital velocity evolves according to the SpinTaylorT5
+    approximant, i.e. the expanded ratio of the derivative of the binding
+    energy and the flux. Non-spinning terms are included to 3.5PN,
+    spin-orbit terms to 3PN and spin-spin terms to 2PN, matching
+    lalsimulation.SimInspiralSpinTaylorPNEvolveOrbit with spinO=6 and
+    phaseO=7 except for the 3PN spin-spin terms in the phasing
+
+    Parameters
+    ----------
+    v: float
+        orbital velocity
+    L: np.ndarray
+        array of shape (3, N) giving the direction of the orbital angular
+        momentum
+    S1: np.ndarray
+        array of shape (3, N) giving the primary spin vector in units of the
+        total mass squared
+    S2: np.ndarray
+        array of shape (3, N) giving the secondary spin vector in units of
+        the total mass squared
+    X1: np.ndarray
+        array of primary masses divided by the total mass
+    X2: np.ndarray
+        array of secondary masses divided by the total mass
+    """
+    eta = X1 * X2
+    delta = X1 - X2
+    v2 = v * v
+    S1L = np.sum(S1 * L, axis=0)
+    S2L = np.sum(S2 * L, axis=0)
+    S1S2 = np.sum(S1 * S2, axis=0)
+    # precession frequencies: leading and next-to-leading order spin-orbit,
+    # leading order spin-spin including the quadrupole-monopole term and
+    # next-to-leading order spin-spin
+    _so = 0.75 + 0.5 * eta + v2 * (9. / 16 + 1.25 * eta - eta ** 2 / 24.)
+    _so_delta = 0.75 + v2 * (9. / 16 - 0.625 * eta)
+    Omega1 = v ** 5 * (_so - _so_delta * delta) * L + v ** 6 * (
+        0.5 * S2 - 1.5 * (S2L + X2 / X1 * S1L) * L
+    ) + v ** 8 * (
+        (-3.25 + 2.25 * X1 + X1 ** 2) * S1L * L + 0.5 * X1 * (1. + X1) * S2
+        - (1.5 + 1.5 * X1 + 0.5 * X1 ** 2) * S2L * L
+    )
+    Omega2 = v ** 5 * (_so + _so_delta * delta) * L + v ** 6 * (
+        0.5 * S1 - 1.5 * (S1L + X1 / X2 * S2L) * L
+    ) + v ** 8 * (
+        (-3.25 + 2.25 * X2 + X2 ** 2) * S2L * L + 0.5 * X2 * (1. + X2) * S1
+        - (1.5 + 1.5 * X2 + 0.5 * X2 ** 2) * S1L * L
+    )
+    dS1 = np.cross(Omega1, S1, axis=0)
+    dS2 = np.cross(Omega2, S2, axis=0)
+    # total angular momentum is conserved, with the magnitude of the orbital
+    # angular momentum given to 1PN
+    dL = -(v / eta) * (dS1 + dS2) / (1. + (1.5 + eta / 6.) * v2)
+    dL -= np.sum(dL * L, axis=0) * L
+    # binding energy and flux coefficients, E = -eta v^2 / 2 (1 + sum e_k v^k)
+    # and F = 32 eta^2 v^10 / 5 (1 + sum f_k v^k)
+    SL = S1L + S2L
+    SigmaL = S2L / X2 - S1L / X1
+    zeros = np.zeros_like(eta)
+    e = [
+        zeros + 1., zeros, -0.75 - eta / 12., zeros,
+        -27. / 8 + 19. / 8 * eta - eta ** 2 / 24., zeros,
+        -675. / 64 + (34445. / 576 - 205. / 96 * np.pi ** 2) * eta
+        - 155. / 96 * eta ** 2 - 35. / 5184 * eta ** 3, zeros
+    ]
+    f = [
+        zeros + 1., zeros, -1247. / 336 - 35. / 12 * eta, zeros + 4 * np.pi,
+        -44711. / 9072 + 9271. / 504 * eta + 65. / 18 * eta ** 2,
+        (-8191. / 672 - 583. / 24 * eta) * np.pi,
+        6643739519. / 69854400 + 16. / 3 * np.pi ** 2 - 1712. / 105 * np.euler_gamma
+        - 856. / 105 * np.log(16 * v2) + (-134543. / 7776 + 41. / 48 * np.pi ** 2)
+        * eta - 94403. / 3024 * eta ** 2 - 775. / 324 * eta ** 3,
+        (-16285. / 504 + 214745. / 1728 * eta + 193385. / 3024 * eta ** 2)
+        * np.pi
+    ]
+    e_so = [zeros] * 8
+    f_so = [zeros] * 8
+    e_so[3] = 14. / 3 * SL + 2 * delta * SigmaL
+    e_so[5] = (11. - 61. / 9 * eta) * SL + delta * (3. - 10. / 3 * eta) * SigmaL
+    f_so[3] = -4 * SL - 1.25 * delta * SigmaL
+    f_so[5] = (-4.5 + 272. / 9 * eta) * SL + (
+        -13. / 16 + 43. / 4 * eta
+    ) * delta * SigmaL
+    f_so[6] = -16 * np.pi * SL - 31. / 6 * np.pi * delta * SigmaL
+    # expand (dE/dv) / F keeping terms linear in the spin-orbit coefficients
+    dE = [(k + 2.) / 2 * e[k] for k in range(8)]
+    dE_so = [(k + 2.) / 2 * e_so[k] for k in range(8)]
+    ratio = [dE[0]]
+    ratio_so = [zeros]
+    for k in range(1, 8):
+        ratio.append(dE[k] - sum(f[j] * ratio[k - j] for j in range(1, k + 1)))
+        ratio_so.append(
+            dE_so[k] - sum(
+                f_so[j] * ratio[k - j] + f[j] * ratio_so[k - j] for j in
+                range(1, k + 1)
+            )
+        )
+    sigma = (721. / 48 * S1L * S2L - 247. / 48 * S1S2) / eta + (
+        719. / 96 * S1L ** 2 - 233. / 96 * np.sum(S1 * S1, axis=0)
+    ) / X1 ** 2 + (
+        719. / 96 * S2L ** 2 - 233. / 96 * np.sum(S2 * S2, axis=0)
+    ) / X2 ** 2
+    series = sum(ratio[k] * v ** k for k in range(8)) + sum(
+        ratio_so[k] * v ** k for k in range(7)
+    ) - sigma * v ** 4
+    dtdv = 5. / (32 * eta * v ** 9) * series
+    return dL * dtdv, dS1 * dtdv, dS2 * dtdv
+
+
+def _precession_phase(mass_1, mass_2, v_start, v_final):
+    """Return a conservative estimate of the precession phase accumulated
+    between two orbital velocities
+
+    Parameters
+    ----------
+    mass_1: np.ndarray
+        array of primary masses
+    mass_2: np.ndarray
+        array of secondary masses
+    v_start: np.ndarray
+        array of initial orbital velocities
+    v_final: float
+        final orbital velocity
+    """
+    eta = mass_1 * mass_2 / (mass_1 + mass_2) ** 2
+    return 5. / (48 * eta) * np.abs(v_start ** -3 - v_final ** -3)
+
+
+def _evolve_spin_vectors(
+    mass_1, mass_2, a_1, a_2, tilt_1, tilt_2, phi_12, v_start, final_velocity,
+    step_size=0.2
+):
+    """Integrate the SpinTaylorT5 precession equations for a batch of samples
+    with a fourth order Runge-Kutta scheme and return the spin angles at the
+    final velocity. Only the current state of each sample is stored. All
+    samples share the same steps in v^-3, which is approximately
+    proportional to the precession phase
+
+    Parameters
+    ----------
+    mass_1: np.ndarray
+        array of primary masses
+    mass_2: np.ndarray
+        array of secondary masses
+    a_1: np.ndarray
+        array of primary spin magnitudes
+    a_2: np.ndarray
+        array of secondary spin magnitudes
+    tilt_1: np.ndarray
+        array of primary spin tilt angles from the orbital angular momentum
+    tilt_2: np.ndarray
+        array of secondary spin tilt angles from the orbital angular momentum
+    phi_12: np.ndarray
+        array of angles between the in-plane spin components
+    v_start: np.ndarray
+        array of orbital velocities to start the evolution from
+    final_velocity: float
+        orbital velocity to evolve the spins up to
+    step_size: float, optional
+        maximum change in the precession phase, in radians, per step.
+        Default 0.2
+    """
+    total_mass = mass_1 + mass_2
+    X1, X2 = mass_1 / total_mass, mass_2 / total_mass
+    nsteps = max(
+        int(np.ceil(
+            np.max(_precession_phase(mass_1, mass_2, v_start, final_velocity))
+            / step_size
+        )), 1
+    )
+    u_start, u_final = v_start ** -3, final_velocity ** -3
+    du = (u_final - u_start) / nsteps
+
+    def derivatives(u, state):
+        v = u ** (-1. / 3)
+        dvdu = -v ** 4 / 3.
+        return np.array(
+            _spin_taylor_t5_derivatives(v, *state, X1, X2)
+        ) * dvdu
+
+    zeros = np.zeros_like(X1)
+    state = np.array([
+        [zeros, zeros, zeros + 1.],
+        a_1 * X1 ** 2 * np.array(
+            [np.sin(tilt_1), zeros, np.cos(tilt_1)]
+        ),
+        a_2 * X2 ** 2 * np.array([
+            np.sin(tilt_2) * np.cos(phi_12), np.sin(tilt_2) * np.sin(phi_12),
+            np.cos(tilt_2)
+        ])
+    ])
+    for step in range(nsteps):
+        u = u_start + step * du
+        k1 = derivatives(u, state)
+        k2 = derivatives(u + du / 2, state + du / 2 * k1)
+        k3 = derivatives(u + du / 2, state + du / 2 * k2)
+        k4 = derivatives(u + du, state + du * k3)
+        state = state + du / 6 * (k1 + 2 * k2 + 2 * k3 + k4)
+    return _tilts_and_phi_12_from_vectors(state[1], state[2], state[0])
+
+
+def _tilts_and_phi_12_from_vectors(S1, S2, L):
+    """Return the tilt angles and phi_12 for a batch of spin vectors and
+    orbital angular momenta. See
+    pesummary.gw.conversions.tilt_angles_and_phi_12_from_spin_vectors_and_L
+
+    Parameters
+    ----------
+    S1: np.ndarray
+        array of shape (3, N) giving the primary spin vectors
+    S2: np.ndarray
+        array of shape (3, N) giving the secondary spin vectors
+    L: np.ndarray
+        array of shape (3, N) giving the orbital angular momenta
+    """
+    L = L / np.linalg.norm(L, axis=0)
+    S1L = np.sum(S1 * L, axis=0)
+    S2L = np.sum(S2 * L, axis=0)
+    S1_perp = S1 - S1L * L
+    S2_perp = S2 - S2L * L
+    with np.errstate(invalid="ignore", divide="ignore"):
+        tilt_1 = np.arccos(np.clip(S1L / np.linalg.norm(S1, axis=0), -1, 1))
+        tilt_2 = np.arccos(np.clip(S2L / np.linalg.norm(S2, axis=0), -1, 1))
+        phi_12 = np.arccos(np.clip(
+            np.sum(S1_perp * S2_perp, axis=0) / (
+                np.linalg.norm(S1_perp, axis=0) *
+                np.linalg.norm(S2_perp, axis=0)
+            ), -1, 1
+        ))
+    sign = np.sum(L * np.cross(S1, S2, axis=0), axis=0)
+    phi_12 = np.where(sign < 0., 2. * np.pi - phi_12, phi_12)
+    return tilt_1, tilt_2, phi_12
+
+
+def _wrapper_for_evolve_spin_vectors(args):
+    """Wrapper function for _evolve_spin_vectors for a pool of workers
+
+    Parameters
+    ----------
+    args: tuple
+        All args passed to _evolve_spin_vectors
+    """
+    return _evolve_spin_vectors(*args)
+
+
+def _evolve_angles_forwards_batched(
+    mass_1, mass_2, a_1, a_2, tilt_1, tilt_2, phi_12, f_start,
+    final_velocity, tolerance, step_size=0.2, batch_size=1000,
+    multi_process=1
+):
+    """Evolve the BBH spin angles forwards by integrating the SpinTaylorT5
+    precession equations for batches of samples at once. Samples are sorted
+    by the expected number of integration steps before being split into
+    batches so that samples within a batch require a similar number of steps
+
+    Parameters
+    ----------
+    mass_1: np.ndarray
+        array of primary masses
+    mass_2: np.ndarray
+        array of secondary masses
+    a_1: np.ndarray
+        array of primary spin magnitudes
+    a_2: np.ndarray
+        array of secondary spin magnitudes
+    tilt_1: np.ndarray
+        array of primary spin tilt angles from the orbital angular momentum
+    tilt_2: np.ndarray
+        array of secondary spin tilt angles from the orbital angular momentum
+    phi_12: np.ndarray
+        array of angles between the in-plane spin components
+    f_start: float
+        frequency to start the evolution from
+    final_velocity: float
+        final velocity to evolve the spins up to
+    tolerance: float
+        Only evolve spins if at least one spins magnitude is greater than
+        tolerance
+    step_size: float, optional
+        maximum change in the precession phase, in radians, per step.
+        Default 0.2
+    batch_size: int, optional
+        number of samples to evolve at once. Default 1000
+    multi_process: int, optional
+        number of cores to run on when evolving the spins. Default: 1
+    """
+    mass_1, mass_2, a_1, a_2 = [
+        np.asarray(param, dtype=float) for param in [mass_1, mass_2, a_1, a_2]
+    ]
+    tilt_1_evol, tilt_2_evol, phi_12_evol = [
+        np.array(param, dtype=float) for param in [tilt_1, tilt_2, phi_12]
+    ]
+    v_start = (np.pi * (mass_1 + mass_2) * MTSUN_SI * f_start) ** (1. / 3)
+    inds = np.argwhere(
+        np.logical_or(a_1 > tolerance, a_2 > tolerance)
+    ).flatten()
+    inds = inds[np.argsort(
+        _precession_phase(mass_1, mass_2, v_start, final_velocity)[inds]
+    )]
+    batches = [
+        inds[num:num + batch_size] for num in range(0, len(inds), batch_size)
+    ]
+    args = [
+        [
+            mass_1[batch], mass_2[batch], a_1[batch], a_2[batch],
+            tilt_1_evol[batch], tilt_2_evol[batch], phi_12_evol[batch],
+            v_start[batch], final_velocity, step_size
+        ] for batch in batches
+    ]
+    _desc = "Evolving spins forward for remnant fits evaluation"
+    if multi_process > 1 and len(batches) > 1:
+        with multiprocessing.Pool(multi_process) as pool:
+            data = list(
+                iterator(
+                    pool.imap(_wrapper_for_evolve_spin_vectors, args),
+                    tqdm=True, logger=logger, total=len(batches), desc=_desc
+                )
+            )
+    else:
+        data = [
+            _wrapper_for_evolve_spin_vectors(_args) for _args in iterator(
+                args, tqdm=True, logger=logger, total=len(batches), desc=_desc
+            )
+        ]
+    for batch, (_tilt_1, _tilt_2, _phi_12) in zip(batches, data):
+        tilt_1_evol[batch] = _tilt_1
+        tilt_2_evol[batch] = _tilt_2
+        phi_12_evol[batch] = _phi_12
+    return tilt_1_evol, tilt_2_evol, phi_12_evol
+
+
 def _wrapper_for_evolve_angles_backwards(args):
     """Wrapper function for evolving tilts backwards for a pool of workers
 
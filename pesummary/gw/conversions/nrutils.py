@@ -653,7 +653,15 @@ def bbh_peak_luminosity_average(*args, fits=LPEAK_FITS, return_fits_used=False):
     )
 
 
-def eval_nrfit(*args, **kwargs):
+def _stdout_redirector(stream):
+    """Return a context manager which redirects anything written to stdout,
+    including output from C libraries, to `stream`
+
+    Parameters
+    ----------
+    stream: io.BytesIO
+        stream to write stdout to
+    """
     from contextlib import contextmanager
     import ctypes
     import io
@@ -688,34 +696,119 @@ def eval_nrfit(*args, **kwargs):
             tfile.close()
             os.close(saved_stdout_fd)
 
-    f = io.BytesIO()
-    with stdout_redirector(f):
-        NRSurrogate_kwargs = kwargs.copy()
-        approximant = kwargs.get("approximant", None)
-        f_low = kwargs.get("f_low", None)
-        f_ref = kwargs.get("f_ref", None)
-        spinfreq_enum = SimInspiralGetSpinFreqFromApproximant(
-            getattr(lalsimulation, approximant)
+    return stdout_redirector(stream)
+
+
+def _eval_nrfit_kwargs(**kwargs):
+    """Convert the kwargs passed to `eval_nrfit` into kwargs for
+    `lalsimulation.nrfits.eval_fits.eval_nrfit`
+    """
+    NRSurrogate_kwargs = kwargs.copy()
+    approximant = kwargs.get("approximant", None)
+    f_low = kwargs.get("f_low", None)
+    f_ref = kwargs.get("f_ref", None)
+    spinfreq_enum = SimInspiralGetSpinFreqFromApproximant(
+        getattr(lalsimulation, approximant)
+    )
+    if spinfreq_enum == SIM_INSPIRAL_SPINS_CASEBYCASE:
+        raise ValueError(
+            "Unable to evolve spins as '{}' does not have a set frequency "
+            "at which the spins are defined".format(approximant)
         )
-        if spinfreq_enum == SIM_INSPIRAL_SPINS_CASEBYCASE:
-            raise ValueError(
-                "Unable to evolve spins as '{}' does not have a set frequency "
-                "at which the spins are defined".format(approximant)
-            )
-        f_start = float(np.where(
-            np.array(spinfreq_enum == SIM_INSPIRAL_SPINS_FLOW), f_low, f_ref
-        ))
-        NRSurrogate_kwargs["f_ref"] = f_start
-        NRSurrogate_kwargs.pop("f_low")
-        NRSurrogate_kwargs.pop("approximant")
-        data = _eval_nrfit(*args, **NRSurrogate_kwargs)
+    f_start = float(np.where(
+        np.array(spinfreq_enum == SIM_INSPIRAL_SPINS_FLOW), f_low, f_ref
+    ))
+    NRSurrogate_kwargs["f_ref"] = f_start
+    NRSurrogate_kwargs.pop("f_low")
+    NRSurrogate_kwargs.pop("approximant")
+    return NRSurrogate_kwargs
+
+
+def eval_nrfit(*args, **kwargs):
+    import io
+
+    f = io.BytesIO()
+    with _stdout_redirector(f):
+        data = _eval_nrfit(*args, **_eval_nrfit_kwargs(**kwargs))
     return data
 
 
+_NRSUR_WORKER = {}
+
+
+def _initialise_NRSur_worker(data, warm_up=True):
+    """Store the samples required for the NRSurrogate fit in a global
+    variable so that they are only sent to each worker once. The surrogate
+    model data is loaded the first time the model is evaluated so a single
+    sample is evaluated when the worker starts
+
+    Parameters
+    ----------
+    data: dict
+        dictionary containing the samples and settings for the fit
+    warm_up: Bool, optional
+        if True, evaluate the first sample to load the surrogate model data.
+        Default True
+    """
+    _NRSUR_WORKER.clear()
+    _NRSUR_WORKER.update(data)
+    if warm_up:
+        try:
+            _evaluate_NRSur_chunk(0, 1)
+        except Exception as e:
+            # the same error is raised when the chunk is evaluated by the
+            # worker, so it is only logged here
+            logger.debug(
+                "Failed to load the surrogate model data when starting the "
+                "worker because: {}".format(e)
+            )
+
+
+def _evaluate_NRSur_chunk(start, stop):
+    """Evaluate the NRSurrogate fit for a contiguous chunk of the samples
+    stored by `_initialise_NRSur_worker`. stdout is only redirected once per
+    chunk
+
+    Parameters
+    ----------
+    start: int
+        index of the first sample in the chunk
+    stop: int
+        index after the last sample in the chunk
+    """
+    import io
+
+    data = _NRSUR_WORKER
+    f = io.BytesIO()
+    with _stdout_redirector(f):
+        return [
+            _eval_nrfit(
+                data["mass_1"][num], data["mass_2"][num], data["a_1_vec"][num],
+                data["a_2_vec"][num], data["model"], data["fits"],
+                **_eval_nrfit_kwargs(
+                    f_low=data["f_low"], f_ref=data["f_ref"][num],
+                    approximant=data["approximant"],
+                    extra_params_dict=data["extra_params_dict"]
+                )
+            ) for num in range(start, stop)
+        ]
+
+
+def _wrapper_for_NRSur_fit(args):
+    """Wrapper function for _evaluate_NRSur_chunk for a pool of workers
+
+    Parameters
+    ----------
+    args: tuple
+        the start and stop index of the chunk
+    """
+    return _evaluate_NRSur_chunk(*args)
+
+
 def NRSur_fit(
     mass_1, mass_2, a_1, a_2, tilt_1, tilt_2, phi_12, phi_jl, theta_jn, phi_ref,
     f_low=20., f_ref=20., model=NRSUR_MODEL, fits=NRSUR_FITS, return_fits_used=False,
-    approximant=None, **kwargs
+    approximant=None, multi_process=1, **kwargs
 ):
     """Return the NR fits based on a chosen NRSurrogate model
 
@@ -755,10 +848,14 @@ def NRSur_fit(
         list of fits that you wish to evaluate
     approximant: str, optional
         The approximant that was used to generate the posterior samples
+    multi_process: int, optional
+        number of cores to use. The samples are split into contiguous chunks
+        and the surrogate model data is loaded once per worker. Default 1
     kwargs: dict, optional
         optional kwargs that are passed directly to the
         `lalsimulation.nrfits.eval_fits.eval_nrfit` function
     """
+    import multiprocessing
     from lal import MSUN_SI, C_SI
     from .spins import component_spins
     from .utils import magnitude_from_vector
@@ -791,19 +888,52 @@ def NRSur_fit(
     )
     a_1_vec = np.array([spins.T[1], spins.T[2], spins.T[3]]).T
     a_2_vec = np.array([spins.T[4], spins.T[5], spins.T[6]]).T
-    mass_1 *= MSUN_SI
-    mass_2 *= MSUN_SI
+    nsamples = len(a_1_vec)
+    data = {
+        "mass_1": np.asarray(mass_1, dtype=float) * MSUN_SI,
+        "mass_2": np.asarray(mass_2, dtype=float) * MSUN_SI,
+        "a_1_vec": a_1_vec, "a_2_vec": a_2_vec,
+        "f_ref": np.broadcast_to(f_ref, nsamples), "f_low": f_low,
+        "model": model, "fits": converted_fits, "approximant": approximant,
+        "extra_params_dict": kwargs
+    }
+    if multi_process is None:
+        multi_process = 1
+    multi_process = int(max(1, min(multi_process, nsamples)))
+    # contiguous chunks of samples. More chunks than workers are used so that
+    # the progress bar is updated regularly
+    nchunks = min(nsamples, max(multi_process * 10, 100))
+    bounds = np.linspace(0, nsamples, nchunks + 1).astype(int)
+    bounds = [
+        (start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if
+        stop > start
+    ]
+    nr_fits, pool = {}, None
     try:
-        _fits = [
-            eval_nrfit(
-                mass_1[num], mass_2[num], a_1_vec[num], a_2_vec[num], model,
-                converted_fits, f_low=f_low, f_ref=f_ref[num],
-                approximant=approximant, extra_params_dict=kwargs
-            ) for num in iterator(
-                range(len(mass_1)), desc=description, tqdm=True, total=len(mass_1),
-                logger=logger
+        if multi_process > 1:
+            pool = multiprocessing.Pool(
+                multi_process, initializer=_initialise_NRSur_worker,
+                initargs=(data,)
             )
-        ]
+            chunks = pool.imap(_wrapper_for_NRSur_fit, bounds)
+        else:
+            _initialise_NRSur_worker(data, warm_up=False)
+            chunks = (_evaluate_NRSur_chunk(*args) for args in bounds)
+        with iterator(
+            None, desc=description, tqdm=True, total=nsamples, logger=logger
+        ) as pbar:
+            for (start, stop), chunk in zip(bounds, chunks):
+                for key in chunk[0].keys():
+                    if key not in nr_fits.keys():
+                        nr_fits[key] = np.zeros(
+                            (nsamples,) + np.shape(chunk[0][key])
+                        )
+                    nr_fits[key][start:stop] = [dic[key] for dic in chunk]
+                pbar.update(stop - start)
+        if pool is not None:
+            pool.close()
+            pool.join()
+            pool = None
     except ValueError as e:
         base = (
             "Failed to generate remnant quantities with the NRSurrogate "
@@ -817,11 +947,16 @@ def NRSur_fit(
                 )
             )
         raise ValueError(base.format(""))
-    nr_fits = {key: np.array([dic[key] for dic in _fits]) for key in _fits[0]}
+    finally:
+        _NRSUR_WORKER.clear()
+        if pool is not None:
+            # a chunk raised so the remaining chunks are not needed
+            pool.terminate()
+            pool.join()
     if fits_map["final_mass"] in nr_fits.keys():
-        nr_fits[fits_map["final_mass"]] = np.array(
-            [final_mass[0] for final_mass in nr_fits[fits_map["final_mass"]]]
-        ) / MSUN_SI
+        nr_fits[fits_map["final_mass"]] = nr_fits[
+            fits_map["final_mass"]
+        ].reshape(nsamples, -1)[:, 0] / MSUN_SI
     if fits_map["final_kick"] in nr_fits.keys():
         nr_fits[fits_map["final_kick"]] *= C_SI / 1000
         final_kick_abs = magnitude_from_vector(
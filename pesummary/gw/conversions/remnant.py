@@ -372,7 +372,8 @@ def _final_from_initial_BBH(
 
 def final_remnant_properties_from_NRSurrogate(
     *args, f_low=20., f_ref=20., model="NRSur7dq4Remnant", return_fits_used=False,
-    properties=["final_mass", "final_spin", "final_kick"], approximant="SEOBNRv4PHM"
+    properties=["final_mass", "final_spin", "final_kick"], approximant="SEOBNRv4PHM",
+    multi_process=1
 ):
     """Return the properties of the final remnant resulting from a BBH merger using
     NRSurrogate fits
@@ -391,12 +392,14 @@ def final_remnant_properties_from_NRSurrogate(
         The list of properties you wish to calculate
     approximant: str, optional
         The approximant that was used to generate the posterior samples
+    multi_process: int, optional
+        number of cores to use when evaluating the NRSurrogate fits. Default 1
     """
     from .nrutils import NRSur_fit
 
     fit = NRSur_fit(
         *args, f_low=f_low, f_ref=f_ref, model=model, fits=properties,
-        approximant=approximant
+        approximant=approximant, multi_process=multi_process
     )
     if return_fits_used:
         return fit, [model]
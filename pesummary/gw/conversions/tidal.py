@@ -1,5 +1,6 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
+from collections import OrderedDict
 import numpy as np
 from pesummary.utils.decorators import array_input
 from pesummary.utils.utils import logger, iterator
@@ -10,6 +11,7 @@ try:
     from lalsimulation import (
         CreateSimNeutronStarFamily, SimNeutronStarRadius,
         SimNeutronStarLoveNumberK2, SimNeutronStarEOS4ParameterPiecewisePolytrope,
+        SimNeutronStarFamMinimumMass, SimNeutronStarMaximumMass,
         SimNSBH_compactness_from_lambda, SimIMRPhenomNSBHProperties,
         SimNeutronStarEOS4ParameterSpectralDecomposition,
         SimIMRPhenomNSBH_baryonic_mass_from_C
@@ -88,17 +90,240 @@ def lambda2_from_lambda1(lambda1, mass1, mass2):
     return lambda2
 
 
+def _lambda_from_family(fam, mass):
+    """Return the tidal deformability of a neutron star with a given mass
+
+    Parameters
+    ----------
+    fam: lalsimulation.SimNeutronStarFamily
+        family of neutron stars for a given equation of state
+    mass: float
+        mass of the neutron star in units of solar mass
+    """
+    r = SimNeutronStarRadius(mass * MSUN_SI, fam)
+    k = SimNeutronStarLoveNumberK2(mass * MSUN_SI, fam)
+    c = mass * MRSUN_SI / r
+    return (2. / 3.) * k / c**5.0
+
+
 def _lambda1_lambda2_from_eos(eos, mass_1, mass_2):
     """Return lambda_1 and lambda_2 assuming a given equation of state
     """
     fam = CreateSimNeutronStarFamily(eos)
-    _lambda = []
-    for mass in [mass_1, mass_2]:
-        r = SimNeutronStarRadius(mass * MSUN_SI, fam)
-        k = SimNeutronStarLoveNumberK2(mass * MSUN_SI, fam)
-        c = mass * MRSUN_SI / r
-        _lambda.append((2. / 3.) * k / c**5.0)
-    return _lambda
+    return [_lambda_from_family(fam, mass) for mass in [mass_1, mass_2]]
+
+
+class EOSFamilyCache(object):
+    """Least recently used cache of neutron star families. Solving the TOV
+    equations for a family is far more expensive than evaluating it. The
+    first time a family is requested it is solved and evaluated directly.
+    If the family is requested again, i.e. for repeated (or, with a
+    quantisation tolerance, nearby) equation of state draws, a dense
+    interpolation table of log(lambda) as a function of mass is built and
+    all subsequent masses are evaluated by interpolation. By default only
+    identical equation of state parameters share a family so the tidal
+    deformabilities are exact up to the interpolation error
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        maximum number of families to store. Default 128
+    tolerance: float/list, optional
+        relative quantisation tolerance for the equation of state parameters.
+        Either a single tolerance for all parameters or one tolerance for
+        each parameter. If provided, each parameter is rounded onto a
+        logarithmic grid with a relative spacing of `tolerance` and the family
+        is solved for the rounded parameters. The tidal deformabilities are
+        therefore only approximate. A tolerance of 0 leaves the parameter
+        unchanged. Default None, i.e. only identical parameters share a
+        family
+    npoints: int, optional
+        number of masses in each interpolation table. Default 500
+
+    Attributes
+    ----------
+    hits: int
+        number of times a family was found in the cache
+    misses: int
+        number of times a family had to be solved
+    """
+    eos_functions = {
+        "piecewise_polytrope": "SimNeutronStarEOS4ParameterPiecewisePolytrope",
+        "spectral_decomposition": (
+            "SimNeutronStarEOS4ParameterSpectralDecomposition"
+        )
+    }
+
+    def __init__(self, maxsize=128, tolerance=None, npoints=500):
+        self.maxsize = maxsize
+        self.tolerance = tolerance
+        self.npoints = npoints
+        self.clear()
+
+    def clear(self):
+        """Remove all families from the cache
+        """
+        self._cache = OrderedDict()
+        self.hits, self.misses = 0, 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def _key(self, eos_type, parameters):
+        """Return the cache key and the (possibly quantised) equation of state
+        parameters
+
+        Parameters
+        ----------
+        eos_type: str
+            either 'piecewise_polytrope' or 'spectral_decomposition'
+        parameters: list
+            equation of state parameters
+        """
+        parameters = np.asarray(parameters, dtype=float)
+        if self.tolerance is None:
+            return (eos_type, tuple(parameters)), parameters
+        tolerance = np.asarray(self.tolerance, dtype=float)
+        step = np.log1p(np.broadcast_to(tolerance, parameters.shape))
+        quantise = (step > 0) & (parameters != 0)
+        index = np.zeros(len(parameters), dtype=np.int64)
+        index[quantise] = np.round(
+            np.log(np.abs(parameters[quantise])) / step[quantise]
+        )
+        quantised = np.where(
+            quantise, np.sign(parameters) * np.exp(index * step), parameters
+        )
+        key = tuple(
+            (int(np.sign(param)), int(ind)) if cond else float(param) for
+            param, ind, cond in zip(parameters, index, quantise)
+        )
+        return (eos_type, key), quantised
+
+    def _solve(self, eos_type, parameters):
+        """Solve the TOV equations for a given equation of state and return
+        the neutron star family
+
+        Parameters
+        ----------
+        eos_type: str
+            either 'piecewise_polytrope' or 'spectral_decomposition'
+        parameters: np.ndarray
+            equation of state parameters
+        """
+        import lalsimulation
+
+        eos = getattr(lalsimulation, self.eos_functions[eos_type])(
+            *[float(param) for param in parameters]
+        )
+        fam = CreateSimNeutronStarFamily(eos)
+        # the radius can not be evaluated at exactly the minimum mass
+        minimum = SimNeutronStarFamMinimumMass(fam) / MSUN_SI * (1 + 1e-4)
+        maximum = SimNeutronStarMaximumMass(fam) / MSUN_SI
+        # the eos must be kept alive for as long as the family is used
+        return {
+            "eos": eos, "family": fam, "minimum": minimum, "maximum": maximum,
+            "log_lambda": None
+        }
+
+    def _interpolate(self, table):
+        """Return a cubic spline of log(lambda) as a function of mass for a
+        solved neutron star family
+
+        Parameters
+        ----------
+        table: dict
+            dictionary returned by the `_solve` method
+        """
+        from scipy.interpolate import CubicSpline
+
+        masses = np.linspace(table["minimum"], table["maximum"], self.npoints)
+        log_lambdas = np.log(
+            [_lambda_from_family(table["family"], mass) for mass in masses]
+        )
+        return CubicSpline(masses, log_lambdas)
+
+    def family(self, eos_type, parameters):
+        """Return the cached family for a given equation of state, solving
+        the TOV equations if it is not in the cache. The interpolation table
+        is built the first time a cached family is reused
+
+        Parameters
+        ----------
+        eos_type: str
+            either 'piecewise_polytrope' or 'spectral_decomposition'
+        parameters: list
+            equation of state parameters
+        """
+        key, parameters = self._key(eos_type, parameters)
+        if key in self._cache:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            table = self._cache[key]
+            if table["log_lambda"] is None:
+                table["log_lambda"] = self._interpolate(table)
+            return table
+        self.misses += 1
+        table = self._solve(eos_type, parameters)
+        self._cache[key] = table
+        if self.maxsize is not None and len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return table
+
+    def lambdas(self, eos_type, parameters, masses):
+        """Return the tidal deformability for a set of masses assuming a
+        given equation of state
+
+        Parameters
+        ----------
+        eos_type: str
+            either 'piecewise_polytrope' or 'spectral_decomposition'
+        parameters: list
+            equation of state parameters
+        masses: list
+            masses of the neutron stars in units of solar mass
+        """
+        table = self.family(eos_type, parameters)
+        masses = np.atleast_1d(np.asarray(masses, dtype=float))
+        lambdas = np.empty(len(masses))
+        if table["log_lambda"] is None:
+            inside = np.zeros(len(masses), dtype=bool)
+        else:
+            inside = (
+                (masses >= table["minimum"]) & (masses <= table["maximum"])
+            )
+            lambdas[inside] = np.exp(table["log_lambda"](masses[inside]))
+        # masses outside of the table, or for a family that has not been
+        # reused, are evaluated directly to match the behaviour of
+        # lalsimulation
+        for num in np.argwhere(~inside).flatten():
+            lambdas[num] = _lambda_from_family(table["family"], masses[num])
+        return lambdas
+
+
+EOS_FAMILY_CACHE = EOSFamilyCache()
+
+
+def _configure_eos_family_cache(maxsize=128, tolerance=None):
+    """Configure the EOS family cache. This is used as the initializer for
+    each worker in a pool
+
+    Parameters
+    ----------
+    maxsize: int, optional
+        maximum number of families to store. Default 128
+    tolerance: float/list, optional
+        relative quantisation tolerance for the equation of state parameters.
+        Default None
+    """
+    if tolerance is not None and np.ndim(tolerance):
+        tolerance = tuple(np.asarray(tolerance, dtype=float))
+    if (
+            EOS_FAMILY_CACHE.maxsize != maxsize or
+            EOS_FAMILY_CACHE.tolerance != tolerance
+    ):
+        EOS_FAMILY_CACHE.maxsize = maxsize
+        EOS_FAMILY_CACHE.tolerance = tolerance
+        EOS_FAMILY_CACHE.clear()
 
 
 def wrapper_for_lambda1_lambda2_polytrope_EOS(args):
@@ -116,10 +341,10 @@ def _lambda1_lambda2_from_4_parameter_piecewise_polytrope_equation_of_state(
     4_parameter_piecewise_polytrope_equation_of_state parameters for a pool
     of workers
     """
-    eos = SimNeutronStarEOS4ParameterPiecewisePolytrope(
-        log_pressure_si, gamma_1, gamma_2, gamma_3
+    return EOS_FAMILY_CACHE.lambdas(
+        "piecewise_polytrope", [log_pressure_si, gamma_1, gamma_2, gamma_3],
+        [mass_1, mass_2]
     )
-    return _lambda1_lambda2_from_eos(eos, mass_1, mass_2)
 
 
 def wrapper_for_lambda1_lambda2_from_spectral_decomposition(args):
@@ -141,63 +366,146 @@ def _lambda1_lambda2_from_spectral_decomposition(
         spectral_decomposition_gamma_0, spectral_decomposition_gamma_1,
         spectral_decomposition_gamma_2, spectral_decomposition_gamma_3
     ]
-    eos = SimNeutronStarEOS4ParameterSpectralDecomposition(*gammas)
-    return _lambda1_lambda2_from_eos(eos, mass_1, mass_2)
+    return EOS_FAMILY_CACHE.lambdas(
+        "spectral_decomposition", gammas, [mass_1, mass_2]
+    )
 
 
-def _lambda1_lambda2_from_eos_multiprocess(function, args, multi_process=1):
+def _warn_eos_tolerance(tolerance):
+    """Warn that the tidal deformabilities are approximate when the equation
+    of state parameters are quantised
+
+    Parameters
+    ----------
+    tolerance: float/list
+        relative quantisation tolerance for the equation of state parameters
     """
+    if tolerance is not None and np.any(np.asarray(tolerance) > 0):
+        logger.warning(
+            "Equation of state parameters are quantised with a relative "
+            "tolerance of {}. The tidal deformability parameters are "
+            "therefore approximate".format(tolerance)
+        )
+
+
+def _lambda1_lambda2_from_eos_multiprocess(
+    function, args, multi_process=1, maxsize=128, tolerance=None
+):
+    """Calculate the tidal deformability parameters for each row in args.
+    Equation of state families are cached in each worker
+
+    Parameters
+    ----------
+    function: func
+        function to evaluate for each row in args
+    args: np.ndarray
+        2d array of arguments
+    multi_process: int, optional
+        number of cores to use. Default 1
+    maxsize: int, optional
+        maximum number of families to cache in each worker. Default 128
+    tolerance: float/list, optional
+        relative quantisation tolerance for the equation of state parameters.
+        Default None
     """
     import multiprocessing
 
-    with multiprocessing.Pool(multi_process[0]) as pool:
-        lambdas = np.array(
-            list(
-                iterator(
-                    pool.imap(function, args), tqdm=True, logger=logger,
-                    total=len(args), desc="Calculating tidal parameters"
+    if multi_process is None:
+        multi_process = 1
+    multi_process = int(np.atleast_1d(multi_process)[0])
+    if multi_process > 1:
+        # large chunks keep consecutive samples, which often share an
+        # equation of state, in the same worker
+        chunksize = int(max(1, len(args) // (4 * multi_process)))
+        with multiprocessing.Pool(
+            multi_process, initializer=_configure_eos_family_cache,
+            initargs=(maxsize, tolerance)
+        ) as pool:
+            lambdas = np.array(
+                list(
+                    iterator(
+                        pool.imap(function, args, chunksize=chunksize),
+                        tqdm=True, logger=logger, total=len(args),
+                        desc="Calculating tidal parameters"
+                    )
                 )
             )
+    else:
+        _configure_eos_family_cache(maxsize=maxsize, tolerance=tolerance)
+        lambdas = np.array(
+            [
+                function(arg) for arg in iterator(
+                    args, tqdm=True, logger=logger, total=len(args),
+                    desc="Calculating tidal parameters"
+                )
+            ]
         )
     lambdas = np.array(lambdas).T
     return lambdas[0], lambdas[1]
 
 
-@array_input()
+@array_input(ignore_kwargs=["multi_process", "cache_size", "tolerance"])
 def lambda1_lambda2_from_4_parameter_piecewise_polytrope_equation_of_state(
-    log_pressure, gamma_1, gamma_2, gamma_3, mass_1, mass_2, multi_process=1
+    log_pressure, gamma_1, gamma_2, gamma_3, mass_1, mass_2, multi_process=1,
+    cache_size=128, tolerance=None
 ):
     """Convert 4 parameter piecewise polytrope EOS parameters to the tidal
     deformability parameters lambda_1, lambda_2
+
+    Parameters
+    ----------
+    multi_process: int, optional
+        number of cores to use. Default 1
+    cache_size: int, optional
+        maximum number of equation of state families to cache. Default 128
+    tolerance: float/list, optional
+        relative quantisation tolerance for the equation of state parameters,
+        either a single tolerance or one for each parameter. Draws within
+        `tolerance` share a family and the returned tidal deformabilities are
+        only approximate. Default None, i.e. exact
     """
     logger.warning(
         "Calculating the tidal deformability parameters based on the 4 "
         "parameter piecewise polytrope equation of state parameters. This may "
         "take some time"
     )
+    _warn_eos_tolerance(tolerance)
     log_pressure_si = log_pressure - 1.
     args = np.array(
         [log_pressure_si, gamma_1, gamma_2, gamma_3, mass_1, mass_2]
     ).T
     return _lambda1_lambda2_from_eos_multiprocess(
         wrapper_for_lambda1_lambda2_polytrope_EOS, args,
-        multi_process=multi_process[0]
+        multi_process=multi_process, maxsize=cache_size, tolerance=tolerance
     )
 
 
-@array_input()
+@array_input(ignore_kwargs=["multi_process", "cache_size", "tolerance"])
 def lambda1_lambda2_from_spectral_decomposition(
     spectral_decomposition_gamma_0, spectral_decomposition_gamma_1,
     spectral_decomposition_gamma_2, spectral_decomposition_gamma_3,
-    mass_1, mass_2, multi_process=1
+    mass_1, mass_2, multi_process=1, cache_size=128, tolerance=None
 ):
     """Convert spectral decomposition parameters to the tidal deformability
     parameters lambda_1, lambda_2
+
+    Parameters
+    ----------
+    multi_process: int, optional
+        number of cores to use. Default 1
+    cache_size: int, optional
+        maximum number of equation of state families to cache. Default 128
+    tolerance: float/list, optional
+        relative quantisation tolerance for the equation of state parameters,
+        either a single tolerance or one for each parameter. Draws within
+        `tolerance` share a family and the returned tidal deformabilities are
+        only approximate. Default None, i.e. exact
     """
     logger.warning(
         "Calculating the tidal deformability parameters from the spectral "
         "decomposition equation of state parameters. This may take some time"
     )
+    _warn_eos_tolerance(tolerance)
     args = np.array(
         [
             spectral_decomposition_gamma_0, spectral_decomposition_gamma_1,
@@ -207,7 +515,7 @@ def lambda1_lambda2_from_spectral_decomposition(
     ).T
     return _lambda1_lambda2_from_eos_multiprocess(
         wrapper_for_lambda1_lambda2_from_spectral_decomposition, args,
-        multi_process=multi_process[0]
+        multi_process=multi_process, maxsize=cache_size, tolerance=tolerance
     )
 
 
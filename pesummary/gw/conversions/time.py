@@ -8,7 +8,6 @@ __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 try:
     from lalsimulation import DetectorPrefixToLALDetector
     from lal import C_SI
-    from astropy.time import Time
 except ImportError:
     pass
 
@@ -18,6 +17,10 @@ def time_in_each_ifo(detector, ra, dec, time_gps):
     """Return the event time in a given detector, given samples for ra, dec,
     time
     """
+    from astropy.time import Time
+    from pesummary.gw.file import check_IERS
+
+    check_IERS()
     gmst = Time(time_gps, format='gps', location=(0, 0))
     corrected_ra = gmst.sidereal_time('mean').rad - ra
 
@@ -1,14 +1,32 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
 from pesummary import conf
-from astropy import cosmology as cosmo
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
-_available_cosmologies = list(cosmo.parameters.available) + ["Planck15_lal"]
-_available_cosmologies += [
-    _cosmology + "_with_Riess2019_H0" for _cosmology in _available_cosmologies
-]
-available_cosmologies = [i.lower() for i in _available_cosmologies]
+
+
+def _get_available_cosmologies():
+    """Return a list of all available cosmologies. astropy.cosmology is only
+    imported when this list is first requested
+    """
+    from astropy import cosmology as cosmo
+
+    _available_cosmologies = list(cosmo.parameters.available) + ["Planck15_lal"]
+    _available_cosmologies += [
+        _cosmology + "_with_Riess2019_H0" for _cosmology in
+        _available_cosmologies
+    ]
+    return [i.lower() for i in _available_cosmologies]
+
+
+def __getattr__(name):
+    if name == "available_cosmologies":
+        if name not in globals():
+            globals()[name] = _get_available_cosmologies()
+        return globals()[name]
+    raise AttributeError(
+        "module '{}' has no attribute '{}'".format(__name__, name)
+    )
 
 
 def get_cosmology(cosmology=conf.cosmology):
@@ -19,6 +37,9 @@ def get_cosmology(cosmology=conf.cosmology):
     cosmology: str
         name of a known cosmology
     """
+    from astropy import cosmology as cosmo
+
+    available_cosmologies = __getattr__("available_cosmologies")
     if cosmology.lower() not in [i.lower() for i in available_cosmologies]:
         raise ValueError(
             "Unrecognised cosmology {}. Available cosmologies are {}".format(
@@ -43,6 +64,8 @@ def get_cosmology(cosmology=conf.cosmology):
 def Planck15_lal_cosmology():
     """Return the Planck15 cosmology coded up in lalsuite
     """
+    from astropy import cosmology as cosmo
+
     return cosmo.LambdaCDM(H0=67.90, Om0=0.3065, Ode0=0.6935)
 
 
@@ -55,6 +78,8 @@ def Riess2019_H0_cosmology(base_cosmology):
     base_cosmology: str
         name of cosmology to use as the base
     """
+    from astropy import cosmology as cosmo
+
     _base_cosmology = get_cosmology(base_cosmology)
     return cosmo.LambdaCDM(
         H0=74.03, Om0=_base_cosmology.Om0, Ode0=_base_cosmology.Ode0
@@ -143,17 +143,33 @@ def _fetch_open_data(
     return download_and_read_file(url, **kwargs)
 
 
-def fetch_open_samples(event, **kwargs):
+def fetch_open_samples(event, multi_process=4, **kwargs):
     """Download and read publically available gravitational wave posterior
     samples
 
     Parameters
     ----------
-    event: str
-        name of the gravitational wave event you wish to download data for
+    event: str/list
+        name of the gravitational wave event you wish to download data for.
+        If a list of events is provided, the data for each event is
+        downloaded in parallel and a list is returned
+    multi_process: int, optional
+        maximum number of simultaneous downloads when a list of events is
+        provided. Default 4
     **kwargs: dict, optional
         all additional kwargs passed to _fetch_open_data
     """
+    if isinstance(event, (list, tuple)):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max(multi_process, 1)) as executor:
+            return list(
+                executor.map(
+                    lambda _event: _fetch_open_data(
+                        _event, type="posterior", **kwargs
+                    ), event
+                )
+            )
     return _fetch_open_data(event, type="posterior", **kwargs)
 
 
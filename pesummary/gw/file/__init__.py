@@ -1,14 +1,29 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
 from pesummary.utils.utils import logger
-from astropy.utils import iers
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+_IERS_CHECKED = False
 
 
-def check_IERS():
-    """Check that the latest IERS data can be downloaded
+def check_IERS(force=False):
+    """Check that the latest IERS data can be downloaded. This is only
+    performed once per session unless force=True. This is not called at
+    import time to avoid importing astropy and making a network request
+    when the IERS data is not needed
+
+    Parameters
+    ----------
+    force: Bool, optional
+        if True, check that the latest IERS data can be downloaded even if it
+        has already been checked. Default False
     """
+    global _IERS_CHECKED
+    if _IERS_CHECKED and not force:
+        return
+    from astropy.utils import iers
+
+    _IERS_CHECKED = True
     try:
         iers.conf.auto_download = True
         iers_a = iers.IERS_Auto.open()
@@ -18,6 +33,3 @@ def check_IERS():
                        "the astropy release dat will be used. Any transformations "
                        "outside of this range will not be allowed.")
         iers.conf.auto_download = False
-
-
-check_IERS()
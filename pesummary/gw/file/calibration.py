@@ -19,13 +19,33 @@ def _spline_angle_xform(delta_psi):
     delta_psi: array
         calibration phase uncertainty
     """
-    rotation = (2.0 + 1.0j * delta_psi) / (2.0 - 1.0j * delta_psi)
-    return 180.0 / np.pi * np.arctan2(np.imag(rotation), np.real(rotation))
+    # the argument of (2 + i delta_psi) / (2 - i delta_psi) is
+    # 2 arctan(delta_psi / 2) which avoids complex arithmetic
+    return 360.0 / np.pi * np.arctan(np.asarray(delta_psi) / 2.0)
+
+
+def _spline_basis(frequencies, interpolated_frequencies):
+    """Return the matrix which maps the values at the spline control points
+    onto the cubic spline interpolant evaluated at `interpolated_frequencies`.
+    Cubic spline interpolation is linear in the values at the control points
+    so the interpolant for every posterior sample is given by `data @ basis.T`
+
+    Parameters
+    ----------
+    frequencies: array
+        The spline control points
+    interpolated_frequencies: array
+        Array of frequencies you wish to evaluate the interpolant for
+    """
+    return interp1d(
+        frequencies, np.eye(len(frequencies)), kind="cubic", axis=0,
+        fill_value=0., bounds_error=False
+    )(interpolated_frequencies)
 
 
 def _interpolate_spline_model(
     frequencies, data, interpolated_frequencies, nfreqs=100, xform=None,
-    level=0.9, pbar=None
+    level=0.9, pbar=None, chunk_size=10**7, basis=None
 ):
     """Interpolate calibration posterior estimates for a spline model in log
     space. Code based upon same function in lalinference.bayespputils
@@ -42,21 +62,31 @@ def _interpolate_spline_model(
         Number of points to evaluate the interpolates spline. Default 100
     xform: func, optional
         Function to transform the spline
+    chunk_size: int, optional
+        maximum number of interpolated values to hold in memory at once. The
+        interpolated frequencies are split into blocks such that no more than
+        chunk_size values are evaluated at once. Default 10**7
+    basis: ndarray, optional
+        precomputed output of `_spline_basis`. Default compute the basis
     """
-    interpolated_data = np.zeros((np.asarray(data).shape[0], nfreqs))
-    for num, samp in enumerate(data):
-        interp = interp1d(
-            frequencies, samp, kind="cubic", fill_value=0., bounds_error=False
-        )(interpolated_frequencies)
+    data = np.asarray(data, dtype=float)
+    if basis is None:
+        basis = _spline_basis(frequencies, interpolated_frequencies)
+    nfreqs = basis.shape[0]
+    nsamples = data.shape[0]
+    block = int(np.clip(chunk_size // max(nsamples, 1), 1, nfreqs))
+    mean, lower, upper = np.zeros((3, nfreqs))
+    for start in range(0, nfreqs, block):
+        stop = min(start + block, nfreqs)
+        interpolated_data = data @ basis[start:stop].T
         if xform is not None:
-            interp = xform(interp)
-        interpolated_data[num] = interp
-        if pbar is not None:
-            pbar.update(1)
-
-    mean = np.mean(interpolated_data, axis=0)
-    lower = np.quantile(interpolated_data, (1 - level) / 2., axis=0)
-    upper = np.quantile(interpolated_data, (1 + level) / 2., axis=0)
+            interpolated_data = xform(interpolated_data)
+        mean[start:stop] = np.mean(interpolated_data, axis=0)
+        lower[start:stop], upper[start:stop] = np.quantile(
+            interpolated_data, [(1 - level) / 2., (1 + level) / 2.], axis=0
+        )
+    if pbar is not None:
+        pbar.update(nsamples)
     return mean, lower, upper
 
 
@@ -81,10 +111,14 @@ def interpolate_calibration_posterior_from_samples(
     **kwargs: dict
         All kwargs passed to _interpolate_spline_model
     """
-    frequencies = np.exp(log_frequencies)
     interpolated_frequencies = np.logspace(
         np.min(log_frequencies), np.max(log_frequencies), nfreqs, base=np.e
     )
+    # the same spline basis is used for the amplitude and phase
+    if kwargs.get("basis", None) is None:
+        kwargs["basis"] = _spline_basis(
+            log_frequencies, np.log(interpolated_frequencies)
+        )
     amp_mean, amp_lower, amp_upper = (
         1 + np.array(
             _interpolate_spline_model(
@@ -12,6 +12,7 @@ try:
 except ImportError:
     GLUE = False
 
+from pesummary.core.file.formats.base_read import _columnar_samples
 from pesummary.gw.file.formats.base_read import GWSingleAnalysisRead
 from pesummary.gw import conversions as con
 from pesummary.utils.utils import logger
@@ -44,8 +45,9 @@ def open_GWTC1(path, path_to_samples=None, **kwargs):
             "called 'Overall_posterior' or 'overall_posterior'"
         )
 
-    parameters = list(data.dtype.names)
-    samples = [list(i) for i in data]
+    parameters, samples = _columnar_samples(
+        list(data.dtype.names), {name: data[name] for name in data.dtype.names}
+    )
     extra_kwargs = GWTC1.grab_extra_kwargs(path)
     extra_kwargs["sampler"]["nsamples"] = len(samples)
     prior_samples = GWTC1.grab_priors(f)
@@ -100,9 +102,11 @@ class GWTC1(GWSingleAnalysisRead):
         keys = list(obj.keys())
         if "prior" in keys or "priors" in keys:
             data = obj["prior"] if "prior" in keys else obj["priors"]
-            parameters = list(data.dtype.names)
-            samples = [list(i) for i in data]
-            return SamplesDict(parameters, np.array(samples).T)
+            parameters, samples = _columnar_samples(
+                list(data.dtype.names),
+                {name: data[name] for name in data.dtype.names}
+            )
+            return SamplesDict(parameters, samples.T)
         logger.warning(
             "Failed to draw prior samples because there is not an entry for "
             "'prior' or 'priors' in the result file"
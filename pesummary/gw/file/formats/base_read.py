@@ -3,7 +3,8 @@
 import numpy as np
 from pesummary.gw.file.standard_names import standard_names
 from pesummary.core.file.formats.base_read import (
-    Read, SingleAnalysisRead, MultiAnalysisRead
+    Read, SingleAnalysisRead, MultiAnalysisRead, _columnar_samples,
+    _append_columns
 )
 from pesummary.utils.utils import logger
 from pesummary.utils.parameters import Parameters
@@ -55,15 +56,12 @@ def _add_log_likelihood(parameters, samples):
     ----------
     parameters: list
         list of parameters stored in the table
-    samples: 2d list
-        list of samples for each parameter. Columns correspond to a given
-        parameter
+    samples: np.ndarray
+        2d array of samples. Columns correspond to a given parameter
     """
     if "log_likelihood" not in parameters:
         parameters.append("log_likelihood")
-        samples = np.vstack(
-            [np.array(samples).T, np.zeros(len(samples))]
-        ).T
+        samples = _append_columns(samples, [0.])
     return parameters, samples
 
 
@@ -83,8 +81,8 @@ class GWRead(Read):
         list of parameters stored in the result file
     converted_parameters: list
         list of parameters that have been derived from the sampled distributions
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file keyed by parameters
     input_version: str
@@ -130,6 +128,7 @@ class GWRead(Read):
             data = self.load_from_function(
                 function, self.path_to_results_file, **kwargs
             )
+        self._columnar_data(data)
         parameters, samples = self.translate_parameters(
             data["parameters"], data["samples"]
         )
@@ -164,11 +163,9 @@ class GWRead(Read):
     def convert_and_translate_prior_samples(self, priors, disable_convert=False):
         """
         """
-        default_parameters = list(priors.keys())
-        default_samples = [
-            [priors[parameter][i] for parameter in default_parameters] for i
-            in range(len(priors[default_parameters[0]]))
-        ]
+        default_parameters, default_samples = _columnar_samples(
+            list(priors.keys()), priors
+        )
         parameters, samples = self.translate_parameters(
             default_parameters, default_samples
         )
@@ -176,7 +173,7 @@ class GWRead(Read):
             return convert(
                 parameters, samples, extra_kwargs=self.extra_kwargs
             )
-        return SamplesDict(parameters, samples)
+        return SamplesDict(parameters, samples.T)
 
     def convert_injection_parameters(
         self, data, extra_kwargs={"sampler": {}, "meta_data": {}},
@@ -241,12 +238,25 @@ class GWRead(Read):
             path, cls=GWInjection, **kwargs
         )
 
-    def interpolate_calibration_spline_posterior(self, **kwargs):
+    def interpolate_calibration_spline_posterior(
+        self, multi_process=1, **kwargs
+    ):
+        """Interpolate the calibration spline posterior for each detector
+
+        Parameters
+        ----------
+        multi_process: int, optional
+            number of threads to use when interpolating the calibration
+            posterior. Each detector is interpolated in a separate thread.
+            Default 1
+        **kwargs: dict, optional
+            all kwargs passed to
+            pesummary.gw.file.calibration.Calibration.from_spline_posterior_samples
+        """
         from pesummary.gw.file.calibration import Calibration
         from pesummary.utils.utils import iterator
         if self.calibration_spline_posterior is None:
             return
-        total = []
         log_frequencies, amplitudes, phases = self.calibration_spline_posterior
         keys = list(log_frequencies.keys())
         _iterator = iterator(
@@ -254,14 +264,22 @@ class GWRead(Read):
             tqdm=True, total=len(self.samples) * 2 * len(keys)
         )
         with _iterator as pbar:
-            for key in keys:
-                total.append(
-                    Calibration.from_spline_posterior_samples(
-                        np.array(log_frequencies[key]),
-                        np.array(amplitudes[key]), np.array(phases[key]),
-                        pbar=pbar, **kwargs
-                    )
+            def _interpolate(key):
+                return Calibration.from_spline_posterior_samples(
+                    np.array(log_frequencies[key]),
+                    np.array(amplitudes[key]), np.array(phases[key]),
+                    pbar=pbar, **kwargs
                 )
+
+            if multi_process > 1 and len(keys) > 1:
+                # the interpolation is dominated by matrix products which
+                # release the GIL so threads avoid copying the samples
+                from multiprocessing.pool import ThreadPool
+
+                with ThreadPool(min(multi_process, len(keys))) as pool:
+                    total = pool.map(_interpolate, keys)
+            else:
+                total = [_interpolate(key) for key in keys]
         return total, log_frequencies.keys()
 
     @staticmethod
@@ -329,8 +347,8 @@ class GWRead(Read):
         ----------
         parameters: list
             list of existing parameters
-        samples: list
-            list of existing samples
+        samples: np.ndarray
+            2d array of existing samples
         config_file: str
             path to the configuration file
         """
@@ -343,6 +361,7 @@ class GWRead(Read):
                 fixed_data = {
                     key.split("fix-")[1]: item for key, item in
                     config.items("engine") if "fix" in key}
+            fixed_values = []
             for i in fixed_data.keys():
                 fixed_parameter = i
                 fixed_value = fixed_data[i]
@@ -352,19 +371,18 @@ class GWRead(Read):
                         pass
                     else:
                         parameters.append(param)
-                        for num in range(len(samples)):
-                            samples[num].append(float(fixed_value))
+                        fixed_values.append(float(fixed_value))
                 except Exception:
                     if fixed_parameter == "logdistance":
                         if "luminosity_distance" not in parameters:
                             parameters.append(standard_names["distance"])
-                            for num in range(len(samples)):
-                                samples[num].append(float(fixed_value))
+                            fixed_values.append(float(fixed_value))
                     if fixed_parameter == "costheta_jn":
                         if "theta_jn" not in parameters:
                             parameters.append(standard_names["theta_jn"])
-                            for num in range(len(samples)):
-                                samples[num].append(float(fixed_value))
+                            fixed_values.append(float(fixed_value))
+            if len(fixed_values):
+                samples = _append_columns(samples, fixed_values)
             return parameters, samples
         return parameters, samples
 
@@ -385,8 +403,8 @@ class GWSingleAnalysisRead(GWRead, SingleAnalysisRead):
         list of parameters stored in the result file
     converted_parameters: list
         list of parameters that have been derived from the sampled distributions
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file keyed by parameters
     input_version: str
@@ -432,9 +450,8 @@ class GWSingleAnalysisRead(GWRead, SingleAnalysisRead):
         ----------
         parameters: list
             list of parameters stored in the table
-        samples: 2d list
-            list of samples for each parameter. Columns correspond to a given
-            parameter
+        samples: np.ndarray
+            2d array of samples. Columns correspond to a given parameter
         """
         return _add_log_likelihood(parameters, samples)
 
@@ -563,10 +580,9 @@ class GWMultiAnalysisRead(GWRead, MultiAnalysisRead):
         mydict = {}
         for num, label in enumerate(self.labels):
             if label in priors.keys() and len(priors[label]):
-                default_parameters = list(priors[label].keys())
-                default_samples = np.array(
-                    [priors[label][_param] for _param in default_parameters]
-                ).T
+                default_parameters, default_samples = _columnar_samples(
+                    list(priors[label].keys()), priors[label]
+                )
                 parameters, samples = self.translate_parameters(
                     [default_parameters], [default_samples]
                 )
@@ -575,7 +591,7 @@ class GWMultiAnalysisRead(GWRead, MultiAnalysisRead):
                         parameters[0], samples[0], extra_kwargs=self.extra_kwargs[num]
                     )
                 else:
-                    mydict[label] = SamplesDict(parameters[0], samples[0])
+                    mydict[label] = SamplesDict(parameters[0], samples[0].T)
             else:
                 mydict[label] = {}
         return MultiAnalysisSamplesDict(mydict)
@@ -4,7 +4,7 @@ import os
 import numpy as np
 from pesummary.core.file.formats.bilby import Bilby as CoreBilby
 from pesummary.gw.file.formats.base_read import GWSingleAnalysisRead
-from pesummary.gw.plots.latex_labels import GWlatex_labels
+from pesummary.gw.latex_labels import GWlatex_labels
 from pesummary.utils.utils import logger
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
@@ -51,6 +51,9 @@ def prior_samples_from_file(path, cls="BBHPriorDict", nsamples=5000, **kwargs):
         class you wish to read in the prior file
     nsamples: int, optional
         number of samples to draw from a prior file. Default 5000
+    **kwargs: dict, optional
+        all kwargs passed to
+        `pesummary.core.file.formats.bilby.prior_samples_from_file`
     """
     from pesummary.core.file.formats.bilby import (
         prior_samples_from_file as _prior_samples_from_file
@@ -124,14 +127,17 @@ class Bilby(GWSingleAnalysisRead):
         self.load(self._grab_data_from_bilby_file, **kwargs)
 
     @staticmethod
-    def grab_priors(bilby_object, nsamples=5000):
+    def grab_priors(bilby_object, nsamples=5000, parameters=None):
         """Draw samples from the prior functions stored in the bilby file
         """
+        from pesummary.core.file.formats.bilby import _draw_prior_samples
         from pesummary.utils.array import Array
 
         f = bilby_object
         try:
-            samples = f.priors.sample(size=nsamples)
+            samples = _draw_prior_samples(
+                f.priors, nsamples, parameters=parameters
+            )
             priors = {key: Array(samples[key]) for key in samples}
         except Exception as e:
             logger.info("Failed to draw prior samples because {}".format(e))
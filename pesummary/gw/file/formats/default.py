@@ -5,6 +5,7 @@ import numpy as np
 from pesummary.gw.file.formats.base_read import (
     GWRead, GWSingleAnalysisRead, GWMultiAnalysisRead
 )
+from pesummary.core.file.formats.base_read import _append_columns
 from pesummary.core.file.formats.default import Default as CoreDefault
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
@@ -26,8 +27,8 @@ class SingleAnalysisDefault(GWSingleAnalysisRead):
         list of parameters stored in the result file
     converted_parameters: list
         list of parameters that have been derived from the sampled distributions
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file keyed by parameters
     input_version: str
@@ -75,8 +76,9 @@ class MultiAnalysisDefault(GWMultiAnalysisRead):
         list of parameters stored in the result file for each analysis
     converted_parameters: 2d list
         list of parameters that have been derived from the sampled distributions
-    samples: 3d list
-        list of samples stored in the result file for each analysis
+    samples: list
+        list of 2d arrays of samples stored in the result file for each
+        analysis
     samples_dict: dict
         dictionary of samples stored in the result file keyed by analysis label
     input_version: str
@@ -124,8 +126,8 @@ class Default(CoreDefault):
         list of parameters stored in the result file
     converted_parameters: list
         list of parameters that have been derived from the sampled distributions
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file keyed by parameters
     input_version: str
@@ -187,19 +189,19 @@ class Default(CoreDefault):
         return kwargs
 
     @staticmethod
-    def _grab_data_from_dat_file(path, **kwargs):
+    def _grab_data_from_dat_file(path, nthreads=None, **kwargs):
         """Grab the data stored in a .dat file
         """
-        data = CoreDefault._grab_data_from_dat_file(path)
+        data = CoreDefault._grab_data_from_dat_file(path, nthreads=nthreads)
         parameters, samples = data["parameters"], data["samples"]
         parameters = GWRead._check_definition_of_inclination(parameters)
         condition1 = "luminosity_distance" not in parameters
         condition2 = "logdistance" in parameters
         if condition1 and condition2:
+            samples = _append_columns(
+                samples, [np.exp(samples[:, parameters.index("logdistance")])]
+            )
             parameters.append("luminosity_distance")
-            for num, i in enumerate(samples):
-                samples[num].append(
-                    np.exp(i[parameters.index("logdistance")]))
         try:
             extra_kwargs = Default.grab_extra_kwargs(parameters, samples)
         except Exception:
@@ -12,6 +12,9 @@ try:
 except ImportError:
     GLUE = False
 
+from pesummary.core.file.formats.base_read import (
+    _columnar_samples, _append_columns
+)
 from pesummary.gw.file.formats.base_read import GWRead, GWSingleAnalysisRead
 from pesummary.gw import conversions as con
 from pesummary.utils.utils import logger
@@ -56,15 +59,17 @@ def open_lalinference(path):
         path, return_posterior_dataset=True
     )
     if "logdistance" in lalinference_names:
+        samples = _append_columns(
+            samples,
+            [np.exp(samples[:, lalinference_names.index("logdistance")])]
+        )
         lalinference_names.append("luminosity_distance")
-        for num, i in enumerate(samples):
-            samples[num].append(
-                np.exp(i[lalinference_names.index("logdistance")]))
     if "costheta_jn" in lalinference_names:
+        samples = _append_columns(
+            samples,
+            [np.arccos(samples[:, lalinference_names.index("costheta_jn")])]
+        )
         lalinference_names.append("theta_jn")
-        for num, i in enumerate(samples):
-            samples[num].append(
-                np.arccos(i[lalinference_names.index("costheta_jn")]))
     extra_kwargs = LALInference.grab_extra_kwargs(path)
     extra_kwargs["sampler"]["nsamples"] = len(samples)
     extra_kwargs["sampler"]["pe_algorithm"] = "lalinference"
@@ -98,8 +103,8 @@ class LALInference(GWSingleAnalysisRead):
         list of parameters stored in the result file
     converted_parameters: list
         list of parameters that have been derived from the sampled distributions
-    samples: 2d list
-        list of samples stored in the result file
+    samples: np.ndarray
+        2d array of samples stored in the result file
     samples_dict: dict
         dictionary of samples stored in the result file keyed by parameters
     input_version: str
@@ -172,11 +177,21 @@ class LALInference(GWSingleAnalysisRead):
 
     @staticmethod
     def _samples_in_lalinference_file(path):
+        """Return a 2d array of the samples stored in the LALInference results
+        file
+
+        Parameters
+        ----------
+        path: str
+            path to the LALInference results file
         """
-        """
-        f = h5py.File(path, 'r')
         path_to_samples = GWRead.guess_path_to_samples(path)
-        samples = [list(i) for i in f[path_to_samples]]
+        with h5py.File(path, 'r') as f:
+            dataset = f[path_to_samples]
+            samples = _columnar_samples(
+                list(dataset.dtype.names),
+                {name: dataset[name] for name in dataset.dtype.names}
+            )[1]
         return samples
 
     @property
@@ -301,8 +316,8 @@ class LALInference(GWSingleAnalysisRead):
         ----------
         parameters: list
             list of existing parameters
-        samples: list
-            list of existing samples
+        samples: np.ndarray
+            2d array of existing samples
         config_file: str
             path to the configuration file
         """
@@ -316,6 +331,7 @@ class LALInference(GWSingleAnalysisRead):
                     key.split("fix-")[1]: item for key, item in
                     config.items("engine") if "fix" in key}
             if fixed_data is not None:
+                fixed_values = []
                 for i in fixed_data.keys():
                     fixed_parameter = i
                     fixed_value = fixed_data[i]
@@ -325,19 +341,18 @@ class LALInference(GWSingleAnalysisRead):
                             pass
                         else:
                             parameters.append(param)
-                            for num in range(len(samples)):
-                                samples[num].append(float(fixed_value))
+                            fixed_values.append(float(fixed_value))
                     except Exception:
                         if fixed_parameter == "logdistance":
                             if "luminosity_distance" not in parameters:
                                 parameters.append(standard_names["distance"])
-                                for num in range(len(samples)):
-                                    samples[num].append(float(fixed_value))
+                                fixed_values.append(float(fixed_value))
                         if fixed_parameter == "costheta_jn":
                             if "theta_jn" not in parameters:
                                 parameters.append(standard_names["theta_jn"])
-                                for num in range(len(samples)):
-                                    samples[num].append(float(fixed_value))
+                                fixed_values.append(float(fixed_value))
+                if len(fixed_values):
+                    samples = _append_columns(samples, fixed_values)
         return parameters, samples
 
     @staticmethod
@@ -350,66 +365,48 @@ class LALInference(GWSingleAnalysisRead):
         ----------
         parameters: list
             list of existing parameters
-        samples: list
-            list of existing samples
+        samples: np.ndarray
+            2d array of existing samples
         config_file: str
             path to the configuration file
         """
-        from pesummary.gw.file.standard_names import standard_names
-
         config = config_file
         if not config.error:
-            fixed_data = None
+            marg_par = {}
             if "engine" in config.sections():
                 marg_par = {
                     key.split("marg")[1]: item for key, item in
                     config.items("engine") if "marg" in key}
+            samples = np.asarray(samples, dtype=float)
+            marginalized = [
+                ["time", "geocent_time", "marginalized_geocent_time", 100000.,
+                 "You have marginalized over time and there are no time "
+                 "samples. Manually setting time to 100000s"],
+                ["phi", "phase", "marginalized_phase", 0.,
+                 "You have marginalized over phase and there are no phase "
+                 "samples. Manually setting the phase to be 0"],
+                ["dist", "luminosity_distance", "marginalized_distance", 100.,
+                 "You have marginalized over distance and there are no "
+                 "distance samples. Manually setting distance to 100Mpc"]
+            ]
             for i in marg_par.keys():
-                if "time" in i and "geocent_time" not in parameters:
-                    if "marginalized_geocent_time" in parameters:
-                        ind = parameters.index("marginalized_geocent_time")
-                        parameters.remove(parameters[ind])
-                        parameters.append("geocent_time")
-                        for num, j in enumerate(samples):
-                            samples[num].append(float(j[ind]))
-                            del j[ind]
-                    else:
-                        logger.warning("You have marginalized over time and "
-                                       "there are no time samples. Manually "
-                                       "setting time to 100000s")
-                        parameters.append("geocent_time")
-                        for num, j in enumerate(samples):
-                            samples[num].append(float(100000))
-                if "phi" in i and "phase" not in parameters:
-                    if "marginalized_phase" in parameters:
-                        ind = parameters.index("marginalized_phase")
-                        parameters.remove(parameters[ind])
-                        parameters.append("phase")
-                        for num, j in enumerate(samples):
-                            samples[num].append(float(j[ind]))
-                            del j[ind]
-                    else:
-                        logger.warning("You have marginalized over phase and "
-                                       "there are no phase samples. Manually "
-                                       "setting the phase to be 0")
-                        parameters.append("phase")
-                        for num, j in enumerate(samples):
-                            samples[num].append(float(0))
-                if "dist" in i and "luminosity_distance" not in parameters:
-                    if "marginalized_distance" in parameters:
-                        ind = parameters.index("marginalized_distance")
+                for key, param, marg_param, default, msg in marginalized:
+                    if key not in i or param in parameters:
+                        continue
+                    if marg_param in parameters:
+                        # move the marginalized column to the end of the
+                        # table under its standard name
+                        ind = parameters.index(marg_param)
                         parameters.remove(parameters[ind])
-                        parameters.append("luminosity_distance")
-                        for num, j in enumerate(samples):
-                            samples[num].append(float(j[ind]))
-                            del j[ind]
+                        parameters.append(param)
+                        order = [
+                            num for num in range(samples.shape[1]) if num != ind
+                        ] + [ind]
+                        samples = samples[:, order]
                     else:
-                        logger.warning("You have marginalized over distance and "
-                                       "there are no distance samples. Manually "
-                                       "setting distance to 100Mpc")
-                        parameters.append("luminosity_distance")
-                        for num, j in enumerate(samples):
-                            samples[num].append(float(100.0))
+                        logger.warning(msg)
+                        parameters.append(param)
+                        samples = _append_columns(samples, [default])
             return parameters, samples
         return parameters, samples
 
@@ -12,6 +12,25 @@ __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 DEFAULT_HDF5_KEYS = CORE_HDF5_KEYS
 
 
+def _summary_values(values):
+    """Convert a nested dictionary of summary statistics to python floats
+    so that it can be stored in a json or hdf5 metafile. Entries which are
+    not numeric are removed
+
+    Parameters
+    ----------
+    values: dict
+        nested dictionary of summary statistics
+    """
+    if isinstance(values, dict):
+        values = {key: _summary_values(value) for key, value in values.items()}
+        return {key: value for key, value in values.items() if value is not None}
+    try:
+        return float(values)
+    except (TypeError, ValueError):
+        return None
+
+
 class _GWMetaFile(_MetaFile):
     """This class handles the creation of a meta file storing all information
     from the analysis
@@ -32,7 +51,8 @@ class _GWMetaFile(_MetaFile):
         existing_priors={}, existing_metafile=None, package_information={},
         mcmc_samples=False, skymap=None, existing_skymap=None,
         filename=None, external_hdf5_links=False, hdf5_compression=None,
-        history=None, descriptions=None, gwdata=None
+        history=None, descriptions=None, gwdata=None, incremental=False,
+        summary=None
     ):
         self.calibration = calibration
         self.psds = psd
@@ -43,6 +63,7 @@ class _GWMetaFile(_MetaFile):
         self.skymap = skymap
         self.existing_skymap = existing_skymap
         self.gwdata = gwdata
+        self.summary = summary
         super(_GWMetaFile, self).__init__(
             samples, labels, config, injection_data, file_versions,
             file_kwargs, webdir=webdir, result_files=result_files, hdf5=hdf5,
@@ -56,18 +77,29 @@ class _GWMetaFile(_MetaFile):
             mcmc_samples=mcmc_samples, filename=filename,
             external_hdf5_links=external_hdf5_links,
             hdf5_compression=hdf5_compression, history=history,
-            descriptions=descriptions
+            descriptions=descriptions, incremental=incremental
         )
         if self.calibration is None:
             self.calibration = {label: {} for label in self.labels}
         if self.psds is None:
             self.psds = {label: {} for label in self.labels}
 
+    @property
+    def append_to_existing(self):
+        """Return True if the new labels can be appended to the existing
+        metafile in place rather than rewriting the full metafile
+        """
+        if self.gwdata is not None and len(self.gwdata):
+            return False
+        return super(_GWMetaFile, self).append_to_existing
+
     def _make_dictionary(self):
         """Generate a single dictionary which stores all information
         """
         super(_GWMetaFile, self)._make_dictionary()
         for num, label in enumerate(self.labels):
+            if label not in self.labels_to_write:
+                continue
             cond = all(self.calibration[label] != j for j in [{}, None])
             if self.calibration != {} and cond:
                 self.data[label]["calibration_envelope"] = {
@@ -87,6 +119,12 @@ class _GWMetaFile(_MetaFile):
                 self.data[label]["approximant"] = self.approximant[label]
             else:
                 self.data[label]["approximant"] = {}
+            if self.summary is not None and label in self.summary.keys():
+                if isinstance(self.data[label]["meta_data"], dict):
+                    self.data[label]["meta_data"] = dict(
+                        self.data[label]["meta_data"],
+                        summary=self.summary[label]
+                    )
             if self.skymap is not None and len(self.skymap):
                 if self.skymap[label] is not None:
                     self.data[label]["skymap"] = {
@@ -117,9 +155,11 @@ class _GWMetaFile(_MetaFile):
     @staticmethod
     def save_to_hdf5(
         data, labels, samples, meta_file, no_convert=False, mcmc_samples=False,
-        external_hdf5_links=False, compression=None, _class=None, gwdata=None
+        external_hdf5_links=False, compression=None, _class=None, gwdata=None,
+        mode="w"
     ):
-        """Save the metafile as a hdf5 file
+        """Save the metafile as a hdf5 file. If mode='a', the data is appended
+        to an existing hdf5 file
         """
         if gwdata is not None and len(gwdata):
             extra_keys = CORE_HDF5_KEYS + ["strain"]
@@ -128,7 +168,8 @@ class _GWMetaFile(_MetaFile):
         _MetaFile.save_to_hdf5(
             data, labels, samples, meta_file, no_convert=no_convert,
             extra_keys=extra_keys, mcmc_samples=mcmc_samples, _class=_class,
-            external_hdf5_links=external_hdf5_links, compression=compression
+            external_hdf5_links=external_hdf5_links, compression=compression,
+            mode=mode
         )
 
 
@@ -237,6 +278,27 @@ class GWMetaFile(GWPostProcessing):
     """This class handles the creation of a metafile storing all information
     from the analysis
     """
+    @property
+    def summary(self):
+        """Return the maximum likelihood samples and classification
+        probabilities for each analysis. These are stored in the metafile so
+        that they do not need to be recomputed when incrementally adding to
+        an existing webpage
+        """
+        summary = {}
+        for label in self.labels:
+            _summary = {
+                "maxL": _summary_values(self.maxL_samples.get(label, None)),
+                "pepredicates": _summary_values(
+                    self.pepredicates_probs.get(label, None)
+                ),
+                "pastro": _summary_values(self.pastro_probs.get(label, None))
+            }
+            summary[label] = {
+                key: value for key, value in _summary.items() if value
+            }
+        return summary
+
     def __init__(self, inputs, history=None):
         super(GWMetaFile, self).__init__(inputs)
         logger.info("Starting to generate the meta file")
@@ -285,18 +347,20 @@ class GWMetaFile(GWPostProcessing):
             existing_skymap=self.existing_skymap, filename=self.filename,
             external_hdf5_links=self.external_hdf5_links,
             hdf5_compression=self.hdf5_compression, history=history,
-            gwdata=self.gwdata, descriptions=self.descriptions
+            gwdata=self.gwdata, descriptions=self.descriptions,
+            incremental=self.incremental, summary=self.summary
         )
         meta_file.make_dictionary()
         if not self.hdf5:
             meta_file.save_to_json(meta_file.data, meta_file.meta_file)
         else:
             meta_file.save_to_hdf5(
-                meta_file.data, meta_file.labels, meta_file.samples,
+                meta_file.data, meta_file.labels_to_write, meta_file.samples,
                 meta_file.meta_file, mcmc_samples=meta_file.mcmc_samples,
                 external_hdf5_links=meta_file.external_hdf5_links,
                 compression=meta_file.hdf5_compression,
-                gwdata=meta_file.gwdata
+                gwdata=meta_file.gwdata,
+                mode="a" if meta_file.append_to_existing else "w"
             )
         meta_file.save_to_dat()
         meta_file.write_marginalized_posterior_to_dat()
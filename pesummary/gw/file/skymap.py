@@ -1,7 +1,10 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
+import os
 import numpy as np
-from pesummary.utils.utils import check_file_exists_and_rename, Empty
+from pesummary.utils.utils import (
+    check_file_exists_and_rename, Empty, logger, make_dir, SKYMAP_CACHE
+)
 from pesummary import conf
 from pesummary.utils.dict import Dict
 
@@ -141,6 +144,26 @@ class SkyMap(np.ndarray):
         skymap, meta = read_sky_map(path, nest=nest)
         return cls(skymap, meta)
 
+    @classmethod
+    def from_healpix(cls, hpmap):
+        """Initiate class with a HEALPix map produced by `ligo.skymap`. The
+        probabilities are extracted in memory in the same (nested) ordering
+        as `SkyMap.from_fits` would return after writing and reading the map
+
+        Parameters
+        ----------
+        hpmap: astropy.table.Table
+            either a multi-order or a flattened HEALPix map, for example
+            as returned by `ligo.skymap.kde.SkyKDE.as_healpix`
+        """
+        if "UNIQ" in hpmap.colnames:
+            from ligo.skymap.bayestar import rasterize
+
+            hpmap = rasterize(hpmap)
+        meta = dict(hpmap.meta)
+        meta["nest"] = True
+        return cls(np.asarray(hpmap["PROB"]), meta)
+
     def save_to_file(self, file_name):
         """Save the calibration data to file
 
@@ -168,3 +191,171 @@ class SkyMap(np.ndarray):
         if obj is None:
             return
         self.meta_data = getattr(obj, "meta_data", None)
+
+
+def skymap_cache_key(pts, trials=5, multi_resolution=True, seed=None):
+    """Return a key which uniquely identifies the skymap produced from a
+    set of samples
+
+    Parameters
+    ----------
+    pts: np.ndarray
+        2d array of (ra, dec) or (ra, dec, dist) samples
+    trials: int, optional
+        number of trials used when fitting the clustered KDE. Default 5
+    multi_resolution: Bool, optional
+        whether or not the skymap is a multi-resolution HEALPix map.
+        Default True
+    seed: int, optional
+        random seed used when fitting the clustered KDE. Default None
+    """
+    import hashlib
+    import json
+
+    pts = np.ascontiguousarray(pts, dtype=np.float64)
+    _hash = hashlib.sha256(pts.tobytes())
+    _hash.update(
+        json.dumps(
+            {
+                "shape": list(pts.shape), "trials": int(trials),
+                "multi_resolution": bool(multi_resolution),
+                "seed": seed if seed is None else int(seed)
+            }, sort_keys=True
+        ).encode("utf-8")
+    )
+    return _hash.hexdigest()
+
+
+def _json_default(value):
+    """Return a json serializable form of meta data stored in a HEALPix map
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def read_cached_skymap(key, cache_dir=SKYMAP_CACHE):
+    """Return the HEALPix map stored in the skymap cache. None is returned
+    if the map is not in the cache or can not be read
+
+    Parameters
+    ----------
+    key: str
+        key returned by `skymap_cache_key`
+    cache_dir: str, optional
+        directory containing the skymap cache
+    """
+    import json
+    from astropy.table import Table
+    from astropy import units as u
+
+    path = os.path.join(cache_dir, "{}.npz".format(key))
+    if not os.path.isfile(path):
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as f:
+            columns = [str(column) for column in f["_columns"]]
+            units = [str(unit) for unit in f["_units"]]
+            hpmap = Table(
+                [f[column] for column in columns], names=columns,
+                meta=json.loads(str(f["_meta"]))
+            )
+        for column, unit in zip(columns, units):
+            if len(unit):
+                hpmap[column].unit = u.Unit(unit)
+        # mark the map as recently used
+        os.utime(path)
+    except Exception as e:
+        logger.debug(
+            "Unable to read cached skymap '{}' because {}".format(path, e)
+        )
+        return None
+    logger.debug("Using cached skymap '{}'".format(path))
+    return hpmap
+
+
+def evict_cached_skymaps(max_size, cache_dir=SKYMAP_CACHE, keep=None):
+    """Remove the least recently used maps from the skymap cache until the
+    size of the cache is below max_size
+
+    Parameters
+    ----------
+    max_size: int
+        maximum size of the cache in bytes
+    cache_dir: str, optional
+        directory containing the skymap cache
+    keep: list, optional
+        list of paths which should not be removed
+    """
+    if not os.path.isdir(cache_dir):
+        return
+    if keep is None:
+        keep = []
+    maps = []
+    for _file in os.listdir(cache_dir):
+        # temporary files belong to maps which are still being written
+        if _file.endswith(".tmp"):
+            continue
+        path = os.path.join(cache_dir, _file)
+        try:
+            maps.append((os.path.getmtime(path), os.path.getsize(path), path))
+        except OSError:
+            continue
+    total = sum(_map[1] for _map in maps)
+    for mtime, size, path in sorted(maps):
+        if total <= max_size:
+            break
+        if path in keep:
+            continue
+        logger.debug("Removing {} from the skymap cache".format(path))
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def write_cached_skymap(key, hpmap, cache_dir=SKYMAP_CACHE, max_size=1024**3):
+    """Store a HEALPix map in the skymap cache. The columns, units and meta
+    data of the map are stored in a numpy archive which is written to a
+    temporary file and moved into place so that concurrent jobs never read
+    a partially written map. The least recently used maps are then removed
+    until the cache is smaller than max_size
+
+    Parameters
+    ----------
+    key: str
+        key returned by `skymap_cache_key`
+    hpmap: astropy.table.Table
+        HEALPix map you wish to store
+    cache_dir: str, optional
+        directory containing the skymap cache
+    max_size: int, optional
+        maximum size of the skymap cache in bytes. Default 1GB
+    """
+    import json
+    import tempfile
+
+    path = os.path.join(cache_dir, "{}.npz".format(key))
+    try:
+        make_dir(cache_dir)
+        columns = list(hpmap.colnames)
+        data = {
+            "_columns": np.array(columns),
+            "_units": np.array([
+                "" if hpmap[column].unit is None else
+                hpmap[column].unit.to_string() for column in columns
+            ]),
+            "_meta": np.array(json.dumps(dict(hpmap.meta), default=_json_default))
+        }
+        data.update({column: np.asarray(hpmap[column]) for column in columns})
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **data)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Unable to cache skymap because {}".format(e))
+        return
+    evict_cached_skymaps(max_size, cache_dir=cache_dir, keep=[path])
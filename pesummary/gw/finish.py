@@ -2,7 +2,6 @@
 
 import subprocess
 import os
-import time
 import numpy as np
 
 from pesummary.core.parser import convert_dict_to_namespace
@@ -19,41 +18,25 @@ class GWFinishingTouches(FinishingTouches):
 
     Parameters
     ----------
-    ligo_skymap_PID: dict
-        dictionary containing the process ID for the ligo.skymap subprocess
-        for each analysis
+    ligo_skymap_scheduler: pesummary.gw.plots.scheduler.SkymapScheduler
+        scheduler which is generating the ligo.skymap skymaps for each
+        analysis
     """
-    def __init__(self, inputs, ligo_skymap_PID=None):
+    def __init__(self, inputs, ligo_skymap_scheduler=None):
         super(GWFinishingTouches, self).__init__(inputs)
-        self.ligo_skymap_PID = ligo_skymap_PID
+        self.ligo_skymap_scheduler = ligo_skymap_scheduler
         self.generate_ligo_skymap_statistics()
 
     def generate_ligo_skymap_statistics(self):
         """Extract key statistics from the ligo.skymap fits file
         """
-        FAILURE = False
-        if self.ligo_skymap_PID is None:
+        if self.ligo_skymap_scheduler is None:
             return
+        logger.info("Waiting for skymap generation to finish")
+        skymaps = self.ligo_skymap_scheduler.wait()
         samples_dir = os.path.join(self.webdir, "samples")
         for label in self.labels:
-            _path = os.path.join(samples_dir, "{}_skymap.fits".format(label))
-            while not os.path.isfile(_path):
-                try:
-                    output = subprocess.check_output(
-                        ["ps -p {}".format(self.ligo_skymap_PID[label])],
-                        shell=True
-                    )
-                    cond1 = "summarypages" not in str(output)
-                    cond2 = "defunct" in str(output)
-                    if cond1 or cond2:
-                        if not os.path.isfile(_path):
-                            FAILURE = True
-                        break
-                except (subprocess.CalledProcessError, KeyError):
-                    FAILURE = True
-                    break
-                time.sleep(60)
-            if FAILURE:
+            if label not in skymaps.keys():
                 continue
             ess = subprocess.Popen(
                 "ligo-skymap-stats {} -p 50 90 -o {}".format(
@@ -67,9 +50,7 @@ class GWFinishingTouches(FinishingTouches):
             self.save_skymap_stats_to_metafile(
                 label, os.path.join(samples_dir, "{}_skymap_stats.dat".format(label))
             )
-            self.save_skymap_data_to_metafile(
-                label, os.path.join(samples_dir, "{}_skymap.fits".format(label))
-            )
+            self.save_skymap_data_to_metafile(label, skymaps[label])
 
     def save_skymap_stats_to_metafile(self, label, filename):
         """Save the skymap statistics to the PESummary metafile
@@ -101,22 +82,23 @@ class GWFinishingTouches(FinishingTouches):
         opts = convert_dict_to_namespace(_dict, add_defaults=command_line())
         _main(opts)
 
-    def save_skymap_data_to_metafile(self, label, filename):
+    def save_skymap_data_to_metafile(self, label, skymap):
         """Save the skymap data to the PESummary metafile
 
         Parameters
         ----------
         label: str
             the label of the analysis that the skymap corresponds to
-        filename: str
-            name of the fits file that contains the skymap for label
+        skymap: str/pesummary.gw.file.skymap.SkyMap
+            either the skymap for label or the name of the fits file that
+            contains the skymap for label
         """
         logger.info("Adding ligo.skymap data to the metafile")
 
         _dict = {
             "webdir": self.webdir,
             "samples": [os.path.join(self.webdir, "samples", "posterior_samples.h5")],
-            "overwrite": True, "store_skymap": {label: filename}
+            "overwrite": True, "store_skymap": {label: skymap}
         }
         opts = convert_dict_to_namespace(_dict, add_defaults=command_line())
         _main(opts)
@@ -412,7 +412,9 @@ class _GWInput(_Input):
                 else:
                     f = GWRead(i, disable_prior=True)
                 try:
-                    calibration_data = f.interpolate_calibration_spline_posterior()
+                    calibration_data = f.interpolate_calibration_spline_posterior(
+                        multi_process=self.multi_process
+                    )
                 except Exception as e:
                     logger.warning(
                         "Failed to extract calibration data from the result "
@@ -652,13 +654,25 @@ class _GWInput(_Input):
     def pepredicates_probs(self):
         return self._pepredicates_probs
 
+    @property
+    def classifications(self):
+        """Source classification and em-bright probabilities for each analysis.
+        These are calculated once, in parallel across analyses, and shared
+        between the `pepredicates_probs` and `pastro_probs` properties
+        """
+        if getattr(self, "_classifications", None) is None:
+            from pesummary.gw.classification import classify_analyses
+
+            self._classifications = classify_analyses(
+                self.samples, multi_process=self.multi_process
+            )
+        return self._classifications
+
     @pepredicates_probs.setter
     def pepredicates_probs(self, pepredicates_probs):
-        from pesummary.gw.pepredicates import get_classifications
-
         classifications = {}
         for num, i in enumerate(list(self.samples.keys())):
-            classifications[i] = get_classifications(self.samples[i])
+            classifications[i] = self.classifications[i]["pepredicates"]
         if self.mcmc_samples:
             if any(_probs is None for _probs in classifications.values()):
                 classifications[self.labels[0]] = None
@@ -687,17 +701,9 @@ class _GWInput(_Input):
 
     @pastro_probs.setter
     def pastro_probs(self, pastro_probs):
-        from pesummary.gw.p_astro import get_probabilities
-
         probabilities = {}
         for num, i in enumerate(list(self.samples.keys())):
-            em_bright = get_probabilities(self.samples[i])
-            if em_bright is not None:
-                probabilities[i] = {
-                    "default": em_bright[0], "population": em_bright[1]
-                }
-            else:
-                probabilities[i] = None
+            probabilities[i] = self.classifications[i]["em_bright"]
         if self.mcmc_samples:
             if any(_probs is None for _probs in probabilities.values()):
                 probabilities[self.labels[0]] = None
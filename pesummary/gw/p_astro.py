@@ -24,21 +24,12 @@ def get_probabilities(samples):
     samples: dict
         dictionary of samples
     """
-    from pesummary.utils.utils import RedirectLogger
-
-    default_error = (
-        "Failed to generate `HasNS` and `HasRemnant` probabilities because {}"
-    )
-    try:
-        with RedirectLogger("p_astro", level="DEBUG") as redirector:
-            data = PAstro.classifications(samples)
-    except ImportError:
-        logger.warning(default_error.format("'p_astro' is not installed"))
-        data = None
-    except Exception as e:
-        logger.warning(default_error.format("%s" % (e)))
-        data = None
-    return data
+    from pesummary.gw.classification import classify
+
+    data = classify(samples, pepredicates=False)["em_bright"]
+    if data is None:
+        return data
+    return data["default"], data["population"]
 
 
 class PAstro(object):
@@ -56,12 +47,17 @@ class PAstro(object):
 
     @staticmethod
     def _classifications(samples):
-        """
+        """Return the `HasNS` and `HasRemnant` probabilities for a set of
+        samples
+
+        Parameters
+        ----------
+        samples: dict/ClassificationSamples
+            samples for a specific result file
         """
         required_params = ["mass_1_source", "mass_2_source", "a_1", "a_2"]
-        parameters = list(samples.keys())
 
-        if not all(i in parameters for i in required_params):
+        if not all(i in samples for i in required_params):
             raise Exception(
                 "Failed to generate `HasNS` and `HasRemnant` probabilities "
                 "because not all required parameters have been provided."
@@ -81,53 +77,58 @@ class PAstro(object):
 
     @staticmethod
     def default_classification(samples):
-        """
+        """Return the `HasNS` and `HasRemnant` probabilities using the default
+        prior used in the analysis
+
+        Parameters
+        ----------
+        samples: dict/ClassificationSamples
+            samples for a specific result file
         """
         return PAstro._classifications(samples)
 
     @staticmethod
-    def population_classification(samples):
-        """
+    def population_classification(samples, population=None):
+        """Return the `HasNS` and `HasRemnant` probabilities using a
+        population prior
+
+        Parameters
+        ----------
+        samples: dict/ClassificationSamples
+            samples for a specific result file
+        population: ClassificationSamples, optional
+            samples which have already been resampled to a population prior.
+            Default resample samples
         """
-        import pandas as pd
-        import copy
-        from pepredicates import rewt_approx_massdist_redshift
-
-        p_astro_samples = copy.deepcopy(samples)
-        mapping = {"mass_1_source": "m1_source",
-                   "mass_2_source": "m2_source",
-                   "luminosity_distance": "dist",
-                   "redshift": "redshift",
-                   "a_1": "a1",
-                   "a_2": "a2"}
-        reverse_mapping = dict((value, key) for key, value in mapping.items())
-
-        keys = list(p_astro_samples.keys())
-        for key in keys:
-            if key in list(mapping.keys()):
-                p_astro_samples[mapping[key]] = p_astro_samples[key]
-
-        p_astro_samples = rewt_approx_massdist_redshift(pd.DataFrame.from_dict(
-            p_astro_samples
-        ))
-        for key, item in p_astro_samples.items():
-            if key in list(reverse_mapping.keys()):
-                p_astro_samples[reverse_mapping[key]] = item
-        try:
-            return PAstro._classifications(p_astro_samples)
-        except KeyError:
+        if population is None:
+            from pesummary.gw.classification import population_reweight
+            population = population_reweight(samples)
+        if not len(population):
             logger.warning(
                 "Failed to generate 'em_bright' probabilities after "
                 "reweighting to a population prior because there were no "
                 "samples after reweighting"
             )
             return {"HasNS": "-", "HasRemnant": "-"}
+        return PAstro._classifications(population)
 
     @staticmethod
-    def classifications(samples):
+    def classifications(samples, population=None):
         """Return the source classification probabilities using both the default
         prior used in the analysis and the population prior
+
+        Parameters
+        ----------
+        samples: dict/ClassificationSamples
+            samples for a specific result file
+        population: ClassificationSamples, optional
+            samples which have already been resampled to a population prior.
+            Default resample samples
         """
-        pop = PAstro.population_classification(samples)
+        from pesummary.gw.classification import ClassificationSamples
+
+        PAstro.check_for_install()
+        samples = ClassificationSamples.from_samples(samples)
+        pop = PAstro.population_classification(samples, population=population)
         default = PAstro.default_classification(samples)
         return default, pop
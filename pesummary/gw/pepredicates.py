@@ -7,7 +7,6 @@ except ImportError:
     PEP = False
 
 import numpy as np
-import pandas as pd
 from pesummary.core.plots.figure import ExistingFigure
 from pesummary.utils.utils import logger
 
@@ -22,33 +21,9 @@ def get_classifications(samples):
     samples: dict
         dictionary of samples
     """
-    from pesummary.utils.utils import RedirectLogger
-    from pesummary.utils.samples_dict import SamplesDict
-
-    default_error = (
-        "Failed to generate source classification probabilities because {}"
-    )
-    try:
-        with RedirectLogger("PEPredicates", level="DEBUG") as redirector:
-            if isinstance(samples, SamplesDict):
-                parameters = samples.parameters
-                samples = samples.samples.T.tolist()
-            else:
-                parameters = list(samples.keys())
-                samples = np.array(list(samples.values())).T.tolist()
-            data = PEPredicates.classifications(samples, parameters)
-        classifications = {
-            "default": data[0], "population": data[1]
-        }
-    except ImportError:
-        logger.warning(
-            default_error.format("'PEPredicates' is not installed")
-        )
-        classifications = None
-    except Exception as e:
-        logger.warning(default_error.format("%s" % (e)))
-        classifications = None
-    return classifications
+    from pesummary.gw.classification import classify
+
+    return classify(samples, em_bright=False)["pepredicates"]
 
 
 class PEPredicates(object):
@@ -75,35 +50,42 @@ class PEPredicates(object):
                 "calculate astro/terrestrial probabilities")
 
     @staticmethod
-    def convert_to_PEPredicate_data_frame(samples, parameters):
-        """Convert the inputs to a pandas data frame compatible with
-        PEPredicated
+    def _check_parameters(samples):
+        """Check that all parameters required by PEPredicates are present
 
         Parameters
         ----------
-        samples: list
-            list of samples for a specific result file
-        parameters: list
-            list of parameters for a specific result file
+        samples: ClassificationSamples
+            samples for a specific result file
         """
-        PEPredicates.check_for_install()
-        psamps = pd.DataFrame()
+        from pesummary.gw.classification import PARAMETER_MAPPING
 
-        mapping = {"mass_1_source": "m1_source",
-                   "mass_2_source": "m2_source",
-                   "luminosity_distance": "dist",
-                   "redshift": "redshift",
-                   "a_1": "a1",
-                   "a_2": "a2"}
-
-        if not all(i in parameters for i in list(mapping.keys())):
+        if not all(i in samples for i in list(PARAMETER_MAPPING.keys())):
             raise Exception(
                 "Failed to generate classification probabilities because not "
                 "all required parameters have been provided.")
 
-        _samples = np.array(samples).T
-        for num, i in enumerate(list(mapping.keys())):
-            psamps[mapping[i]] = _samples[parameters.index(i)]
+    @staticmethod
+    def convert_to_PEPredicate_data_frame(samples, parameters=None):
+        """Convert the inputs to a table compatible with PEPredicates. Only
+        the required columns are projected and no pandas DataFrame is built
+
+        Parameters
+        ----------
+        samples: dict/np.ndarray
+            dictionary of samples or a 2d array of samples for a specific
+            result file
+        parameters: list, optional
+            list of parameters for a specific result file. Only used if
+            samples is a 2d array
+        """
+        from pesummary.gw.classification import ClassificationSamples
+
+        PEPredicates.check_for_install()
+        psamps = ClassificationSamples.from_samples(
+            samples, parameters=parameters
+        )
+        PEPredicates._check_parameters(psamps)
         return psamps
 
     @staticmethod
@@ -112,8 +94,8 @@ class PEPredicates(object):
 
         Parameters
         ----------
-        samples: list
-            list of samples for a specific result file
+        samples: ClassificationSamples
+            samples for a specific result file
         """
         PEPredicates.check_for_install()
         return pep.rewt_approx_massdist_redshift(samples)
@@ -129,8 +111,8 @@ class PEPredicates(object):
             list of samples for a specific result file
         parameters: list
             list of parameters corresponding to samples
-        dataframe: pandas.DataFrame
-            pandas DataFrame containing samples for specific result file.
+        dataframe: ClassificationSamples
+            table containing samples for specific result file.
             dataframe must have entries m1_source, m2_source, dist, redshift,
             a1, a2
         """
@@ -160,8 +142,8 @@ class PEPredicates(object):
         parameters: list
             list of parameters corresponding to samples. Used only if
             predicate_dataframe is None
-        predicate_dataframe: pandas.DataFrame
-            pandas DataFrame containing samples for specific result file.
+        predicate_dataframe: ClassificationSamples
+            table containing samples for specific result file.
             predicate_dataframe must have entries m1_source, m2_source, dist,
             redshift, a1, a2.
         """
@@ -178,7 +160,8 @@ class PEPredicates(object):
 
     @staticmethod
     def population_classification(
-        samples=None, parameters=None, predicate_dataframe=None
+        samples=None, parameters=None, predicate_dataframe=None,
+        population=None
     ):
         """Return the source classification probabilities using a population
         prior
@@ -191,43 +174,69 @@ class PEPredicates(object):
         parameters: list
             list of parameters corresponding to samples. Used only if
             predicate_dataframe is None
-        predicate_dataframe: pandas.DataFrame
-            pandas DataFrame containing samples for specific result file.
+        predicate_dataframe: ClassificationSamples
+            table containing samples for specific result file.
             predicate_dataframe must have entries m1_source, m2_source, dist,
             redshift, a1, a2.
+        population: ClassificationSamples, optional
+            samples which have already been resampled to a population prior.
+            Default resample predicate_dataframe
         """
         PEPredicates.check_for_install()
-        predicate_dataframe = PEPredicates.check_for_dataframe(
-            samples=samples, parameters=parameters, dataframe=predicate_dataframe
-        )
-        psamps_resamples = PEPredicates.resample_to_population(
-            predicate_dataframe
-        )
+        if population is None:
+            predicate_dataframe = PEPredicates.check_for_dataframe(
+                samples=samples, parameters=parameters,
+                dataframe=predicate_dataframe
+            )
+            population = PEPredicates.resample_to_population(
+                predicate_dataframe
+            )
         ptable = pep.predicate_table(
-            PEPredicates.default_predicates(), psamps_resamples
+            PEPredicates.default_predicates(), population
         )
         for key, value in ptable.items():
             ptable[key] = np.round(value, 5)
         return ptable
 
     @staticmethod
-    def classifications(samples, parameters):
+    def classifications(samples, parameters=None, population=None):
         """Return the source classification probabilities using both the default
         prior used in the analysis and the population prior
+
+        Parameters
+        ----------
+        samples: dict/np.ndarray
+            dictionary of samples or a 2d array of samples for a specific
+            result file
+        parameters: list, optional
+            list of parameters corresponding to samples. Only used if samples
+            is a 2d array
+        population: ClassificationSamples, optional
+            samples which have already been resampled to a population prior.
+            Default resample samples
         """
         df = PEPredicates.convert_to_PEPredicate_data_frame(samples, parameters)
-        pop = PEPredicates.population_classification(predicate_dataframe=df)
+        pop = PEPredicates.population_classification(
+            predicate_dataframe=df, population=population
+        )
         default = PEPredicates.default_classification(predicate_dataframe=df)
         return default, pop
 
     @staticmethod
-    def plot(samples, parameters, population_prior=True):
+    def plot(samples, parameters=None, population_prior=True):
         """Make a plot of the samples classified by type
 
         Parameters
         ----------
-        samples: list
-            list of samples for a specific result file
+        samples: dict/np.ndarray
+            dictionary of samples or a 2d array of samples for a specific
+            result file
+        parameters: list, optional
+            list of parameters corresponding to samples. Only used if samples
+            is a 2d array
+        population_prior: Bool, optional
+            if True, resample the samples to a population prior before
+            plotting. Default True
         """
         logger.debug("Generating the PEPredicates plot")
         PEPredicates.check_for_install()
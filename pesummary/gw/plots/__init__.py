@@ -1,6 +1,11 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
-from pesummary.gw.plots.cmap import cylon
+from pesummary.utils.lazy import attach
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
-cylon()
+
+# matplotlib is only imported, and the cylon colormap registered, when a
+# plotting module is first used
+__getattr__, __dir__, __all__ = attach(
+    __name__, submod_attrs={"cmap": ["cylon"]}
+)
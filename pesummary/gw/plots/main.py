@@ -12,7 +12,7 @@ from pesummary.core.plots.bounded_1d_kde import ReflectionBoundedKDE
 from pesummary.gw.plots.latex_labels import GWlatex_labels
 from pesummary.utils.utils import (
     logger, resample_posterior_distribution, get_matplotlib_backend,
-    get_matplotlib_style_file
+    get_matplotlib_style_file, RedirectLogger
 )
 from pesummary.utils.decorators import no_latex_plot
 from pesummary.gw.plots import publication
@@ -43,7 +43,9 @@ class _PlotGeneration(_BasePlotGeneration):
         linestyles=None, disable_interactive=False, disable_corner=False,
         publication_kwargs={}, multi_process=1, mcmc_samples=False,
         skymap=None, existing_skymap=None, corner_params=None,
-        preliminary_pages=False, expert_plots=True, checkpoint=False
+        preliminary_pages=False, expert_plots=True, checkpoint=False,
+        thumbnails=False, webp_thumbnails=False, incremental=False, seed=None,
+        interactive_point_budget=None
     ):
         super(_PlotGeneration, self).__init__(
             savedir=savedir, webdir=webdir, labels=labels,
@@ -59,7 +61,10 @@ class _PlotGeneration(_BasePlotGeneration):
             disable_comparison=disable_comparison, linestyles=linestyles,
             disable_interactive=disable_interactive, disable_corner=disable_corner,
             multi_process=multi_process, corner_params=corner_params,
-            expert_plots=expert_plots, checkpoint=checkpoint
+            expert_plots=expert_plots, checkpoint=checkpoint,
+            thumbnails=thumbnails, webp_thumbnails=webp_thumbnails,
+            incremental=incremental,
+            interactive_point_budget=interactive_point_budget
         )
         self.preliminary_pages = preliminary_pages
         if not isinstance(self.preliminary_pages, dict):
@@ -91,12 +96,13 @@ class _PlotGeneration(_BasePlotGeneration):
         self.psd = psd
         self.existing_psd = existing_psd
         self.multi_threading_for_skymap = multi_threading_for_skymap
+        self.seed = seed
         self.approximant = approximant
         self.existing_approximant = existing_approximant
         self.pepredicates_probs = pepredicates_probs
         self.publication = publication
         self.publication_kwargs = publication_kwargs
-        self._ligo_skymap_PID = {}
+        self._ligo_skymap_scheduler = None
 
         self.plot_type_dictionary.update({
             "psd": self.psd_plot,
@@ -118,8 +124,22 @@ class _PlotGeneration(_BasePlotGeneration):
             })
 
     @property
-    def ligo_skymap_PID(self):
-        return self._ligo_skymap_PID
+    def ligo_skymap_scheduler(self):
+        """Return the scheduler used to generate skymaps with ligo.skymap.
+        The scheduler is created the first time a skymap is requested and
+        shares `multi_threading_for_skymap` CPUs between all analyses which
+        require a ligo.skymap skymap
+        """
+        if self._ligo_skymap_scheduler is None:
+            from pesummary.gw.plots.scheduler import SkymapScheduler
+
+            njobs = len(
+                [label for label in self.labels if self.skymap[label] is None]
+            )
+            self._ligo_skymap_scheduler = SkymapScheduler(
+                cpu_budget=self.multi_threading_for_skymap, njobs=njobs
+            )
+        return self._ligo_skymap_scheduler
 
     def generate_plots(self):
         """Generate all plots for all result files
@@ -273,9 +293,7 @@ class _PlotGeneration(_BasePlotGeneration):
         )
 
         if SKYMAP and not self.no_ligo_skymap and self.skymap[label] is None:
-            from pesummary.utils.utils import RedirectLogger
-
-            logger.info("Launching subprocess to generate skymap plot with "
+            logger.info("Scheduling subprocess to generate skymap plot with "
                         "ligo.skymap")
             try:
                 _time = samples["geocent_time"]
@@ -286,20 +304,13 @@ class _PlotGeneration(_BasePlotGeneration):
                     "DATE_OBS field in the header".format(label)
                 )
                 _time = None
-            with RedirectLogger("ligo.skymap", level="DEBUG") as redirector:
-                process = mp.Process(
-                    target=self._ligo_skymap_plot,
-                    args=[
-                        self.savedir, samples["ra"], samples["dec"],
-                        samples["luminosity_distance"], _time,
-                        label, self.nsamples_for_skymap, self.webdir,
-                        self.multi_threading_for_skymap, _injection,
-                        self.preliminary_pages[label]
-                    ]
-                )
-                process.start()
-                PID = process.pid
-            self._ligo_skymap_PID[label] = PID
+            self.ligo_skymap_scheduler.submit(
+                label, self._ligo_skymap_plot, self.savedir, samples["ra"],
+                samples["dec"], samples["luminosity_distance"], _time, label,
+                self.nsamples_for_skymap, self.webdir,
+                injection=_injection, preliminary=self.preliminary_pages[label],
+                seed=self.seed
+            )
         elif SKYMAP and not self.no_ligo_skymap:
             self._ligo_skymap_array_plot(
                 self.savedir, self.skymap[label], label,
@@ -343,10 +354,10 @@ class _PlotGeneration(_BasePlotGeneration):
     @staticmethod
     @no_latex_plot
     def _ligo_skymap_plot(savedir, ra, dec, dist, time, label, nsamples_for_skymap,
-                          webdir, multi_threading_for_skymap, injection,
-                          preliminary=False):
+                          webdir, multi_threading_for_skymap=1, injection=None,
+                          preliminary=False, seed=None):
         """Generate a skymap plot for a given set of samples using the
-        ligo.skymap package
+        ligo.skymap package and return the skymap
 
         Parameters
         ----------
@@ -366,28 +377,41 @@ class _PlotGeneration(_BasePlotGeneration):
             the number of samples used to generate skymap
         webdir: str
             the directory to store the fits file
+        multi_threading_for_skymap: int, optional
+            number of threads to use when generating the skymap. Default 1
+        injection: list, optional
+            list containing the injected value of ra and dec
         preliminary: Bool, optional
             if True, add a preliminary watermark to the plot
+        seed: int, optional
+            random seed used when downsampling and generating the skymap.
+            This makes the skymap reproducible, allowing it to be reused from
+            the skymap cache. Default None
         """
         import math
 
         downsampled = False
         if nsamples_for_skymap is not None:
+            if seed is not None:
+                np.random.seed(seed)
             ra, dec, dist = resample_posterior_distribution(
                 [ra, dec, dist], nsamples_for_skymap
             )
             downsampled = True
         if injection is not None and any(math.isnan(inj) for inj in injection):
             injection = None
-        fig = gw._ligo_skymap_plot(
-            ra, dec, dist=dist, savedir=os.path.join(webdir, "samples"),
-            nprocess=multi_threading_for_skymap, downsampled=downsampled,
-            label=label, time=time, injection=injection
-        )
+        with RedirectLogger("ligo.skymap", level="DEBUG"):
+            fig, skymap = gw._ligo_skymap_plot(
+                ra, dec, dist=dist, savedir=os.path.join(webdir, "samples"),
+                nprocess=multi_threading_for_skymap, downsampled=downsampled,
+                label=label, time=time, injection=injection, seed=seed,
+                return_skymap=True
+            )
         _PlotGeneration.save(
             fig, os.path.join(savedir, "{}_skymap".format(label)),
             preliminary=preliminary
         )
+        return skymap
 
     @staticmethod
     @no_latex_plot
@@ -406,7 +430,7 @@ class _PlotGeneration(_BasePlotGeneration):
         preliminary: Bool, optional
             if True, add a preliminary watermark to the plot
         """
-        fig = gw._ligo_skymap_plot_from_array(skymap)
+        fig = gw._ligo_skymap_plot_from_array(skymap)[0]
         _PlotGeneration.save(
             fig, os.path.join(savedir, "{}_skymap".format(label)),
             preliminary=preliminary
@@ -1037,8 +1061,6 @@ class _PlotGeneration(_BasePlotGeneration):
         """
         from pesummary.gw.pepredicates import PEPredicates
 
-        parameters = list(samples.keys())
-        samples = np.array([samples[param] for param in parameters]).T
         if not population_prior:
             filename = os.path.join(
                 savedir, "{}_default_pepredicates.png".format(label)
@@ -1051,9 +1073,7 @@ class _PlotGeneration(_BasePlotGeneration):
         if os.path.isfile(filename) and checkpoint:
             pass
         else:
-            fig = PEPredicates.plot(
-                samples, parameters, population_prior=population_prior
-            )
+            fig = PEPredicates.plot(samples, population_prior=population_prior)
             if not population_prior:
                 _PlotGeneration.save(
                     fig, filename, preliminary=preliminary
@@ -1217,7 +1237,7 @@ class _PlotGeneration(_BasePlotGeneration):
 
     @staticmethod
     def _interactive_corner_plot(
-        savedir, label, samples, latex_labels, checkpoint=False
+        savedir, label, samples, latex_labels, checkpoint=False, payload=None
     ):
         """Generate an interactive corner plot for a given set of samples
 
@@ -1232,6 +1252,12 @@ class _PlotGeneration(_BasePlotGeneration):
             contain samples for each parameter
         latex_labels: str
             latex labels for each parameter in samples
+        checkpoint: Bool, optional
+            if True, do not regenerate a plot which already exists
+        payload: str, optional
+            location of the shared payload for label. If provided, the
+            samples are loaded from the payload rather than being embedded in
+            the html file
         """
         filename = os.path.join(
             savedir, "corner", "{}_interactive_source.html".format(label)
@@ -1248,7 +1274,10 @@ class _PlotGeneration(_BasePlotGeneration):
             labels = [latex_labels[parameter] for parameter in parameters]
             _ = interactive.corner(
                 data, labels, write_to_html_file=filename,
-                dimensions={"width": 900, "height": 900}
+                dimensions={"width": 900, "height": 900},
+                payload=None if payload is None else dict(
+                    src=payload, label=label, parameters=parameters
+                )
             )
 
         filename = os.path.join(
@@ -1262,5 +1291,8 @@ class _PlotGeneration(_BasePlotGeneration):
             data = [samples[parameter] for parameter in parameters]
             labels = [latex_labels[parameter] for parameter in parameters]
             _ = interactive.corner(
-                data, labels, write_to_html_file=filename
+                data, labels, write_to_html_file=filename,
+                payload=None if payload is None else dict(
+                    src=payload, label=label, parameters=parameters
+                )
             )
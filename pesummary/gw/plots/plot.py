@@ -6,6 +6,8 @@ from pesummary.utils.utils import (
 )
 from pesummary.utils.decorators import no_latex_plot
 from pesummary.gw.plots.bounds import default_bounds
+from pesummary.gw.plots.cmap import cylon
+from pesummary.gw.file import check_IERS
 from pesummary.core.plots.seaborn.kde import kdeplot
 from pesummary.core.plots.figure import figure, subplots, ExistingFigure
 from pesummary.core.plots.plot import _default_legend_kwargs
@@ -21,6 +23,8 @@ from scipy.ndimage import gaussian_filter
 from astropy.time import Time
 
 _check_latex_install()
+cylon()
+check_IERS()
 
 from lal import MSUN_SI, PC_SI
 
@@ -512,7 +516,8 @@ def _waveform_comparison_plot(maxL_params_list, colors, labels,
 def _ligo_skymap_plot(ra, dec, dist=None, savedir="./", nprocess=1,
                       downsampled=False, label="pesummary", time=None,
                       distance_map=True, multi_resolution=True,
-                      injection=None, **kwargs):
+                      injection=None, trials=5, seed=None, cache=True,
+                      cache_dir=None, return_skymap=False, **kwargs):
     """Plot the sky location of the source for a given approximant using the
     ligo.skymap package
 
@@ -536,14 +541,31 @@ def _ligo_skymap_plot(ra, dec, dist=None, savedir="./", nprocess=1,
         Boolean for whether or not to generate a multiresolution HEALPix map
     injection: list, optional
         List containing RA and DEC of the injection. Both must be in radians
+    trials: int, optional
+        number of trials used when fitting the clustered KDE. Default 5
+    seed: int, optional
+        random seed used when fitting the clustered KDE. Default None
+    cache: Bool, optional
+        if True, reuse a skymap which has previously been generated from the
+        same samples, trials, resolution and seed, and cache newly generated
+        skymaps. Default True
+    cache_dir: str, optional
+        directory to use for the skymap cache. Default
+        pesummary.utils.utils.SKYMAP_CACHE
+    return_skymap: Bool, optional
+        if True, return the skymap as a pesummary.gw.file.skymap.SkyMap
+        object as well as the figure. Default False
     kwargs: dict
         optional keyword arguments
     """
-    import healpy as hp
-    from ligo.skymap import plot, postprocess, io
+    from ligo.skymap import io
     from ligo.skymap.bayestar import rasterize
     from ligo.skymap.kde import Clustered2DSkyKDE, Clustered2Plus1DSkyKDE
     from astropy.time import Time
+    from pesummary.gw.file.skymap import (
+        SkyMap, skymap_cache_key, read_cached_skymap, write_cached_skymap
+    )
+    from pesummary.utils.utils import SKYMAP_CACHE
 
     if dist is not None and distance_map:
         pts = np.column_stack((ra, dec, dist))
@@ -551,10 +573,28 @@ def _ligo_skymap_plot(ra, dec, dist=None, savedir="./", nprocess=1,
     else:
         pts = np.column_stack((ra, dec))
         cls = Clustered2DSkyKDE
-    skypost = cls(pts, trials=5, jobs=nprocess)
-    hpmap = skypost.as_healpix()
-    if not multi_resolution:
-        hpmap = rasterize(hpmap)
+    if cache_dir is None:
+        cache_dir = SKYMAP_CACHE
+    hpmap = None
+    if cache:
+        key = skymap_cache_key(
+            pts, trials=trials, multi_resolution=multi_resolution, seed=seed
+        )
+        hpmap = read_cached_skymap(key, cache_dir=cache_dir)
+    if hpmap is None:
+        if seed is not None:
+            state = np.random.get_state()
+            np.random.seed(seed)
+        try:
+            skypost = cls(pts, trials=trials, jobs=nprocess)
+            hpmap = skypost.as_healpix()
+        finally:
+            if seed is not None:
+                np.random.set_state(state)
+        if not multi_resolution:
+            hpmap = rasterize(hpmap)
+        if cache:
+            write_cached_skymap(key, hpmap, cache_dir=cache_dir)
     hpmap.meta['creator'] = "pesummary"
     hpmap.meta['origin'] = 'LIGO/Virgo'
     hpmap.meta['gps_creation_time'] = Time.now().gps
@@ -571,12 +611,15 @@ def _ligo_skymap_plot(ra, dec, dist=None, savedir="./", nprocess=1,
     io.write_sky_map(
         os.path.join(savedir, "%s_skymap.fits" % (label)), hpmap, nest=True
     )
-    skymap, metadata = io.fits.read_sky_map(
-        os.path.join(savedir, "%s_skymap.fits" % (label)), nest=None
-    )
-    return _ligo_skymap_plot_from_array(
+    # the probabilities are extracted in memory rather than reading back the
+    # fits file which has just been written
+    skymap = SkyMap.from_healpix(hpmap)
+    fig = _ligo_skymap_plot_from_array(
         skymap, nsamples=len(ra), downsampled=downsampled, injection=injection
     )[0]
+    if return_skymap:
+        return fig, skymap
+    return fig
 
 
 def _ligo_skymap_plot_from_array(
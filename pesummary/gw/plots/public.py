@@ -27,7 +27,9 @@ class _PlotGeneration(_GWPlotGeneration):
         existing_weights=None, weights=None, disable_comparison=False,
         linestyles=None, disable_interactive=False, disable_corner=False,
         publication_kwargs={}, multi_process=1, corner_params=None,
-        preliminary_pages=False, expert_plots=False, checkpoint=False
+        preliminary_pages=False, expert_plots=False, checkpoint=False,
+        thumbnails=False, webp_thumbnails=False, incremental=False, seed=None,
+        interactive_point_budget=None
     ):
         super(_PlotGeneration, self).__init__(
             savedir=savedir, webdir=webdir, labels=labels,
@@ -57,5 +59,7 @@ class _PlotGeneration(_GWPlotGeneration):
             publication_kwargs=publication_kwargs,
             multi_process=multi_process, corner_params=corner_params,
             preliminary_pages=preliminary_pages, expert_plots=expert_plots,
-            checkpoint=checkpoint
+            checkpoint=checkpoint, thumbnails=thumbnails,
+            webp_thumbnails=webp_thumbnails, incremental=incremental,
+            seed=seed, interactive_point_budget=interactive_point_budget
         )
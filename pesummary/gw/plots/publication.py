@@ -114,7 +114,7 @@ def twod_contour_plots(
         {
             "kde": Bounded_2d_kde, "kde_kwargs": {
                 "transform": transform, "xlow": xlow, "xhigh": xhigh,
-                "ylow": ylow, "yhigh": yhigh
+                "ylow": ylow, "yhigh": yhigh, "method": "fft"
             }
         }
     )
@@ -159,7 +159,7 @@ def _setup_triangle_plot(parameters, kwargs):
         {
             "kde_2d": Bounded_2d_kde, "kde_2d_kwargs": {
                 "transform": transform, "xlow": xlow, "xhigh": xhigh,
-                "ylow": ylow, "yhigh": yhigh
+                "ylow": ylow, "yhigh": yhigh, "method": "fft"
             }, "kde": bounded_1d_kde
         }
     )
@@ -0,0 +1,328 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import time
+import threading
+import traceback
+import multiprocessing as mp
+from multiprocessing import connection
+from pesummary.utils.utils import logger
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+
+def _run_job(conn, function, args, kwargs):
+    """Run a job in a subprocess and send the result back to the parent
+
+    Parameters
+    ----------
+    conn: multiprocessing.connection.Connection
+        connection used to send the result back to the parent process
+    function: func
+        function you wish to evaluate
+    args: tuple
+        arguments passed to function
+    kwargs: dict
+        keyword arguments passed to function
+    """
+    try:
+        message = ("success", function(*args, **kwargs))
+    except BaseException:
+        message = ("failure", traceback.format_exc())
+    try:
+        conn.send(message)
+    except Exception:
+        conn.send(("failure", traceback.format_exc()))
+    finally:
+        conn.close()
+
+
+class _Job(object):
+    """Class to store the information about a single job
+
+    Parameters
+    ----------
+    label: str
+        label associated with the job
+    function: func
+        function you wish to evaluate
+    args: tuple
+        arguments passed to function
+    kwargs: dict
+        keyword arguments passed to function
+    threads: int
+        number of threads assigned to the job
+    """
+    def __init__(self, label, function, args, kwargs, threads):
+        self.label = label
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.threads = threads
+        self.process = None
+        self.connection = None
+        self.start_time = None
+
+    def start(self):
+        """Start the job in a separate process
+        """
+        reader, writer = mp.Pipe(duplex=False)
+        self.process = mp.Process(
+            target=_run_job, args=[writer, self.function, self.args, self.kwargs]
+        )
+        self.start_time = time.time()
+        self.process.start()
+        writer.close()
+        self.connection = reader
+
+    def collect(self):
+        """Return the status and result of a job which has finished
+        """
+        try:
+            status, result = self.connection.recv()
+        except (EOFError, OSError):
+            self.process.join()
+            status, result = (
+                "failure", "process exited with code {}".format(
+                    self.process.exitcode
+                )
+            )
+        self.connection.close()
+        self.process.join()
+        return status, result
+
+
+class SkymapScheduler(object):
+    """Class to generate skymaps in separate processes while respecting a
+    total CPU budget. The number of skymaps which run concurrently and the
+    number of threads assigned to each are chosen such that the total never
+    exceeds the budget. Jobs beyond the number of concurrent slots are queued
+    and started as soon as a running job finishes. Progress and failures are
+    reported through the pesummary logger and the result of each job is
+    returned to the parent process
+
+    Parameters
+    ----------
+    cpu_budget: int, optional
+        total number of CPUs available for skymap generation. Default 1
+    njobs: int, optional
+        expected number of jobs. This is used to choose the number of
+        concurrent jobs and threads per job. Default cpu_budget
+    max_threads_per_job: int, optional
+        maximum number of threads to assign to a single job. Default None
+    thread_kwarg: str, optional
+        name of the keyword argument used to pass the number of threads to
+        each job. Default 'multi_threading_for_skymap'
+
+    Attributes
+    ----------
+    concurrency: int
+        maximum number of jobs which run concurrently
+    results: dict
+        dictionary containing the result of each job which has finished
+        successfully
+    failures: dict
+        dictionary containing the traceback of each job which failed
+
+    Examples
+    --------
+    >>> from pesummary.gw.plots.scheduler import SkymapScheduler
+    >>> scheduler = SkymapScheduler(cpu_budget=16, njobs=10)
+    >>> scheduler.concurrency
+    10
+    >>> scheduler.threads
+    [2, 2, 2, 2, 2, 2, 1, 1, 1, 1]
+    """
+    def __init__(
+        self, cpu_budget=1, njobs=None, max_threads_per_job=None,
+        thread_kwarg="multi_threading_for_skymap"
+    ):
+        self.cpu_budget = max(1, int(cpu_budget or 1))
+        if njobs is None:
+            njobs = self.cpu_budget
+        self.njobs = max(1, int(njobs))
+        self.max_threads_per_job = max_threads_per_job
+        self.thread_kwarg = thread_kwarg
+        self.concurrency = min(self.njobs, self.cpu_budget)
+        self.results = {}
+        self.failures = {}
+        self._pending = []
+        self._running = []
+        self._nsubmitted = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._dispatcher = None
+
+    @property
+    def threads(self):
+        """Return the number of threads assigned to each of the expected
+        jobs. Leftover CPUs are shared among the first jobs in each round
+        """
+        return [self._threads_for_job(num) for num in range(self.njobs)]
+
+    @property
+    def labels(self):
+        """Return the labels of all submitted jobs
+        """
+        return list(self.results.keys()) + list(self.failures.keys()) + [
+            job.label for job in self._running + self._pending
+        ]
+
+    def _threads_for_job(self, index):
+        """Return the number of threads to assign to a given job
+
+        Parameters
+        ----------
+        index: int
+            index of the job in the order that it was submitted
+        """
+        if index >= self.njobs:
+            return 1
+        threads = self.cpu_budget // self.concurrency
+        if index % self.concurrency < self.cpu_budget % self.concurrency:
+            threads += 1
+        if self.max_threads_per_job is not None:
+            threads = min(threads, self.max_threads_per_job)
+        return max(1, threads)
+
+    def submit(self, label, function, *args, **kwargs):
+        """Submit a job to the scheduler. The job is started immediately if a
+        slot is available, otherwise it is queued. The number of threads
+        assigned to the job is passed to function with the `thread_kwarg`
+        keyword argument
+
+        Parameters
+        ----------
+        label: str
+            label associated with the job
+        function: func
+            function you wish to evaluate. Must be picklable
+        *args: tuple
+            arguments passed to function
+        **kwargs: dict
+            keyword arguments passed to function
+        """
+        threads = self._threads_for_job(self._nsubmitted)
+        self._nsubmitted += 1
+        kwargs[self.thread_kwarg] = threads
+        job = _Job(label, function, args, kwargs, threads)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(
+                    "Unable to submit a job to a scheduler which has been "
+                    "closed"
+                )
+            self._pending.append(job)
+            self._start_pending()
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch, daemon=True
+                )
+                self._dispatcher.start()
+            self._condition.notify_all()
+        return job
+
+    def _start_pending(self):
+        """Start queued jobs while there are free slots. Must be called while
+        holding the lock
+        """
+        while self._pending and len(self._running) < self.concurrency:
+            job = self._pending.pop(0)
+            logger.info(
+                "Starting skymap generation for {} with {} thread{} ({} "
+                "running, {} queued)".format(
+                    job.label, job.threads, "s" if job.threads > 1 else "",
+                    len(self._running) + 1, len(self._pending)
+                )
+            )
+            job.start()
+            self._running.append(job)
+
+    def _finish(self, job):
+        """Collect the result of a job which has finished
+
+        Parameters
+        ----------
+        job: _Job
+            the job which has finished
+        """
+        status, result = job.collect()
+        duration = time.time() - job.start_time
+        if status == "success":
+            self.results[job.label] = result
+        else:
+            self.failures[job.label] = result
+        ndone = len(self.results) + len(self.failures)
+        ntotal = ndone + len(self._running) + len(self._pending)
+        if status == "success":
+            logger.info(
+                "Finished skymap generation for {} in {:.1f}s ({}/{})".format(
+                    job.label, duration, ndone, ntotal
+                )
+            )
+        else:
+            logger.warning(
+                "Failed to generate a skymap for {} ({}/{}): {}".format(
+                    job.label, ndone, ntotal, result.strip().split("\n")[-1]
+                )
+            )
+            logger.debug(result)
+
+    def _dispatch(self):
+        """Wait for running jobs to finish and start queued jobs in their
+        place. This runs in a separate thread
+        """
+        while True:
+            with self._condition:
+                while not self._running and not self._pending:
+                    if self._closed:
+                        return
+                    self._condition.wait()
+                running = list(self._running)
+            waitables = [job.connection for job in running] + [
+                job.process.sentinel for job in running
+            ]
+            ready = connection.wait(waitables, timeout=1.)
+            if not ready:
+                continue
+            finished = [
+                job for job in running if job.connection in ready or
+                job.process.sentinel in ready
+            ]
+            for job in finished:
+                self._finish(job)
+            with self._condition:
+                for job in finished:
+                    self._running.remove(job)
+                self._start_pending()
+                self._condition.notify_all()
+
+    def wait(self, timeout=None):
+        """Wait for all submitted jobs to finish and return the results. No
+        further jobs can be submitted after this is called
+
+        Parameters
+        ----------
+        timeout: float, optional
+            maximum time in seconds to wait. Default None, i.e. wait until all
+            jobs have finished
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._dispatcher is not None:
+            self._dispatcher.join(timeout)
+        return self.results
+
+    def terminate(self):
+        """Terminate all running jobs and remove queued jobs
+        """
+        with self._condition:
+            self._closed = True
+            for job in self._pending:
+                self.failures[job.label] = "job cancelled"
+            self._pending = []
+            for job in self._running:
+                job.process.terminate()
+            self._condition.notify_all()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
@@ -2,7 +2,7 @@
 
 import numpy as np
 from ..utils.utils import logger
-from ..core.reweight import rejection_sampling, options
+from ..core.reweight import apply_weights, options
 from .cosmology import get_cosmology
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
@@ -10,7 +10,7 @@ __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
 def uniform_in_comoving_volume_from_uniform_in_volume(
     samples, redshift_method="exact", cosmology="Planck15", convert_kwargs={},
-    star_formation_rate_power=0, **kwargs
+    star_formation_rate_power=0, mode="rejection", **kwargs
 ):
     """Resample a table of posterior distributions from a uniform in volume
     distance prior to a uniform in comoving volume distance prior. For details
@@ -35,6 +35,10 @@ def uniform_in_comoving_volume_from_uniform_in_volume(
     star_formation_rate_power: int, optional
         power to use to include a star formation rate evolution. Default 0,
         i.e. no evolution
+    mode: str, optional
+        either 'rejection' to resample the posterior with rejection sampling
+        or 'weights' to keep all samples and attach importance weights.
+        Default 'rejection'
     """
     import astropy.units as u
     parameters = samples.keys()
@@ -75,7 +79,7 @@ def uniform_in_comoving_volume_from_uniform_in_volume(
             + (1. + redshift)**2.
         )
     )
-    return rejection_sampling(samples, weights)
+    return apply_weights(samples, weights, mode=mode)
 
 
 options.update(
@@ -108,7 +108,8 @@ class _WebpageGeneration(_CoreWebpageGeneration):
         disable_interactive=False, publication_kwargs={}, no_ligo_skymap=False,
         psd=None, priors=None, package_information={"packages": []},
         mcmc_samples=False, external_hdf5_links=False, preliminary_pages=False,
-        existing_plot=None, disable_expert=False, analytic_priors=None
+        existing_plot=None, disable_expert=False, analytic_priors=None,
+        multi_process=1, thumbnails=False, incremental=False
     ):
         self.pepredicates_probs = pepredicates_probs
         self.pastro_probs = pastro_probs
@@ -142,7 +143,8 @@ class _WebpageGeneration(_CoreWebpageGeneration):
             package_information=package_information, mcmc_samples=mcmc_samples,
             external_hdf5_links=external_hdf5_links, key_data=key_data,
             existing_plot=existing_plot, disable_expert=disable_expert,
-            analytic_priors=analytic_priors
+            analytic_priors=analytic_priors, multi_process=multi_process,
+            thumbnails=thumbnails, incremental=incremental
         )
         if self.file_kwargs is None:
             self.file_kwargs = {
@@ -225,7 +227,10 @@ class _WebpageGeneration(_CoreWebpageGeneration):
             self.make_publication_pages()
         if self.gwdata is not None:
             self.make_detector_pages()
-        if all(val is not None for key, val in self.pepredicates_probs.items()):
+        if all(
+                self.pepredicates_probs[label] is not None for label in
+                self.result_page_labels
+        ):
             self.make_classification_pages()
 
     def _make_home_pages(self, pages):
@@ -526,7 +531,9 @@ class _WebpageGeneration(_CoreWebpageGeneration):
     def make_classification_pages(self):
         """Wrapper function for _make_publication_pages()
         """
-        pages = ["{}_{}_Classification".format(i, i) for i in self.labels]
+        pages = [
+            "{}_{}_Classification".format(i, i) for i in self.result_page_labels
+        ]
         self.create_blank_html_pages(pages)
         self._make_classification_pages(pages)
 
@@ -541,6 +548,8 @@ class _WebpageGeneration(_CoreWebpageGeneration):
         executable = self.get_executable("summaryclassification")
         general_cli = "%s --samples {}" % (executable)
         for num, label in enumerate(self.labels):
+            if label not in self.result_page_labels:
+                continue
             html_file = self.setup_page(
                 "{}_Classification".format(label),
                 self.navbar["result_page"][label], label,
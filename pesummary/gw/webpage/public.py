@@ -24,7 +24,8 @@ class _PublicWebpageGeneration(_GWWebpageGeneration):
         psd=None, priors=None, package_information={"packages": []},
         mcmc_samples=False, external_hdf5_links=False,
         preliminary_pages=False, existing_plot=None, disable_expert=False,
-        analytic_priors=None
+        analytic_priors=None, multi_process=1, thumbnails=False,
+        incremental=False
     ):
         super(_PublicWebpageGeneration, self).__init__(
             webdir=webdir, samples=samples, labels=labels,
@@ -50,7 +51,9 @@ class _PublicWebpageGeneration(_GWWebpageGeneration):
             package_information=package_information,
             mcmc_samples=mcmc_samples, external_hdf5_links=external_hdf5_links,
             preliminary_pages=preliminary_pages, existing_plot=existing_plot,
-            disable_expert=disable_expert, analytic_priors=analytic_priors
+            disable_expert=disable_expert, analytic_priors=analytic_priors,
+            multi_process=multi_process, thumbnails=thumbnails,
+            incremental=incremental
         )
 
     def setup_page(
@@ -79,7 +82,7 @@ class _PublicWebpageGeneration(_GWWebpageGeneration):
         """
         html_file = webpage.open_html(
             web_dir=self.webdir, base_url=self.base_url, html_page=html_page,
-            label=label
+            label=label, image_dimensions=self.image_dimensions
         )
         html_file.make_header(approximant=approximant)
         if html_page == "home" or html_page == "home.html":
@@ -5,16 +5,34 @@ import importlib
 from pathlib import Path
 from pesummary.core.file.formats.ini import read_ini
 from pesummary.core.file.formats.pickle import read_pickle
-from pesummary.gw.file.strain import StrainData
-from pesummary.gw.file.skymap import SkyMap
+from pesummary.core.file.formats.checkpoint import read_checkpoint
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
+
+def _read_skymap(*args, **kwargs):
+    """Read a skymap with pesummary.gw.file.skymap.SkyMap.from_fits. The
+    SkyMap class is only imported when needed to avoid importing healpy and
+    astropy when reading posterior samples
+    """
+    from pesummary.gw.file.skymap import SkyMap
+    return SkyMap.from_fits(*args, **kwargs)
+
+
+def _read_strain(*args, **kwargs):
+    """Read strain data with pesummary.gw.file.strain.StrainData.read. The
+    StrainData class is only imported when needed to avoid importing gwpy when
+    reading posterior samples
+    """
+    from pesummary.gw.file.strain import StrainData
+    return StrainData.read(*args, **kwargs)
+
+
 OTHER = {
-    "fits": SkyMap.from_fits,
+    "fits": _read_skymap,
     "ini": read_ini,
-    "gwf": StrainData.read,
-    "lcf": StrainData.read,
+    "gwf": _read_strain,
+    "lcf": _read_strain,
     "pickle": read_pickle
 }
 
@@ -97,6 +115,8 @@ def read(
     extension = Path(path).suffix[1:]
     if cls is not None:
         return cls.load_file(path, **kwargs)
+    if checkpoint:
+        return read_checkpoint(path, **kwargs)
     if extension in OTHER.keys():
         return OTHER[extension](path, **kwargs)
     elif file_format == "ini":
@@ -105,8 +125,6 @@ def read(
         return OTHER["fits"](path, **kwargs)
     elif strain:
         return OTHER["gwf"](path, **kwargs)
-    elif checkpoint:
-        return OTHER["pickle"](path, **kwargs)
 
     module = importlib.import_module("pesummary.{}.file.read".format(package))
     return getattr(module, "read")(path, file_format=file_format, **kwargs)
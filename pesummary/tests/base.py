@@ -2,6 +2,7 @@
 
 import os
 import numpy as np
+import pytest
 from pathlib import Path
 from pesummary.core.command_line import command_line
 from pesummary.gw.command_line import insert_gwspecific_option_group
@@ -16,6 +17,24 @@ class Namespace(object):
         self.__dict__.update(kwargs)
 
 
+def benchmark(test):
+    """Mark a test as a benchmark. Benchmarks time pesummary and are therefore
+    sensitive to the load on the machine. They are skipped unless the
+    PESUMMARY_BENCHMARK environment variable is set. All benchmarks can be
+    run with `PESUMMARY_BENCHMARK=1 pytest -m benchmark`
+
+    Parameters
+    ----------
+    test: func/class
+        test function or test class to mark as a benchmark
+    """
+    test = pytest.mark.benchmark(test)
+    return pytest.mark.skipif(
+        "PESUMMARY_BENCHMARK" not in os.environ,
+        reason="benchmarks only run when PESUMMARY_BENCHMARK is set"
+    )(test)
+
+
 def namespace(args):
     """Generate a namespace for testing purposes
 
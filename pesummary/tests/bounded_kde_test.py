@@ -1,7 +1,7 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
 from pesummary.core.plots.bounded_1d_kde import ReflectionBoundedKDE, bounded_1d_kde
-from pesummary.core.plots.bounded_2d_kde import Bounded_2d_kde
+from pesummary.core.plots.bounded_2d_kde import Bounded_2d_kde, KDE_GRID_CACHE
 from scipy.stats import gaussian_kde
 import numpy as np
 import pytest
@@ -52,3 +52,30 @@ class TestBounded_kde(object):
         with pytest.raises(AssertionError):
             np.testing.assert_almost_equal(scipy([[9.45, 10.55], [5., 5.]]),  [0., 0.])
         np.testing.assert_almost_equal(bounded([[9.45, 10.55], [5., 5.]]), [0., 0.])
+
+    def test_bounded_2d_kde_fft(self):
+        """Test that the FFT gridded density agrees with the direct estimate
+        """
+        np.random.seed(123)
+        samples = np.array([
+            np.random.uniform(0, 1, 2000) ** 2,
+            np.random.normal(0.8, 0.2, 2000)
+        ])
+        samples = samples[:, samples[1] < 1.]
+        bounds = {"xlow": 0., "xhigh": 1., "ylow": -1., "yhigh": 1.}
+        x = np.linspace(-0.05, 1.05, 60)
+        y = np.linspace(0., 1.05, 50)
+        direct = Bounded_2d_kde(samples, **bounds).grid_evaluate(x, y)
+        KDE_GRID_CACHE.clear()
+        fft = Bounded_2d_kde(samples, method="fft", **bounds).grid_evaluate(
+            x, y
+        )
+        assert fft.shape == (len(y), len(x))
+        np.testing.assert_allclose(fft, direct, atol=1e-3 * np.max(direct))
+        assert np.all(fft[:, x < 0.] == 0.)
+        assert np.all(fft[y > 1., :] == 0.)
+        assert KDE_GRID_CACHE.misses == 1
+        Bounded_2d_kde(samples, method="fft", **bounds).grid_evaluate(x, y)
+        assert KDE_GRID_CACHE.hits == 1
+        with pytest.raises(ValueError):
+            Bounded_2d_kde(samples, method="unknown")
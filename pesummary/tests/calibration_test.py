@@ -81,3 +81,47 @@ class TestCalibration(object):
 
         with pytest.raises(IndexError):
             obj = Calibration([10, 10])
+
+    def test_from_spline_posterior_samples(self):
+        """Test that the batched spline interpolation matches interpolating
+        each posterior sample separately
+        """
+        from scipy.interpolate import interp1d
+        from pesummary.gw.file.calibration import (
+            _interpolate_spline_model, _spline_angle_xform
+        )
+
+        log_frequencies = np.log(np.logspace(1, 3, 10))
+        data = np.random.normal(0, 0.1, size=(200, 10))
+        interpolated = np.linspace(
+            np.min(log_frequencies), np.max(log_frequencies), 50
+        )
+        expected = np.array(
+            [
+                _spline_angle_xform(interp1d(
+                    log_frequencies, samp, kind="cubic", fill_value=0.,
+                    bounds_error=False
+                )(interpolated)) for samp in data
+            ]
+        )
+        # use a small chunk_size so the frequencies are split into blocks
+        mean, lower, upper = _interpolate_spline_model(
+            log_frequencies, data, interpolated, nfreqs=50,
+            xform=_spline_angle_xform, level=0.9, chunk_size=1000
+        )
+        np.testing.assert_almost_equal(mean, np.mean(expected, axis=0))
+        np.testing.assert_almost_equal(
+            lower, np.quantile(expected, 0.05, axis=0)
+        )
+        np.testing.assert_almost_equal(
+            upper, np.quantile(expected, 0.95, axis=0)
+        )
+        rotation = (2.0 + 1.0j * data) / (2.0 - 1.0j * data)
+        np.testing.assert_almost_equal(
+            _spline_angle_xform(data),
+            180.0 / np.pi * np.arctan2(np.imag(rotation), np.real(rotation))
+        )
+        obj = Calibration.from_spline_posterior_samples(
+            log_frequencies, data.T, data.T
+        )
+        assert obj.shape == (300, 7)
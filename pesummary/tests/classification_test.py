@@ -0,0 +1,101 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import numpy as np
+from pesummary.utils.samples_dict import SamplesDict
+from pesummary.gw.classification import (
+    ClassificationSamples, bootstrap_uncertainty, classify, classify_analyses
+)
+import pytest
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+
+class TestClassification(object):
+    """Test the `pesummary.gw.classification` module
+    """
+    def setup_method(self):
+        """Setup the TestClassification class
+        """
+        np.random.seed(123456789)
+        nsamples = 5000
+        self.samples = SamplesDict({
+            "mass_1_source": np.random.uniform(1, 60, nsamples),
+            "mass_2_source": np.random.uniform(1, 20, nsamples),
+            "luminosity_distance": np.random.uniform(50, 1000, nsamples),
+            "redshift": np.random.uniform(0.01, 0.2, nsamples),
+            "a_1": np.random.uniform(0, 1, nsamples),
+            "a_2": np.random.uniform(0, 1, nsamples),
+            "chirp_mass": np.random.uniform(1, 20, nsamples)
+        })
+
+    def test_classification_samples(self):
+        """Test that the ClassificationSamples class only projects the
+        required columns and does not copy them
+        """
+        samples = ClassificationSamples.from_samples(self.samples)
+        assert sorted(samples.keys()) == sorted(
+            ["m1_source", "m2_source", "dist", "redshift", "a1", "a2"]
+        )
+        assert len(samples) == 5000
+        assert "chirp_mass" not in samples
+        assert "mass_1_source" in samples
+        assert np.shares_memory(samples["m1_source"], self.samples["mass_1_source"])
+        np.testing.assert_almost_equal(
+            samples["mass_1_source"], self.samples["mass_1_source"]
+        )
+        mask = self.samples["mass_1_source"] > 30
+        reduced = samples[mask]
+        assert isinstance(reduced, ClassificationSamples)
+        assert len(reduced) == np.sum(mask)
+        np.testing.assert_almost_equal(
+            reduced["a2"], self.samples["a_2"][mask]
+        )
+        parameters = self.samples.keys()
+        array = ClassificationSamples.from_samples(
+            self.samples.samples.T, parameters=parameters
+        )
+        np.testing.assert_almost_equal(array["dist"], samples["dist"])
+
+    def test_bootstrap_uncertainty(self):
+        """Test that the bootstrap uncertainty matches the analytic standard
+        error on a fraction
+        """
+        probs = {"BBH": 0.9, "NSBH": 0.1, "BNS": 0., "HasNS": "-"}
+        uncertainty = bootstrap_uncertainty(probs, 10000, nbootstrap=20000)
+        for key in ["BBH", "NSBH"]:
+            np.testing.assert_almost_equal(
+                uncertainty[key], (probs[key] * (1 - probs[key]) / 10000)**0.5,
+                decimal=3
+            )
+        assert uncertainty["BNS"] == 0.
+        assert uncertainty["HasNS"] == "-"
+
+    def test_shared_population_draw(self):
+        """Test that the PEPredicates population classification is computed
+        from a single population draw
+        """
+        pytest.importorskip("pepredicates")
+        from pesummary.gw.pepredicates import PEPredicates
+
+        np.random.seed(987654321)
+        data = classify(self.samples, em_bright=False, nbootstrap=100)
+        np.random.seed(987654321)
+        default, population = PEPredicates.classifications(
+            self.samples.samples.T, self.samples.keys()
+        )
+        assert data["pepredicates"]["default"] == default
+        assert data["pepredicates"]["population"] == population
+        assert "default_uncertainty" in data["pepredicates"].keys()
+
+    def test_missing_parameters(self):
+        """Test that None is returned when classifications cannot be
+        calculated
+        """
+        samples = self.samples.copy()
+        samples.pop("redshift")
+        data = classify(samples)
+        assert data["pepredicates"] is None
+        assert data["em_bright"] is None
+        data = classify_analyses({"one": samples, "two": samples})
+        assert sorted(data.keys()) == ["one", "two"]
+        assert all(value["pepredicates"] is None for value in data.values())
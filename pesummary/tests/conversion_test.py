@@ -928,6 +928,55 @@ class TestNRutils(object):
             ), 8
         )
 
+    def test_NRSur_fit_multi_process(self, monkeypatch):
+        """Test that the NRSurrogate fits are the same when evaluated with
+        multiple processes. The surrogate model is replaced by a cheap
+        deterministic function of the samples
+        """
+        import multiprocessing
+        from pesummary.gw.conversions import nrutils
+
+        if multiprocessing.get_start_method() != "fork":
+            pytest.skip("the patched surrogate model is only shared by fork")
+
+        def _eval_nrfit(mass_1, mass_2, chi_1, chi_2, model, fits, **kwargs):
+            return {
+                "FinalMass": np.array([mass_1 + mass_2]),
+                "FinalSpin": np.array(chi_1) + np.array(chi_2),
+                "RecoilKick": np.array(chi_1) - np.array(chi_2)
+            }
+
+        monkeypatch.setattr(nrutils, "NRSUR_MODULE", True)
+        monkeypatch.setattr(nrutils, "_eval_nrfit", _eval_nrfit, raising=False)
+        monkeypatch.setattr(
+            nrutils, "_eval_nrfit_kwargs", lambda **kwargs: {}
+        )
+        np.random.seed(123)
+        nsamples = 1000
+        samples = [
+            np.random.uniform(20, 50, nsamples),
+            np.random.uniform(5, 20, nsamples),
+            np.random.uniform(0, 1, nsamples),
+            np.random.uniform(0, 1, nsamples),
+            np.random.uniform(0, np.pi, nsamples),
+            np.random.uniform(0, np.pi, nsamples),
+            np.random.uniform(0, 2 * np.pi, nsamples),
+            np.random.uniform(0, 2 * np.pi, nsamples),
+            np.random.uniform(0, np.pi, nsamples),
+            np.random.uniform(0, 2 * np.pi, nsamples)
+        ]
+        fits = ["final_mass", "final_spin", "final_kick"]
+        serial = nrutils.NRSur_fit(*samples, fits=fits, multi_process=1)
+        parallel = nrutils.NRSur_fit(*samples, fits=fits, multi_process=2)
+        assert sorted(serial.keys()) == sorted(parallel.keys()) == sorted(fits)
+        for key in fits:
+            assert len(serial[key]) == nsamples
+            np.testing.assert_almost_equal(serial[key], parallel[key])
+        np.testing.assert_almost_equal(
+            serial["final_mass"], samples[0] + samples[1]
+        )
+        assert not len(nrutils._NRSUR_WORKER)
+
 
 class TestConvert(object):
     """Test the pesummary.gw.conversions._Conversion class
@@ -989,6 +1038,22 @@ class TestConvert(object):
         for param, value in no_checkpoint.items():
             np.testing.assert_almost_equal(value, checkpoint[param])
 
+    def test_return_samples(self):
+        """Check that the posterior table is returned with the correct
+        orientation when a list of parameters and samples is passed
+        """
+        converted = self._convert()
+        parameters = ["mass_1", "mass_2", "spin_1z", "spin_2z"]
+        samples = np.array([converted[param] for param in parameters]).T
+        _parameters, _samples = convert(
+            parameters, samples, return_dict=False
+        )
+        assert _samples.shape == (len(samples), len(_parameters))
+        for param in converted.keys():
+            np.testing.assert_almost_equal(
+                _samples[:, _parameters.index(param)], converted[param]
+            )
+
 
 def test_evolve_angles_forwards():
     """Check that the pesummary.gw.conversions.evolve.evolve_angles_forwards
@@ -1097,6 +1162,57 @@ def test_evolve_angles_forwards():
         np.testing.assert_almost_equal(phi_12_evol, phi_12_evol_true)
 
 
+def test_evolve_angles_forwards_numpy_backend():
+    """Check that the numpy backend for
+    pesummary.gw.conversions.evolve.evolve_angles_forwards agrees with
+    lalsimulation.SimInspiralSpinTaylorPNEvolveOrbit
+    """
+    from pesummary.gw.conversions.evolve import evolve_spins
+    input_data = [
+        (
+            146.41677334700145, 123.72830811599943, 0.4788630899579355,
+            0.4486656607260327, 2.121165143160338, 0.5194005460918241,
+            3.0144238369366736
+        ),
+        (
+            145.60646217583144, 97.70678957171464, 0.418373390477266,
+            0.22414039975174402, 2.2857994587400494, 2.730311388309907,
+            3.47318438014925
+        ),
+        (
+            144.27815417432444, 99.32482850107179, 0.3413842190485782,
+            0.12003981467617035, 2.4429395586527884, 0.9993057630904596,
+            1.422769967575501
+        ),
+        (36., 29., 0.7, 0.6, 1.0, 2.0, 1.0),
+        (10., 1.4, 0.8, 0.5, 1.2, 0.5, 1.0),
+        (10., 5., 0.5, 0., 0.5, 0.5, 0.5),
+    ]
+    samples = [np.array(param) for param in zip(*input_data)]
+    args = samples + [20., 20., "IMRPhenomPv2"]
+    lal = evolve_spins(*args, evolve_limit="ISCO", multi_process=1)
+    numpy = evolve_spins(
+        *args, evolve_limit="ISCO", multi_process=1, backend="numpy",
+        batch_size=4
+    )
+    np.testing.assert_allclose(numpy[0], lal[0], atol=1e-2)
+    np.testing.assert_allclose(numpy[1], lal[1], atol=1e-2)
+    np.testing.assert_allclose(numpy[2], lal[2], atol=5e-2)
+    # spins below the tolerance are not evolved
+    np.testing.assert_almost_equal(
+        evolve_spins(
+            *[np.array([0.]) if num in [2, 3] else param[:1] for num, param
+              in enumerate(samples)], 20., 20., "IMRPhenomPv2",
+            evolve_limit="ISCO", backend="numpy"
+        ), [samples[4][:1], samples[5][:1], samples[6][:1]]
+    )
+    with pytest.raises(ValueError):
+        evolve_spins(
+            *args, evolve_limit="ISCO", backend="numpy",
+            evolution_approximant="SpinTaylorT4"
+        )
+
+
 def test_evolve_angles_backwards():
     """Check that the pesummary.gw.conversions.evolve.evolve_angles_backwards
     function works as expected
@@ -1140,3 +1256,122 @@ def test_evolve_angles_backwards():
             else:
                 np.testing.assert_almost_equal(tilt_1_inf, sample[10], 5)
                 np.testing.assert_almost_equal(tilt_2_inf, sample[11], 5)
+
+
+class TestEOSFamilyCache(object):
+    """Test the pesummary.gw.conversions.tidal.EOSFamilyCache class
+    """
+    @staticmethod
+    def _lambda_from_family(fam, mass):
+        """Analytic stand in for the tidal deformability of a family
+        """
+        return fam * mass**-5
+
+    def setup(self):
+        """Setup the TestEOSFamilyCache class
+        """
+        from pesummary.gw.conversions.tidal import EOSFamilyCache
+
+        def _solve(eos_type, parameters):
+            self.solved.append(tuple(parameters))
+            return {
+                "eos": None, "family": float(np.sum(parameters)),
+                "minimum": 1., "maximum": 2., "log_lambda": None
+            }
+
+        self.solved = []
+        self.cache = EOSFamilyCache(maxsize=2, npoints=200)
+        self.cache._solve = _solve
+
+    def test_lru_eviction(self, monkeypatch):
+        """Test that the least recently used family is evicted when the
+        cache is full
+        """
+        from pesummary.gw.conversions import tidal
+        monkeypatch.setattr(tidal, "_lambda_from_family", self._lambda_from_family)
+        for params in [[1.], [2.], [1.], [3.]]:
+            self.cache.lambdas("piecewise_polytrope", params, [1.5])
+        assert len(self.cache) == 2
+        assert self.cache.misses == 3
+        assert self.cache.hits == 1
+        # [2.] was the least recently used family so it was evicted
+        self.cache.lambdas("piecewise_polytrope", [1.], [1.5])
+        assert self.cache.hits == 2
+        self.cache.lambdas("piecewise_polytrope", [2.], [1.5])
+        assert self.cache.misses == 4
+        assert self.solved == [(1.,), (2.,), (3.,), (2.,)]
+
+    def test_quantised_keys(self, monkeypatch):
+        """Test that equation of state parameters within the tolerance share
+        a family and that the family is solved for the quantised parameters
+        """
+        from pesummary.gw.conversions import tidal
+        monkeypatch.setattr(tidal, "_lambda_from_family", self._lambda_from_family)
+        self.cache.lambdas("spectral_decomposition", [1.001, 2.], [1.5])
+        self.cache.lambdas("spectral_decomposition", [1.002, 2.], [1.5])
+        assert self.cache.misses == 2
+        self.cache.tolerance = 1e-2
+        self.cache.clear()
+        self.solved = []
+        self.cache.lambdas("spectral_decomposition", [1.001, 2.], [1.5])
+        self.cache.lambdas("spectral_decomposition", [1.002, 2.], [1.5])
+        assert self.cache.misses == 1
+        assert self.cache.hits == 1
+        # the tolerance is relative so the quantised parameters lie within
+        # `tolerance` of the requested parameters
+        np.testing.assert_almost_equal(self.solved, [(1., 1.01**70)])
+        np.testing.assert_allclose(self.solved[0], [1.001, 2.], rtol=1e-2)
+        # different equations of state never share a family
+        self.cache.lambdas("piecewise_polytrope", [1.001, 2.], [1.5])
+        assert self.cache.misses == 2
+        # small and negative parameters are quantised on the same relative
+        # scale
+        self.cache.lambdas("spectral_decomposition", [-0.02001, 2.], [1.5])
+        self.cache.lambdas("spectral_decomposition", [-0.02002, 2.], [1.5])
+        self.cache.lambdas("spectral_decomposition", [0.02001, 2.], [1.5])
+        assert self.cache.misses == 4
+        assert self.solved[-1][0] > 0
+
+    def test_per_parameter_tolerance(self, monkeypatch):
+        """Test that a tolerance can be given for each parameter and that a
+        tolerance of 0 keeps the parameter exact
+        """
+        from pesummary.gw.conversions import tidal
+        monkeypatch.setattr(tidal, "_lambda_from_family", self._lambda_from_family)
+        self.cache.tolerance = [1e-2, 0.]
+        self.cache.lambdas("spectral_decomposition", [1.001, 2.], [1.5])
+        self.cache.lambdas("spectral_decomposition", [1.002, 2.], [1.5])
+        assert self.cache.misses == 1
+        np.testing.assert_almost_equal(self.solved, [(1., 2.)])
+        self.cache.lambdas("spectral_decomposition", [1.001, 2.0001], [1.5])
+        assert self.cache.misses == 2
+        np.testing.assert_almost_equal(self.solved[-1], (1., 2.0001))
+
+    def test_in_and_out_of_table_evaluation(self, monkeypatch):
+        """Test that a family is evaluated directly until it is reused and
+        that masses outside of the interpolation table are always evaluated
+        directly
+        """
+        from pesummary.gw.conversions import tidal
+        calls = []
+
+        def _lambda_from_family(fam, mass):
+            calls.append(mass)
+            return self._lambda_from_family(fam, mass)
+
+        monkeypatch.setattr(tidal, "_lambda_from_family", _lambda_from_family)
+        masses = [1.2, 1.7, 2.5]
+        truth = [self._lambda_from_family(3., mass) for mass in masses]
+        lambdas = self.cache.lambdas("piecewise_polytrope", [3.], masses)
+        np.testing.assert_almost_equal(lambdas, truth)
+        assert calls == masses
+        assert self.cache._cache[("piecewise_polytrope", (3.,))]["log_lambda"] is None
+        calls.clear()
+        lambdas = self.cache.lambdas("piecewise_polytrope", [3.], masses)
+        np.testing.assert_allclose(lambdas, truth, rtol=1e-6)
+        # 200 points for the interpolation table and 1 out of table mass
+        assert len(calls) == 201
+        assert calls[-1] == 2.5
+        calls.clear()
+        self.cache.lambdas("piecewise_polytrope", [3.], masses)
+        assert calls == [2.5]
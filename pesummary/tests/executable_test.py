@@ -1521,6 +1521,42 @@ class TestSummarySplit(Base):
             for param in g.keys():
                 assert all(sample in original[param] for sample in g[param])
 
+    @pytest.mark.executabletest
+    def test_split_indexed(self):
+        """Test that a file is successfully split into a single indexed file
+        and that the split matches the N separate files
+        """
+        import json
+        from pesummary.io import read
+        from pesummary.cli.summarysplit import load_split
+        command_line = (
+            "summarysplit --samples .outdir/test.h5 --file_format dat "
+            "--outdir .outdir/split --N_files 7 --multi_process 2"
+        )
+        self.launch(command_line)
+        command_line = (
+            "summarysplit --samples .outdir/test.h5 --indexed "
+            "--outdir .outdir/indexed --N_files 7"
+        )
+        self.launch(command_line)
+        original = read(".outdir/test.h5").samples_dict
+        with open(".outdir/indexed/split_posterior_samples_manifest.json") as f:
+            manifest = json.load(f)
+        assert len(manifest["splits"]) == 7
+        assert manifest["splits"]["6"][1] == original.number_of_samples
+        for num in range(7):
+            split = load_split(".outdir/indexed/split_posterior_samples.h5", num)
+            f = read(".outdir/split/split_posterior_samples_{}.dat".format(num))
+            start, stop = manifest["splits"][str(num)]
+            assert split.number_of_samples == stop - start
+            for param in original.keys():
+                np.testing.assert_almost_equal(
+                    split[param], original[param][start:stop]
+                )
+                np.testing.assert_almost_equal(
+                    split[param], f.samples_dict[param]
+                )
+
     @pytest.mark.executabletest
     def test_split_multi_analysis(self):
         """Test that a file containing multiple analyses is successfully split
@@ -1645,6 +1681,79 @@ class TestSummaryCombine_Posteriors(Base):
             assert all(ss in one[param] for ss in combined[param][:half])
             assert all(ss in two[param] for ss in combined[param][half:])
 
+    @pytest.mark.executabletest
+    def test_combine_stream(self):
+        """Test that the posteriors are combined when the `--stream` option
+        is provided
+        """
+        from pesummary.core.file.stream import StreamingPosterior
+        from pesummary.io import read
+        one = read(".outdir/example3.dat").samples_dict
+        two = read(".outdir/example2.h5").samples_dict
+        streamed = StreamingPosterior(".outdir/example2.h5")
+        assert streamed.nsamples == two.number_of_samples
+        np.testing.assert_almost_equal(
+            streamed.take(parameters=["mass_1"], chunk_size=7)[:, 0],
+            two["mass_1"]
+        )
+        for file_format, extension in zip(["dat", "numpy"], ["dat", "npy"]):
+            command_line = (
+                "summarycombine_posteriors --outdir .outdir --filename "
+                "stream.{} --file_format {} --samples .outdir/example3.dat "
+                ".outdir/example2.h5 --labels one two --weights 0.5 0.5 "
+                "--seed 12345 --stream --chunk_size 13".format(
+                    extension, file_format
+                )
+            )
+            self.launch(command_line)
+            combined = read(".outdir/stream.{}".format(extension)).samples_dict
+            half = int(combined.number_of_samples / 2.)
+            assert combined.number_of_samples == 2 * min(
+                one.number_of_samples, two.number_of_samples
+            )
+            for param in one.keys():
+                assert all(ss in one[param] for ss in combined[param][:half])
+                assert all(ss in two[param] for ss in combined[param][half:])
+                # check that rows have not been mixed
+                ind = np.argwhere(one[param] == combined[param][0])
+                assert combined["mass_1"][0] in one["mass_1"][ind]
+
+    @pytest.mark.executabletest
+    def test_combine_stream_default_filename(self):
+        """Test that a default filename is used when the `--stream` option
+        is provided without `--filename`
+        """
+        import glob
+        from pesummary.io import read
+        for options, extension in zip(["--file_format json", "--shuffle"], ["json", "dat"]):
+            os.makedirs(".outdir/{}".format(extension))
+            command_line = (
+                "summarycombine_posteriors --outdir .outdir/{} {} --samples "
+                ".outdir/example3.dat .outdir/example2.h5 --labels one two "
+                "--seed 12345 --stream".format(extension, options)
+            )
+            self.launch(command_line)
+            _file, = glob.glob(".outdir/{}/pesummary_*.{}".format(extension, extension))
+            assert read(_file).samples_dict.number_of_samples > 0
+
+    @pytest.mark.executabletest
+    def test_combine_stream_unsupported_format(self):
+        """Test that the files are loaded into memory when the `--stream`
+        option is provided for a format that cannot be streamed
+        """
+        from pesummary.core.file.stream import StreamingPosterior
+        from pesummary.io import read
+        with pytest.raises(ValueError):
+            StreamingPosterior(".outdir/example.json")
+        command_line = (
+            "summarycombine_posteriors --outdir .outdir --filename "
+            "stream.dat --samples .outdir/example.json .outdir/example2.h5 "
+            "--labels one two --seed 12345 --stream"
+        )
+        self.launch(command_line)
+        combined = read(".outdir/stream.dat").samples_dict
+        assert combined.number_of_samples > 0
+
     @pytest.mark.executabletest
     def test_combine_metafile_failures(self):
         """Test that errors are raised when incorrect labels are passed when "
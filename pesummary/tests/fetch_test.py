@@ -114,3 +114,188 @@ def test_fetch_open_strain():
     )
     np.testing.assert_almost_equal(data.value, data2.value)
     np.testing.assert_almost_equal(data.times.value, data2.times.value)
+
+
+class TestDownloadCache(object):
+    """Test the `pesummary.core.fetch.DownloadCache` class against a local
+    HTTP server
+    """
+    def setup_method(self):
+        """Setup the TestDownloadCache class
+        """
+        import tempfile
+        import threading
+        from functools import partial
+        from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+        from pesummary.core.fetch import DownloadCache
+
+        self.serve_dir = tempfile.mkdtemp(dir=".")
+        self.cache_dir = tempfile.mkdtemp(dir=".")
+        self.requests = []
+
+        class Handler(SimpleHTTPRequestHandler):
+            def do_GET(handler):
+                self.requests.append(handler.path)
+                return super(Handler, handler).do_GET()
+
+            def log_message(handler, *args):
+                return
+
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), partial(Handler, directory=self.serve_dir)
+        )
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = "http://127.0.0.1:{}".format(self.server.server_address[1])
+        self.cache = DownloadCache(cache_dir=self.cache_dir)
+        np.random.seed(123456789)
+        self.samples = np.random.uniform(0, 1, size=(100, 2))
+        for num in range(4):
+            np.savetxt(
+                os.path.join(self.serve_dir, "samples_{}.dat".format(num)),
+                self.samples + num, header="a b", comments=""
+            )
+
+    def teardown_method(self):
+        """Remove the files and directories created from this class
+        """
+        import shutil
+
+        self.server.shutdown()
+        self.server.server_close()
+        for directory in [self.serve_dir, self.cache_dir]:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def test_cache_hit(self):
+        """Test that a cached url is not downloaded a second time
+        """
+        url = "{}/samples_0.dat".format(self.url)
+        path = self.cache.fetch(url)
+        assert os.path.isfile(path)
+        assert self.cache.fetch(url) == path
+        assert len(self.requests) == 1
+        assert self.cache.hits == 1 and self.cache.misses == 1
+        data = download_and_read_file(url, cache=self.cache)
+        np.testing.assert_almost_equal(
+            np.array(data.samples_dict[["a", "b"]].samples).T, self.samples
+        )
+        assert len(self.requests) == 1
+
+    def test_checksum(self):
+        """Test that a ValueError is raised when the checksum of a downloaded
+        file does not match and that a corrupted cached file is downloaded
+        again
+        """
+        import pytest
+        from pesummary.core.fetch import _sha256
+
+        url = "{}/samples_0.dat".format(self.url)
+        with pytest.raises(ValueError):
+            self.cache.fetch(url, sha256="0" * 64)
+        assert self.cache.lookup(url) is None
+        expected = _sha256(os.path.join(self.serve_dir, "samples_0.dat"))
+        path = self.cache.fetch(url, sha256=expected)
+        with open(path, "a") as f:
+            f.write("1 1\n")
+        assert self.cache.lookup(url) is None
+        path = self.cache.fetch(url)
+        assert _sha256(path) == expected
+        assert len(self.requests) == 3
+
+    def test_download_kwargs(self):
+        """Test that the kwargs accepted by astropy.utils.data.download_file
+        can be passed to a cached download
+        """
+        url = "{}/samples_0.dat".format(self.url)
+        data = download_and_read_file(
+            url, cache=self.cache, download_kwargs={"show_progress": False}
+        )
+        np.testing.assert_almost_equal(
+            np.array(data.samples_dict[["a", "b"]].samples).T, self.samples
+        )
+        url = "{}/samples_1.dat".format(self.url)
+        file_name = download_and_read_file(
+            url, cache=self.cache, read_file=False,
+            download_kwargs={"show_progress": False, "allow_insecure": True}
+        )
+        assert os.path.abspath(file_name).startswith(
+            os.path.abspath(self.cache_dir)
+        )
+        np.testing.assert_almost_equal(
+            np.genfromtxt(file_name, skip_header=1), self.samples + 1
+        )
+        assert len(self.requests) == 2
+
+    def test_verify(self):
+        """Test that a cached file is only re-hashed when its size or
+        modification time has changed or when verify=True
+        """
+        url = "{}/samples_0.dat".format(self.url)
+        path = self.cache.fetch(url)
+        stat = os.stat(path)
+        with open(path, "r+") as f:
+            f.write("A")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert self.cache.lookup(url) == path
+        self.cache.verify = True
+        assert self.cache.lookup(url) is None
+
+    def test_eviction(self):
+        """Test that the least recently used files are removed once the cache
+        exceeds its maximum size
+        """
+        import time
+
+        urls = ["{}/samples_{}.dat".format(self.url, num) for num in range(4)]
+        size = os.path.getsize(os.path.join(self.serve_dir, "samples_0.dat"))
+        self.cache.max_size = 2 * size
+        for url in urls:
+            self.cache.fetch(url)
+            time.sleep(0.01)
+        assert len(self.cache) <= 2
+        assert self.cache.size <= self.cache.max_size
+        assert self.cache.lookup(urls[-1]) is not None
+        assert self.cache.lookup(urls[0]) is None
+
+    def test_fetch_many(self):
+        """Test that multiple urls can be downloaded in parallel
+        """
+        urls = ["{}/samples_{}.dat".format(self.url, num) for num in range(4)]
+        paths = self.cache.fetch_many(urls, multi_process=4)
+        assert len(paths) == 4
+        for num, path in enumerate(paths):
+            np.testing.assert_almost_equal(
+                np.genfromtxt(path, skip_header=1), self.samples + num
+            )
+        assert sorted(self.requests) == sorted(
+            "/samples_{}.dat".format(num) for num in range(4)
+        )
+
+    def test_extract_single_file(self):
+        """Test that a single file can be streamed out of a cached tarball
+        """
+        import tarfile
+        import pytest
+
+        with tarfile.open(os.path.join(self.serve_dir, "samples.tar.gz"), "w:gz") as tar:
+            for num in range(4):
+                tar.add(
+                    os.path.join(self.serve_dir, "samples_{}.dat".format(num)),
+                    arcname="samples/samples_{}.dat".format(num)
+                )
+        url = "{}/samples.tar.gz".format(self.url)
+        data = download_and_read_file(
+            url, cache=self.cache, unpack=True, path="samples_2.dat"
+        )
+        np.testing.assert_almost_equal(
+            np.array(data.samples_dict[["a", "b"]].samples).T, self.samples + 2
+        )
+        file_name = download_and_read_file(
+            url, cache=self.cache, unpack=True, path="samples_2.dat",
+            read_file=False
+        )
+        assert file_name.name == "samples_2.dat"
+        assert len(self.requests) == 1
+        with pytest.raises(ValueError):
+            self.cache.extract(self.cache.lookup(url), "samples_5.dat")
@@ -0,0 +1,163 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import sys
+import subprocess
+import pytest
+from .base import benchmark
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+# Maximum time in seconds that it should take to import the module which
+# provides each console script. These budgets were recorded with ~3x headroom
+# and should only be increased when a new import is unavoidable. As the
+# import time depends on the machine, these budgets are only checked when
+# benchmarks are requested
+IMPORT_TIME_BUDGET = {
+    "summaryclassification": 5.,
+    "summaryclean": 2.,
+    "summarycombine": 1.,
+    "summarycombine_posteriors": 1.5,
+    "summarycompare": 6.,
+    "summarydetchar": 5.,
+    "summaryextract": 1.,
+    "summarygracedb": 0.5,
+    "summaryjscompare": 5.,
+    "summarymodify": 2.,
+    "summarypages": 2.,
+    "summarypageslw": 2.5,
+    "summarypipe": 1.,
+    "summaryplots": 10.,
+    "summarypublication": 7.,
+    "summaryrecreate": 1.5,
+    "summaryreview": 2.5,
+    "summarysplit": 1.,
+    "summarytest": 1.5,
+    "summarytgr": 3.,
+    "summaryversion": 0.5,
+}
+
+# Heavy optional dependencies which should not be imported by the light
+# weight console scripts
+HEAVY_MODULES = [
+    "matplotlib", "astropy", "lalsimulation", "scipy.stats", "gwpy",
+    "pandas", "seaborn", "ligo.skymap"
+]
+LIGHT_SCRIPTS = [
+    "summarycombine", "summarycombine_posteriors", "summaryextract",
+    "summarygracedb", "summarypipe", "summarysplit", "summaryversion"
+]
+
+
+def _import_in_subprocess(module):
+    """Import a module in a fresh interpreter and return the time taken and
+    the list of imported modules
+
+    Parameters
+    ----------
+    module: str
+        name of the module you wish to import
+    """
+    script = (
+        "import sys, time, importlib; t0 = time.time(); "
+        "importlib.import_module('{}'); print(time.time() - t0); "
+        "print(' '.join(sorted(sys.modules.keys())))".format(module)
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", script], stderr=subprocess.DEVNULL
+    ).decode("utf-8").strip().split("\n")
+    return float(output[-2]), output[-1].split()
+
+
+class TestImportTime(object):
+    """Test that the console scripts can be imported within the recorded
+    budget
+    """
+    @benchmark
+    @pytest.mark.parametrize("script", sorted(IMPORT_TIME_BUDGET.keys()))
+    def test_import_time_budget(self, script):
+        """Test that each console script can be imported within its budget.
+        The fastest of 3 imports is used to reduce the sensitivity to load
+        """
+        duration = min(
+            _import_in_subprocess("pesummary.cli.{}".format(script))[0] for
+            _ in range(3)
+        )
+        assert duration < IMPORT_TIME_BUDGET[script], (
+            "Importing pesummary.cli.{} took {:.2f}s which exceeds the budget "
+            "of {:.2f}s".format(script, duration, IMPORT_TIME_BUDGET[script])
+        )
+
+    @pytest.mark.parametrize("script", LIGHT_SCRIPTS)
+    def test_no_heavy_imports(self, script):
+        """Test that the light weight console scripts do not import any heavy
+        optional dependencies
+        """
+        _, modules = _import_in_subprocess("pesummary.cli.{}".format(script))
+        for module in HEAVY_MODULES:
+            assert module not in modules, (
+                "pesummary.cli.{} imports {}".format(script, module)
+            )
+
+
+class TestLazyImport(object):
+    """Test the `pesummary.utils.lazy` module
+    """
+    def test_lazy_import(self):
+        """Test that the lazy_import function only imports a module when an
+        attribute is accessed
+        """
+        import json
+        from pesummary.utils.lazy import lazy_import, LazyModule
+
+        assert lazy_import("json") is json
+        module = lazy_import("pesummary.tests._lazy_test_module_does_not_exist")
+        assert isinstance(module, LazyModule)
+        with pytest.raises(ImportError):
+            module.attribute
+        _, modules = _import_in_subprocess("pesummary.utils.utils")
+        assert "scipy.stats" not in modules
+        assert "h5py" not in modules
+
+    def test_attach(self):
+        """Test that the attach function lazily loads submodules and
+        submodule attributes
+        """
+        from pesummary.utils.lazy import attach
+        import pesummary.gw.conversions as conversions
+
+        __getattr__, __dir__, __all__ = attach(
+            "pesummary.gw.conversions", submodules=["tgr"],
+            submod_attrs={"evolve": ["evolve_spins"]}
+        )
+        assert sorted(__all__) == ["evolve_spins", "tgr"]
+        from pesummary.gw.conversions.evolve import evolve_spins
+        assert __getattr__("evolve_spins") is evolve_spins
+        assert __getattr__("tgr").__name__ == "pesummary.gw.conversions.tgr"
+        assert "tgr" in __dir__()
+        with pytest.raises(AttributeError):
+            __getattr__("random")
+        assert conversions.NRSur_fit.__module__ == (
+            "pesummary.gw.conversions.nrutils"
+        )
+
+    def test_lazy_version(self):
+        """Test that the version information is still available
+        """
+        import pesummary
+
+        assert isinstance(pesummary.__version__, str)
+        assert pesummary.__version__ in pesummary.__version_string__
+        with pytest.raises(AttributeError):
+            pesummary.random
+
+    def test_subfunction_docstring(self):
+        """Test that the docstrings of subfunctions are loaded when requested
+        """
+        from pesummary.utils.samples_dict import SamplesDict
+
+        samples = SamplesDict({"a": [1., 2., 3.]})
+        assert "Subfunctions" in SamplesDict.plot.__doc__
+        assert "pesummary.core.plots.plot._1d_histogram_plot" in (
+            samples.plot.__doc__
+        )
+        assert samples.plot.__name__ == "plot"
@@ -63,6 +63,11 @@ class TestCommandLine(object):
         opts = self.parser.parse_args(["--add_to_existing"])
         assert opts.add_to_existing == True
 
+    def test_incremental(self):
+        assert self.parser.get_default("incremental") == False
+        opts = self.parser.parse_args(["--incremental"])
+        assert opts.incremental == True
+
     def test_approximant(self):
         assert self.parser.get_default("approximant") == None
         opts = self.parser.parse_args(["--approximant", "test"])
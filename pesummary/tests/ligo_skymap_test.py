@@ -64,10 +64,68 @@ def test_ligo_skymap(samples, tmpdir):
     _samples = Table.read(samples)
     fig = gwplot._ligo_skymap_plot(
         _samples["ra"], _samples["dec"], dist=_samples["distance"],
-        savedir=str(tmpdir), label="pesummary"
+        savedir=str(tmpdir), label="pesummary", cache=False
     )
     pesummary_table = Table.read(
         str(tmpdir / 'pesummary_skymap.fits'), format='fits'
     )
     diff = setdiff(table, pesummary_table)
     assert not len(diff)
+
+
+@pytest.mark.ligoskymaptest
+def test_ligo_skymap_cache(samples, tmpdir, monkeypatch):
+    from ligo.skymap import kde
+    from pesummary.gw.file.skymap import SkyMap
+
+    _samples = Table.read(samples)
+    cache_dir = str(tmpdir / "cache")
+    kwargs = dict(
+        dist=_samples["distance"], savedir=str(tmpdir), seed=150914,
+        cache_dir=cache_dir, return_skymap=True
+    )
+    fig, skymap = gwplot._ligo_skymap_plot(
+        _samples["ra"], _samples["dec"], label="first", **kwargs
+    )
+    assert len(os.listdir(cache_dir)) == 1
+    assert os.listdir(cache_dir)[0].endswith(".npz")
+    # the in memory skymap should match the fits file written to disk
+    np.testing.assert_almost_equal(
+        skymap, SkyMap.from_fits(str(tmpdir / "first_skymap.fits"))
+    )
+
+    def refit(*args, **kwargs):
+        raise AssertionError("The skymap should be read from the cache")
+
+    monkeypatch.setattr(kde.Clustered2Plus1DSkyKDE, "__init__", refit)
+    fig, cached = gwplot._ligo_skymap_plot(
+        _samples["ra"], _samples["dec"], label="second", **kwargs
+    )
+    np.testing.assert_almost_equal(skymap, cached)
+    diff = setdiff(
+        Table.read(str(tmpdir / "first_skymap.fits"), format="fits"),
+        Table.read(str(tmpdir / "second_skymap.fits"), format="fits")
+    )
+    assert not len(diff)
+
+
+def test_ligo_skymap_cache_eviction(tmpdir):
+    from pesummary.gw.file.skymap import (
+        read_cached_skymap, write_cached_skymap
+    )
+
+    cache_dir = str(tmpdir / "cache")
+    hpmap = Table(
+        {"UNIQ": np.arange(1000), "PROBDENSITY": np.ones(1000) / u.sr},
+        meta={"creator": "pesummary", "distmean": np.float64(100.)}
+    )
+    write_cached_skymap("one", hpmap, cache_dir=cache_dir)
+    cached = read_cached_skymap("one", cache_dir=cache_dir)
+    np.testing.assert_almost_equal(cached["PROBDENSITY"], hpmap["PROBDENSITY"])
+    assert cached["PROBDENSITY"].unit == u.sr**-1
+    assert cached.meta["distmean"] == 100.
+    size = os.path.getsize(os.path.join(cache_dir, "one.npz"))
+    for key in ["two", "three"]:
+        write_cached_skymap(key, hpmap, cache_dir=cache_dir, max_size=2 * size)
+    assert sorted(os.listdir(cache_dir)) == ["three.npz", "two.npz"]
+    assert read_cached_skymap("one", cache_dir=cache_dir) is None
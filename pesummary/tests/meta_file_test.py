@@ -502,3 +502,133 @@ class TestMetaFile(object):
             else:
                 for num, i in enumerate(list(self.input_injection["EXP1"].keys())):
                     assert self.input_injection["EXP1"][i] == data["EXP1"]["injection_data"][i]
+
+    def test_incremental(self):
+        """Test that new analyses are appended to an existing hdf5 metafile
+        in place when incremental=True
+        """
+        path = "{}/samples/posterior_samples.h5".format(tmpdir_main)
+        original = self.hdf5_file["EXP1"]["posterior_samples"][()]
+        creation_time = self.hdf5_file["history"]["gps_creation_time"][()]
+        self.hdf5_file.close()
+        labels = ["EXP1", "EXP2"]
+        samples = {
+            "EXP1": self.input_data["EXP1"],
+            "EXP2": SamplesDict(
+                self.input_parameters,
+                np.array([np.random.random(10) for i in range(15)])
+            )
+        }
+        object = _GWMetaFile(
+            samples, labels, self.input_config * 2,
+            {label: self.input_injection["EXP1"] for label in labels},
+            {label: "3.0" for label in labels},
+            {label: self.input_file_kwargs["EXP1"] for label in labels},
+            webdir=tmpdir_main, hdf5=True, result_files=[None, None],
+            psd={label: self.psds["EXP1"] for label in labels},
+            calibration={label: self.calibration["EXP1"] for label in labels},
+            existing_label=["EXP1"], existing_config=self.input_config,
+            existing=tmpdir_main, existing_metafile=path, incremental=True
+        )
+        assert object.append_to_existing
+        assert object.labels_to_write == ["EXP2"]
+        object.make_dictionary()
+        assert sorted(object.data.keys()) == ["EXP2"]
+        object.save_to_hdf5(
+            object.data, object.labels_to_write, object.samples,
+            object.meta_file, mode="a"
+        )
+        self.hdf5_file = h5py.File(path, "r")
+        assert sorted(list(self.hdf5_file.keys())) == sorted(
+            labels + ["version", "history"]
+        )
+        np.testing.assert_almost_equal(
+            self.hdf5_file["history"]["gps_creation_time"][()], creation_time
+        )
+        for param in original.dtype.names:
+            np.testing.assert_almost_equal(
+                self.hdf5_file["EXP1"]["posterior_samples"][param],
+                original[param]
+            )
+        for param in self.input_parameters:
+            np.testing.assert_almost_equal(
+                self.hdf5_file["EXP2"]["posterior_samples"][param],
+                samples["EXP2"][param]
+            )
+
+    def test_summary(self):
+        """Test that the maximum likelihood samples and classification
+        probabilities are stored in the metafile and can be read back when
+        incrementally adding to an existing webpage
+        """
+        from types import SimpleNamespace
+        from pesummary.io import read
+        from pesummary.utils.utils import _stored_summary
+
+        summary = {"EXP1": {
+            "maxL": {"mass_1": 10.}, "pepredicates": {
+                "default": {"BBH": 0.9, "BNS": 0.1}
+            }
+        }}
+        for hdf5 in [False, True]:
+            object = _GWMetaFile(
+                self.input_data, self.input_labels, self.input_config,
+                self.input_injection, self.input_file_version,
+                self.input_file_kwargs, webdir=tmpdir_main, psd=self.psds,
+                calibration=self.calibration, hdf5=hdf5, summary=summary
+            )
+            object.make_dictionary()
+            assert "summary" not in self.input_file_kwargs["EXP1"].keys()
+            if hdf5:
+                self.hdf5_file.close()
+                object.save_to_hdf5(
+                    object.data, object.labels, object.samples,
+                    object.meta_file
+                )
+                self.hdf5_file = h5py.File(object.meta_file, "r")
+            else:
+                object.save_to_json(object.data, object.meta_file)
+            f = read(object.meta_file)
+            namespace = SimpleNamespace(
+                existing_file_kwargs={"EXP1": f.extra_kwargs[0]}
+            )
+            for key, value in summary["EXP1"].items():
+                assert _stored_summary(namespace, "EXP1", key) == value
+            assert _stored_summary(namespace, "EXP1", "pastro") is None
+
+    def test_summary_missing(self):
+        """Test that metafiles which do not store the summary statistics can
+        still be read and that the summary statistics are then recomputed
+        """
+        from types import SimpleNamespace
+        from pesummary.io import read
+        from pesummary.utils.utils import _stored_summary
+
+        for hdf5 in [False, True]:
+            object = _GWMetaFile(
+                self.input_data, self.input_labels, self.input_config,
+                self.input_injection, self.input_file_version,
+                self.input_file_kwargs, webdir=tmpdir_main, psd=self.psds,
+                calibration=self.calibration, hdf5=hdf5
+            )
+            object.make_dictionary()
+            if hdf5:
+                self.hdf5_file.close()
+                object.save_to_hdf5(
+                    object.data, object.labels, object.samples,
+                    object.meta_file
+                )
+                self.hdf5_file = h5py.File(object.meta_file, "r")
+            else:
+                object.save_to_json(object.data, object.meta_file)
+            f = read(object.meta_file)
+            assert f.labels == ["EXP1"]
+            assert "summary" not in f.extra_kwargs[0].keys()
+            np.testing.assert_almost_equal(
+                f.samples_dict["EXP1"]["mass_1"], self.samples[0]
+            )
+            namespace = SimpleNamespace(
+                existing_file_kwargs={"EXP1": f.extra_kwargs[0]}
+            )
+            for key in ["maxL", "pepredicates", "pastro"]:
+                assert _stored_summary(namespace, "EXP1", key) is None
@@ -314,6 +314,41 @@ class TestPlot(object):
         assert isinstance(fig, matplotlib.figure.Figure) == True
 
 
+class TestThumbnails(object):
+    """Class to test the `pesummary.core.plots.thumbnails` module
+    """
+    def setup(self):
+        if os.path.isdir(tmpdir):
+            shutil.rmtree(tmpdir)
+        os.makedirs(tmpdir)
+
+    def teardown(self):
+        if os.path.isdir(tmpdir):
+            shutil.rmtree(tmpdir)
+
+    def test_make_thumbnails(self):
+        """Test that thumbnails are generated and the dimensions of each
+        image are recorded
+        """
+        from PIL import Image
+        from pesummary.core.plots.thumbnails import (
+            make_thumbnails, read_image_dimensions, thumbnail_path
+        )
+
+        Image.new("RGB", (1800, 1200)).save(os.path.join(tmpdir, "one.png"))
+        Image.new("RGB", (300, 300)).save(os.path.join(tmpdir, "two.png"))
+        dimensions = make_thumbnails(tmpdir, width=450)
+        assert sorted(dimensions.keys()) == ["one.png", "two.png"]
+        assert dimensions["one.png"]["width"] == 1800
+        assert dimensions["one.png"]["height"] == 1200
+        assert dimensions["one.png"]["thumbnail_width"] == 450
+        assert dimensions["one.png"]["thumbnail_height"] == 300
+        assert dimensions["two.png"]["thumbnail_width"] == 300
+        with Image.open(thumbnail_path(os.path.join(tmpdir, "one.png"))) as f:
+            assert f.size == (450, 300)
+        assert read_image_dimensions(tmpdir) == dimensions
+
+
 class TestPopulation(object):
     """Class to test the `pesummary.core.plot.population` module
     """
@@ -430,3 +465,140 @@ class TestPublication(object):
             linestyles=["-", "--"], percentiles=[5, 95]
         )
         assert isinstance(fig, matplotlib.figure.Figure)
+
+
+def _scheduled_job(value, multi_threading_for_skymap=1):
+    """Function used to test the SkymapScheduler
+    """
+    import time
+
+    time.sleep(0.1)
+    if value < 0:
+        raise ValueError("negative value")
+    return value ** 2, multi_threading_for_skymap
+
+
+class TestSkymapScheduler(object):
+    """Class to test the pesummary.gw.plots.scheduler.SkymapScheduler class
+    """
+    def test_allocation(self):
+        """Test that the CPU budget is never exceeded
+        """
+        from pesummary.gw.plots.scheduler import SkymapScheduler
+
+        scheduler = SkymapScheduler(cpu_budget=16, njobs=10)
+        assert scheduler.concurrency == 10
+        assert scheduler.threads == [2] * 6 + [1] * 4
+        scheduler = SkymapScheduler(cpu_budget=4, njobs=10)
+        assert scheduler.concurrency == 4
+        assert scheduler.threads == [1] * 10
+        scheduler = SkymapScheduler(cpu_budget=8, njobs=2)
+        assert scheduler.threads == [4, 4]
+        scheduler = SkymapScheduler(
+            cpu_budget=8, njobs=2, max_threads_per_job=3
+        )
+        assert scheduler.threads == [3, 3]
+        for budget in range(1, 20):
+            for njobs in range(1, 12):
+                scheduler = SkymapScheduler(cpu_budget=budget, njobs=njobs)
+                threads = scheduler.threads
+                assert len(threads) == njobs
+                assert min(threads) >= 1
+                for num in range(0, njobs, scheduler.concurrency):
+                    assert sum(
+                        threads[num:num + scheduler.concurrency]
+                    ) <= max(budget, 1)
+
+    def test_results(self):
+        """Test that the results and failures are returned to the parent
+        process
+        """
+        from pesummary.gw.plots.scheduler import SkymapScheduler
+
+        scheduler = SkymapScheduler(cpu_budget=3, njobs=4)
+        for num, value in enumerate([1, 2, -1, 4]):
+            scheduler.submit("label_{}".format(num), _scheduled_job, value)
+        results = scheduler.wait()
+        assert sorted(results.keys()) == ["label_0", "label_1", "label_3"]
+        assert results["label_0"] == (1, 1)
+        assert results["label_3"] == (16, 1)
+        assert list(scheduler.failures.keys()) == ["label_2"]
+        assert "negative value" in scheduler.failures["label_2"]
+        with pytest.raises(RuntimeError):
+            scheduler.submit("label_4", _scheduled_job, 5)
+        scheduler = SkymapScheduler(cpu_budget=4, njobs=2)
+        scheduler.submit("a", _scheduled_job, 3)
+        scheduler.submit("b", _scheduled_job, 3)
+        assert scheduler.wait() == {"a": (9, 2), "b": (9, 2)}
+
+
+class TestInteractive(object):
+    """Class to test the pesummary.core.plots.interactive module
+    """
+    def setup(self):
+        if os.path.isdir(tmpdir):
+            shutil.rmtree(tmpdir)
+        os.makedirs(tmpdir)
+
+    def teardown(self):
+        if os.path.isdir(tmpdir):
+            shutil.rmtree(tmpdir)
+
+    def test_downsample(self):
+        """Test that the downsampled samples respect the point budget and keep
+        the tails of each dimension
+        """
+        from pesummary.core.plots.interactive import downsample
+
+        samples = np.random.normal(size=(3, 10000))
+        indices = downsample(samples, npoints=500)
+        assert len(indices) == 500
+        assert len(np.unique(indices)) == 500
+        for dim in samples:
+            assert np.argmin(dim) in indices
+            assert np.argmax(dim) in indices
+        np.testing.assert_equal(
+            downsample(samples[:, :100], npoints=500), np.arange(100)
+        )
+
+    def test_payload(self):
+        """Test that the samples are stored once in a shared payload rather
+        than being embedded in each interactive plot
+        """
+        import base64
+        import json
+        from pesummary.core.plots import interactive
+
+        samples = {
+            "a": np.random.normal(size=5000),
+            "geocent_time": 1187008882.4 + np.random.normal(0, 0.01, 5000)
+        }
+        payload = os.path.join(tmpdir, "payload.js")
+        interactive.write_payload(samples, "label", payload, npoints=200)
+        with open(payload, "r") as f:
+            data = json.loads(
+                f.read().split("window.PESUMMARY_SAMPLES[\"label\"] = ")[1][:-2]
+            )
+        assert data["nsamples"] == 200
+        for param, value in samples.items():
+            decoded = data["offset"][param] + np.frombuffer(
+                base64.b64decode(data["data"][param]), dtype="<f4"
+            ).astype(np.float64)
+            np.testing.assert_almost_equal(
+                np.max(decoded), np.max(value), decimal=5
+            )
+            assert all(np.min(np.abs(value - _)) < 1e-5 for _ in decoded)
+        filename = os.path.join(tmpdir, "corner.html")
+        interactive.corner(
+            list(samples.values()), ["a", "b"], write_to_html_file=filename,
+            payload=dict(src="payload.js", label="label", parameters=["a"])
+        )
+        with open(filename, "r") as f:
+            html = f.read()
+        assert "<script src='payload.js'></script>" in html
+        assert "dimensions.0.values" in html
+        embedded = os.path.join(tmpdir, "embedded.html")
+        interactive.corner(
+            list(samples.values()), ["a", "b"], write_to_html_file=embedded
+        )
+        assert os.path.getsize(filename) < os.path.getsize(embedded) / 10.
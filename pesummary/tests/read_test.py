@@ -3,8 +3,9 @@
 import os
 import shutil
 import numpy as np
+import pytest
 
-from .base import make_result_file, testing_dir
+from .base import make_result_file, testing_dir, benchmark
 import pesummary
 from pesummary.gw.file.read import read as GWRead
 from pesummary.core.file.read import read as Read
@@ -2164,3 +2165,296 @@ def test_add_log_likelihood():
     )
     if os.path.isdir(tmpdir):
         shutil.rmtree(tmpdir)
+
+
+def test_checkpoint_log():
+    """Test that an append-only checkpoint file is replayed correctly and
+    that an incomplete final record is ignored
+    """
+    from pesummary.core.file.formats.checkpoint import (
+        write_checkpoint, append_to_checkpoint, is_checkpoint_log
+    )
+    from pesummary.gw.conversions import _PickledConversion
+
+    if not os.path.isdir(tmpdir):
+        os.mkdir(tmpdir)
+    path = "{}/checkpoint.pickle".format(tmpdir)
+    state = _PickledConversion()
+    state.parameters = ["a", "b"]
+    state.samples = list(np.random.uniform(0, 1, (2, 100)))
+    state.columnar = True
+    write_checkpoint(state, path)
+    assert is_checkpoint_log(path)
+    c = np.random.uniform(0, 1, 100)
+    append_to_checkpoint(path, "_append_column", "c", c)
+    append_to_checkpoint(path, "_replace_column", "a", 2 * c)
+    append_to_checkpoint(path, "_remove_column", "b")
+    append_to_checkpoint(path, "_remove_samples", np.array([0, 99]))
+    f = read(path, checkpoint=True)
+    assert f.parameters == ["a", "c"]
+    assert len(f.samples) == 2
+    np.testing.assert_almost_equal(f.samples[0], 2 * c[1:99])
+    np.testing.assert_almost_equal(f.samples[1], c[1:99])
+    # simulate a write which was interrupted part way through a record
+    append_to_checkpoint(path, "_append_column", "d", c)
+    with open(path, "rb+") as _f:
+        _f.truncate(os.path.getsize(path) - 10)
+    f = read(path, checkpoint=True)
+    assert f.parameters == ["a", "c"]
+    # check that checkpoint files written as a single pickle can be read
+    write(state, file_format="pickle", filename="old.pickle", outdir=tmpdir)
+    f = read("{}/old.pickle".format(tmpdir), checkpoint=True)
+    assert f.parameters == ["a", "b"]
+    if os.path.isdir(tmpdir):
+        shutil.rmtree(tmpdir)
+
+
+def test_columnar_samples():
+    """Test that samples are stored as a columnar 2d array
+    """
+    from pesummary.core.file.formats.base_read import (
+        _columnar_samples, _append_columns
+    )
+    columns = {"a": np.arange(10.), "b": np.arange(10.) ** 2}
+    parameters, samples = _columnar_samples(None, columns)
+    assert parameters == ["a", "b"]
+    assert isinstance(samples, np.ndarray)
+    assert samples.shape == (10, 2)
+    assert samples.flags["F_CONTIGUOUS"]
+    np.testing.assert_almost_equal(samples[:, 1], columns["b"])
+    parameters, samples = _columnar_samples(["b", "a"], columns)
+    np.testing.assert_almost_equal(samples[:, 0], columns["b"])
+    samples = _append_columns(samples, [0., np.ones(10)])
+    assert samples.shape == (10, 4)
+    np.testing.assert_almost_equal(samples[:, 2], np.zeros(10))
+    if not os.path.isdir(tmpdir):
+        os.makedirs(tmpdir)
+    write(["a", "b"], np.array([columns["a"], columns["b"]]).T, outdir=tmpdir,
+          filename="columnar.json", file_format="json")
+    f = read(os.path.join(tmpdir, "columnar.json"))
+    assert isinstance(f.samples, np.ndarray)
+    np.testing.assert_almost_equal(f.samples_dict["b"], columns["b"])
+
+
+class TestChunkedTextReader(object):
+    """Test the chunked text reader used for dat, txt and csv files
+    """
+    def setup_method(self):
+        """Setup the TestChunkedTextReader class
+        """
+        if not os.path.isdir(tmpdir):
+            os.makedirs(tmpdir)
+        self.parameters = ["a", "b", "c", "d"]
+        self.samples = np.random.normal(size=(5000, 4))
+        for ext, delimiter in zip(["dat", "csv"], ["\t", ","]):
+            np.savetxt(
+                os.path.join(tmpdir, "chunked.{}".format(ext)), self.samples,
+                delimiter=delimiter, header=delimiter.join(self.parameters),
+                comments=""
+            )
+
+    def test_matches_genfromtxt(self):
+        """Test that the chunked reader returns the same samples as
+        np.genfromtxt regardless of the number of chunks and threads
+        """
+        from pesummary.core.file.formats.dat import read_text_columns
+        from pesummary.core.file.formats.numpy import genfromtxt
+
+        for ext, delimiter in zip(["dat", "csv"], [None, ","]):
+            path = os.path.join(tmpdir, "chunked.{}".format(ext))
+            _parameters, _samples = genfromtxt(
+                path, delimiter=delimiter, names=True
+            )
+            for nthreads, chunk_bytes in zip([1, 4], [2**26, 10000]):
+                parameters, samples = read_text_columns(
+                    path, delimiter=delimiter, nthreads=nthreads,
+                    chunk_bytes=chunk_bytes
+                )
+                assert parameters == _parameters == self.parameters
+                assert samples.flags["F_CONTIGUOUS"]
+                np.testing.assert_array_equal(samples, _samples)
+
+    def test_fallback(self):
+        """Test that malformed files are read with np.genfromtxt
+        """
+        from pesummary.core.file.formats.dat import read_text_columns, read_dat
+
+        path = os.path.join(tmpdir, "malformed.dat")
+        with open(path, "w") as f:
+            f.write("# a b\n1 2\n# comment\n\n3 4\n")
+        with pytest.raises(ValueError):
+            read_text_columns(path)
+        parameters, samples = read_dat(path)
+        assert parameters == ["a", "b"]
+        np.testing.assert_array_equal(samples, [[1., 2.], [3., 4.]])
+        # ragged rows must not be reshaped even if the total number of
+        # values is a multiple of the number of parameters
+        with open(path, "w") as f:
+            f.write("a b\n1 2 3\n4\n")
+        with pytest.raises(ValueError):
+            read_text_columns(path)
+        with pytest.raises(ValueError):
+            read_text_columns(path, nthreads=1)
+
+    def test_nthreads(self, monkeypatch):
+        """Test that the number of threads is passed from read to the chunked
+        reader
+        """
+        from pesummary.core.file.formats import dat
+
+        calls = []
+        read_text_columns = dat.read_text_columns
+
+        def _read_text_columns(*args, **kwargs):
+            calls.append(kwargs["nthreads"])
+            return read_text_columns(*args, **kwargs)
+
+        monkeypatch.setattr(dat, "read_text_columns", _read_text_columns)
+        for ext in ["dat", "csv"]:
+            f = read(os.path.join(tmpdir, "chunked.{}".format(ext)), nthreads=2)
+            np.testing.assert_almost_equal(
+                f.samples_dict["a"], self.samples[:, 0]
+            )
+        assert calls == [2, 2]
+
+    @benchmark
+    def test_benchmark(self):
+        """Benchmark the throughput of the chunked reader against
+        np.genfromtxt
+        """
+        import time
+        from pesummary.core.file.formats.dat import read_text_columns
+        from pesummary.core.file.formats.numpy import genfromtxt
+
+        path = os.path.join(tmpdir, "benchmark.dat")
+        np.savetxt(
+            path, np.random.normal(size=(100000, 10)), comments="",
+            header=" ".join(["p{}".format(num) for num in range(10)])
+        )
+        size = os.path.getsize(path) / 1024 ** 2
+        throughput = {}
+        for label, function in zip(
+                ["chunked", "genfromtxt"],
+                [read_text_columns, lambda path: genfromtxt(path, names=True)]
+        ):
+            t0 = time.time()
+            function(path)
+            throughput[label] = size / (time.time() - t0)
+        assert throughput["chunked"] > throughput["genfromtxt"], (
+            "chunked: {chunked:.1f} MB/s, genfromtxt: {genfromtxt:.1f} "
+            "MB/s".format(**throughput)
+        )
+
+
+def test_prior_sample_cache():
+    """Test that prior samples are only drawn for the requested parameters
+    and are reused for the same prior, number of samples and seed
+    """
+    from bilby.core.prior import PriorDict, Uniform, Constraint
+    from pesummary.core.file.formats.bilby import PriorSampleCache
+
+    def make_prior():
+        return PriorDict({
+            "a": Uniform(0, 1, "a"), "b": Uniform(0, 2, "b"), "c": 1.5
+        })
+
+    cache_dir = os.path.join(tmpdir, "prior_cache")
+    cache = PriorSampleCache(cache_dir=cache_dir)
+    samples = cache.sample(make_prior(), 100, parameters=["a", "c"], seed=1)
+    assert sorted(samples.keys()) == ["a", "c"]
+    assert (cache.hits, cache.misses) == (0, 2)
+    _samples = cache.sample(make_prior(), 100, seed=1)
+    assert sorted(_samples.keys()) == ["a", "b", "c"]
+    assert (cache.hits, cache.misses) == (2, 3)
+    np.testing.assert_almost_equal(samples["a"], _samples["a"])
+    np.testing.assert_almost_equal(_samples["c"], 1.5 * np.ones(100))
+    # a new cache should read the draws from disk
+    cache = PriorSampleCache(cache_dir=cache_dir)
+    __samples = cache.sample(make_prior(), 100, seed=1)
+    assert (cache.hits, cache.misses) == (3, 0)
+    np.testing.assert_almost_equal(__samples["b"], _samples["b"])
+    different = cache.sample(make_prior(), 100, seed=2)
+    assert not np.allclose(different["a"], _samples["a"])
+    assert len(cache) == 2
+    # priors with constraints are drawn jointly
+    prior = make_prior()
+    prior["d"] = Constraint(0, 1)
+    prior.conversion_function = lambda sample: dict(
+        sample, d=sample["a"] + sample["b"]
+    )
+    constrained = cache.sample(prior, 100, parameters=["a", "b"], seed=1)
+    assert np.all(constrained["a"] + constrained["b"] <= 1)
+
+
+def test_prior_sample_cache_shared_draws():
+    """Test that requests for different numbers of samples share a draw and
+    that the disk cache is bounded in size
+    """
+    from bilby.core.prior import PriorDict, Uniform
+    from pesummary.core.file.formats.bilby import PriorSampleCache
+
+    def make_prior(maximum=1):
+        return PriorDict({"a": Uniform(0, maximum, "a")})
+
+    cache_dir = os.path.join(tmpdir, "prior_cache_shared")
+    cache = PriorSampleCache(cache_dir=cache_dir, ndraws=1000)
+    samples = cache.sample(make_prior(), 100)
+    _samples = cache.sample(make_prior(), 200)
+    assert len(samples["a"]) == 100 and len(_samples["a"]) == 200
+    assert (cache.hits, cache.misses) == (1, 1)
+    np.testing.assert_almost_equal(samples["a"], _samples["a"][:100])
+    # editing the returned samples does not change the cache
+    samples["a"][:] = -1.
+    assert np.all(cache.sample(make_prior(), 100)["a"] >= 0)
+    # requests for more than ndraws samples draw a larger block
+    assert len(cache.sample(make_prior(), 1500)["a"]) == 1500
+    assert cache.misses == 2
+    # the least recently used draws are removed from disk
+    cache = PriorSampleCache(
+        cache_dir=cache_dir, ndraws=1000, max_size=3 * 8 * 1000
+    )
+    for maximum in range(2, 6):
+        cache.sample(make_prior(maximum=maximum), 100)
+    assert len(os.listdir(cache_dir)) <= 3
+    assert os.path.isdir(
+        os.path.join(cache_dir, cache.key(make_prior(maximum=5), 1000))
+    )
+
+
+def test_prior_sample_cache_key():
+    """Test that the prior sample cache key depends on the full prior
+    definition
+    """
+    from bilby.core.prior import PriorDict, Interped, FromFile, Uniform
+    from pesummary.core.file.formats.bilby import PriorSampleCache
+
+    xx = np.linspace(0, 1, 2000)
+    yy = np.ones_like(xx)
+    _yy = yy.copy()
+    _yy[1000] = 2.
+    one = PriorDict({"a": Interped(xx, yy, name="a")})
+    two = PriorDict({"a": Interped(xx, _yy, name="a")})
+    # numpy summarises long arrays in their repr
+    assert repr(one["a"]) == repr(two["a"])
+    assert PriorSampleCache.key(one, 100) != PriorSampleCache.key(two, 100)
+    # priors read from file depend on the contents of the file
+    path = os.path.join(tmpdir, "prior_cache_key.txt")
+    np.savetxt(path, np.array([xx, yy]).T)
+    key = PriorSampleCache.key(PriorDict({"a": FromFile(path, name="a")}), 100)
+    np.savetxt(path, np.array([xx, _yy]).T)
+    assert key != PriorSampleCache.key(
+        PriorDict({"a": FromFile(path, name="a")}), 100
+    )
+    # the conversion function is part of the key
+
+    def conversion_function(sample):
+        return sample
+
+    three = PriorDict({"a": Uniform(0, 1, "a")})
+    four = PriorDict(
+        {"a": Uniform(0, 1, "a")}, conversion_function=conversion_function
+    )
+    assert PriorSampleCache.key(three, 100) != PriorSampleCache.key(four, 100)
+    assert PriorSampleCache.key(three, 100) == PriorSampleCache.key(
+        PriorDict({"a": Uniform(0, 1, "a")}), 100
+    )
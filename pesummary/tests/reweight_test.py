@@ -2,7 +2,10 @@
 
 import pytest
 import numpy as np
-from ..core.reweight import rejection_sampling
+from ..core.reweight import (
+    rejection_sampling, importance_sampling, effective_sample_size,
+    apply_weights
+)
 from ..gw.reweight import uniform_in_comoving_volume_from_uniform_in_volume
 from ..utils.samples_dict import SamplesDict
 from .base import gw_parameters
@@ -87,3 +90,69 @@ def test_uniform_in_comoving_volume_from_uniform_in_volume():
         new_samples = uniform_in_comoving_volume_from_uniform_in_volume(
             original_samples
         )
+
+
+def test_importance_sampling():
+    """Test that the pesummary.core.reweight.importance_sampling function
+    works as expected
+    """
+    original_samples = SamplesDict(
+        {param: np.random.uniform(0, 10, n_samples) for param in gw_parameters()}
+    )
+    weights = np.random.uniform(0, 5, n_samples)
+    new_samples = importance_sampling(original_samples, weights)
+    # no samples should be discarded
+    assert new_samples.number_of_samples == original_samples.number_of_samples
+    for param in original_samples.keys():
+        np.testing.assert_almost_equal(new_samples[param], original_samples[param])
+        np.testing.assert_almost_equal(
+            new_samples[param].weights, weights / np.max(weights)
+        )
+    np.testing.assert_almost_equal(
+        new_samples.effective_sample_size, effective_sample_size(weights)
+    )
+    assert new_samples.effective_sample_size < new_samples.number_of_samples
+    # weighted summary statistics should use the importance weights
+    np.testing.assert_almost_equal(
+        new_samples["mass_1"].average(type="mean"),
+        np.average(original_samples["mass_1"], weights=weights)
+    )
+    # reweighting weighted samples should multiply the weights
+    _weights = np.random.uniform(0, 5, n_samples)
+    reweighted = importance_sampling(new_samples, _weights)
+    assert reweighted.parameters.count("weights") == 1
+    np.testing.assert_almost_equal(
+        reweighted["weights"],
+        weights * _weights / np.max(weights * _weights)
+    )
+    # resampling should only happen when explicitly requested
+    resampled = new_samples.resample()
+    assert "weights" not in resampled.keys()
+    assert resampled.number_of_samples <= original_samples.number_of_samples
+    assert resampled[resampled.parameters[0]].weights is None
+
+
+def test_reweight_mode():
+    """Test that the pesummary.utils.samples_dict.SamplesDict.reweight method
+    attaches weights rather than discarding samples when mode='weights'
+    """
+    original_samples = SamplesDict(
+        {param: np.random.uniform(0, 10, n_samples) for param in gw_parameters()}
+    )
+
+    def function(samples, mode="rejection"):
+        return apply_weights(samples, samples["luminosity_distance"], mode=mode)
+
+    new_samples = original_samples.reweight(function, mode="weights")
+    assert new_samples.number_of_samples == original_samples.number_of_samples
+    assert "weights" in new_samples.keys()
+    assert not any("_non_reweighted" in key for key in new_samples.keys())
+    np.testing.assert_almost_equal(
+        new_samples["luminosity_distance"],
+        original_samples["luminosity_distance"]
+    )
+    new_samples = original_samples.reweight(function)
+    assert new_samples.number_of_samples <= original_samples.number_of_samples
+    assert "weights" not in new_samples.keys()
+    with pytest.raises(ValueError):
+        apply_weights(original_samples, np.ones(n_samples), mode="unknown")
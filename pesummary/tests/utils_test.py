@@ -339,6 +339,62 @@ class TestSamplesDict(object):
         remove = dataset.pop("a")
         assert list(dataset.keys()) == ["b"]
 
+    def test_backing_store(self):
+        """Test that the samples are stored in a single growable array and
+        each parameter is a view of the stored samples
+        """
+        dataset = SamplesDict(self.parameters, self.samples)
+        for num in range(20):
+            dataset["c{}".format(num)] = np.random.uniform(0, 1, 100)
+            assert dataset.samples.shape == (num + 3, 100)
+        for param in dataset.keys():
+            assert np.shares_memory(dataset[param], dataset.samples)
+        np.testing.assert_almost_equal(dataset.samples[0], self.samples[0])
+        np.testing.assert_almost_equal(dataset["c4"], dataset.samples[6])
+        assert dataset["c4"].maximum == np.max(dataset["c4"])
+        # replacing a parameter updates the stored samples
+        dataset["a"] = np.zeros(100)
+        np.testing.assert_almost_equal(dataset.samples[0], np.zeros(100))
+        # slicing returns a view and masking returns the selected samples
+        sliced = dataset[10:20]
+        assert sliced.number_of_samples == 10
+        assert np.shares_memory(sliced["b"], dataset["b"])
+        np.testing.assert_almost_equal(sliced["b"], dataset["b"][10:20])
+        mask = dataset["b"] > np.median(dataset["b"])
+        masked = dataset[mask]
+        np.testing.assert_almost_equal(masked["c1"], dataset["c1"][mask])
+        # structured array contains the same samples
+        structured = dataset.to_structured_array()
+        assert list(structured.dtype.names) == list(dataset.keys())
+        for param in dataset.keys():
+            np.testing.assert_almost_equal(structured[param], dataset[param])
+        # samples read from a file are normally stored as (samples x
+        # parameters) and the structured array is then a zero-copy view
+        table = np.ascontiguousarray(np.array(self.samples).T)
+        dataset = SamplesDict(self.parameters, table.T)
+        structured = dataset.to_structured_array()
+        assert np.shares_memory(structured, dataset.samples)
+
+    def test_pop_backing_store(self):
+        """Test that the remaining parameters are views of the stored samples
+        after a parameter is removed
+        """
+        samples = np.random.uniform(0, 1, (3, 100))
+        dataset = SamplesDict(["a", "b", "c"], samples)
+        dataset.pop("b")
+        assert dataset.samples.shape == (2, 100)
+        np.testing.assert_almost_equal(dataset["c"], samples[2])
+        assert dataset["c"].maximum == np.max(samples[2])
+        for param in dataset.keys():
+            assert np.shares_memory(dataset[param], dataset.samples)
+        # changes made to a parameter after a pop are seen by the stored
+        # samples
+        dataset["c"][:] = 5.
+        np.testing.assert_almost_equal(dataset.samples[1], np.ones(100) * 5.)
+        dataset["a"] = np.zeros(100)
+        np.testing.assert_almost_equal(dataset.samples[0], np.zeros(100))
+        np.testing.assert_almost_equal(dataset.samples[1], np.ones(100) * 5.)
+
     def test_core_plots(self):
         """Test that the core plotting methods of the SamplesDict class work as
         expected
@@ -745,6 +801,53 @@ class TestMCMCSamplesDict(object):
                     transpose_copy[level1][level2], dataframe[level1][level2]
                 )
 
+    def test_combine_cache(self):
+        """Test that the combined samples are cached until the chains change
+        """
+        dataframe = MCMCSamplesDict(self.parameters, self.chains)
+        combined = dataframe.combine
+        for num, param in enumerate(self.parameters):
+            np.testing.assert_almost_equal(
+                combined[param], np.concatenate(
+                    [chain[num] for chain in self.chains]
+                )
+            )
+        # later calls return read-only views of the cached samples
+        assert np.shares_memory(dataframe.combine["a"], combined["a"])
+        with pytest.raises(ValueError):
+            combined["a"][:] = -1.
+        np.testing.assert_almost_equal(
+            dataframe.combine["a"][:100], self.chains[0][0]
+        )
+        # replacing a parameter in the combined samples copies the samples
+        # rather than changing the cache
+        combined["a"] = np.zeros(len(combined["a"]))
+        np.testing.assert_almost_equal(
+            dataframe.combine["a"][:100], self.chains[0][0]
+        )
+        combined = dataframe.combine
+        transpose = dataframe.T.combine
+        for param in self.parameters:
+            np.testing.assert_almost_equal(transpose[param], combined[param])
+        dataframe.discard_samples(10)
+        discarded = dataframe.combine
+        assert discarded.number_of_samples == 180
+        assert not np.shares_memory(discarded["a"], combined["a"])
+        np.testing.assert_almost_equal(
+            discarded["a"][:90], self.chains[0][0][10:]
+        )
+        dataframe["chain_1"] = {"a": [1., 2.], "b": [3., 4.]}
+        np.testing.assert_almost_equal(
+            dataframe.combine["b"][-2:], [3., 4.]
+        )
+        # replacing the samples of a chain is seen by later calls
+        dataframe["chain_1"]["b"] = [5., 6.]
+        np.testing.assert_almost_equal(
+            dataframe.combine["b"][-2:], [5., 6.]
+        )
+        dataframe["chain_1"].pop("a")
+        assert "a" not in dataframe.combine.keys()
+
     def test_key_data(self):
         """Test that the key data is correct
         """
@@ -782,7 +885,76 @@ class TestMCMCSamplesDict(object):
             10, algorithm="burnin_by_first_n", step_number=True
         )
         assert len(burnin["chain_0"]["a"]) == len(idxs) - 10
-        
+
+    def test_diagnostics(self):
+        """Test that the convergence diagnostics are correct for a set of
+        autoregressive chains with a known autocorrelation time
+        """
+        from scipy.signal import lfilter
+        from pesummary.utils.diagnostics import autocorrelation
+
+        phi = 0.9
+        noise = np.random.normal(size=(4, 2, 20000))
+        chains = lfilter([1], [1, -phi], noise, axis=-1)
+        dataframe = MCMCSamplesDict(["a", "b"], chains)
+        expected_tau = (1 + phi) / (1 - phi)
+        tau = dataframe.autocorrelation_time()
+        ess = dataframe.effective_sample_size(method="basic")
+        for param in ["a", "b"]:
+            assert abs(tau[param] - expected_tau) / expected_tau < 0.2
+            assert abs(ess[param] - 80000 / expected_tau) / (
+                80000 / expected_tau
+            ) < 0.2
+        acf = dataframe.autocorrelation("a")["a"]
+        assert acf.shape == (4, 20000)
+        np.testing.assert_almost_equal(acf[:, 0], 1.)
+        np.testing.assert_almost_equal(np.mean(acf[:, 1]), phi, decimal=1)
+        x = chains[0, 0] - np.mean(chains[0, 0])
+        np.testing.assert_almost_equal(
+            acf[0, 5], np.sum(x[:-5] * x[5:]) / np.sum(x * x)
+        )
+        np.testing.assert_almost_equal(autocorrelation(chains)[0, 0], acf[0])
+        rhat = dataframe.split_gelman_rubin()
+        assert all(value < 1.01 for value in rhat.values())
+        diagnostics = dataframe.diagnostics()
+        for key in ["autocorrelation_time", "rhat", "ess_bulk", "ess_tail"]:
+            assert key in diagnostics["a"].keys()
+        assert diagnostics["a"]["rhat"] == rhat["a"]
+        chains[0] += 5.
+        dataframe = MCMCSamplesDict(["a", "b"], chains)
+        assert all(
+            value > 1.1 for value in dataframe.split_gelman_rubin().values()
+        )
+
+    def test_burnin_by_autocorrelation(self):
+        """Test that the autocorrelation time is used to remove burnin and
+        thin the chains
+        """
+        from scipy.signal import lfilter
+
+        from pesummary.utils.diagnostics import (
+            integrated_autocorrelation_time
+        )
+
+        noise = np.random.normal(size=(3, 2, 5000))
+        chains = lfilter([1], [1, -0.9], noise, axis=-1)
+        dataframe = MCMCSamplesDict(["a", "b"], chains)
+        tau = integrated_autocorrelation_time(chains[..., 2500:])
+        nburnin = int(np.ceil(2 * np.max(tau)))
+        nthin = int(0.5 * np.min(tau))
+        burnin = dataframe.burnin(algorithm="burnin_by_autocorrelation")
+        assert burnin.number_of_samples["chain_0"] == len(
+            np.arange(5000)[nburnin::nthin]
+        )
+        np.testing.assert_almost_equal(
+            burnin["chain_1"]["b"], chains[1, 1, nburnin::nthin]
+        )
+        burnin = dataframe.burnin(
+            algorithm="burnin_by_autocorrelation", thin=False
+        )
+        assert burnin.number_of_samples["chain_0"] == 5000 - nburnin
+        assert dataframe.number_of_samples["chain_0"] == 5000
+
 
 class TestList(object):
     """Test the List class
@@ -964,6 +1136,86 @@ def test_jensen_shannon_divergence():
     )
 
 
+class TestBootstrap(object):
+    """Test the `pesummary.utils.bootstrap` module
+    """
+    def setup(self):
+        """Setup the TestBootstrap class
+        """
+        self.rng = np.random.default_rng(123456789)
+        self.samples = self.rng.uniform(0, 1, 2000)**2
+
+    def test_bootstrap_indices(self):
+        """Test that each replicate is drawn without replacement
+        """
+        from pesummary.utils.bootstrap import bootstrap_indices
+
+        indices = bootstrap_indices(
+            100, 40, 25, random_state=self.rng, max_elements=1000
+        )
+        assert indices.shape == (25, 40)
+        assert all(len(np.unique(row)) == 40 for row in indices)
+        assert np.max(indices) < 100
+        with pytest.raises(ValueError):
+            bootstrap_indices(10, 20, 2)
+
+    def test_batched_kde(self):
+        """Test that the batched KDE agrees with scipy.stats.gaussian_kde and
+        the ReflectionBoundedKDE class
+        """
+        from scipy.stats import gaussian_kde
+        from pesummary.core.plots.bounded_1d_kde import ReflectionBoundedKDE
+        from pesummary.utils.bootstrap import batched_kde
+
+        pts = np.linspace(0, 1, 100)
+        sets = np.array([self.samples, self.samples[::-1] ** 0.5])
+        batched = batched_kde(sets, pts)
+        for num, _set in enumerate(sets):
+            np.testing.assert_allclose(
+                batched[num], gaussian_kde(_set)(pts), rtol=0,
+                atol=1e-3 * np.max(batched[num])
+            )
+        batched = batched_kde(sets, pts, xlow=0., xhigh=1.)
+        for num, _set in enumerate(sets):
+            np.testing.assert_allclose(
+                batched[num], ReflectionBoundedKDE(_set, xlow=0., xhigh=1.)(pts),
+                rtol=0, atol=1e-3 * np.max(batched[num])
+            )
+        assert np.isnan(batched_kde(np.ones((1, 10)), pts)).all()
+
+    def test_jensen_shannon_divergence(self):
+        """Test that the batched JS divergence matches
+        pesummary.utils.utils.jensen_shannon_divergence_from_pdfs
+        """
+        from pesummary.utils.bootstrap import (
+            batched_jensen_shannon_divergence,
+            bootstrap_jensen_shannon_divergences
+        )
+
+        pdfs_a = self.rng.uniform(0, 1, (5, 100))
+        pdfs_b = self.rng.uniform(0, 1, (5, 100))
+        pdfs_a[:, :10] = 0.
+        batched = batched_jensen_shannon_divergence(pdfs_a, pdfs_b)
+        for num in range(5):
+            assert batched[num] == utils.jensen_shannon_divergence_from_pdfs(
+                [pdfs_a[num].copy(), pdfs_b[num].copy()]
+            )
+        samples = {"a": self.samples, "b": self.rng.normal(0, 1, 1000)}
+        other = {"a": self.samples ** 0.5, "b": self.rng.normal(0, 1, 1000)}
+        kwargs = {"nsamples": 500, "ntests": 20, "seed": 12345}
+        single = bootstrap_jensen_shannon_divergences(
+            samples, other, ["a", "b"], bounds={"a": (0., 1.)}, **kwargs
+        )
+        multi = bootstrap_jensen_shannon_divergences(
+            samples, other, ["a", "b"], bounds={"a": (0., 1.)},
+            multi_process=2, **kwargs
+        )
+        for param in ["a", "b"]:
+            assert len(single[param]) == 20
+            np.testing.assert_almost_equal(single[param], multi[param])
+        assert np.median(single["a"]) > np.median(single["b"])
+
+
 def test_make_cache_style_file():
     """Test that the `make_cache_style_file` works as expected
     """
@@ -112,6 +112,23 @@ class TestPage(object):
         assert all_links[0].text == "other"
         assert all_links[1].text == "example"
 
+    def test_replace_navbar_links(self):
+        self.html.make_navbar(["other", "example"], histogram_download="test")
+        self.html.close()
+        with open("{}/home.html".format(tmpdir)) as fp:
+            html = fp.read()
+        html = webpage.replace_navbar_links(html, ["other", "example", "new"])
+        soup = BeautifulSoup(html, features="html.parser")
+        all_links = soup.find_all("a", class_="nav-link")
+        assert [link.text for link in all_links[:3]] == [
+            "other", "example", "new"
+        ]
+        assert len(soup.find_all("nav")) == 1
+        assert "Histogram Data" in html
+        assert webpage.replace_navbar_links("<p>test</p>", ["new"]) == (
+            "<p>test</p>"
+        )
+
     @pytest.mark.parametrize('headings, contents', [(["column1", "column2"],
         [["entry1", "entry2"], ["entry3", "entry4"]]),])
     def test_table(self, headings, contents):
@@ -162,6 +179,72 @@ class TestPage(object):
         assert all_images[0]["src"] == "image1.png"
         assert all_images[1]["src"] == "image2.png"
 
+    def test_table_of_images_with_thumbnails(self):
+        from PIL import Image
+        from pesummary.core.plots.thumbnails import make_thumbnails
+
+        os.makedirs("{}/plots".format(tmpdir))
+        for name in ["image1.png", "image2.png"]:
+            Image.new("RGB", (1800, 1200)).save(
+                "{}/plots/{}".format(tmpdir, name)
+            )
+        dimensions = make_thumbnails("{}/plots".format(tmpdir))
+        html = webpage.open_html(
+            tmpdir, "https://example", "home", image_dimensions=dimensions
+        )
+        contents = [["./plots/image1.png", "./plots/image2.png"]]
+        html.make_table_of_images(contents=contents)
+        html.make_modal_carousel(images=contents[0])
+        html.close()
+        self.html.close()
+        with open("{}/home.html".format(tmpdir)) as fp:
+            soup = BeautifulSoup(fp, features="html.parser")
+        all_images = soup.find_all("img")
+        assert len(all_images) == 4
+        for num, name in enumerate(["image1.png", "image2.png"]):
+            assert all_images[num]["src"] == "./plots/thumbnails/{}".format(name)
+            assert all_images[num]["data-src"] == "./plots/{}".format(name)
+            assert all_images[num]["loading"] == "lazy"
+            assert all_images[num]["width"] == "450"
+            assert all_images[num]["height"] == "300"
+            assert all_images[num + 2]["src"] == "./plots/{}".format(name)
+            assert all_images[num + 2]["loading"] == "lazy"
+
+    def test_table_of_images_with_webp_thumbnails(self):
+        from PIL import Image
+        from pesummary.core.plots.thumbnails import make_thumbnails
+
+        os.makedirs("{}/plots".format(tmpdir))
+        for name in ["1d_posterior_a.png", "1d_posterior_b.png"]:
+            Image.new("RGB", (1800, 1200)).save(
+                "{}/plots/{}".format(tmpdir, name)
+            )
+        dimensions = make_thumbnails("{}/plots".format(tmpdir), webp=True)
+        if not all(value["webp"] for value in dimensions.values()):
+            pytest.skip("Pillow was built without webp support")
+        html = webpage.open_html(
+            tmpdir, "https://example", "home", image_dimensions=dimensions
+        )
+        html.make_table_of_images(contents=[["./plots/1d_posterior_a.png"]])
+        # images which are toggled with changeimage only have their src
+        # updated so they must not be wrapped in a picture tag
+        html.make_table_of_images(
+            contents=[["./plots/1d_posterior_b.png"]], code="changeimage"
+        )
+        html.close()
+        self.html.close()
+        with open("{}/home.html".format(tmpdir)) as fp:
+            soup = BeautifulSoup(fp, features="html.parser")
+        pictures = soup.find_all("picture")
+        assert len(pictures) == 1
+        assert pictures[0].find("source")["srcset"] == (
+            "./plots/thumbnails/1d_posterior_a.webp"
+        )
+        all_images = soup.find_all("img")
+        assert len(all_images) == 2
+        assert all_images[1].parent.name != "picture"
+        assert all_images[1]["src"] == "./plots/thumbnails/1d_posterior_b.png"
+
     def test_insert_image(self):
         path = "./path/to/image.png"
         self.html.insert_image(path)
@@ -310,3 +393,42 @@ class TestWebpage(object):
                 except ValueError:
                     assert _key_data[row[0]][header] is None
                     assert row[num + 1] == 'None'
+
+    def test_multi_process(self):
+        """Test that the same webpages are produced when groups of webpages
+        are generated in parallel
+        """
+        import re
+        from pesummary.gw.webpage.main import _WebpageGeneration
+
+        _tmpdir = tmpdir + "_multi_process"
+        try:
+            webpage = _WebpageGeneration(
+                webdir=_tmpdir, labels=self.labels, samples=self.samples,
+                pepredicates_probs={label: None for label in self.labels},
+                same_parameters=["chirp_mass", "mass_ratio"], multi_process=3
+            )
+            webpage.generate_webpages()
+            # modal carousels are given randomly generated ids
+            _ids = re.compile("(Modal|demo)_[0-9A-F]{6}")
+            serial = sorted(
+                os.path.basename(_file) for _file in
+                glob(os.path.join(tmpdir, "html", "*.html"))
+            )
+            parallel = sorted(
+                os.path.basename(_file) for _file in
+                glob(os.path.join(_tmpdir, "html", "*.html"))
+            )
+            assert serial == parallel
+            for _file in serial:
+                if _file == "Logging.html":
+                    continue
+                with open(os.path.join(tmpdir, "html", _file), "r") as f:
+                    serial_contents = _ids.sub("", f.read())
+                with open(os.path.join(_tmpdir, "html", _file), "r") as f:
+                    parallel_contents = _ids.sub("", f.read()).replace(
+                        _tmpdir, tmpdir
+                    )
+                assert serial_contents == parallel_contents
+        finally:
+            shutil.rmtree(_tmpdir, ignore_errors=True)
@@ -0,0 +1,374 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import numpy as np
+from pesummary.utils.utils import logger
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+
+def bootstrap_indices(
+    length, nsamples, ntests, random_state=None, max_elements=2**24
+):
+    """Draw the indices for many bootstrap replicates at once. Each replicate
+    is drawn without replacement
+
+    Parameters
+    ----------
+    length: int
+        number of samples to draw from
+    nsamples: int
+        number of samples to draw for each replicate
+    ntests: int
+        number of replicates
+    random_state: np.random.Generator, optional
+        random number generator to use. Default np.random.default_rng()
+    max_elements: int, optional
+        maximum number of random numbers to hold in memory at once. The
+        replicates are drawn in blocks to respect this limit
+
+    Returns
+    -------
+    indices: np.ndarray
+        2d array of shape (ntests, nsamples)
+    """
+    if nsamples > length:
+        raise ValueError(
+            "Unable to draw {} samples without replacement from {} "
+            "samples".format(nsamples, length)
+        )
+    if random_state is None:
+        random_state = np.random.default_rng()
+    indices = np.empty((ntests, nsamples), dtype=np.intp)
+    block = max(1, int(max_elements // max(length, 1)))
+    for start in range(0, ntests, block):
+        stop = min(start + block, ntests)
+        keys = random_state.random((stop - start, length))
+        indices[start:stop] = np.argpartition(
+            keys, nsamples - 1, axis=1
+        )[:, :nsamples]
+    return indices
+
+
+def batched_kde(
+    samples, points, xlow=None, xhigh=None, bw_method=None, ngrid=None
+):
+    """Evaluate a Gaussian kernel density estimate for many sets of samples
+    on a shared set of points in one batched operation. Each set of samples
+    is linearly binned onto a common grid and convolved with its own Gaussian
+    kernel with an FFT. The bandwidth of each kernel follows Scott's rule as
+    used by `scipy.stats.gaussian_kde`. If bounds are provided, the boundaries
+    are treated as reflections as in
+    `pesummary.core.plots.bounded_1d_kde.ReflectionBoundedKDE`
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        2d array of shape (nsets, nsamples)
+    points: np.ndarray
+        points to evaluate the density at
+    xlow: float, optional
+        lower bound of the distribution
+    xhigh: float, optional
+        upper bound of the distribution
+    bw_method: float, optional
+        scalar bandwidth factor. Default Scott's rule, nsamples ** (-1 / 5)
+    ngrid: int, optional
+        number of grid points to use for the FFT. Default chosen such that
+        the smallest kernel spans at least 20 grid points
+
+    Returns
+    -------
+    densities: np.ndarray
+        2d array of shape (nsets, len(points)). Sets with zero variance are
+        nan
+    """
+    samples = np.atleast_2d(np.asarray(samples, dtype=float))
+    points = np.asarray(points, dtype=float)
+    nsets, nsamples = samples.shape
+    if bw_method is None:
+        bw_method = nsamples ** (-1. / 5)
+    bandwidth = np.std(samples, axis=1, ddof=1) * bw_method
+    valid = bandwidth > 0
+    _bandwidth = np.where(valid, bandwidth, 1.)
+    hmax = np.max(_bandwidth[valid]) if valid.any() else 1.
+    hmin = np.min(_bandwidth[valid]) if valid.any() else 1.
+    low = np.min(samples) - 5 * hmax
+    high = np.max(samples) + 5 * hmax
+    if ngrid is None:
+        ngrid = int(
+            2**np.ceil(np.log2(max(1024, 20 * (high - low) / hmin)))
+        )
+        ngrid = min(ngrid, 2**16)
+    dx = (high - low) / (ngrid - 1)
+
+    # linear binning of every set onto the shared grid
+    position = (samples - low) / dx
+    lower = np.clip(np.floor(position).astype(np.intp), 0, ngrid - 2)
+    weight = position - lower
+    offset = (np.arange(nsets) * ngrid)[:, None]
+    counts = np.bincount(
+        (lower + offset).ravel(), weights=(1. - weight).ravel(),
+        minlength=nsets * ngrid
+    )
+    counts += np.bincount(
+        (lower + 1 + offset).ravel(), weights=weight.ravel(),
+        minlength=nsets * ngrid
+    )
+    counts = counts.reshape(nsets, ngrid)
+
+    # convolve with a Gaussian kernel. The grid is padded by 5 bandwidths on
+    # each side so wrap around from the circular convolution is negligible
+    nfft = 2 * ngrid
+    frequencies = np.fft.rfftfreq(nfft)
+    # high frequency modes of the kernel underflow to 0 which is harmless
+    with np.errstate(under="ignore"):
+        kernel = np.exp(
+            -2 * (np.pi * frequencies[None, :] * (_bandwidth[:, None] / dx))**2
+        )
+        grid_density = np.fft.irfft(
+            np.fft.rfft(counts, n=nfft, axis=1) * kernel, n=nfft, axis=1
+        )[:, :ngrid] / (nsamples * dx)
+
+    def _interpolate(x):
+        index = (x - low) / dx
+        inside = (index >= 0) & (index <= ngrid - 1)
+        _lower = np.clip(np.floor(index).astype(np.intp), 0, ngrid - 2)
+        _weight = index - _lower
+        values = (
+            grid_density[:, _lower] * (1. - _weight) +
+            grid_density[:, _lower + 1] * _weight
+        )
+        values[:, ~inside] = 0.
+        return values
+
+    densities = _interpolate(points)
+    if xlow is not None:
+        densities += _interpolate(2 * xlow - points)
+    if xhigh is not None:
+        densities += _interpolate(2 * xhigh - points)
+    out_of_bounds = np.zeros(len(points), dtype=bool)
+    if xlow is not None:
+        out_of_bounds[points < xlow] = True
+    if xhigh is not None:
+        out_of_bounds[points > xhigh] = True
+    densities[:, out_of_bounds] = 0.
+    densities[~valid] = np.nan
+    return np.clip(densities, 0., None)
+
+
+def batched_jensen_shannon_divergence(pdfs_a, pdfs_b, decimal=5, base=np.e):
+    """Calculate the JS divergence between many pairs of distributions at
+    once. This matches
+    `pesummary.utils.utils.jensen_shannon_divergence_from_pdfs` for each
+    pair
+
+    Parameters
+    ----------
+    pdfs_a: np.ndarray
+        2d array of distributions with shape (npairs, npoints)
+    pdfs_b: np.ndarray
+        2d array of distributions with shape (npairs, npoints)
+    decimal: int, float
+        number of decimal places to round the JS divergence to
+    base: float, optional
+        base of the logarithm. Default np.e
+    """
+    a = np.atleast_2d(pdfs_a)
+    b = np.atleast_2d(pdfs_b)
+    with np.errstate(divide="ignore", invalid="ignore", under="ignore"):
+        a = a / np.sum(a, axis=1)[:, None]
+        b = b / np.sum(b, axis=1)[:, None]
+        m = 0.5 * (a + b)
+        kl_forward = np.sum(
+            np.where(a > 0, a * np.log(a / m), 0.), axis=1
+        )
+        kl_backward = np.sum(
+            np.where(b > 0, b * np.log(b / m), 0.), axis=1
+        )
+    js = (kl_forward / 2. + kl_backward / 2.) / np.log(base)
+    invalid = np.isnan(pdfs_a).any(axis=-1) | np.isnan(pdfs_b).any(axis=-1)
+    js[np.atleast_1d(invalid)] = np.nan
+    return np.round(js, decimal)
+
+
+def bootstrap_kde(
+    samples, points=None, nsamples=1000, ntests=100, xlow=None, xhigh=None,
+    percentiles=[5, 50, 95], random_state=None, npoints=1000
+):
+    """Evaluate the density of many bootstrap replicates of a set of samples
+    on a shared grid
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        samples you wish to bootstrap
+    points: np.ndarray, optional
+        points to evaluate the density at. Default npoints evenly spaced
+        points between the minimum and maximum sample
+    nsamples: int, optional
+        number of samples to draw for each replicate. Default 1000
+    ntests: int, optional
+        number of replicates. Default 100
+    xlow: float, optional
+        lower bound of the distribution
+    xhigh: float, optional
+        upper bound of the distribution
+    percentiles: list, optional
+        percentiles of the densities to return at each point. Default
+        [5, 50, 95]
+    random_state: np.random.Generator, optional
+        random number generator to use
+    npoints: int, optional
+        number of points to evaluate the density at if points is not
+        provided. Default 1000
+
+    Returns
+    -------
+    points: np.ndarray
+        points the density was evaluated at
+    densities: np.ndarray
+        2d array of shape (ntests, len(points))
+    bands: np.ndarray
+        2d array of shape (len(percentiles), len(points))
+    """
+    samples = np.asarray(samples, dtype=float)
+    if points is None:
+        points = np.linspace(np.min(samples), np.max(samples), npoints)
+    indices = bootstrap_indices(
+        len(samples), nsamples, ntests, random_state=random_state
+    )
+    densities = batched_kde(samples[indices], points, xlow=xlow, xhigh=xhigh)
+    bands = np.nanpercentile(densities, percentiles, axis=0)
+    return points, densities, bands
+
+
+def bootstrap_jensen_shannon_divergence(
+    samples_a, samples_b, nsamples=1000, ntests=100, xlow=None, xhigh=None,
+    decimal=5, base=np.e, npoints=100, random_state=None
+):
+    """Calculate the JS divergence between many bootstrap replicates of two
+    sets of samples. The densities of every replicate are evaluated on a
+    shared grid spanning both sets of samples
+
+    Parameters
+    ----------
+    samples_a: np.ndarray
+        first set of samples
+    samples_b: np.ndarray
+        second set of samples
+    nsamples: int, optional
+        number of samples to draw for each replicate. Default 1000
+    ntests: int, optional
+        number of replicates. Default 100
+    xlow: float, optional
+        lower bound of the distribution
+    xhigh: float, optional
+        upper bound of the distribution
+    decimal: int, float
+        number of decimal places to round the JS divergence to
+    base: float, optional
+        base of the logarithm. Default np.e
+    npoints: int, optional
+        number of points in the shared grid. Default 100
+    random_state: np.random.Generator, optional
+        random number generator to use
+
+    Returns
+    -------
+    js: np.ndarray
+        array of length ntests containing the JS divergence for each
+        replicate
+    """
+    if random_state is None:
+        random_state = np.random.default_rng()
+    samples_a = np.asarray(samples_a, dtype=float)
+    samples_b = np.asarray(samples_b, dtype=float)
+    nsamples = min([nsamples, len(samples_a), len(samples_b)])
+    boot_a = samples_a[
+        bootstrap_indices(len(samples_a), nsamples, ntests, random_state)
+    ]
+    boot_b = samples_b[
+        bootstrap_indices(len(samples_b), nsamples, ntests, random_state)
+    ]
+    points = np.linspace(
+        min(np.min(boot_a), np.min(boot_b)),
+        max(np.max(boot_a), np.max(boot_b)), npoints
+    )
+    densities = batched_kde(
+        np.vstack([boot_a, boot_b]), points, xlow=xlow, xhigh=xhigh
+    )
+    return batched_jensen_shannon_divergence(
+        densities[:ntests], densities[ntests:], decimal=decimal, base=base
+    )
+
+
+def _wrapper_for_bootstrap_jensen_shannon_divergence(args):
+    """Wrapper function for bootstrap_jensen_shannon_divergence for a pool of
+    workers
+
+    Parameters
+    ----------
+    args: tuple
+        samples_a, samples_b, seed and a dictionary of kwargs passed to
+        bootstrap_jensen_shannon_divergence
+    """
+    samples_a, samples_b, seed, kwargs = args
+    return bootstrap_jensen_shannon_divergence(
+        samples_a, samples_b, random_state=np.random.default_rng(seed),
+        **kwargs
+    )
+
+
+def bootstrap_jensen_shannon_divergences(
+    samples_a, samples_b, parameters, bounds={}, multi_process=1, seed=None,
+    **kwargs
+):
+    """Calculate the bootstrapped JS divergence for many parameters. The
+    parameters are spread across a pool of workers
+
+    Parameters
+    ----------
+    samples_a: dict
+        dictionary of samples keyed by parameter
+    samples_b: dict
+        dictionary of samples keyed by parameter
+    parameters: list
+        parameters you wish to calculate the JS divergence for
+    bounds: dict, optional
+        dictionary containing the (xlow, xhigh) bounds for each parameter
+    multi_process: int, optional
+        number of cpus to use. Default 1
+    seed: int, optional
+        seed used to generate an independent random seed for each parameter
+    **kwargs: dict, optional
+        all additional kwargs passed to bootstrap_jensen_shannon_divergence
+
+    Returns
+    -------
+    js: dict
+        dictionary of arrays containing the JS divergence for each replicate
+        keyed by parameter
+    """
+    seeds = np.random.SeedSequence(seed).spawn(len(parameters))
+    args = []
+    for param, _seed in zip(parameters, seeds):
+        xlow, xhigh = bounds.get(param, (None, None))
+        args.append(
+            (
+                np.asarray(samples_a[param]), np.asarray(samples_b[param]),
+                _seed, dict(kwargs, xlow=xlow, xhigh=xhigh)
+            )
+        )
+    logger.debug(
+        "Calculating the bootstrapped JS divergence for {} parameters".format(
+            len(parameters)
+        )
+    )
+    if multi_process > 1:
+        import multiprocessing
+
+        with multiprocessing.Pool(multi_process) as pool:
+            js = pool.map(_wrapper_for_bootstrap_jensen_shannon_divergence, args)
+    else:
+        js = list(map(_wrapper_for_bootstrap_jensen_shannon_divergence, args))
+    return {param: value for param, value in zip(parameters, js)}
@@ -226,16 +226,40 @@ def array_input(ignore_args=None, ignore_kwargs=None, force_return_array=False):
     return _array_input
 
 
-def docstring_subfunction(*args):
-    """Edit the docstring of a function to show the docstrings of subfunctions
+class _SubfunctionDocstring(object):
+    """Wrapper for a function whose docstring also shows the docstrings of
+    a set of subfunctions. The subfunctions are only imported when the
+    docstring is first requested to avoid importing (often heavy) plotting
+    modules at import time
+
+    Parameters
+    ----------
+    func: func
+        function you wish to wrap
+    subfunctions: list/str
+        the full import path to a subfunction or a list of full import paths
+        to the subfunctions
     """
-    def wrapper_function(func):
+    def __init__(self, func, subfunctions):
+        functools.update_wrapper(
+            self, func, assigned=[
+                _ for _ in functools.WRAPPER_ASSIGNMENTS if _ != "__doc__"
+            ]
+        )
+        self._func = func
+        self._subfunctions = subfunctions
+        self._docstring = None
+
+    @property
+    def __doc__(self):
         import importlib
 
-        original_docstring = func.__doc__
-        if isinstance(args[0], list):
+        if self._docstring is not None:
+            return self._docstring
+        original_docstring = self._func.__doc__ or ""
+        if isinstance(self._subfunctions, list):
             original_docstring += "\n\nSubfunctions:\n"
-            for subfunction in args[0]:
+            for subfunction in self._subfunctions:
                 _subfunction = subfunction.split(".")
                 module = ".".join(_subfunction[:-1])
                 function = _subfunction[-1]
@@ -245,18 +269,38 @@ def docstring_subfunction(*args):
                     getattr(module, function).__doc__
                 )
         else:
-            _subfunction = args[0].split(".")
+            subfunction = self._subfunctions
+            _subfunction = subfunction.split(".")
             module = ".".join(_subfunction[:-1])
             function = _subfunction[-1]
             module = importlib.import_module(module)
             original_docstring += (
                 "\n\nSubfunctions:\n\n{}{}".format(
-                    args[0] + "\n" + "-" * len(args[0]) + "\n",
+                    subfunction + "\n" + "-" * len(subfunction) + "\n",
                     getattr(module, function).__doc__
                 )
             )
-        func.__doc__ = original_docstring
-        return func
+        self._docstring = original_docstring
+        return self._docstring
+
+    def __call__(self, *args, **kwargs):
+        return self._func(*args, **kwargs)
+
+    def __get__(self, instance, owner):
+        import types
+
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+
+def docstring_subfunction(*args):
+    """Edit the docstring of a function to show the docstrings of subfunctions.
+    The docstrings of the subfunctions are only loaded when the docstring is
+    first requested
+    """
+    def wrapper_function(func):
+        return _SubfunctionDocstring(func, args[0])
     return wrapper_function
 
 
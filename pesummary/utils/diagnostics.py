@@ -0,0 +1,290 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import numpy as np
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+__doc__ = """Convergence diagnostics for mcmc chains. All functions act on a
+(chains x parameters x steps) array so that the diagnostics for every
+parameter and chain are computed in a single batched operation. The split
+R-hat and bulk/tail effective sample size follow Vehtari, A. et al.,
+Bayesian Analysis, Vol 16, No. 2, pp. 667--718 (2021). The integrated
+autocorrelation time uses the automatic windowing procedure of Sokal, A.,
+Functional Integration, pp. 131--192 (1997)"""
+
+
+def _as_array(samples):
+    """Return a set of samples as a (chains x parameters x steps) array
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        either a 1d array of samples for a single chain, a 2d array of
+        (chains x steps) or a 3d array of (chains x parameters x steps)
+    """
+    samples = np.asarray(samples, dtype=float)
+    if samples.ndim == 1:
+        return samples[None, None, :]
+    elif samples.ndim == 2:
+        return samples[:, None, :]
+    elif samples.ndim == 3:
+        return samples
+    raise ValueError(
+        "Please provide samples as a (chains x parameters x steps) array"
+    )
+
+
+def _split_chains(samples):
+    """Split each chain in half and return a (2 * chains x parameters x
+    steps / 2) array. If the number of steps is odd, the middle step is
+    discarded
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        3d array of (chains x parameters x steps)
+    """
+    half = samples.shape[-1] // 2
+    return np.concatenate(
+        [samples[..., :half], samples[..., -half:]], axis=0
+    )
+
+
+def autocorrelation(samples):
+    """Return the normalised autocorrelation function for every chain and
+    parameter with a single batched real FFT
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        array of samples. The autocorrelation is computed along the last
+        axis
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pesummary.utils.diagnostics import autocorrelation
+    >>> chains = np.random.normal(size=(4, 3, 1000))
+    >>> acf = autocorrelation(chains)
+    >>> acf.shape
+    (4, 3, 1000)
+    """
+    samples = np.asarray(samples, dtype=float)
+    nsteps = samples.shape[-1]
+    nfft = 2 * nsteps
+    x = samples - np.mean(samples, axis=-1, keepdims=True)
+    f = np.fft.rfft(x, n=nfft, axis=-1)
+    acf = np.fft.irfft(f * np.conj(f), n=nfft, axis=-1)[..., :nsteps]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return acf / acf[..., :1]
+
+
+def integrated_autocorrelation_time(samples, c=5):
+    """Return the integrated autocorrelation time for each parameter. The
+    autocorrelation function is averaged over chains and the sum is
+    truncated with Sokal's automatic window
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        either a 1d array of samples for a single chain, a 2d array of
+        (chains x steps) or a 3d array of (chains x parameters x steps)
+    c: float, optional
+        window constant. The window is the smallest M such that
+        M >= c * tau(M). Default 5
+    """
+    samples = _as_array(samples)
+    rho = np.mean(autocorrelation(samples), axis=0)
+    taus = 2. * np.cumsum(rho, axis=-1) - 1.
+    lags = np.arange(rho.shape[-1])
+    window = lags[None, :] >= c * taus
+    index = np.where(
+        window.any(axis=-1), np.argmax(window, axis=-1), rho.shape[-1] - 1
+    )
+    return taus[np.arange(len(taus)), index]
+
+
+def _average_rank(samples):
+    """Return the rank of each sample along the last axis. Ties are
+    assigned the average of the ranks they span, as in
+    `scipy.stats.rankdata`, but all rows are ranked in a single batched sort
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        2d array of samples. Each row is ranked separately
+    """
+    nrows, ncols = samples.shape
+    order = np.argsort(samples, axis=-1)
+    ordered = np.take_along_axis(samples, order, axis=-1)
+    new_group = np.ones_like(ordered, dtype=bool)
+    new_group[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    starts = np.flatnonzero(new_group.ravel())
+    counts = np.diff(np.append(starts, new_group.size))
+    average = (starts % ncols) + (counts - 1) / 2. + 1.
+    group = np.cumsum(new_group.ravel()) - 1
+    ranks = np.empty_like(ordered)
+    np.put_along_axis(
+        ranks, order, average[group].reshape(nrows, ncols), axis=-1
+    )
+    return ranks
+
+
+def _rank_normalize(samples):
+    """Rank normalize the samples for each parameter, pooling all chains
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        3d array of (chains x parameters x steps)
+    """
+    from scipy.special import ndtri
+
+    nchains, nparameters, nsteps = samples.shape
+    pooled = np.moveaxis(samples, 1, 0).reshape(nparameters, -1)
+    ranks = _average_rank(pooled)
+    z = ndtri((ranks - 3. / 8) / (pooled.shape[-1] + 1. / 4))
+    return np.moveaxis(z.reshape(nparameters, nchains, nsteps), 0, 1)
+
+
+def _rhat(samples):
+    """Return the potential scale reduction factor for each parameter
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        3d array of (chains x parameters x steps)
+    """
+    nsteps = samples.shape[-1]
+    chain_mean = np.mean(samples, axis=-1)
+    chain_var = np.var(samples, axis=-1, ddof=1)
+    B = nsteps * np.var(chain_mean, axis=0, ddof=1)
+    W = np.mean(chain_var, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.sqrt(((nsteps - 1.) / nsteps * W + B / nsteps) / W)
+
+
+def split_rhat(samples):
+    """Return the rank normalized split R-hat for each parameter. This is
+    the maximum of the bulk and tail (folded) split R-hat
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        either a 2d array of (chains x steps) or a 3d array of
+        (chains x parameters x steps)
+    """
+    split = _split_chains(_as_array(samples))
+    bulk = _rhat(_rank_normalize(split))
+    folded = np.abs(split - np.median(split, axis=(0, 2), keepdims=True))
+    tail = _rhat(_rank_normalize(folded))
+    return np.maximum(bulk, tail)
+
+
+def _ess(samples):
+    """Return the effective sample size for each parameter using Geyer's
+    initial monotone sequence estimator
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        3d array of (chains x parameters x steps)
+    """
+    nchains, _, nsteps = samples.shape
+    acf = autocorrelation(samples)
+    autocovariance = np.var(samples, axis=-1)[..., None] * acf
+    W = np.mean(autocovariance[..., 0], axis=0) * nsteps / (nsteps - 1.)
+    var_plus = W * (nsteps - 1.) / nsteps
+    if nchains > 1:
+        var_plus = var_plus + np.var(np.mean(samples, axis=-1), axis=0, ddof=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rho = 1. - (
+            W[:, None] - np.mean(autocovariance, axis=0)
+        ) / var_plus[:, None]
+    rho[..., 0] = 1.
+    npairs = nsteps // 2
+    pairs = rho[..., :2 * npairs:2] + rho[..., 1:2 * npairs:2]
+    positive = np.cumprod(pairs > 0, axis=-1).astype(bool)
+    pairs = np.minimum.accumulate(np.where(positive, pairs, np.inf), axis=-1)
+    tau = -1. + 2. * np.sum(np.where(positive, pairs, 0.), axis=-1)
+    tau = np.maximum(tau, 1. / np.log10(nchains * nsteps))
+    return nchains * nsteps / tau
+
+
+def effective_sample_size(samples, method="bulk"):
+    """Return the effective sample size for each parameter
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        either a 1d array of samples for a single chain, a 2d array of
+        (chains x steps) or a 3d array of (chains x parameters x steps)
+    method: str, optional
+        either 'bulk' (rank normalized split chains), 'tail' (minimum of the
+        effective sample size of the 5% and 95% quantiles) or 'basic'.
+        Default 'bulk'
+    """
+    samples = _as_array(samples)
+    if method == "basic":
+        return _ess(samples)
+    split = _split_chains(samples)
+    if method == "bulk":
+        return _ess(_rank_normalize(split))
+    elif method == "tail":
+        lower, upper = np.quantile(split, [0.05, 0.95], axis=(0, 2))
+        return np.minimum(
+            _ess((split <= lower[None, :, None]) * 1.),
+            _ess((split <= upper[None, :, None]) * 1.)
+        )
+    raise ValueError(
+        "Unknown method '{}'. Please choose either 'bulk', 'tail' or "
+        "'basic'".format(method)
+    )
+
+
+def diagnostics(samples, parameters=None, c=5):
+    """Return the integrated autocorrelation time, split R-hat and bulk and
+    tail effective sample size for each parameter
+
+    Parameters
+    ----------
+    samples: np.ndarray
+        3d array of (chains x parameters x steps)
+    parameters: list, optional
+        names of each parameter. Default 'parameter_{num}'
+    c: float, optional
+        window constant used when calculating the integrated autocorrelation
+        time. Default 5
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from pesummary.utils.diagnostics import diagnostics
+    >>> chains = np.random.normal(size=(4, 2, 1000))
+    >>> data = diagnostics(chains, parameters=["a", "b"])
+    >>> sorted(data["a"].keys())
+    ['autocorrelation_time', 'ess_bulk', 'ess_tail', 'rhat']
+    """
+    samples = _as_array(samples)
+    if parameters is None:
+        parameters = [
+            "parameter_{}".format(num) for num in range(samples.shape[1])
+        ]
+    # the rank normalized split chains are shared between the split R-hat
+    # and bulk effective sample size to avoid sorting the samples twice
+    split = _split_chains(samples)
+    normalized = _rank_normalize(split)
+    folded = np.abs(split - np.median(split, axis=(0, 2), keepdims=True))
+    lower, upper = np.quantile(split, [0.05, 0.95], axis=(0, 2))
+    data = {
+        "autocorrelation_time": integrated_autocorrelation_time(samples, c=c),
+        "rhat": np.maximum(_rhat(normalized), _rhat(_rank_normalize(folded))),
+        "ess_bulk": _ess(normalized),
+        "ess_tail": np.minimum(
+            _ess((split <= lower[None, :, None]) * 1.),
+            _ess((split <= upper[None, :, None]) * 1.)
+        ),
+    }
+    return {
+        param: {key: value[num] for key, value in data.items()} for num, param
+        in enumerate(parameters)
+    }
@@ -0,0 +1,141 @@
+# Licensed under an MIT style license -- see LICENSE.md
+
+import sys
+import types
+import importlib
+import importlib.util
+
+__author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy which only imports the underlying module when one of its
+    attributes is first accessed
+
+    Parameters
+    ----------
+    name: str
+        full name of the module you wish to import
+    """
+    def __init__(self, name):
+        super(LazyModule, self).__init__(name)
+        self.__dict__["_module"] = None
+
+    def _load(self):
+        """Import the underlying module
+        """
+        if self._module is None:
+            self.__dict__["_module"] = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        if self._module is None:
+            return "<lazily imported module '{}'>".format(self.__name__)
+        return repr(self._module)
+
+
+def lazy_import(name):
+    """Return a module which is only imported when one of its attributes is
+    first accessed. If the module has already been imported, the existing
+    module is returned. Any ImportError is raised when the module is first
+    used
+
+    Parameters
+    ----------
+    name: str
+        full name of the module you wish to import
+
+    Examples
+    --------
+    >>> from pesummary.utils.lazy import lazy_import
+    >>> stats = lazy_import("scipy.stats")
+    >>> "scipy.stats" in sys.modules
+    False
+    >>> stats.norm  # scipy.stats is only imported here
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
+
+
+def module_available(name):
+    """Return True if a module can be imported without executing it. Note
+    that the parent package of a submodule is imported
+
+    Parameters
+    ----------
+    name: str
+        full name of the module you wish to check
+    """
+    if name in sys.modules:
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def attach(package_name, submodules=None, submod_attrs=None):
+    """Return a module level `__getattr__` and `__dir__` which lazily import
+    the submodules and submodule attributes of a package when they are first
+    accessed (see PEP 562)
+
+    Parameters
+    ----------
+    package_name: str
+        name of the package. This is normally `__name__`
+    submodules: list, optional
+        list of submodules which are lazily imported when accessed
+    submod_attrs: dict, optional
+        dictionary of attributes which are lazily imported from a given
+        submodule, keyed by the name of the submodule
+
+    Returns
+    -------
+    __getattr__: func
+        module level `__getattr__` function
+    __dir__: func
+        module level `__dir__` function
+    __all__: list
+        list of all lazily loaded names
+
+    Examples
+    --------
+    >>> from pesummary.utils.lazy import attach
+    >>> __getattr__, __dir__, __all__ = attach(
+    ...     __name__, submodules=["plot"], submod_attrs={"cmap": ["cylon"]}
+    ... )
+    """
+    submodules = set(submodules or [])
+    submod_attrs = submod_attrs or {}
+    attr_to_modules = {
+        attr: mod for mod, attrs in submod_attrs.items() for attr in attrs
+    }
+    __all__ = sorted(submodules | set(attr_to_modules.keys()))
+
+    def __getattr__(name):
+        if name in submodules:
+            return importlib.import_module(
+                "{}.{}".format(package_name, name)
+            )
+        elif name in attr_to_modules:
+            module = importlib.import_module(
+                "{}.{}".format(package_name, attr_to_modules[name])
+            )
+            attr = getattr(module, name)
+            setattr(sys.modules[package_name], name, attr)
+            return attr
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(package_name, name)
+        )
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(__all__))
+
+    return __getattr__, __dir__, list(__all__)
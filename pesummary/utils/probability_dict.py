@@ -3,8 +3,8 @@
 from pesummary.utils.samples_dict import SamplesDict
 from pesummary.utils.dict import Dict
 from pesummary.utils.pdf import DiscretePDF, DiscretePDF2D
-from pesummary.core.plots.latex_labels import latex_labels
-from pesummary.gw.plots.latex_labels import GWlatex_labels
+from pesummary.core.latex_labels import latex_labels
+from pesummary.gw.latex_labels import GWlatex_labels
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
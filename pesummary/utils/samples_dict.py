@@ -1,14 +1,13 @@
 # Licensed under an MIT style license -- see LICENSE.md
 
-import copy
 import numpy as np
 from pesummary.utils.utils import resample_posterior_distribution, logger
 from pesummary.utils.decorators import docstring_subfunction
 from pesummary.utils.array import Array, _2DArray
 from pesummary.utils.dict import Dict
 from pesummary.utils.parameters import Parameters
-from pesummary.core.plots.latex_labels import latex_labels
-from pesummary.gw.plots.latex_labels import GWlatex_labels
+from pesummary.core.latex_labels import latex_labels
+from pesummary.gw.latex_labels import GWlatex_labels
 from pesummary import conf
 import importlib
 
@@ -30,8 +29,20 @@ class SamplesDict(Dict):
         If True, the posterior samples for each parameter are scaled to the
         same length
 
+    Notes
+    -----
+    When all parameters have the same number of numeric samples, the samples
+    are stored in a single growable (samples x parameters) array and each
+    parameter is a zero-copy view of one column. Adding a parameter only
+    reallocates the array when its capacity is exceeded, and the capacity
+    grows geometrically. Slicing returns views of the stored array and
+    masking performs a single gather
+
     Attributes
     ----------
+    samples: np.ndarray
+        2d array of shape (parameters x samples) containing the samples for
+        each parameter
     maxL: pesummary.utils.samples_dict.SamplesDict
         SamplesDict object containing the maximum likelihood sample keyed by
         the parameter
@@ -49,6 +60,9 @@ class SamplesDict(Dict):
         dictionary containing the key data associated with each array
     number_of_samples: int
         Number of samples stored in the SamplesDict object
+    effective_sample_size: float
+        Kish's effective sample size of the weighted samples. This is the
+        number of samples if the samples are not weighted
     latex_labels: dict
         Dictionary of latex labels for each parameter
     available_plots: list
@@ -81,6 +95,9 @@ class SamplesDict(Dict):
         list of keys with an '_' as their first character
     reweight:
         Reweight the posterior samples according to a new prior
+    resample:
+        Convert weighted posterior samples into unweighted posterior samples
+        with rejection sampling
     write:
         Save the stored posterior samples to file
 
@@ -109,17 +126,165 @@ class SamplesDict(Dict):
             logger_warn=logger_warn, latex_labels=latex_labels
         )
 
+    @property
+    def samples(self):
+        _storage = self.__dict__.get("_storage", None)
+        if _storage is not None:
+            return _storage[:, :self._nparameters].T
+        try:
+            return self.__dict__["_samples"]
+        except KeyError:
+            raise AttributeError(
+                "'{}' object has no attribute 'samples'".format(
+                    self.__class__.__name__
+                )
+            )
+
+    @samples.setter
+    def samples(self, samples):
+        """Store the samples. If the samples can be represented as a 2d
+        numeric array, they are stored (without copying where possible) as
+        the backing store for the SamplesDict. Otherwise they are stored as
+        provided
+        """
+        self._storage = None
+        self._owns_storage = False
+        self._samples = samples
+        try:
+            _samples = np.asarray(samples)
+        except (ValueError, TypeError):
+            return
+        if _samples.ndim != 2 or _samples.dtype.kind not in "biuf":
+            return
+        self._storage = _samples.T
+        self._nparameters = _samples.shape[0]
+        self._samples = None
+
+    def _column(self, index):
+        """Return a zero-copy view of the samples for a given parameter
+
+        Parameters
+        ----------
+        index: int
+            index of the parameter in self.parameters
+        """
+        return self._storage[:, index]
+
+    @staticmethod
+    def _view_with_attributes(column, value):
+        """Return a zero-copy Array view of a column in the backing store
+        which has the same attributes as a given Array
+
+        Parameters
+        ----------
+        column: np.ndarray
+            column of the backing store
+        value: pesummary.utils.array.Array
+            Array object containing the attributes to use
+        """
+        _view = column.view(Array)
+        for attr in Array.__slots__:
+            setattr(_view, attr, getattr(value, attr, None))
+        return _view
+
+    def _reallocate(self, capacity, dtype=None):
+        """Copy the backing store to a new array which is owned by the
+        SamplesDict and has space for a given number of parameters. All
+        parameters which are views of the old backing store are updated to be
+        views of the new backing store
+
+        Parameters
+        ----------
+        capacity: int
+            number of parameters the new backing store can hold
+        dtype: np.dtype, optional
+            dtype of the new backing store. Default the dtype of the existing
+            backing store
+        """
+        old = self._storage
+        nparameters = self._nparameters
+        new = np.empty(
+            (old.shape[0], capacity), dtype=dtype if dtype is not None else
+            old.dtype
+        )
+        new[:, :nparameters] = old[:, :nparameters]
+        self._storage = new
+        self._owns_storage = True
+        for num, key in enumerate(self.parameters[:nparameters]):
+            if not super(SamplesDict, self).__contains__(key):
+                continue
+            value = super(SamplesDict, self).__getitem__(key)
+            if isinstance(value, np.ndarray) and np.may_share_memory(value, old):
+                super(SamplesDict, self).__setitem__(
+                    key, self._view_with_attributes(new[:, num], value)
+                )
+
+    def _store(self, key, value):
+        """Store the samples for a parameter in the backing store. Returns
+        False if the samples can not be stored in the backing store
+
+        Parameters
+        ----------
+        key: str
+            name of the parameter
+        value: pesummary.utils.array.Array
+            samples for the parameter
+        """
+        if self.__dict__.get("_storage", None) is None:
+            return False
+        if value.ndim != 1 or len(value) != self._storage.shape[0]:
+            return False
+        if value.dtype.kind not in "biuf":
+            return False
+        dtype = np.result_type(self._storage, value)
+        if key in self.parameters[:self._nparameters]:
+            index = self.parameters.index(key)
+            column = self._column(index)
+            if np.may_share_memory(value, column):
+                if value.__array_interface__ == column.__array_interface__:
+                    super(SamplesDict, self).__setitem__(
+                        key, self._view_with_attributes(column, value)
+                    )
+                    return True
+                value = value.copy()
+            if not self._owns_storage or dtype != self._storage.dtype:
+                self._reallocate(self._storage.shape[1], dtype=dtype)
+        else:
+            index = self._nparameters
+            capacity = self._storage.shape[1]
+            if not self._owns_storage or index >= capacity or (
+                dtype != self._storage.dtype
+            ):
+                self._reallocate(
+                    max(2 * capacity, index + 1, 8), dtype=dtype
+                )
+            self._nparameters += 1
+        column = self._column(index)
+        column[:] = value
+        super(SamplesDict, self).__setitem__(
+            key, self._view_with_attributes(column, value)
+        )
+        return True
+
     def __getitem__(self, key):
         """Return an object representing the specialization of SamplesDict
         by type arguments found in key.
         """
         if isinstance(key, slice):
+            if self.__dict__.get("_storage", None) is not None:
+                return SamplesDict(self.parameters, self.samples[:, key])
             return SamplesDict(
                 self.parameters, np.array(
                     [i[key.start:key.stop:key.step] for i in self.samples]
                 )
             )
-        elif isinstance(key, (list, np.ndarray)):
+        elif isinstance(key, (list, np.ndarray)) and not all(
+                isinstance(_key, str) for _key in key
+        ):
+            if self.__dict__.get("_storage", None) is not None:
+                return SamplesDict(
+                    self.parameters, self._storage[key, :self._nparameters].T
+                )
             return SamplesDict(
                 self.parameters, np.array([i[key] for i in self.samples])
             )
@@ -127,13 +292,38 @@ class SamplesDict(Dict):
             return self.samples[self.parameters.index(key)]
         return super(SamplesDict, self).__getitem__(key)
 
+    @property
+    def _version(self):
+        """Number of times the samples stored in the SamplesDict have been
+        replaced or resized. Changes made to the samples in place are not
+        counted
+        """
+        return self.__dict__.get("_nchanges", 0)
+
+    def _changed(self):
+        """Record that the samples stored in the SamplesDict have changed
+        """
+        self.__dict__["_nchanges"] = self._version + 1
+
     def __setitem__(self, key, value):
+        self._changed()
         _value = value
         if not isinstance(value, Array):
             _value = Array(value)
+        try:
+            if self._store(key, _value):
+                if key not in self.parameters:
+                    self.parameters.append(key)
+                    self._update_latex_labels()
+                return
+        except AttributeError:
+            pass
         super(SamplesDict, self).__setitem__(key, _value)
         try:
             if key not in self.parameters:
+                if self.__dict__.get("_storage", None) is not None:
+                    self._samples = np.array(self.samples)
+                    self._storage = None
                 self.parameters.append(key)
                 try:
                     cond = (
@@ -251,6 +441,15 @@ class SamplesDict(Dict):
     def number_of_samples(self):
         return len(self[self.parameters[0]])
 
+    @property
+    def effective_sample_size(self):
+        from pesummary.core.reweight import effective_sample_size
+
+        weights = self[self.parameters[0]].weights
+        if weights is None:
+            return float(self.number_of_samples)
+        return effective_sample_size(weights)
+
     @property
     def plotting_map(self):
         existing = super(SamplesDict, self).plotting_map
@@ -324,12 +523,36 @@ class SamplesDict(Dict):
 
         return DataFrame(self, **kwargs)
 
-    def to_structured_array(self, **kwargs):
-        """Convert a SamplesDict object to a structured numpy array
+    def to_structured_array(self, index=None, **kwargs):
+        """Convert a SamplesDict object to a structured numpy array. When the
+        backing store is a contiguous float64 array which only contains the
+        returned parameters, the structured array is a zero-copy view of the
+        stored samples. Otherwise the samples are gathered with a single copy
+
+        Parameters
+        ----------
+        index: list, optional
+            index to use for the rows. This is not stored in the structured
+            array
+        **kwargs: dict, optional
+            all additional kwargs are passed to the pandas.DataFrame class
         """
-        return self.to_pandas(**kwargs).to_records(
-            index=False, column_dtypes=float
+        parameters = self.keys()
+        _storage = self.__dict__.get("_storage", None)
+        if len(kwargs) or _storage is None or not len(parameters):
+            if index is not None:
+                kwargs["index"] = index
+            return self.to_pandas(**kwargs).to_records(
+                index=False, column_dtypes=float
+            )
+        indices = [self.parameters.index(param) for param in parameters]
+        if indices != list(range(_storage.shape[1])):
+            _storage = _storage[:, indices]
+        _storage = np.ascontiguousarray(_storage, dtype=np.float64)
+        dtype = np.dtype(
+            {"names": list(parameters), "formats": [np.float64] * len(indices)}
         )
+        return _storage.view(dtype)[:, 0].view(np.recarray)
 
     def pop(self, parameter):
         """Delete a parameter from the SamplesDict
@@ -346,11 +569,25 @@ class SamplesDict(Dict):
                 )
             )
             return
+        self._changed()
         ind = self.parameters.index(parameter)
         self.parameters.remove(parameter)
         samples = self.samples
         self.samples = np.delete(samples, ind, axis=0)
-        return super(SamplesDict, self).pop(parameter)
+        value = super(SamplesDict, self).pop(parameter)
+        if self.__dict__.get("_storage", None) is not None:
+            # the remaining parameters are views of the old backing store so
+            # they are updated to be views of the new backing store
+            for num, key in enumerate(self.parameters):
+                if not super(SamplesDict, self).__contains__(key):
+                    continue
+                super(SamplesDict, self).__setitem__(
+                    key, self._view_with_attributes(
+                        self._column(num),
+                        super(SamplesDict, self).__getitem__(key)
+                    )
+                )
+        return value
 
     def downsample(self, number):
         """Downsample the samples stored in the SamplesDict class
@@ -360,6 +597,7 @@ class SamplesDict(Dict):
         number: int
             Number of samples you wish to downsample to
         """
+        self._changed()
         self.samples = resample_posterior_distribution(self.samples, number)
         self.make_dictionary()
         return self
@@ -372,6 +610,7 @@ class SamplesDict(Dict):
         number: int
             Number of samples that you wish to remove
         """
+        self._changed()
         self.make_dictionary(discard_samples=number)
         return self
 
@@ -408,7 +647,7 @@ class SamplesDict(Dict):
         else:
             weights = None
         _2d_array = _2DArray(
-            np.array(self.samples)[:, discard_samples:], likelihood=likelihoods,
+            np.asarray(self.samples)[:, discard_samples:], likelihood=likelihoods,
             prior=priors, weights=weights
         )
         for key, val in zip(self.parameters, _2d_array):
@@ -466,7 +705,8 @@ class SamplesDict(Dict):
         return extra_kwargs
 
     def reweight(
-        self, function, ignore_debug_params=["recalib", "spcal"], **kwargs
+        self, function, ignore_debug_params=["recalib", "spcal"],
+        mode="rejection", **kwargs
     ):
         """Reweight the posterior samples according to a new prior
 
@@ -477,6 +717,10 @@ class SamplesDict(Dict):
         ignore_debug_params: list, optional
             params to ignore when storing unweighted posterior distributions.
             Default any param with ['recalib', 'spcal'] in their name
+        mode: str, optional
+            either 'rejection' to resample the posterior with rejection
+            sampling or 'weights' to keep all samples and store importance
+            weights under the 'weights' key. Default 'rejection'
         """
         from pesummary.gw.reweight import options
         if isinstance(function, str) and function in options.keys():
@@ -489,6 +733,8 @@ class SamplesDict(Dict):
                 )
             )
         _samples = SamplesDict(self.copy())
+        if mode != "rejection":
+            return function(_samples, mode=mode, **kwargs)
         new_samples = function(_samples, **kwargs)
         _samples.downsample(new_samples.number_of_samples)
         for key, item in new_samples.items():
@@ -497,6 +743,27 @@ class SamplesDict(Dict):
             _samples[key] = item
         return SamplesDict(_samples)
 
+    def resample(self):
+        """Convert weighted posterior samples into unweighted posterior
+        samples with rejection sampling. The 'weights' are removed from the
+        returned SamplesDict. This is useful when exporting the samples to a
+        format which does not support weights
+        """
+        from pesummary.core.reweight import rejection_sampling
+
+        weights = self[self.parameters[0]].weights
+        if weights is None:
+            return SamplesDict(self.copy())
+        parameters = [
+            param for param in self.parameters if param not in
+            ["weights", "weight"]
+        ]
+        _samples = SamplesDict(
+            parameters, np.array([self[param] for param in parameters]),
+            logger_warn="debug"
+        )
+        return rejection_sampling(_samples, weights)
+
     def _marginalized_posterior(self, parameter, module="core", **kwargs):
         """Wrapper for the `pesummary.core.plots.plot._1d_histogram_plot` or
         `pesummary.gw.plots.plot._1d_histogram_plot`
@@ -575,6 +842,9 @@ class SamplesDict(Dict):
                     "None of the chosen parameters are in the posterior "
                     "samples table. Please choose other parameters to plot"
                 )
+        weights = self[self.parameters[0]].weights
+        if weights is not None and "weights" not in kwargs.keys():
+            kwargs["weights"] = weights
         return getattr(module, "_make_corner_plot")(
             self, self.latex_labels, corner_parameters=_parameters, **kwargs
         )[0]
@@ -1083,48 +1353,31 @@ class _MultiDimensionalSamplesDict(Dict):
             }
         return self.name(transpose_dict, transpose=_transpose)
 
-    def _combine(
-        self, labels=None, use_all=False, weights=None, shuffle=False,
-        logger_level="debug"
+    @staticmethod
+    def _number_of_draws(
+        labels, lengths, use_all=False, weights=None, provided_labels=True,
+        _logger=logger.debug
     ):
-        """Combine samples from a select number of analyses into a single
-        SamplesDict object.
+        """Return the number of samples to draw from each analysis when
+        combining them into a single set of samples
 
         Parameters
         ----------
-        labels: list, optional
-            analyses you wish to combine. Default use all labels stored in the
-            dictionary
+        labels: list
+            analyses you wish to combine
+        lengths: np.ndarray
+            the number of samples stored for each analysis
         use_all: Bool, optional
             if True, use all of the samples (do not weight). Default False
-        weights: dict, optional
-            dictionary of weights for each of the posteriors. Keys must be the
-            labels you wish to combine and values are the weights you wish to
-            assign to the posterior
-        shuffle: Bool, optional
-            shuffle the combined samples
-        logger_level: str, optional
-            logger level you wish to use. Default debug.
+        weights: dict/list, optional
+            weights for each of the posteriors. See `_combine`
+        provided_labels: Bool, optional
+            True if the labels were explicitly provided. If False, weights must
+            be provided as a dictionary
+        _logger: func, optional
+            function to use for logging
         """
-        try:
-            _logger = getattr(logger, logger_level)
-        except AttributeError:
-            raise ValueError(
-                "Unknown logger level. Please choose either 'info' or 'debug'"
-            )
-        if labels is None:
-            _provided_labels = False
-            labels = self.labels
-        else:
-            _provided_labels = True
-            if not all(label in self.labels for label in labels):
-                raise ValueError(
-                    "Not all of the provided labels exist in the dictionary. "
-                    "The list of available labels are: {}".format(
-                        ", ".join(self.labels)
-                    )
-                )
-        _logger("Combining the following analyses: {}".format(labels))
+        _lengths = np.asarray(lengths)
         if use_all and weights is not None:
             raise ValueError(
                 "Unable to use all samples and provide weights"
@@ -1138,7 +1391,7 @@ class _MultiDimensionalSamplesDict(Dict):
                         len(labels)
                     )
                 )
-            if not _provided_labels and not isinstance(weights, dict):
+            if not provided_labels and not isinstance(weights, dict):
                 raise ValueError(
                     "Weights must be provided as a dictionary keyed by the "
                     "analysis label. The available labels are: {}".format(
@@ -1169,9 +1422,6 @@ class _MultiDimensionalSamplesDict(Dict):
                     )
                 )
             )
-        _lengths = np.array(
-            [self.number_of_samples[key] for key in labels]
-        )
         if use_all:
             draw = _lengths
         else:
@@ -1197,42 +1447,138 @@ class _MultiDimensionalSamplesDict(Dict):
             )
         )
 
-        if self.transpose:
-            _data = self.T
-        else:
-            _data = copy.deepcopy(self)
-        for num, label in enumerate(labels):
-            if draw[num] > 0:
-                _data[label].downsample(draw[num])
-            else:
-                _data[label] = {
-                    param: np.array([]) for param in _data[label].keys()
-                }
+        return draw
+
+    def _combine(
+        self, labels=None, use_all=False, weights=None, shuffle=False,
+        logger_level="debug"
+    ):
+        """Combine samples from a select number of analyses into a single
+        SamplesDict object.
+
+        Parameters
+        ----------
+        labels: list, optional
+            analyses you wish to combine. Default use all labels stored in the
+            dictionary
+        use_all: Bool, optional
+            if True, use all of the samples (do not weight). Default False
+        weights: dict, optional
+            dictionary of weights for each of the posteriors. Keys must be the
+            labels you wish to combine and values are the weights you wish to
+            assign to the posterior
+        shuffle: Bool, optional
+            shuffle the combined samples
+        logger_level: str, optional
+            logger level you wish to use. Default debug.
+        """
         try:
-            intersection = set.intersection(
-                *[
-                    set(_params) for _key, _params in _data.parameters.items() if
-                    _key in labels
-                ]
-            )
+            _logger = getattr(logger, logger_level)
         except AttributeError:
-            intersection = _data.parameters
+            raise ValueError(
+                "Unknown logger level. Please choose either 'info' or 'debug'"
+            )
+        if labels is None:
+            _provided_labels = False
+            labels = self.labels
+        else:
+            _provided_labels = True
+            if not all(label in self.labels for label in labels):
+                raise ValueError(
+                    "Not all of the provided labels exist in the dictionary. "
+                    "The list of available labels are: {}".format(
+                        ", ".join(self.labels)
+                    )
+                )
+        _logger("Combining the following analyses: {}".format(labels))
+        _lengths = np.array(
+            [self.number_of_samples[key] for key in labels]
+        )
+        draw = self._number_of_draws(
+            labels, _lengths, use_all=use_all, weights=weights,
+            provided_labels=_provided_labels, _logger=_logger
+        )
+        indices = [
+            None if draw[num] == _lengths[num] else np.random.choice(
+                _lengths[num], draw[num], replace=False
+            ) for num in range(len(labels))
+        ]
+        parameters, data = self._gather(labels, indices, draw)
+        if shuffle:
+            np.random.shuffle(data)
+        return SamplesDict(parameters, data.T, logger_warn="debug")
+
+    def _analysis_parameters(self, label):
+        """Return the list of parameters stored for a given analysis
+
+        Parameters
+        ----------
+        label: str
+            the analysis you wish to return the parameters for
+        """
+        if self.transpose:
+            return list(self.keys())
+        return list(self[label].keys())
+
+    def _analysis_samples(self, label, parameter):
+        """Return the samples for a given parameter and analysis without
+        copying
+
+        Parameters
+        ----------
+        label: str
+            the analysis you wish to return samples for
+        parameter: str
+            the parameter you wish to return samples for
+        """
+        if self.transpose:
+            return self[parameter][label]
+        return self[label][parameter]
+
+    def _gather(self, labels, indices, draw):
+        """Gather the samples drawn from a select number of analyses into a
+        single preallocated (samples x parameters) array. Only the parameters
+        common to all analyses are included
+
+        Parameters
+        ----------
+        labels: list
+            analyses you wish to gather samples from
+        indices: list
+            the indices of the samples to draw from each analysis. If None,
+            all samples are used
+        draw: np.ndarray
+            the number of samples drawn from each analysis
+        """
+        _parameters = [self._analysis_parameters(label) for label in labels]
+        intersection = set.intersection(*[set(_) for _ in _parameters])
+        parameters = [
+            param for param in _parameters[0] if param in intersection
+        ]
         logger.debug(
             "Only including the parameters: {} as they are common to all "
-            "analyses".format(", ".join(list(intersection)))
+            "analyses".format(", ".join(parameters))
         )
-        data = {
-            param: np.concatenate([_data[key][param] for key in labels]) for
-            param in intersection
-        }
-        if shuffle:
-            inds = np.random.choice(
-                np.sum(draw), size=np.sum(draw), replace=False
-            )
-            data = {
-                param: value[inds] for param, value in data.items()
-            }
-        return SamplesDict(data, logger_warn="debug")
+        dtype = np.result_type(
+            *[
+                self._analysis_samples(label, param).dtype for label in
+                labels for param in parameters
+            ]
+        ) if len(parameters) else float
+        data = np.empty((int(np.sum(draw)), len(parameters)), dtype=dtype)
+        offset = 0
+        for num, label in enumerate(labels):
+            if draw[num] == 0:
+                continue
+            _slice = slice(offset, offset + draw[num])
+            for idx, param in enumerate(parameters):
+                column = np.asarray(self._analysis_samples(label, param))
+                if indices[num] is None:
+                    data[_slice, idx] = column
+                else:
+                    data[_slice, idx] = column[indices[num]]
+            offset += draw[num]
+        return parameters, data
 
     @property
     def nsamples(self):
@@ -1309,7 +1655,10 @@ class MCMCSamplesDict(_MultiDimensionalSamplesDict):
         different lengths, all chains are resized to the minimum number of
         samples
     combine: pesummary.utils.samples_dict.SamplesDict
-        Combine all samples from all chains into a single SamplesDict object
+        Combine all samples from all chains into a single SamplesDict object.
+        The combined samples are cached until a chain is replaced, resized or
+        has samples discarded and are returned as a read-only view of the
+        cache
     nchains: int
         Total number of chains stored in the MCMCSamplesDict object
     number_of_samples: dict
@@ -1329,6 +1678,20 @@ class MCMCSamplesDict(_MultiDimensionalSamplesDict):
     gelman_rubin: float
         Return the Gelman-Rubin statistic between the chains for a given
         parameter. See pesummary.utils.utils.gelman_rubin
+    split_gelman_rubin: dict
+        Return the rank normalized split R-hat statistic for a set of
+        parameters. See pesummary.utils.diagnostics.split_rhat
+    autocorrelation: dict
+        Return the autocorrelation function of each chain for a set of
+        parameters
+    autocorrelation_time: dict
+        Return the integrated autocorrelation time for a set of parameters
+    effective_sample_size: dict
+        Return the bulk, tail or basic effective sample size for a set of
+        parameters
+    diagnostics: dict
+        Return all convergence diagnostics for a set of parameters. See
+        pesummary.utils.diagnostics
     samples:
         Return a list of samples stored in the MCMCSamplesDict object for a
         given parameter
@@ -1405,9 +1768,41 @@ class MCMCSamplesDict(_MultiDimensionalSamplesDict):
             data[param] = value.key_data
         return data
 
+    def __setitem__(self, key, value):
+        self.__dict__["_nchanges"] = self.__dict__.get("_nchanges", 0) + 1
+        super(MCMCSamplesDict, self).__setitem__(key, value)
+
+    @property
+    def _version(self):
+        """Return a counter which changes whenever a chain is added, replaced,
+        resized or has samples discarded. This is used to decide when the
+        cached combined samples are stale. Changes made to the samples in
+        place are not tracked
+        """
+        return (
+            self.__dict__.get("_nchanges", 0), tuple(
+                getattr(value, "_version", 0) for value in self.values()
+            )
+        )
+
     @property
     def combine(self):
-        return self._combine(use_all=True, weights=None)
+        version = self._version
+        _cached = self.__dict__.get("_cached_combine", None)
+        if _cached is None or _cached[0] != version:
+            _lengths = np.array(
+                [self.number_of_samples[key] for key in self.labels]
+            )
+            parameters, data = self._gather(
+                self.labels, [None] * len(self.labels), _lengths
+            )
+            _cached = (version, parameters, data)
+            self.__dict__["_cached_combine"] = _cached
+        # return a read-only view so that the cached samples can not be
+        # changed by the caller
+        data = _cached[2].view()
+        data.flags.writeable = False
+        return SamplesDict(_cached[1], data.T, logger_warn="debug")
 
     def discard_samples(self, number):
         """Remove the first n samples
@@ -1420,6 +1815,7 @@ class MCMCSamplesDict(_MultiDimensionalSamplesDict):
         """
         if isinstance(number, int):
             number = {chain: number for chain in self.keys()}
+        self.__dict__["_nchanges"] = self.__dict__.get("_nchanges", 0) + 1
         for chain in self.keys():
             self[chain].discard_samples(number[chain])
         return self
@@ -1461,6 +1857,120 @@ class MCMCSamplesDict(_MultiDimensionalSamplesDict):
 
         return _gelman_rubin(self.samples(parameter), decimal=decimal)
 
+    def _chain_array(self, parameters=None):
+        """Return a (chains x parameters x steps) array of samples. If the
+        chains are of different lengths, all chains are resized to the
+        minimum number of samples
+
+        Parameters
+        ----------
+        parameters: list, optional
+            parameters to include. Default all parameters common to all chains
+        """
+        if parameters is None:
+            _parameters = [
+                self._analysis_parameters(label) for label in self.labels
+            ]
+            common = set.intersection(*[set(_) for _ in _parameters])
+            parameters = [param for param in _parameters[0] if param in common]
+        elif isinstance(parameters, str):
+            parameters = [parameters]
+        nsteps = self.minimum_number_of_samples
+        data = np.empty((len(self.labels), len(parameters), nsteps))
+        for num, label in enumerate(self.labels):
+            for idx, param in enumerate(parameters):
+                data[num, idx] = self._analysis_samples(label, param)[:nsteps]
+        return parameters, data
+
+    def autocorrelation(self, parameters=None):
+        """Return the normalised autocorrelation function of each chain for
+        a set of parameters. All chains and parameters are computed in a
+        single batched FFT. See pesummary.utils.diagnostics.autocorrelation
+
+        Parameters
+        ----------
+        parameters: list, optional
+            parameters you wish to compute the autocorrelation function for.
+            Default all parameters common to all chains
+        """
+        from pesummary.utils.diagnostics import autocorrelation
+
+        parameters, data = self._chain_array(parameters)
+        acf = autocorrelation(data)
+        return {param: acf[:, num] for num, param in enumerate(parameters)}
+
+    def autocorrelation_time(self, parameters=None, c=5):
+        """Return the integrated autocorrelation time for a set of
+        parameters. See
+        pesummary.utils.diagnostics.integrated_autocorrelation_time
+
+        Parameters
+        ----------
+        parameters: list, optional
+            parameters you wish to compute the autocorrelation time for.
+            Default all parameters common to all chains
+        c: float, optional
+            window constant. Default 5
+        """
+        from pesummary.utils.diagnostics import integrated_autocorrelation_time
+
+        parameters, data = self._chain_array(parameters)
+        tau = integrated_autocorrelation_time(data, c=c)
+        return {param: tau[num] for num, param in enumerate(parameters)}
+
+    def split_gelman_rubin(self, parameters=None):
+        """Return the rank normalized split R-hat statistic for a set of
+        parameters. See pesummary.utils.diagnostics.split_rhat
+
+        Parameters
+        ----------
+        parameters: list, optional
+            parameters you wish to compute the split R-hat for. Default all
+            parameters common to all chains
+        """
+        from pesummary.utils.diagnostics import split_rhat
+
+        parameters, data = self._chain_array(parameters)
+        rhat = split_rhat(data)
+        return {param: rhat[num] for num, param in enumerate(parameters)}
+
+    def effective_sample_size(self, parameters=None, method="bulk"):
+        """Return the effective sample size for a set of parameters. See
+        pesummary.utils.diagnostics.effective_sample_size
+
+        Parameters
+        ----------
+        parameters: list, optional
+            parameters you wish to compute the effective sample size for.
+            Default all parameters common to all chains
+        method: str, optional
+            either 'bulk', 'tail' or 'basic'. Default 'bulk'
+        """
+        from pesummary.utils.diagnostics import effective_sample_size
+
+        parameters, data = self._chain_array(parameters)
+        ess = effective_sample_size(data, method=method)
+        return {param: ess[num] for num, param in enumerate(parameters)}
+
+    def diagnostics(self, parameters=None, c=5):
+        """Return the integrated autocorrelation time, split R-hat and bulk
+        and tail effective sample size for a set of parameters. See
+        pesummary.utils.diagnostics.diagnostics
+
+        Parameters
+        ----------
+        parameters: list, optional
+            parameters you wish to compute the diagnostics for. Default all
+            parameters common to all chains
+        c: float, optional
+            window constant used when calculating the autocorrelation time.
+            Default 5
+        """
+        from pesummary.utils.diagnostics import diagnostics
+
+        parameters, data = self._chain_array(parameters)
+        return diagnostics(data, parameters=parameters, c=c)
+
 
 class MultiAnalysisSamplesDict(_MultiDimensionalSamplesDict):
     """Class to samples from multiple analyses
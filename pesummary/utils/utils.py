@@ -9,11 +9,8 @@ import copy
 import shutil
 
 import numpy as np
-from scipy.integrate import cumtrapz
-from scipy.interpolate import interp1d
-from scipy import stats
-import h5py
 from pesummary import conf
+from pesummary.utils.lazy import lazy_import
 
 __author__ = ["Charlie Hoy <charlie.hoy@ligo.org>"]
 
@@ -31,6 +28,12 @@ CACHE_DIR = os.path.join(
 )
 STYLE_CACHE = os.path.join(CACHE_DIR, "style")
 LOG_CACHE = os.path.join(CACHE_DIR, "log")
+SKYMAP_CACHE = os.path.join(CACHE_DIR, "skymap")
+PRIOR_CACHE = os.path.join(CACHE_DIR, "prior")
+FETCH_CACHE = os.path.join(CACHE_DIR, "fetch")
+
+stats = lazy_import("scipy.stats")
+h5py = lazy_import("h5py")
 
 
 def resample_posterior_distribution(posterior, nsamples):
@@ -46,6 +49,9 @@ def resample_posterior_distribution(posterior, nsamples):
         number of samples that you wish to randomly draw from the distribution
     """
     if len(posterior) == 1:
+        from scipy.integrate import cumtrapz
+        from scipy.interpolate import interp1d
+
         n, bins = np.histogram(posterior, bins=50)
         n = np.array([0] + [i for i in n])
         cdf = cumtrapz(n, bins, initial=0)
@@ -296,9 +302,37 @@ def remove_tmp_directories():
             os.remove(i)
 
 
+def _stored_summary(namespace, label, key):
+    """Return a summary statistic stored in the existing metafile for a given
+    label. None is returned if the summary statistic is not stored
+
+    Parameters
+    ----------
+    namespace: object
+        namespace object containing the existing file kwargs
+    label: str
+        label of the analysis you wish to return the summary statistic for
+    key: str
+        name of the summary statistic, for example `maxL`
+    """
+    def _to_float(value):
+        if isinstance(value, dict):
+            return {k: _to_float(v) for k, v in value.items()}
+        return float(np.asarray(value).flatten()[0])
+
+    kwargs = getattr(namespace, "existing_file_kwargs", None)
+    try:
+        return _to_float(kwargs[label]["summary"][key])
+    except (KeyError, TypeError, ValueError, IndexError):
+        return None
+
+
 def _add_existing_data(namespace):
-    """Add existing data to namespace object
+    """Add existing data to namespace object. If `namespace.incremental` is
+    True, the maximum likelihood samples and classification probabilities
+    stored in the existing metafile are used rather than recomputed
     """
+    incremental = getattr(namespace, "incremental", False)
     for num, i in enumerate(namespace.existing_labels):
         if hasattr(namespace, "labels") and i not in namespace.labels:
             namespace.labels.append(i)
@@ -356,25 +390,38 @@ def _add_existing_data(namespace):
                     namespace.skymap[i] = None
         if hasattr(namespace, "maxL_samples"):
             if i not in list(namespace.maxL_samples.keys()):
-                namespace.maxL_samples[i] = {
-                    key: val.maxL for key, val in namespace.samples[i].items()
-                }
+                stored = _stored_summary(namespace, i, "maxL")
+                if incremental and stored is not None:
+                    namespace.maxL_samples[i] = stored
+                else:
+                    namespace.maxL_samples[i] = {
+                        key: val.maxL for key, val in
+                        namespace.samples[i].items()
+                    }
         if hasattr(namespace, "pepredicates_probs"):
             if i not in list(namespace.pepredicates_probs.keys()):
-                from pesummary.gw.pepredicates import get_classifications
+                stored = _stored_summary(namespace, i, "pepredicates")
+                if incremental and stored is not None:
+                    namespace.pepredicates_probs[i] = stored
+                else:
+                    from pesummary.gw.pepredicates import get_classifications
 
-                namespace.pepredicates_probs[i] = get_classifications(
-                    namespace.existing_samples[i]
-                )
+                    namespace.pepredicates_probs[i] = get_classifications(
+                        namespace.existing_samples[i]
+                    )
         if hasattr(namespace, "pastro_probs"):
             if i not in list(namespace.pastro_probs.keys()):
-                from pesummary.gw.p_astro import get_probabilities
+                stored = _stored_summary(namespace, i, "pastro")
+                if incremental and stored is not None:
+                    namespace.pastro_probs[i] = stored
+                else:
+                    from pesummary.gw.p_astro import get_probabilities
 
-                em_bright = get_probabilities(namespace.existing_samples[i])
-                namespace.pastro_probs[i] = {
-                    "default": em_bright[0],
-                    "population": em_bright[1]
-                }
+                    em_bright = get_probabilities(namespace.existing_samples[i])
+                    namespace.pastro_probs[i] = {
+                        "default": em_bright[0],
+                        "population": em_bright[1]
+                    }
     if hasattr(namespace, "result_files"):
         number = len(namespace.labels)
         while len(namespace.result_files) < number:
@@ -788,7 +835,7 @@ def jensen_shannon_divergence(*args, **kwargs):
 
 
 def jensen_shannon_divergence_from_samples(
-    samples, kde=stats.gaussian_kde, decimal=5, base=np.e, **kwargs
+    samples, kde=None, decimal=5, base=np.e, **kwargs
 ):
     """Calculate the JS divergence between two sets of samples
 
@@ -796,8 +843,9 @@ def jensen_shannon_divergence_from_samples(
     ----------
     samples: list
         2d list containing the samples drawn from two pdfs
-    kde: func
-        function to use when calculating the kde of the samples
+    kde: func, optional
+        function to use when calculating the kde of the samples. Default
+        scipy.stats.gaussian_kde
     decimal: int, float
         number of decimal places to round the JS divergence to
     base: float, optional
@@ -836,7 +884,7 @@ def jensen_shannon_divergence_from_pdfs(pdfs, decimal=5, base=np.e):
     return np.round(kl_forward / 2. + kl_backward / 2., decimal)
 
 
-def samples_to_kde(samples, kde=stats.gaussian_kde, **kwargs):
+def samples_to_kde(samples, kde=None, **kwargs):
     """Generate KDE for a set of samples
 
     Parameters
@@ -844,9 +892,12 @@ def samples_to_kde(samples, kde=stats.gaussian_kde, **kwargs):
     samples: list
         list containing the samples to create a KDE for. samples can also
         be a 2d list containing samples from multiple analyses.
-    kde: func
-        function to use when calculating the kde of the samples
+    kde: func, optional
+        function to use when calculating the kde of the samples. Default
+        scipy.stats.gaussian_kde
     """
+    if kde is None:
+        kde = stats.gaussian_kde
     _SINGLE_ANALYSIS = False
     if not isinstance(samples[0], (np.ndarray, list, tuple)):
         _SINGLE_ANALYSIS = True